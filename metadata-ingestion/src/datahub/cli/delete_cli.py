@@ -1,9 +1,12 @@
+import itertools
 import logging
+import os
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
 import humanfriendly
@@ -14,8 +17,10 @@ from tabulate import tabulate
 from datahub.cli import cli_utils
 from datahub.configuration.datetimes import ClickDatetime
 from datahub.emitter.aspect import ASPECT_MAP, TIMESERIES_ASPECT_MAP
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.graph.client import DataHubGraph, get_default_graph
 from datahub.ingestion.graph.filters import RemovedStatusFilter
+from datahub.metadata.schema_classes import StatusClass, SystemMetadataClass
 from datahub.telemetry import telemetry
 from datahub.upgrade import upgrade
 from datahub.utilities.perf_timer import PerfTimer
@@ -41,6 +46,15 @@ _RECURSIVE_DELETE_TYPES = {
     "dataPlatformInstance",
 }
 
+# The number of status aspects to emit per request for soft deletes.
+_SOFT_DELETE_BATCH_SIZE = 100
+
+# A request this many times slower than the fastest one we've seen is taken as a
+# sign that the server is overloaded.
+_SLOW_REQUEST_FACTOR = 5
+_MIN_BACKOFF_SEC = 0.5
+_MAX_BACKOFF_SEC = 30.0
+
 
 @click.group(cls=DefaultGroup, default="by-filter")
 def delete() -> None:
@@ -352,7 +366,18 @@ def undo_by_filter(
     help="Only delete soft-deleted entities, for hard deletion",
 )
 @click.option(
-    "--workers", type=int, default=1, help="Num of workers to use for deletion."
+    "--workers",
+    type=int,
+    default=1,
+    help="Max num of workers to use for deletion. "
+    "Fewer workers are used while the server is slow or returning errors.",
+)
+@click.option(
+    "--checkpoint-file",
+    required=False,
+    type=click.Path(dir_okay=False),
+    help="File to record the deleted urns in. "
+    "If a delete is interrupted, re-running it with the same file skips the urns that were already deleted.",
 )
 @upgrade.check_upgrade
 @telemetry.with_telemetry()
@@ -373,6 +398,7 @@ def by_filter(
     dry_run: bool,
     only_soft_deleted: bool,
     workers: int = 1,
+    checkpoint_file: Optional[str] = None,
 ) -> None:
     """Delete metadata from datahub using a single urn or a combination of filters."""
 
@@ -413,38 +439,36 @@ def by_filter(
     graph = get_default_graph()
     logger.info(f"Using {graph}")
 
-    # Determine which urns to delete.
+    # Determine which urns to delete. The urns are produced lazily, so that mass
+    # deletes don't need to hold every urn in memory.
     delete_by_urn = bool(urn) and not recursive
-    if urn:
-        urns = [urn]
 
-        if recursive:
-            # Add children urns to the list.
-            if guess_entity_type(urn) == "dataPlatformInstance":
-                urns.extend(
-                    graph.get_urns_by_filter(
+    def _get_urns() -> Iterable[str]:
+        if urn:
+            yield urn
+
+            if recursive:
+                # Add children urns to the list.
+                if guess_entity_type(urn) == "dataPlatformInstance":
+                    yield from graph.get_urns_by_filter(
                         platform_instance=urn,
                         status=soft_delete_filter,
                         batch_size=batch_size,
                     )
-                )
-            else:
-                urns.extend(
-                    graph.get_urns_by_filter(
+                else:
+                    yield from graph.get_urns_by_filter(
                         container=urn,
                         status=soft_delete_filter,
                         batch_size=batch_size,
                     )
-                )
-    elif urn_file:
-        with open(urn_file, "r") as r:
-            urns = []
-            for line in r.readlines():
-                urn = line.strip().strip('"')
-                urns.append(urn)
-    else:
-        urns = list(
-            graph.get_urns_by_filter(
+        elif urn_file:
+            with open(urn_file, "r") as r:
+                for line in r:
+                    file_urn = line.strip().strip('"')
+                    if file_urn:
+                        yield file_urn
+        else:
+            yield from graph.get_urns_by_filter(
                 entity_types=[entity_type] if entity_type else None,
                 platform=platform,
                 env=env,
@@ -452,53 +476,204 @@ def by_filter(
                 status=soft_delete_filter,
                 batch_size=batch_size,
             )
+
+    checkpoint = _DeleteCheckpoint(checkpoint_file) if checkpoint_file else None
+    if checkpoint and checkpoint.num_done:
+        click.echo(
+            f"Skipping {checkpoint.num_done} urn(s) that were already deleted according to {checkpoint_file}"
         )
-        if len(urns) == 0:
+
+    def _get_remaining_urns() -> Iterable[str]:
+        if checkpoint:
+            return (urn for urn in _get_urns() if not checkpoint.is_done(urn))
+        return _get_urns()
+
+    # Print out a summary of the urns to be deleted and confirm with the user.
+    # This requires an extra pass over the urns, so we skip it for forced deletes.
+    num_urns: Optional[int] = None
+    if not delete_by_urn and (dry_run or not force):
+        summary = _summarize_urns(_get_remaining_urns())
+        num_urns = summary.num_urns
+        if num_urns == 0:
             click.echo(
                 "Found no urns to delete. Maybe you want to change your filters to be something different?"
             )
             return
 
-    # Print out a summary of the urns to be deleted and confirm with the user.
-    if not delete_by_urn:
-        urns_by_type: Dict[str, List[str]] = {}
-        for urn in urns:
-            entity_type = guess_entity_type(urn)
-            urns_by_type.setdefault(entity_type, []).append(urn)
-        if len(urns_by_type) > 1:
+        if len(summary.num_urns_by_type) > 1:
             # Display a breakdown of urns by entity type if there's multiple.
             click.echo("Found urns of multiple entity types")
-            for entity_type, entity_urns in urns_by_type.items():
+            for urns_type, count in summary.num_urns_by_type.items():
                 click.echo(
-                    f"- {len(entity_urns)} {entity_type} urn(s). Sample: {random.sample(entity_urns, k=min(5, len(entity_urns)))}"
+                    f"- {count} {urns_type} urn(s). Sample: {summary.samples_by_type[urns_type]}"
                 )
         else:
-            click.echo(
-                f"Found {len(urns)} {entity_type} urn(s). Sample: {random.sample(urns, k=min(5, len(urns)))}"
-            )
+            [(urns_type, samples)] = summary.samples_by_type.items()
+            click.echo(f"Found {num_urns} {urns_type} urn(s). Sample: {samples}")
 
         if not force and not dry_run:
             click.confirm(
-                f"This will delete {len(urns)} entities from DataHub. Do you want to continue?",
+                f"This will delete {num_urns} entities from DataHub. Do you want to continue?",
                 abort=True,
             )
 
-    _delete_urns_parallel(
-        graph=graph,
-        urns=urns,
-        aspect_name=aspect,
-        soft=soft,
-        dry_run=dry_run,
-        delete_by_urn=delete_by_urn,
-        start_time=start_time,
-        end_time=end_time,
-        workers=workers,
-    )
+    try:
+        _delete_urns(
+            graph=graph,
+            urns=_get_urns(),
+            aspect_name=aspect,
+            soft=soft,
+            dry_run=dry_run,
+            delete_by_urn=delete_by_urn,
+            start_time=start_time,
+            end_time=end_time,
+            workers=workers,
+            num_urns=num_urns,
+            checkpoint=checkpoint,
+        )
+    finally:
+        if checkpoint:
+            checkpoint.close()
 
 
-def _delete_urns_parallel(
+class _AdaptiveConcurrencyLimiter:
+    """Adapts the number of in-flight delete requests to the server's health.
+
+    This follows the usual additive-increase / multiplicative-decrease scheme.
+    The limit is halved when a request fails or is much slower than the fastest
+    requests we've seen, and grows by one after a full round of healthy requests.
+    After a failure, new requests are also delayed with an exponential backoff.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(max_limit, 1)
+        self.limit = self.max_limit
+        self.backoff_sec = 0.0
+
+        self._baseline_latency_sec: Optional[float] = None
+        self._healthy_streak = 0
+        # Requests that were already in flight when we decreased the limit will
+        # likely be slow too, so we don't decrease again until a round completes.
+        self._completions_until_next_decrease = 0
+
+    def on_success(self, latency_sec: float) -> None:
+        self.backoff_sec = 0.0
+        self._completions_until_next_decrease -= 1
+
+        if (
+            self._baseline_latency_sec is None
+            or latency_sec < self._baseline_latency_sec
+        ):
+            self._baseline_latency_sec = latency_sec
+        elif latency_sec > self._baseline_latency_sec * _SLOW_REQUEST_FACTOR:
+            self._decrease()
+            return
+
+        self._healthy_streak += 1
+        if self._healthy_streak >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self._healthy_streak = 0
+
+    def wait(self) -> None:
+        if self.backoff_sec:
+            time.sleep(self.backoff_sec)
+
+    def on_error(self) -> None:
+        self.backoff_sec = min(
+            max(self.backoff_sec * 2, _MIN_BACKOFF_SEC), _MAX_BACKOFF_SEC
+        )
+        self._completions_until_next_decrease -= 1
+        self._decrease()
+
+    def _decrease(self) -> None:
+        self._healthy_streak = 0
+        if self._completions_until_next_decrease <= 0:
+            self.limit = max(self.limit // 2, 1)
+            self._completions_until_next_decrease = self.limit
+
+
+class _DeleteCheckpoint:
+    """An append-only log of the urns that have been deleted.
+
+    If a mass delete is interrupted, re-running it with the same checkpoint file
+    skips the urns that were already deleted.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self._done = {line.strip() for line in f if line.strip()}
+        self._file = open(path, "a")
+
+    @property
+    def num_done(self) -> int:
+        return len(self._done)
+
+    def is_done(self, urn: str) -> bool:
+        return urn in self._done
+
+    def mark_done(self, urns: List[str]) -> None:
+        self._file.writelines(f"{urn}\n" for urn in urns)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclass
+class _UrnSummary:
+    num_urns: int = 0
+    num_urns_by_type: Dict[str, int] = field(default_factory=dict)
+    samples_by_type: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _summarize_urns(urns: Iterable[str], sample_size: int = 5) -> _UrnSummary:
+    # Counts the urns and picks a random sample of each type, without holding
+    # all of the urns in memory.
+    summary = _UrnSummary()
+    for urn in urns:
+        entity_type = guess_entity_type(urn)
+        summary.num_urns += 1
+        seen = summary.num_urns_by_type.get(entity_type, 0) + 1
+        summary.num_urns_by_type[entity_type] = seen
+
+        samples = summary.samples_by_type.setdefault(entity_type, [])
+        if len(samples) < sample_size:
+            samples.append(urn)
+        else:
+            # Reservoir sampling.
+            i = random.randrange(seen)
+            if i < sample_size:
+                samples[i] = urn
+    return summary
+
+
+def _soft_delete_urns(
     graph: DataHubGraph,
     urns: List[str],
+    run_id: str = "__datahub-delete-cli",
+) -> DeletionResult:
+    deletion_timestamp = int(time.time() * 1000)
+    graph.emit_mcps(
+        [
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=StatusClass(removed=True),
+                systemMetadata=SystemMetadataClass(
+                    runId=run_id, lastObserved=deletion_timestamp
+                ),
+            )
+            for urn in urns
+        ]
+    )
+    return DeletionResult(num_entities=len(urns), num_records=len(urns))
+
+
+def _delete_urns(
+    graph: DataHubGraph,
+    urns: Iterable[str],
     delete_by_urn: bool,
     start_time: Optional[datetime],
     end_time: Optional[datetime],
@@ -506,13 +681,28 @@ def _delete_urns_parallel(
     soft: bool = True,
     dry_run: bool = False,
     workers: int = 1,
-) -> None:
+    num_urns: Optional[int] = None,
+    checkpoint: Optional[_DeleteCheckpoint] = None,
+    soft_delete_batch_size: int = _SOFT_DELETE_BATCH_SIZE,
+) -> DeletionResult:
+    """Deletes the urns as they're produced by the iterable.
+
+    At most `workers` requests are in flight at a time, so that the urns are read
+    lazily and memory usage stays bounded. Soft deletes are emitted in batches.
+    """
+
     deletion_result = DeletionResult()
+    num_failed = 0
+    limiter = _AdaptiveConcurrencyLimiter(workers)
+
+    def process_batch(batch: List[str]) -> DeletionResult:
+        if soft and not dry_run:
+            return _soft_delete_urns(graph, batch)
 
-    def process_urn(urn):
+        assert len(batch) == 1
         return _delete_one_urn(
             graph=graph,
-            urn=urn,
+            urn=batch[0],
             aspect_name=aspect_name,
             soft=soft,
             dry_run=dry_run,
@@ -520,32 +710,84 @@ def _delete_urns_parallel(
             end_time=end_time,
         )
 
+    def _gen_batches() -> Iterator[List[str]]:
+        batch_size = soft_delete_batch_size if soft and not dry_run else 1
+        urns_iter = iter(urns)
+        if checkpoint:
+            urns_iter = (urn for urn in urns_iter if not checkpoint.is_done(urn))
+        while True:
+            batch = list(itertools.islice(urns_iter, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    batches = _gen_batches()
+
+    progress: Optional[progressbar.ProgressBar] = None
+    if not delete_by_urn and not dry_run:
+        progress = progressbar.ProgressBar(
+            max_value=num_urns if num_urns is not None else progressbar.UnknownLength,
+            redirect_stdout=True,
+        )
+    num_processed = 0
+
     with PerfTimer() as timer, ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_urn = {executor.submit(process_urn, urn): urn for urn in urns}
-
-        completed_futures = as_completed(future_to_urn)
-        if not delete_by_urn and not dry_run:
-            futures_iter = progressbar.progressbar(
-                as_completed(future_to_urn),
-                max_value=len(future_to_urn),
-                redirect_stdout=True,
-            )
-        else:
-            futures_iter = completed_futures
+        in_flight: Dict[Future, Tuple[List[str], float]] = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < limiter.limit:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                    break
+                limiter.wait()
+                in_flight[executor.submit(process_batch, batch)] = (
+                    batch,
+                    time.perf_counter(),
+                )
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch, submitted_at = in_flight.pop(future)
+                try:
+                    one_result = future.result()
+                except Exception as e:
+                    limiter.on_error()
+                    num_failed += len(batch)
+                    batch_desc = (
+                        batch[0]
+                        if len(batch) == 1
+                        else f"{batch[0]} and {len(batch) - 1} others"
+                    )
+                    click.secho(f"Error processing URN {batch_desc}: {e}", fg="red")
+                else:
+                    limiter.on_success(time.perf_counter() - submitted_at)
+                    deletion_result.merge(one_result)
+                    if checkpoint and not dry_run:
+                        checkpoint.mark_done(batch)
 
-        for future in futures_iter:
-            try:
-                one_result = future.result()
-                deletion_result.merge(one_result)
-            except Exception as e:
-                urn = future_to_urn[future]
-                click.secho(f"Error processing URN {urn}: {e}", fg="red")
+                num_processed += len(batch)
+                if progress is not None:
+                    progress.update(num_processed)
+
+    if progress is not None:
+        progress.finish()
 
     click.echo(
         deletion_result.format_message(
             dry_run=dry_run, soft=soft, time_sec=timer.elapsed_seconds()
         )
     )
+    if num_failed:
+        message = f"Failed to delete {num_failed} entities."
+        if checkpoint:
+            message += (
+                f" Re-run with --checkpoint-file {checkpoint.path} to retry them."
+            )
+        click.secho(message, fg="red")
+    return deletion_result
 
 
 def _validate_user_urn_and_filters(
@@ -23,7 +23,9 @@ _ENTITY_TYPE_UNSET = "ENTITY_TYPE_UNSET"
 
 
 def _make_generic_aspect(codegen_obj: DictWrapper) -> GenericAspectClass:
-    serialized = json.dumps(pre_json_transform(codegen_obj.to_obj()))
+    serialized = json.dumps(
+        pre_json_transform(codegen_obj.to_obj(), codegen_obj.RECORD_SCHEMA)
+    )
     return GenericAspectClass(
         value=serialized.encode(),
         contentType=JSON_CONTENT_TYPE,
@@ -50,7 +52,7 @@ def _try_from_generic_aspect(
     aspect_cls = ASPECT_MAP[aspectName]
 
     serialized = aspect.value.decode()
-    obj = post_json_transform(json.loads(serialized))
+    obj = post_json_transform(json.loads(serialized), aspect_cls.RECORD_SCHEMA)
 
     return True, aspect_cls.from_obj(obj)
 
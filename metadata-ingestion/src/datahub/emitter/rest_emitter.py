@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import gzip
 import json
 import logging
 import os
@@ -45,6 +46,11 @@ from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
 if TYPE_CHECKING:
     from datahub.ingestion.graph.client import DataHubGraph
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT_SEC = 30  # 30 seconds should be plenty to connect
@@ -63,6 +69,12 @@ _DEFAULT_RETRY_MAX_TIMES = int(
 
 _DATAHUB_EMITTER_TRACE = get_boolean_env_variable("DATAHUB_EMITTER_TRACE", False)
 
+_DEFAULT_GZIP_REQUESTS = get_boolean_env_variable(
+    "DATAHUB_REST_EMITTER_GZIP_REQUESTS", False
+)
+# Favor speed over compression ratio, since this runs on the sink threads.
+_GZIP_COMPRESS_LEVEL = 1
+
 # The limit is 16mb. We will use a max of 15mb to have some space
 # for overhead like request headers.
 # This applies to pretty much all calls to GMS.
@@ -77,6 +89,27 @@ BATCH_INGEST_MAX_PAYLOAD_LENGTH = int(
 )
 
 
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter than the stdlib, e.g. for ints beyond 64 bits.
+            pass
+    return json.dumps(obj).encode()
+
+
+def _make_batch_payload(
+    encoded_mcps: Sequence[bytes], async_flag: Optional[bool]
+) -> bytes:
+    # Assembles the ingestProposalBatch request body from MCPs that have
+    # already been serialized, so that each MCP only gets serialized once.
+    payload = b'{"proposals": [' + b", ".join(encoded_mcps) + b"]"
+    if async_flag is not None:
+        payload += b', "async": "true"' if async_flag else b', "async": "false"'
+    return payload + b"}"
+
+
 class RequestsSessionConfig(ConfigModel):
     timeout: Union[float, Tuple[float, float], None] = _DEFAULT_TIMEOUT_SEC
 
@@ -162,6 +195,7 @@ class DataHubRestEmitter(Closeable, Emitter):
         ca_certificate_path: Optional[str] = None,
         client_certificate_path: Optional[str] = None,
         disable_ssl_verification: bool = False,
+        gzip_requests: Optional[bool] = None,
     ):
         if not gms_server:
             raise ConfigurationError("gms server is required")
@@ -173,6 +207,7 @@ class DataHubRestEmitter(Closeable, Emitter):
 
         self._gms_server = fixup_gms_url(gms_server)
         self._token = token
+        self._gzip_requests = get_or_else(gzip_requests, _DEFAULT_GZIP_REQUESTS)
         self.server_config: Dict[str, Any] = {}
 
         self._session = requests.Session()
@@ -296,7 +331,7 @@ class DataHubRestEmitter(Closeable, Emitter):
         url = f"{self._gms_server}/entities?action=ingest"
 
         raw_mce_obj = mce.proposedSnapshot.to_obj()
-        mce_obj = pre_json_transform(raw_mce_obj)
+        mce_obj = pre_json_transform(raw_mce_obj, mce.proposedSnapshot.RECORD_SCHEMA)
         snapshot_fqn = (
             f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
         )
@@ -308,7 +343,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             "entity": {"value": {snapshot_fqn: mce_obj}},
             "systemMetadata": system_metadata_obj,
         }
-        payload = json.dumps(snapshot)
+        payload = _json_dumps_bytes(snapshot)
 
         self._emit_generic(url, payload)
 
@@ -326,7 +361,7 @@ class DataHubRestEmitter(Closeable, Emitter):
         if async_flag is not None:
             payload_dict["async"] = "true" if async_flag else "false"
 
-        payload = json.dumps(payload_dict)
+        payload = _json_dumps_bytes(payload_dict)
 
         self._emit_generic(url, payload)
 
@@ -341,17 +376,21 @@ class DataHubRestEmitter(Closeable, Emitter):
         for mcp in mcps:
             ensure_has_system_metadata(mcp)
 
-        mcp_objs = [pre_json_transform(mcp.to_obj()) for mcp in mcps]
+        # Each MCP is serialized exactly once. The encoded bytes are used both to
+        # compute the chunk sizes and to assemble the request bodies.
+        encoded_mcps = [
+            _json_dumps_bytes(pre_json_transform(mcp.to_obj())) for mcp in mcps
+        ]
 
         # As a safety mechanism, we need to make sure we don't exceed the max payload size for GMS.
         # If we will exceed the limit, we need to break it up into chunks.
-        mcp_obj_chunks: List[List[str]] = []
+        mcp_obj_chunks: List[List[bytes]] = []
         current_chunk_size = INGEST_MAX_PAYLOAD_BYTES
-        for mcp_obj in mcp_objs:
-            mcp_obj_size = len(json.dumps(mcp_obj))
+        for mcp, encoded_mcp in zip(mcps, encoded_mcps):
+            mcp_obj_size = len(encoded_mcp)
             if _DATAHUB_EMITTER_TRACE:
                 logger.debug(
-                    f"Iterating through object with size {mcp_obj_size} (type: {mcp_obj.get('aspectName')}"
+                    f"Iterating through object with size {mcp_obj_size} (type: {mcp.aspectName}"
                 )
 
             if (
@@ -362,7 +401,7 @@ class DataHubRestEmitter(Closeable, Emitter):
                     logger.debug("Decided to create new chunk")
                 mcp_obj_chunks.append([])
                 current_chunk_size = 0
-            mcp_obj_chunks[-1].append(mcp_obj)
+            mcp_obj_chunks[-1].append(encoded_mcp)
             current_chunk_size += mcp_obj_size
         if len(mcp_obj_chunks) > 0:
             logger.debug(
@@ -370,13 +409,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             )
 
         for mcp_obj_chunk in mcp_obj_chunks:
-            # TODO: We're calling json.dumps on each MCP object twice, once to estimate
-            # the size when chunking, and again for the actual request.
-            payload_dict: dict = {"proposals": mcp_obj_chunk}
-            if async_flag is not None:
-                payload_dict["async"] = "true" if async_flag else "false"
-
-            payload = json.dumps(payload_dict)
+            payload = _make_batch_payload(mcp_obj_chunk, async_flag)
             self._emit_generic(url, payload)
 
         return len(mcp_obj_chunks)
@@ -389,24 +422,35 @@ class DataHubRestEmitter(Closeable, Emitter):
         usage_obj = pre_json_transform(raw_usage_obj)
 
         snapshot = {"buckets": [usage_obj]}
-        payload = json.dumps(snapshot)
+        payload = _json_dumps_bytes(snapshot)
         self._emit_generic(url, payload)
 
-    def _emit_generic(self, url: str, payload: str) -> None:
-        curl_command = make_curl_command(self._session, "POST", url, payload)
+    def _emit_generic(self, url: str, payload: Union[str, bytes]) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode()
         payload_size = len(payload)
         if payload_size > INGEST_MAX_PAYLOAD_BYTES:
             # since we know total payload size here, we could simply avoid sending such payload at all and report a warning, with current approach we are going to cause whole ingestion to fail
             logger.warning(
                 f"Apparent payload size exceeded {INGEST_MAX_PAYLOAD_BYTES}, might fail with an exception due to the size"
             )
-        logger.debug(
-            "Attempting to emit aspect (size: %s) to DataHub GMS; using curl equivalent to:\n%s",
-            payload_size,
-            curl_command,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Building the curl command is expensive for large payloads.
+            curl_command = make_curl_command(
+                self._session, "POST", url, payload.decode()
+            )
+            logger.debug(
+                "Attempting to emit aspect (size: %s) to DataHub GMS; using curl equivalent to:\n%s",
+                payload_size,
+                curl_command,
+            )
+
+        headers = None
+        if self._gzip_requests:
+            payload = gzip.compress(payload, compresslevel=_GZIP_COMPRESS_LEVEL)
+            headers = {"Content-Encoding": "gzip"}
         try:
-            response = self._session.post(url, data=payload)
+            response = self._session.post(url, data=payload, headers=headers)
             response.raise_for_status()
         except HTTPError as e:
             try:
@@ -1,5 +1,11 @@
+import functools
 from collections import OrderedDict
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import avro.schema
+
+_PEGASUS2AVRO_PREFIX = "com.linkedin.pegasus2avro."
+_LINKEDIN_PREFIX = "com.linkedin."
 
 
 def _pre_handle_union_with_aliases(
@@ -93,21 +99,261 @@ def _json_transform(obj: Any, from_pattern: str, to_pattern: str, pre: bool) ->
     return obj
 
 
-def pre_json_transform(obj: Any) -> Any:
-    """Usually called before sending avro-serialized json over to the rest.li server"""
+_Transform = Callable[[Any], Any]
+
+
+class _SchemaTransformCompiler:
+    """Compiles a json transform that is specialized for a given avro schema.
+
+    The generic `_json_transform` inspects every dict and list in the object to
+    figure out whether it is a union that needs its member name rewritten. Since
+    we know the schema up front, we can precompute where the unions are and what
+    their member names map to, and pass primitive values through untouched.
+
+    Whenever the data doesn't look like what the schema describes (e.g. extra
+    fields in a response from the server), that subtree is handed to the generic
+    transform, so the output is the same either way.
+    """
+
+    def __init__(self, from_pattern: str, to_pattern: str, pre: bool):
+        self.from_pattern = from_pattern
+        self.to_pattern = to_pattern
+        self.pre = pre
+
+        self.fallback: _Transform = functools.partial(
+            _json_transform, from_pattern=from_pattern, to_pattern=to_pattern, pre=pre
+        )
+        self._records: Dict[str, _Transform] = {}
+
+    def compile(self, schema: avro.schema.Schema) -> Optional[_Transform]:
+        # Returns None if values of this schema can be passed through as-is.
+
+        if isinstance(schema, avro.schema.RecordSchema):
+            name = schema.fullname
+            if name not in self._records:
+                # Records can refer back to themselves, so we register a
+                # placeholder before compiling the record's fields.
+                compiled: List[_Transform] = []
+                self._records[name] = lambda obj: compiled[0](obj)
+                compiled.append(self._compile_record(schema))
+                self._records[name] = compiled[0]
+            return self._records[name]
+        elif isinstance(schema, avro.schema.UnionSchema):
+            return self._compile_union(schema)
+        elif isinstance(schema, avro.schema.ArraySchema):
+            return self._compile_array(schema)
+        elif isinstance(schema, avro.schema.MapSchema):
+            return self._compile_map(schema)
+        elif schema.type in {"bytes", "fixed"}:
+            return _decode_bytes
+        return None
+
+    def _compile_record(self, schema: avro.schema.RecordSchema) -> _Transform:
+        fallback = self.fallback
+        from_pattern = self.from_pattern
+
+        if _has_union_with_aliases(schema):
+            # The special handling for unions with aliases is shape-based and
+            # looks at both the union and its parent, so we leave it alone.
+            return fallback
+
+        field_transforms: Dict[str, _Transform] = {}
+        passthrough_fields = set()
+        for field in schema.fields:
+            transform = self.compile(field.type)
+            if transform is None:
+                passthrough_fields.add(field.name)
+            else:
+                field_transforms[field.name] = transform
+
+        def transform_record(obj: Any) -> Any:
+            if not isinstance(obj, dict):
+                return fallback(obj)
+            if len(obj) == 1 and next(iter(obj)).startswith(from_pattern):
+                return fallback(obj)
+
+            return {
+                key: value
+                if key in passthrough_fields
+                else field_transforms.get(key, fallback)(value)
+                for key, value in obj.items()
+                if value is not None
+            }
+
+        return transform_record
+
+    def _compile_union(self, schema: avro.schema.UnionSchema) -> Optional[_Transform]:
+        fallback = self.fallback
+
+        # Maps the member name as it appears in the input to the member name
+        # in the output and the transform for the member's value.
+        members: Dict[str, Tuple[str, Optional[_Transform]]] = {}
+        member_transforms: List[Optional[_Transform]] = []
+        for member in schema.schemas:
+            if member.type == "null":
+                continue
+            transform = self.compile(member)
+            member_transforms.append(transform)
+
+            # This matches how avrogen names union members.
+            avro_name = (
+                member.fullname
+                if isinstance(member, avro.schema.NamedSchema)
+                else member.type
+            )
+            if self.pre:
+                in_name = avro_name
+            else:
+                in_name = _replace_prefix(avro_name, self.to_pattern, self.from_pattern)
+            members[in_name] = (
+                _replace_prefix(in_name, self.from_pattern, self.to_pattern),
+                transform,
+            )
+
+        if all(transform is None for transform in member_transforms) and not any(
+            name != new_name for name, (new_name, _) in members.items()
+        ):
+            # e.g. Union[None, str], which never needs changes.
+            return None
+
+        # Unambiguous unions are serialized without the member name wrapper.
+        unwrapped_transform = (
+            member_transforms[0] if len(member_transforms) == 1 else fallback
+        )
+
+        def transform_union(obj: Any) -> Any:
+            if isinstance(obj, dict) and len(obj) == 1:
+                ((key, value),) = obj.items()
+                member = members.get(key)
+                if member is not None:
+                    new_key, transform = member
+                    if value is not None and transform is not None:
+                        value = transform(value)
+                    return {new_key: value}
+            if obj is None or unwrapped_transform is None:
+                return obj
+            return unwrapped_transform(obj)
+
+        return transform_union
+
+    def _compile_array(self, schema: avro.schema.ArraySchema) -> _Transform:
+        fallback = self.fallback
+        item_transform = self.compile(schema.items)
+
+        def transform_array(obj: Any) -> Any:
+            if not isinstance(obj, list):
+                return fallback(obj)
+            if item_transform is None:
+                return list(obj)
+            return [None if item is None else item_transform(item) for item in obj]
+
+        return transform_array
+
+    def _compile_map(self, schema: avro.schema.MapSchema) -> _Transform:
+        fallback = self.fallback
+        from_pattern = self.from_pattern
+        value_transform = self.compile(schema.values)
+
+        def transform_map(obj: Any) -> Any:
+            if not isinstance(obj, dict):
+                return fallback(obj)
+            if len(obj) == 1 and next(iter(obj)).startswith(from_pattern):
+                return fallback(obj)
+
+            if value_transform is None:
+                return {key: value for key, value in obj.items() if value is not None}
+            return {
+                key: value_transform(value)
+                for key, value in obj.items()
+                if value is not None
+            }
+
+        return transform_map
+
+
+def _has_union_with_aliases(schema: avro.schema.RecordSchema) -> bool:
+    if "fieldDiscriminator" in schema.fields_dict:
+        return True
+
+    for field in schema.fields:
+        field_schemas = (
+            field.type.schemas
+            if isinstance(field.type, avro.schema.UnionSchema)
+            else [field.type]
+        )
+        for field_schema in field_schemas:
+            if (
+                isinstance(field_schema, avro.schema.RecordSchema)
+                and "fieldDiscriminator" in field_schema.fields_dict
+            ):
+                return True
+    return False
+
+
+def _decode_bytes(obj: Any) -> Any:
+    if isinstance(obj, bytes):
+        return obj.decode()
+    return obj
+
+
+def _replace_prefix(name: str, from_pattern: str, to_pattern: str) -> str:
+    if name.startswith(from_pattern):
+        return name.replace(from_pattern, to_pattern, 1)
+    return name
+
+
+# Avro schemas aren't hashable, so we key the compiled transforms by full name.
+_compiled_transforms: Dict[Tuple[str, bool], _Transform] = {}
+
+
+def _get_schema_transform(schema: avro.schema.RecordSchema, pre: bool) -> _Transform:
+    key = (schema.fullname, pre)
+    if key not in _compiled_transforms:
+        if pre:
+            compiler = _SchemaTransformCompiler(
+                from_pattern=_PEGASUS2AVRO_PREFIX, to_pattern=_LINKEDIN_PREFIX, pre=True
+            )
+        else:
+            compiler = _SchemaTransformCompiler(
+                from_pattern=_LINKEDIN_PREFIX,
+                to_pattern=_PEGASUS2AVRO_PREFIX,
+                pre=False,
+            )
+        _compiled_transforms[key] = compiler.compile(schema) or compiler.fallback
+    return _compiled_transforms[key]
+
+
+def pre_json_transform(
+    obj: Any, schema: Optional[avro.schema.RecordSchema] = None
+) -> Any:
+    """Usually called before sending avro-serialized json over to the rest.li server
+
+    If the avro schema of `obj` is known (e.g. `DatasetPropertiesClass.RECORD_SCHEMA`),
+    passing it in will use a transform that is precompiled for that schema, which is
+    much faster than walking the entire object.
+    """
+    if schema is not None:
+        return _get_schema_transform(schema, pre=True)(obj)
     return _json_transform(
         obj,
-        from_pattern="com.linkedin.pegasus2avro.",
-        to_pattern="com.linkedin.",
+        from_pattern=_PEGASUS2AVRO_PREFIX,
+        to_pattern=_LINKEDIN_PREFIX,
         pre=True,
     )
 
 
-def post_json_transform(obj: Any) -> Any:
-    """Usually called after receiving restli-serialized json before instantiating into avro-generated Python classes"""
+def post_json_transform(
+    obj: Any, schema: Optional[avro.schema.RecordSchema] = None
+) -> Any:
+    """Usually called after receiving restli-serialized json before instantiating into avro-generated Python classes
+
+    Accepts an optional `schema`, with the same semantics as `pre_json_transform`.
+    """
+    if schema is not None:
+        return _get_schema_transform(schema, pre=False)(obj)
     return _json_transform(
         obj,
-        from_pattern="com.linkedin.",
-        to_pattern="com.linkedin.pegasus2avro.",
+        from_pattern=_LINKEDIN_PREFIX,
+        to_pattern=_PEGASUS2AVRO_PREFIX,
         pre=False,
     )
@@ -66,7 +66,9 @@ class EnsureAspectSizeProcessor:
         logger.debug(f"Amount of schema fields: {len(schema.fields)}")
         accepted_fields: List[SchemaFieldClass] = []
         for field in schema.fields:
-            field_size = len(json.dumps(pre_json_transform(field.to_obj())))
+            field_size = len(
+                json.dumps(pre_json_transform(field.to_obj(), field.RECORD_SCHEMA))
+            )
             logger.debug(f"Field {field.fieldPath} takes total {field_size}")
             if total_fields_size + field_size < self.payload_constraint:
                 accepted_fields.append(field)
@@ -8,6 +8,7 @@ from datahub.ingestion.api.committable import Committable
 from datahub.ingestion.graph.client import DataHubGraph
 
 if TYPE_CHECKING:
+    from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
     from datahub.ingestion.run.pipeline import PipelineConfig
 
 T = TypeVar("T")
@@ -58,6 +59,10 @@ class PipelineContext:
         self.preview_mode = preview_mode
         self.checkpointers: Dict[str, Committable] = {}
 
+        # Set up by the pipeline when server aspect prefetching is enabled.
+        # Transformers should use this instead of the graph when it's set.
+        self.server_aspect_cache: Optional["ServerAspectCache"] = None
+
         self._set_dataset_urn_to_lower_if_needed()
 
     def _set_dataset_urn_to_lower_if_needed(self) -> None:
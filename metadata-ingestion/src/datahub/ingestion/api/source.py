@@ -1,6 +1,7 @@
 import contextlib
 import datetime
 import logging
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -15,7 +16,6 @@ from typing import (
     List,
     Optional,
     Sequence,
-    Set,
     Type,
     TypeVar,
     Union,
@@ -27,7 +27,6 @@ from typing_extensions import LiteralString, Self
 
 from datahub.configuration.common import ConfigModel
 from datahub.configuration.source_common import PlatformInstanceConfigMixin
-from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.ingestion.api.auto_work_units.auto_dataset_properties_aspect import (
     auto_patch_last_modified,
 )
@@ -49,8 +48,10 @@ from datahub.ingestion.api.source_helpers import (
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.schema_classes import UpstreamLineageClass
+from datahub.utilities.fingerprint_set import FingerprintSet
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 from datahub.utilities.type_annotations import get_class_from_annotation
+from datahub.utilities.urns.urn import guess_entity_type
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,8 @@ class StructuredLogs(Report):
             StructuredLogLevel.INFO: LossyDict(10),
         }
     )
+    # Sources may report from worker threads.
+    _lock: threading.Lock = field(default_factory=threading.Lock)
 
     def report_log(
         self,
@@ -151,25 +154,27 @@ class StructuredLogs(Report):
         elif log:
             logger.log(level=level.value, msg=log_content, stacklevel=stacklevel)
 
-        if log_key not in entries:
-            context_list: LossyList[str] = LossyList()
-            if context is not None:
-                context_list.append(context)
-            entries[log_key] = StructuredLogEntry(
-                title=title,
-                message=message,
-                context=context_list,
-            )
-        else:
-            if context is not None:
-                entries[log_key].context.append(context)
+        with self._lock:
+            if log_key not in entries:
+                context_list: LossyList[str] = LossyList()
+                if context is not None:
+                    context_list.append(context)
+                entries[log_key] = StructuredLogEntry(
+                    title=title,
+                    message=message,
+                    context=context_list,
+                )
+            else:
+                if context is not None:
+                    entries[log_key].context.append(context)
 
     def _get_of_type(self, level: StructuredLogLevel) -> LossyList[StructuredLogEntry]:
         entries = self._entries[level]
         result: LossyList[StructuredLogEntry] = LossyList()
-        for log in entries.values():
-            result.append(log)
-        result.set_total(entries.total_key_count())
+        with self._lock:
+            for log in entries.values():
+                result.append(log)
+            result.set_total(entries.total_key_count())
         return result
 
     @property
@@ -191,7 +196,9 @@ class SourceReport(Report):
     events_produced: int = 0
     events_produced_per_sec: int = 0
 
-    _urns_seen: Set[str] = field(default_factory=set)
+    # Only used to dedup the entities samples. This holds hashes of the urns
+    # instead of the urns themselves, and has a fixed memory cap.
+    _urns_seen: FingerprintSet = field(default_factory=FingerprintSet)
     entities: Dict[str, list] = field(default_factory=lambda: defaultdict(LossyList))
     aspects: Dict[str, Dict[str, int]] = field(
         default_factory=lambda: defaultdict(lambda: defaultdict(int))
@@ -222,24 +229,26 @@ class SourceReport(Report):
 
             # Specialized entity reporting.
             if not isinstance(wu.metadata, MetadataChangeEvent):
-                mcps = [wu.metadata]
+                entityType = wu.metadata.entityType
+                aspects = [(wu.metadata.aspectName, wu.metadata.aspect)]
             else:
-                mcps = list(mcps_from_mce(wu.metadata))
-
-            for mcp in mcps:
-                entityType = mcp.entityType
-                aspectName = mcp.aspectName
-
-                if urn not in self._urns_seen:
-                    self._urns_seen.add(urn)
-                    self.entities[entityType].append(urn)
-
+                # This is equivalent to going through mcps_from_mce, but avoids
+                # building the MCPs just to count their aspects.
+                entityType = guess_entity_type(urn)
+                aspects = [
+                    (aspect.get_aspect_name(), aspect)
+                    for aspect in wu.metadata.proposedSnapshot.aspects
+                ]
+
+            if aspects and self._urns_seen.add(urn):
+                self.entities[entityType].append(urn)
+
+            for aspectName, aspect in aspects:
                 if aspectName is not None:  # usually true
                     self.aspects[entityType][aspectName] += 1
                     self.aspect_urn_samples[entityType][aspectName].append(urn)
-                    if isinstance(mcp.aspect, UpstreamLineageClass):
-                        upstream_lineage = cast(UpstreamLineageClass, mcp.aspect)
-                        if upstream_lineage.fineGrainedLineages:
+                    if isinstance(aspect, UpstreamLineageClass):
+                        if aspect.fineGrainedLineages:
                             self.aspect_urn_samples[entityType][
                                 "fineGrainedLineages"
                             ].append(urn)
@@ -139,6 +139,7 @@ class DataHubGraph(DatahubRestEmitter):
             ca_certificate_path=self.config.ca_certificate_path,
             client_certificate_path=self.config.client_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            gzip_requests=self.config.gzip_requests,
         )
 
         self.server_id = _MISSING_SERVER_ID
@@ -197,6 +198,7 @@ class DataHubGraph(DatahubRestEmitter):
                 disable_ssl_verification=session_config.disable_ssl_verification,
                 ca_certificate_path=session_config.ca_certificate_path,
                 client_certificate_path=session_config.client_certificate_path,
+                gzip_requests=emitter._gzip_requests,
             )
         )
 
@@ -313,7 +315,7 @@ class DataHubGraph(DatahubRestEmitter):
         aspect_json = response_json.get("aspect", {}).get(aspect_type_name)
         if aspect_json is not None:
             # need to apply a transform to the response to match rest.li and avro serialization
-            post_json_obj = post_json_transform(aspect_json)
+            post_json_obj = post_json_transform(aspect_json, record_schema)
             return aspect_type.from_obj(post_json_obj)
         else:
             raise GraphError(
@@ -1122,6 +1124,12 @@ class DataHubGraph(DatahubRestEmitter):
     def get_latest_pipeline_checkpoint(
         self, pipeline_name: str, platform: str
     ) -> Optional[Checkpoint["GenericCheckpointState"]]:
+        from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
+            JobId,
+        )
+        from datahub.ingestion.source.state.checkpoint import (
+            get_checkpoint_shard_job_name,
+        )
         from datahub.ingestion.source.state.entity_removal_state import (
             GenericCheckpointState,
         )
@@ -1145,6 +1153,9 @@ class DataHubGraph(DatahubRestEmitter):
             job_name=job_name,
             checkpoint_aspect=raw_checkpoint,
             state_class=GenericCheckpointState,
+            shard_loader=lambda shard: checkpoint_provider.get_latest_checkpoint(
+                pipeline_name, JobId(get_checkpoint_shard_job_name(job_name, shard))
+            ),
         )
 
     def get_search_results(
@@ -17,3 +17,5 @@ class DatahubClientConfig(ConfigModel):
     ca_certificate_path: Optional[str] = None
     client_certificate_path: Optional[str] = None
     disable_ssl_verification: bool = False
+    # If unset, falls back to the DATAHUB_REST_EMITTER_GZIP_REQUESTS env variable.
+    gzip_requests: Optional[bool] = None
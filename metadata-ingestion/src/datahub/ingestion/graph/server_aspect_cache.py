@@ -0,0 +1,192 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from datahub.emitter.aspect import TIMESERIES_ASPECT_MAP
+from datahub.emitter.mce_builder import Aspect
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import post_json_transform
+from datahub.ingestion.api.report import Report
+from datahub.ingestion.graph.client import DataHubGraph
+from datahub.metadata.schema_classes import (
+    ChangeTypeClass,
+    MetadataChangeEventClass,
+    MetadataChangeProposalClass,
+    _Aspect,
+)
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.urns.urn import guess_entity_type
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 100
+
+
+@dataclass
+class ServerAspectCacheReport(Report):
+    hits: int = 0
+    misses: int = 0
+    hit_rate: Optional[float] = None
+
+    num_prefetch_requests: int = 0
+    num_prefetch_failures: int = 0
+    num_aspects_prefetched: int = 0
+    prefetch_timer: PerfTimer = field(default_factory=PerfTimer)
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        if self.hits or self.misses:
+            self.hit_rate = round(self.hits / (self.hits + self.misses), 4)
+
+
+class ServerAspectCache:
+    """Serves reads of server-side aspects for a window of upcoming entities.
+
+    Transformers with PATCH semantics need the server's current version of the
+    aspects they modify. Instead of fetching those one entity at a time, the
+    pipeline calls `set_window` with the urns of the next batch of workunits, and
+    this fetches the relevant aspects for all of them with a few bulk requests.
+
+    The cache learns which aspects to prefetch from the lookups it serves. The
+    first lookup of a new aspect for an entity type fetches it for the rest of the
+    current window, and later windows prefetch it up front. Entries only live
+    until the next window, which bounds the memory usage and keeps values from
+    going stale while the pipeline writes its own changes to the server. Within a
+    window, the pipeline reports the aspects it emits via `update_from_record`, so
+    that a second patch to the same entity builds on the first one.
+
+    This is not thread-safe, and should only be used from the thread that runs
+    the transformers.
+    """
+
+    def __init__(
+        self,
+        graph: DataHubGraph,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        report: Optional[ServerAspectCacheReport] = None,
+    ):
+        self.graph = graph
+        self.batch_size = batch_size
+        self.report = report or ServerAspectCacheReport()
+
+        # entity type -> urns in the current window
+        self._window: Dict[str, List[str]] = {}
+        # entity type -> aspect name -> aspect class
+        self._aspect_types: Dict[str, Dict[str, Type[_Aspect]]] = defaultdict(dict)
+        # (urn, aspect name) -> serialized aspect, or None if the aspect doesn't exist.
+        # We store the serialized form so that each lookup returns a fresh object,
+        # since transformers may modify the aspects they get back.
+        self._cache: Dict[Tuple[str, str], Optional[dict]] = {}
+
+    def set_window(self, urns: Iterable[str]) -> None:
+        """Replaces the current window, and prefetches the known aspects for it."""
+
+        self._cache.clear()
+
+        window: Dict[str, Dict[str, None]] = defaultdict(dict)
+        for urn in urns:
+            window[guess_entity_type(urn)][urn] = None
+        self._window = {
+            entity_type: list(entity_urns)
+            for entity_type, entity_urns in window.items()
+        }
+
+        for entity_type, entity_urns in self._window.items():
+            aspect_types = list(self._aspect_types[entity_type].values())
+            if aspect_types:
+                self._prefetch(entity_type, entity_urns, aspect_types)
+
+    def get_aspect(
+        self, entity_urn: str, aspect_type: Type[Aspect]
+    ) -> Optional[Aspect]:
+        """A drop-in replacement for `DataHubGraph.get_aspect` for the latest version."""
+
+        aspect_name = aspect_type.ASPECT_NAME
+        key = (entity_urn, aspect_name)
+        if key in self._cache:
+            self.report.hits += 1
+            return self._deserialize(aspect_type, self._cache[key])
+
+        self.report.misses += 1
+        entity_type = guess_entity_type(entity_urn)
+        known_aspect_types = self._aspect_types[entity_type]
+        if aspect_name not in known_aspect_types and (
+            aspect_name not in TIMESERIES_ASPECT_MAP
+        ):
+            known_aspect_types[aspect_name] = aspect_type
+            window_urns = self._window.get(entity_type, [])
+            if entity_urn in window_urns:
+                self._prefetch(entity_type, window_urns, [aspect_type])
+                if key in self._cache:
+                    return self._deserialize(aspect_type, self._cache[key])
+
+        aspect = self.graph.get_aspect(entity_urn, aspect_type)
+        self._cache[key] = aspect.to_obj() if aspect is not None else None
+        return aspect
+
+    def update_from_record(self, record: Any) -> None:
+        """Updates the cache with an aspect that the pipeline is writing to the server."""
+
+        if isinstance(record, MetadataChangeEventClass):
+            for aspect in record.proposedSnapshot.aspects:
+                self._update(record.proposedSnapshot.urn, aspect.ASPECT_NAME, aspect)
+        elif isinstance(record, MetadataChangeProposalWrapper):
+            if record.entityUrn is None:
+                return
+            if (
+                record.aspect is not None
+                and record.changeType == ChangeTypeClass.UPSERT
+            ):
+                self._update(record.entityUrn, record.aspect.ASPECT_NAME, record.aspect)
+            elif record.aspectName is not None:
+                # We can't apply patches here, so the next lookup has to refetch.
+                self._cache.pop((record.entityUrn, record.aspectName), None)
+        elif isinstance(record, MetadataChangeProposalClass):
+            if record.entityUrn is not None and record.aspectName is not None:
+                self._cache.pop((record.entityUrn, record.aspectName), None)
+
+    def _update(self, entity_urn: str, aspect_name: str, aspect: _Aspect) -> None:
+        if aspect_name not in TIMESERIES_ASPECT_MAP:
+            self._cache[(entity_urn, aspect_name)] = aspect.to_obj()
+
+    @staticmethod
+    def _deserialize(
+        aspect_type: Type[Aspect], obj: Optional[dict]
+    ) -> Optional[Aspect]:
+        return aspect_type.from_obj(obj) if obj is not None else None
+
+    def _prefetch(
+        self, entity_type: str, urns: List[str], aspect_types: List[Type[_Aspect]]
+    ) -> None:
+        aspect_names = [aspect_type.ASPECT_NAME for aspect_type in aspect_types]
+        for i in range(0, len(urns), self.batch_size):
+            batch = urns[i : i + self.batch_size]
+            try:
+                with self.report.prefetch_timer:
+                    entities = self.graph.get_entities_v2(
+                        entity_type, batch, aspects=aspect_names
+                    )
+            except Exception as e:
+                # The individual lookups will fall back to fetching these aspects.
+                self.report.num_prefetch_failures += 1
+                logger.warning(
+                    f"Failed to prefetch {aspect_names} for {len(batch)} {entity_type} entities: {e}"
+                )
+                continue
+            self.report.num_prefetch_requests += 1
+
+            for urn in batch:
+                entity_aspects: Dict[str, Any] = entities.get(urn, {})
+                for aspect_type in aspect_types:
+                    aspect_json = entity_aspects.get(aspect_type.ASPECT_NAME)
+                    if aspect_json is None:
+                        self._cache[(urn, aspect_type.ASPECT_NAME)] = None
+                        continue
+
+                    # The OpenAPI response wraps each aspect's value alongside its metadata.
+                    self._cache[(urn, aspect_type.ASPECT_NAME)] = post_json_transform(
+                        aspect_json.get("value", aspect_json),
+                        aspect_type.RECORD_SCHEMA,
+                    )
+                    self.report.num_aspects_prefetched += 1
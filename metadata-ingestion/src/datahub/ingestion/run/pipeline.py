@@ -8,8 +8,8 @@ import shutil
 import sys
 import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import click
 import humanfriendly
@@ -29,8 +29,13 @@ from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.graph.client import DataHubGraph, get_default_graph
+from datahub.ingestion.graph.server_aspect_cache import (
+    ServerAspectCache,
+    ServerAspectCacheReport,
+)
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
 )
@@ -52,6 +57,10 @@ from datahub.utilities.global_warning_util import (
     get_global_warnings,
 )
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorReport,
+)
 
 logger = logging.getLogger(__name__)
 _REPORT_PRINT_INTERVAL_SECONDS = 60
@@ -142,6 +151,39 @@ def _add_init_error_context(step: str) -> Iterator[None]:
         raise PipelineInitError(f"Failed to {step}: {e}") from e
 
 
+@dataclass
+class PipelineStageReport(Report):
+    """Throughput and stall times for a stage of a pipeline run with staged execution.
+
+    Stages are connected by bounded queues. A stage that spends a lot of time waiting
+    for input is starved by the previous stage, and a stage that spends a lot of time
+    waiting for output is throttled by the next stage.
+    """
+
+    items: int = 0
+    throughput_per_sec: float = 0.0
+    waiting_for_input_sec: float = 0.0
+    waiting_for_output_sec: float = 0.0
+
+    _start_time: float = field(default_factory=time.perf_counter)
+    # The queues that this stage reads from and writes to.
+    _input: Optional[ThreadedIteratorExecutorReport] = None
+    _output: Optional[ThreadedIteratorExecutorReport] = None
+
+    def compute_stats(self) -> None:
+        if self._input is not None:
+            self.items = self._input.items_yielded
+            self.waiting_for_input_sec = round(self._input.consumer_blocked_sec, 2)
+        if self._output is not None:
+            self.items = self._output.items_yielded
+            self.waiting_for_output_sec = round(self._output.producer_blocked_sec, 2)
+
+        elapsed = time.perf_counter() - self._start_time
+        if elapsed > 0:
+            self.throughput_per_sec = round(self.items / elapsed, 2)
+        return super().compute_stats()
+
+
 @dataclass
 class CliReport(Report):
     cli_version: str = nice_version_name()
@@ -163,6 +205,9 @@ class CliReport(Report):
     thread_count: Optional[int] = None
     peak_thread_count: Optional[int] = None
 
+    pipeline_stages: Optional[Dict[str, PipelineStageReport]] = None
+    server_aspect_cache: Optional[ServerAspectCacheReport] = None
+
     def compute_stats(self) -> None:
         try:
             mem_usage = psutil.Process(os.getpid()).memory_info().rss
@@ -325,6 +370,14 @@ class Pipeline:
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
 
+        if (
+            self.transformers
+            and self.ctx.graph is not None
+            and self.config.flags.transformer_aspect_prefetch
+        ):
+            self.ctx.server_aspect_cache = ServerAspectCache(self.ctx.graph)
+            self.cli_report.server_aspect_cache = self.ctx.server_aspect_cache.report
+
         # Add the system metadata transformer at the end of the list.
         self.transformers.append(SystemMetadataTransformer(self.ctx))
 
@@ -463,69 +516,10 @@ class Pipeline:
                         self.ctx, self.config.failure_log.log_config
                     )
                 )
-                for wu in itertools.islice(
-                    self.source.get_workunits(),
-                    self.preview_workunits if self.preview_mode else None,
-                ):
-                    try:
-                        if self._time_to_print() and not self.no_progress:
-                            self.pretty_print_summary(currently_running=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to print summary {e}")
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_start(wu)
-                    try:
-                        # Most of this code is meant to be fully stream-based instead of generating all records into memory.
-                        # However, the extractor in particular will never generate a particularly large list. We want the
-                        # exception reporting to be associated with the source, and not the transformer. As such, we
-                        # need to materialize the generator returned by get_records().
-                        record_envelopes = list(self.extractor.get_records(wu))
-                    except Exception as e:
-                        self.source.get_report().failure(
-                            "Source produced bad metadata", context=wu.id, exc=e
-                        )
-                        continue
-                    try:
-                        for record_envelope in self.transform(record_envelopes):
-                            if not self.dry_run:
-                                try:
-                                    self.sink.write_record_async(
-                                        record_envelope, callback
-                                    )
-                                except Exception as e:
-                                    # In case the sink's error handling is bad, we still want to report the error.
-                                    self.sink.report.report_failure(
-                                        f"Failed to write record: {e}"
-                                    )
-
-                    except (RuntimeError, SystemExit):
-                        raise
-                    except Exception as e:
-                        logger.error(
-                            "Failed to process some records. Continuing.",
-                            exc_info=e,
-                        )
-                        # TODO: Transformer errors should cause the pipeline to fail.
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_end(wu)
-                self.extractor.close()
-                self.source.close()
-                # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-                for record_envelope in self.transform(
-                    [
-                        RecordEnvelope(
-                            record=EndOfStream(),
-                            metadata={"workunit_id": "end-of-stream"},
-                        )
-                    ]
-                ):
-                    if not self.dry_run and not isinstance(
-                        record_envelope.record, EndOfStream
-                    ):
-                        # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                        self.sink.write_record_async(record_envelope, callback)
+                if self.config.flags.staged_execution:
+                    self._run_staged(callback)
+                else:
+                    self._run_sequential(callback)
 
                 self.process_commits()
                 self.final_status = PipelineStatus.COMPLETED
@@ -544,6 +538,197 @@ class Pipeline:
 
                 self._notify_reporters_on_ingestion_completion()
 
+    def _get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        return itertools.islice(
+            self.source.get_workunits(),
+            self.preview_workunits if self.preview_mode else None,
+        )
+
+    def _prefetch_server_aspects(
+        self, workunits: Iterable[MetadataWorkUnit]
+    ) -> Iterable[MetadataWorkUnit]:
+        # Reads ahead a window of workunits, so that the server aspects that the
+        # transformers need for them can be fetched in bulk.
+        cache = self.ctx.server_aspect_cache
+        if cache is None:
+            yield from workunits
+            return
+
+        window_size = self.config.flags.transformer_aspect_prefetch_window
+        workunits = iter(workunits)
+        while True:
+            window = list(itertools.islice(workunits, window_size))
+            if not window:
+                break
+
+            urns = []
+            for wu in window:
+                try:
+                    urns.append(wu.get_urn())
+                except AssertionError:
+                    # Some MCPs only have an entity key aspect instead of an urn.
+                    continue
+            cache.set_window(urns)
+            yield from window
+
+    def _run_sequential(self, callback: WriteCallback) -> None:
+        for wu in self._prefetch_server_aspects(self._get_workunits()):
+            try:
+                if self._time_to_print() and not self.no_progress:
+                    self.pretty_print_summary(currently_running=True)
+            except Exception as e:
+                logger.warning(f"Failed to print summary {e}")
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            try:
+                # Most of this code is meant to be fully stream-based instead of generating all records into memory.
+                # However, the extractor in particular will never generate a particularly large list. We want the
+                # exception reporting to be associated with the source, and not the transformer. As such, we
+                # need to materialize the generator returned by get_records().
+                record_envelopes = list(self.extractor.get_records(wu))
+            except Exception as e:
+                self.source.get_report().failure(
+                    "Source produced bad metadata", context=wu.id, exc=e
+                )
+                continue
+            try:
+                for record_envelope in self.transform(record_envelopes):
+                    if not self.dry_run:
+                        try:
+                            self.sink.write_record_async(record_envelope, callback)
+                        except Exception as e:
+                            # In case the sink's error handling is bad, we still want to report the error.
+                            self.sink.report.report_failure(
+                                f"Failed to write record: {e}"
+                            )
+
+            except (RuntimeError, SystemExit):
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to process some records. Continuing.",
+                    exc_info=e,
+                )
+                # TODO: Transformer errors should cause the pipeline to fail.
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+        self.extractor.close()
+        self.source.close()
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(),
+                    metadata={"workunit_id": "end-of-stream"},
+                )
+            ]
+        ):
+            if not self.dry_run and not isinstance(record_envelope.record, EndOfStream):
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _run_staged(self, callback: WriteCallback) -> None:
+        # Runs the source, the extractor + transformers, and the sink in separate
+        # threads, so that CPU work in each of them can overlap. The stages are
+        # connected by bounded queues, so a slow sink still throttles the source.
+        queue_size = self.config.flags.staged_execution_queue_size
+        workunits_report = ThreadedIteratorExecutorReport()
+        records_report = ThreadedIteratorExecutorReport()
+        self.cli_report.pipeline_stages = {
+            "source": PipelineStageReport(_output=workunits_report),
+            "transform": PipelineStageReport(
+                _input=workunits_report, _output=records_report
+            ),
+            "sink": PipelineStageReport(_input=records_report),
+        }
+
+        def _transform_stage() -> Iterable[
+            Tuple[Optional[MetadataWorkUnit], Optional[List[RecordEnvelope]]]
+        ]:
+            workunits = ThreadedIteratorExecutor.process(
+                worker_func=self._get_workunits,
+                args_list=[()],
+                max_workers=1,
+                max_queue_size=queue_size,
+                report=workunits_report,
+            )
+            with contextlib.closing(workunits):
+                for wu in self._prefetch_server_aspects(workunits):
+                    try:
+                        # See the comment in _run_sequential about materializing this.
+                        record_envelopes = list(self.extractor.get_records(wu))
+                    except Exception as e:
+                        self.source.get_report().failure(
+                            "Source produced bad metadata", context=wu.id, exc=e
+                        )
+                        yield wu, None
+                        continue
+                    yield wu, self._transform_workunit_records(record_envelopes)
+
+            self.extractor.close()
+            self.source.close()
+            # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+            yield (
+                None,
+                [
+                    record_envelope
+                    for record_envelope in self.transform(
+                        [
+                            RecordEnvelope(
+                                record=EndOfStream(),
+                                metadata={"workunit_id": "end-of-stream"},
+                            )
+                        ]
+                    )
+                    if not isinstance(record_envelope.record, EndOfStream)
+                ],
+            )
+
+        for wu, record_envelopes in ThreadedIteratorExecutor.process(
+            worker_func=_transform_stage,
+            args_list=[()],
+            max_workers=1,
+            max_queue_size=queue_size,
+            report=records_report,
+        ):
+            try:
+                if self._time_to_print() and not self.no_progress:
+                    self.pretty_print_summary(currently_running=True)
+            except Exception as e:
+                logger.warning(f"Failed to print summary {e}")
+
+            if self.dry_run:
+                continue
+            if wu is not None:
+                self.sink.handle_work_unit_start(wu)
+            if record_envelopes is None:
+                # The extractor failed, which has already been reported.
+                continue
+            for record_envelope in record_envelopes:
+                try:
+                    self.sink.write_record_async(record_envelope, callback)
+                except Exception as e:
+                    # In case the sink's error handling is bad, we still want to report the error.
+                    self.sink.report.report_failure(f"Failed to write record: {e}")
+            if wu is not None:
+                self.sink.handle_work_unit_end(wu)
+
+    def _transform_workunit_records(
+        self, record_envelopes: List[RecordEnvelope]
+    ) -> List[RecordEnvelope]:
+        transformed: List[RecordEnvelope] = []
+        try:
+            for record_envelope in self.transform(record_envelopes):
+                transformed.append(record_envelope)
+        except (RuntimeError, SystemExit):
+            raise
+        except Exception as e:
+            logger.error("Failed to process some records. Continuing.", exc_info=e)
+            # TODO: Transformer errors should cause the pipeline to fail.
+        return transformed
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
@@ -553,8 +738,21 @@ class Pipeline:
         for transformer in self.transformers:
             records = transformer.transform(records)
 
+        if self.ctx.server_aspect_cache is not None and self.transformers:
+            records = self._update_server_aspect_cache(records)
         return records
 
+    def _update_server_aspect_cache(
+        self, records: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        # Later workunits in the same prefetch window must see the aspects we've
+        # already emitted, or a second patch to an entity would undo the first one.
+        cache = self.ctx.server_aspect_cache
+        assert cache is not None
+        for record_envelope in records:
+            cache.update_from_record(record_envelope.record)
+            yield record_envelope
+
     def process_commits(self) -> None:
         """
         Evaluates the commit_policy for each committable in the context and triggers the commit operation
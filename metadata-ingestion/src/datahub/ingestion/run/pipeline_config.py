@@ -63,6 +63,39 @@ class FlagsConfig(ConfigModel):
         ),
     )
 
+    staged_execution: bool = Field(
+        default=False,
+        description=(
+            "Run the source, the extractor and transformers, and the sink in separate threads, connected by bounded queues. "
+            "This lets CPU-heavy work in the source overlap with the transformers. "
+            "Per-stage throughput and stall times are included in the cli report."
+        ),
+    )
+
+    staged_execution_queue_size: int = Field(
+        default=1000,
+        description=(
+            "The maximum number of workunits buffered between stages. Requires `staged_execution` to be enabled."
+        ),
+    )
+
+    transformer_aspect_prefetch: bool = Field(
+        default=False,
+        description=(
+            "For transformers with PATCH semantics, fetch the server's existing aspects for a window of upcoming "
+            "workunits with bulk requests, instead of one request per entity per transformer. "
+            "Cache hit and miss counts are included in the cli report."
+        ),
+    )
+
+    transformer_aspect_prefetch_window: int = Field(
+        default=100,
+        description=(
+            "The number of workunits to prefetch server aspects for at a time. "
+            "Requires `transformer_aspect_prefetch` to be enabled."
+        ),
+    )
+
     set_system_metadata: bool = Field(
         True, description="Set system metadata on entities."
     )
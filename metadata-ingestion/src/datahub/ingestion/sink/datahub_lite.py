@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Union
+from typing import List, Tuple, Union
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -17,11 +17,14 @@ logger = logging.getLogger(__name__)
 class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
+    # The number of records to buffer before writing them in a single transaction.
+    batch_size: int = 1000
 
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(self.config.dict(exclude={"batch_size"}))
+        self._pending: List[Tuple[RecordEnvelope, WriteCallback]] = []
 
     def write_record_async(
         self,
@@ -39,17 +42,33 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
 
+        self._pending.append((record_envelope, write_callback))
+        if len(self._pending) >= self.config.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
         try:
-            self.datahub_lite.write(record)
-            self.report.report_record_written(record_envelope)
+            self.datahub_lite.write_batch(
+                [record_envelope.record for record_envelope, _ in pending]
+            )
         except Exception as e:
-            self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
-            if write_callback:
-                write_callback.on_failure(record_envelope, e, {})
+            for record_envelope, write_callback in pending:
+                self.report.report_failure(
+                    f"{record_envelope.metadata}: {type(e)}: {e}"
+                )
+                if write_callback:
+                    write_callback.on_failure(record_envelope, e, {})
         else:
-            if write_callback:
-                write_callback.on_success(record_envelope, success_metadata={})
+            for record_envelope, write_callback in pending:
+                self.report.report_record_written(record_envelope)
+                if write_callback:
+                    write_callback.on_success(record_envelope, success_metadata={})
 
     def close(self):
         if self.datahub_lite:
+            self._flush()
             self.datahub_lite.close()
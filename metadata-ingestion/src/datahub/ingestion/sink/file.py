@@ -1,7 +1,9 @@
 import json
 import logging
 import pathlib
-from typing import Iterable, Union
+from typing import Iterable, Optional, Tuple, Union
+
+from pydantic import Field
 
 from datahub.configuration.common import ConfigModel
 from datahub.emitter.aspect import JSON_CONTENT_TYPE, JSON_PATCH_CONTENT_TYPE
@@ -13,6 +15,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities.binary_mcp_file import BinaryMcpFileWriter, is_binary_mcp_file
 
 logger = logging.getLogger(__name__)
 
@@ -39,14 +42,37 @@ def _to_obj_for_file(
     return obj.to_obj()
 
 
+def _get_urn_and_aspect_name(
+    obj: Union[
+        MetadataChangeEvent,
+        MetadataChangeProposal,
+        MetadataChangeProposalWrapper,
+    ],
+) -> Tuple[str, Optional[str]]:
+    if isinstance(obj, MetadataChangeEvent):
+        return obj.proposedSnapshot.urn, None
+    assert obj.entityUrn is not None
+    return obj.entityUrn, obj.aspectName
+
+
 class FileSinkConfig(ConfigModel):
-    filename: str
+    filename: str = Field(
+        description=(
+            "Path to file to write to. If the filename ends with .mcpb, records are "
+            "written in the compact binary MCP format instead of as a JSON array."
+        )
+    )
 
     legacy_nested_json_string: bool = False
 
 
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
+        self.binary_writer: Optional[BinaryMcpFileWriter] = None
+        if is_binary_mcp_file(self.config.filename):
+            self.binary_writer = BinaryMcpFileWriter(self.config.filename)
+            return
+
         fpath = pathlib.Path(self.config.filename)
         self.file = fpath.open("w")
         self.file.write("[\n")
@@ -68,17 +94,24 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
             record, simplified_structure=not self.config.legacy_nested_json_string
         )
 
-        if self.wrote_something:
-            self.file.write(",\n")
+        if self.binary_writer is not None:
+            self.binary_writer.write(*_get_urn_and_aspect_name(record), obj)
+        else:
+            if self.wrote_something:
+                self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
-        self.wrote_something = True
+            json.dump(obj, self.file, indent=4)
+            self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
         if write_callback:
             write_callback.on_success(record_envelope, {})
 
     def close(self):
+        if self.binary_writer is not None:
+            self.binary_writer.close()
+            return
+
         self.file.write("\n]")
         self.file.close()
 
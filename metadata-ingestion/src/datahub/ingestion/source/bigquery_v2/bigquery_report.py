@@ -15,6 +15,9 @@ from datahub.sql_parsing.sql_parsing_aggregator import SqlAggregatorReport
 from datahub.utilities.lossy_collections import LossyDict, LossyList, LossySet
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutorReport,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -170,6 +173,9 @@ class BigQueryV2Report(
     exclude_empty_projects: Optional[bool] = None
 
     init_schema_resolver_timer: PerfTimer = field(default_factory=PerfTimer)
+    dataset_processing_executor: ThreadedIteratorExecutorReport = field(
+        default_factory=ThreadedIteratorExecutorReport
+    )
     schema_api_perf: BigQuerySchemaApiPerfReport = field(
         default_factory=BigQuerySchemaApiPerfReport
     )
@@ -456,6 +456,7 @@ class BigQuerySchemaGenerator:
             worker_func=_process_schema_worker,
             args_list=[(bq_dataset,) for bq_dataset in bigquery_project.datasets],
             max_workers=self.config.max_threads_dataset_parallelism,
+            report=self.report.dataset_processing_executor,
         ):
             yield wu
 
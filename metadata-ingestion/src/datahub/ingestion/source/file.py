@@ -1,12 +1,16 @@
+import collections
+import concurrent.futures
 import datetime
 import json
 import logging
+import multiprocessing
 import os.path
 import pathlib
+import re
 from dataclasses import dataclass, field
 from enum import auto
 from functools import partial
-from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
 
 import ijson
 from pydantic import validator
@@ -50,9 +54,26 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities.binary_mcp_file import BinaryMcpFileReader, is_binary_mcp_file
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# When reading files in parallel, large JSON arrays are split into shards of
+# roughly this size, each of which is decoded by a separate worker.
+_SHARD_SIZE_BYTES = 16 * 1024 * 1024
+_SHARD_SCAN_CHUNK_SIZE = 1024 * 1024
+
+_FileItem = Union[
+    MetadataChangeEvent,
+    MetadataChangeProposalWrapper,
+    MetadataChangeProposal,
+]
+
 
 class FileReadMode(ConfigEnum):
     STREAM = auto()
@@ -91,6 +112,17 @@ class FileSourceConfig(StatefulIngestionConfigBase):
         ),
     )
 
+    parsing_processes: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "If set, local files are decoded and deserialized in this many worker processes. "
+            "Files are read in parallel, and large JSON arrays are split into shards that are "
+            "decoded independently. Records are still emitted in file order. "
+            "The read_mode and count_all_before_starting options are ignored in this mode."
+        ),
+    )
+
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
     )
@@ -128,6 +160,8 @@ class FileSourceReport(StaleEntityRemovalSourceReport):
     total_parse_time_in_seconds: float = 0
     total_count_time_in_seconds: float = 0
     total_deserialize_time_in_seconds: float = 0
+    num_file_shards: int = 0
+    num_file_shards_failed: int = 0
 
     def add_deserialize_time(self, delta: datetime.timedelta) -> None:
         self.total_deserialize_time_in_seconds += round(delta.total_seconds(), 2)
@@ -211,8 +245,10 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
         fs_class = fs_registry.get(schema)
         fs = fs_class.create()
         for file_info in fs.list(path_str):
-            if file_info.is_file and file_info.path.endswith(
-                self.config.file_extension
+            if file_info.is_file and (
+                file_info.path.endswith(self.config.file_extension)
+                # Binary files can always be read when pointed to directly.
+                or (file_info.path == path_str and is_binary_mcp_file(path_str))
             ):
                 yield file_info
 
@@ -229,28 +265,128 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
     def get_workunits_internal(
         self,
     ) -> Iterable[MetadataWorkUnit]:
-        for f in self.get_filenames():
-            for i, obj in self.iterate_generic_file(f):
-                id = f"{f.path}:{i}"
-                if isinstance(
-                    obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)
+        if self.config.parsing_processes:
+            records = self._iterate_files_parallel()
+        else:
+            records = self._iterate_files()
+
+        for f, i, obj in records:
+            id = f"{f.path}:{i}"
+            if isinstance(obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)):
+                if (
+                    self.config.aspect is not None
+                    and obj.aspectName is not None
+                    and obj.aspectName != self.config.aspect
                 ):
-                    if (
-                        self.config.aspect is not None
-                        and obj.aspectName is not None
-                        and obj.aspectName != self.config.aspect
-                    ):
-                        continue
+                    continue
 
-                    if isinstance(obj, MetadataChangeProposalWrapper):
-                        yield MetadataWorkUnit(id, mcp=obj)
-                    else:
-                        yield MetadataWorkUnit(id, mcp_raw=obj)
+                if isinstance(obj, MetadataChangeProposalWrapper):
+                    yield MetadataWorkUnit(id, mcp=obj)
                 else:
-                    yield MetadataWorkUnit(id, mce=obj)
+                    yield MetadataWorkUnit(id, mcp_raw=obj)
+            else:
+                yield MetadataWorkUnit(id, mce=obj)
+
+    def _iterate_files(self) -> Iterator[Tuple[FileInfo, int, _FileItem]]:
+        for f in self.get_filenames():
+            for i, obj in self.iterate_generic_file(f):
+                yield f, i, obj
             self.report.total_num_files += 1
             self.report.append_total_bytes_on_disk(f.size)
 
+    def _get_file_shards(self) -> Iterator[Tuple[FileInfo, int, int]]:
+        for f in self.get_filenames():
+            if _is_shardable(f.path):
+                shards = _get_array_shard_offsets(f.path, f.size, _SHARD_SIZE_BYTES)
+            else:
+                shards = [(0, f.size)]
+            self.report.num_file_shards += len(shards)
+            for start, end in shards:
+                yield f, start, end
+
+    def _iterate_files_parallel(self) -> Iterator[Tuple[FileInfo, int, _FileItem]]:
+        processes = self.config.parsing_processes
+
+        # We use spawn instead of fork, since the parent process usually has
+        # open sqlite connections and background threads.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            # To bound memory usage, only a couple shards per worker are in flight.
+            # The results are consumed in order, so records are emitted in the same
+            # order as when reading sequentially.
+            pending: Deque[
+                Tuple[FileInfo, int, int, Optional[concurrent.futures.Future]]
+            ] = collections.deque()
+            shards_iter = self._get_file_shards()
+            num_elements_read = 0
+            fallback_path: Optional[str] = None
+            while True:
+                while len(pending) < 2 * processes:
+                    shard = next(shards_iter, None)
+                    if shard is None:
+                        break
+                    f, start, end = shard
+                    if f.path == fallback_path:
+                        continue
+                    future = None
+                    if _is_shardable(f.path):
+                        future = executor.submit(
+                            _read_file_shard, f.path, start, end, f.size
+                        )
+                    pending.append((f, start, end, future))
+                if not pending:
+                    break
+
+                f, start, end, future = pending.popleft()
+                if future is None:
+                    for i, obj in self.iterate_generic_file(f):
+                        yield f, i, obj
+                    self.report.total_num_files += 1
+                    self.report.append_total_bytes_on_disk(f.size)
+                    continue
+
+                if start == 0:
+                    num_elements_read = 0
+                    self._report_file_started(f)
+                    self.report.current_file_elements_read = 0
+
+                try:
+                    shard_result: _FileShardResult = future.result()
+                except Exception as e:
+                    # This happens if the file wasn't split on element boundaries,
+                    # e.g. because of unusual formatting. The bytes from the start
+                    # of this shard onwards are still a valid sequence of elements,
+                    # so we read all of them in this process instead.
+                    logger.warning(
+                        f"Failed to read bytes {start}-{end} of {f.path} in a worker; "
+                        f"reading the rest of the file in the main process instead: {e}"
+                    )
+                    self.report.num_file_shards_failed += 1
+                    fallback_path = f.path
+                    while pending and pending[0][0].path == f.path:
+                        _, _, _, remaining_future = pending.popleft()
+                        if remaining_future is not None:
+                            remaining_future.cancel()
+                    end = f.size
+                    shard_result = _read_file_shard(f.path, start, end, f.size)
+
+                self.report.add_parse_time(shard_result.parse_time)
+                self.report.add_deserialize_time(shard_result.deserialize_time)
+                for i, error in shard_result.errors:
+                    self.report.report_failure(f"path-{num_elements_read + i}", error)
+                for i, obj in shard_result.items:
+                    yield f, num_elements_read + i, obj
+
+                num_elements_read += shard_result.num_elements
+                self.report.current_file_elements_read = num_elements_read
+                self.report.current_file_bytes_read = end
+                if end == f.size:
+                    self._report_file_completed(f)
+                    self.report.total_num_files += 1
+                    self.report.append_total_bytes_on_disk(f.size)
+
     def get_report(self):
         return self.report
 
@@ -269,8 +405,7 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
         schema = get_path_schema(file_status.path)
         fs_class = fs_registry.get(schema)
         fs = fs_class.create()
-        self.report.current_file_name = file_status.path
-        self.report.current_file_size = file_status.size
+        self._report_file_started(file_status)
         fp = fs.open(file_status.path)
 
         with fp:
@@ -279,9 +414,36 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
             else:
                 yield from self._iterate_file_batch(fp)
 
+        self._report_file_completed(file_status)
+
+    def _iterate_binary_file(self, file_status: FileInfo) -> Iterable[Tuple[int, Any]]:
+        schema = get_path_schema(file_status.path)
+        fs_class = fs_registry.get(schema)
+        fs = fs_class.create()
+        self._report_file_started(file_status)
+        self.report.current_file_elements_read = 0
+
+        # Records for other aspects are skipped without decoding them.
+        aspect_names = [self.config.aspect] if self.config.aspect else None
+        with fs.open(file_status.path) as fp:
+            reader = BinaryMcpFileReader(fp)
+            parse_start_time = datetime.datetime.now()
+            for record in reader.read(aspect_names=aspect_names):
+                self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+                self.report.current_file_elements_read += 1
+                yield record.index, record.obj
+                parse_start_time = datetime.datetime.now()
+
+        self._report_file_completed(file_status)
+
+    def _report_file_started(self, file_status: FileInfo) -> None:
+        self.report.current_file_name = file_status.path
+        self.report.current_file_size = file_status.size
+
+    def _report_file_completed(self, file_status: FileInfo) -> None:
         self.report.files_completed.append(file_status.path)
         self.report.num_files_completed += 1
-        self.report.total_bytes_read_completed_files += self.report.current_file_size
+        self.report.total_bytes_read_completed_files += file_status.size
         self.report.reset_current_file_stats()
 
     def _iterate_file_streaming(self, fp: Any) -> Iterable[Any]:
@@ -309,7 +471,7 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
 
     def _iterate_file_batch(self, fp: Any) -> Iterable[Any]:
         # Read the file.
-        contents = json.load(fp)
+        contents = _json_loads(fp.read())
 
         # Maintain backwards compatibility with the single-object format.
         if isinstance(contents, list):
@@ -340,7 +502,13 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
             ],
         ]
     ]:
-        for i, obj in enumerate(self._iterate_file(file_status)):
+        rows: Iterable[Tuple[int, Any]]
+        if is_binary_mcp_file(file_status.path):
+            rows = self._iterate_binary_file(file_status)
+        else:
+            rows = enumerate(self._iterate_file(file_status))
+
+        for i, obj in rows:
             try:
                 deserialize_start_time = datetime.datetime.now()
                 item = _from_obj_for_file(obj)
@@ -422,6 +590,121 @@ def _from_obj_for_file(
         return item
 
 
+def _json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib, e.g. for NaN or ints beyond 64 bits.
+            pass
+    return json.loads(data)
+
+
+def _is_shardable(path: str) -> bool:
+    # Remote files can't be read by offset, and binary files are read sequentially.
+    return get_path_schema(path) == "file" and not is_binary_mcp_file(path)
+
+
+def _get_array_shard_offsets(
+    path: str, size: int, shard_size: int
+) -> List[Tuple[int, int]]:
+    """Splits a JSON array file into byte ranges that each hold whole elements.
+
+    This only recognizes files where every top-level element is an object whose
+    closing brace sits on its own line, at the same indentation as its opening
+    brace - which is what the file sink and `json.dump(..., indent=n)` produce.
+    Other files are returned as a single shard.
+    """
+
+    with open(path, "rb") as f:
+        head = f.read(_SHARD_SCAN_CHUNK_SIZE)
+        match = re.match(rb"\s*\[([ \t\r\n]*)\{", head)
+        if size <= shard_size or not match or b"\n" not in match.group(1):
+            return [(0, size)]
+
+        # A top-level element ends with a line like "}," at the same indentation
+        # as the first element. Nested objects are indented further, and strings
+        # can't contain raw newlines, so this pattern can't occur inside an element.
+        indent = match.group(1).rpartition(b"\n")[2]
+        separator = b"\n" + indent + b"},"
+
+        offsets = [0]
+        pos = shard_size
+        while pos < size:
+            f.seek(pos)
+            buffer = b""
+            cut = None
+            while cut is None:
+                chunk = f.read(_SHARD_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer = buffer[-(len(separator) - 1) :] + chunk
+                index = buffer.find(separator)
+                if index >= 0:
+                    cut = f.tell() - len(buffer) + index + len(separator)
+            if cut is None:
+                break
+            offsets.append(cut)
+            pos = cut + shard_size
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _decode_array_shard(data: bytes, whole_file: bool) -> List[Any]:
+    if whole_file:
+        contents = _json_loads(data)
+
+        # Maintain backwards compatibility with the single-object format.
+        return contents if isinstance(contents, list) else [contents]
+
+    # Only the first shard includes the opening bracket, and only the last one
+    # includes the closing bracket. All others end with a trailing comma.
+    data = data.strip()
+    if data.startswith(b"["):
+        data = data[1:]
+    if data.endswith(b"]"):
+        data = data[:-1]
+    data = data.rstrip().rstrip(b",")
+    return _json_loads(b"[" + data + b"]")
+
+
+@dataclass
+class _FileShardResult:
+    # Indexes are relative to the start of the shard.
+    items: List[Tuple[int, _FileItem]]
+    errors: List[Tuple[int, str]]
+    num_elements: int
+    parse_time: datetime.timedelta
+    deserialize_time: datetime.timedelta
+
+
+def _read_file_shard(path: str, start: int, end: int, size: int) -> _FileShardResult:
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    parse_start_time = datetime.datetime.now()
+    rows = _decode_array_shard(data, whole_file=start == 0 and end == size)
+    deserialize_start_time = datetime.datetime.now()
+
+    result = _FileShardResult(
+        items=[],
+        errors=[],
+        num_elements=len(rows),
+        parse_time=deserialize_start_time - parse_start_time,
+        deserialize_time=datetime.timedelta(),
+    )
+    for i, obj in enumerate(rows):
+        try:
+            item = _from_obj_for_file(obj)
+            if item is not None:
+                result.items.append((i, item))
+        except Exception as e:
+            result.errors.append((i, str(e)))
+    result.deserialize_time = datetime.datetime.now() - deserialize_start_time
+    return result
+
+
 def read_metadata_file(
     file: pathlib.Path,
 ) -> Iterable[
@@ -26,3 +26,9 @@ def load_lkml(path: Union[str, pathlib.Path]) -> dict:
 
     with open(path) as file:
         return lkml.load(file)
+
+
+def loads_lkml(text: str) -> dict:
+    """Parses LookML text and returns a dictionary."""
+
+    return lkml.load(text)
@@ -14,6 +14,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ class LookerModel:
         path: str,
         source_config: LookMLSourceConfig,
         reporter: LookMLSourceReport,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -60,6 +62,7 @@ class LookerModel:
             path,
             source_config,
             reporter,
+            parse_cache=parse_cache,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
         )
@@ -76,6 +79,7 @@ class LookerModel:
                 parsed = load_and_preprocess_file(
                     path=included_file,
                     source_config=source_config,
+                    parse_cache=parse_cache,
                 )
                 included_explores = parsed.get("explores", [])
                 explores.extend(included_explores)
@@ -106,6 +110,7 @@ class LookerModel:
         reporter: LookMLSourceReport,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> List[ProjectInclude]:
         """Resolve ``include`` statements in LookML model files to a list of ``.lkml`` files.
 
@@ -218,6 +223,7 @@ class LookerModel:
                     parsed = load_and_preprocess_file(
                         path=included_file,
                         source_config=source_config,
+                        parse_cache=parse_cache,
                     )
                     seen_so_far.add(included_file)
                     if "includes" in parsed:  # we have more includes to resolve!
@@ -232,6 +238,7 @@ class LookerModel:
                                 reporter,
                                 seen_so_far,
                                 traversal_path=f"{traversal_path} -> {pathlib.Path(included_file).stem}",
+                                parse_cache=parse_cache,
                             )
                         )
                 except Exception as e:
@@ -272,6 +279,7 @@ class LookerViewFile:
         raw_file_content: str,
         source_config: LookMLSourceConfig,
         reporter: LookMLSourceReport,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -286,6 +294,7 @@ class LookerViewFile:
             absolute_file_path,
             source_config,
             reporter,
+            parse_cache=parse_cache,
             seen_so_far=seen_so_far,
         )
         logger.debug(
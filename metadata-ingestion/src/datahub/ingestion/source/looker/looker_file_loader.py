@@ -14,6 +14,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +31,14 @@ class LookerViewFileLoader:
         base_projects_folder: Dict[str, pathlib.Path],
         reporter: LookMLSourceReport,
         source_config: LookMLSourceConfig,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> None:
         self.viewfile_cache: Dict[str, Optional[LookerViewFile]] = {}
         self._root_project_name = root_project_name
         self._base_projects_folder = base_projects_folder
         self.reporter = reporter
         self.source_config = source_config
+        self.parse_cache = parse_cache
 
     def _load_viewfile(
         self, project_name: str, path: str, reporter: LookMLSourceReport
@@ -74,6 +77,7 @@ class LookerViewFileLoader:
             parsed = load_and_preprocess_file(
                 path=path,
                 source_config=self.source_config,
+                parse_cache=self.parse_cache,
             )
 
             looker_viewfile = LookerViewFile.from_looker_dict(
@@ -85,6 +89,7 @@ class LookerViewFileLoader:
                 raw_file_content=raw_file_content,
                 source_config=self.source_config,
                 reporter=reporter,
+                parse_cache=self.parse_cache,
             )
             logger.debug(f"adding viewfile for path {path} to the cache")
             self.viewfile_cache[path] = looker_viewfile
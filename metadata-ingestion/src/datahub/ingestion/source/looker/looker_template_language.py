@@ -28,6 +28,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     DERIVED_VIEW_PATTERN,
     LookMLSourceConfig,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -422,8 +423,9 @@ def process_lookml_template_language(
 def load_and_preprocess_file(
     path: Union[str, pathlib.Path],
     source_config: LookMLSourceConfig,
+    parse_cache: Optional[LookMLParseCache] = None,
 ) -> dict:
-    parsed = load_lkml(path)
+    parsed = parse_cache.load(path) if parse_cache else load_lkml(path)
 
     process_lookml_template_language(
         view_lkml_file_dict=parsed,
@@ -1,4 +1,5 @@
 import logging
+import pathlib
 from dataclasses import dataclass, field as dataclass_field
 from datetime import timedelta
 from typing import Any, Dict, List, Literal, Optional, Union
@@ -28,6 +29,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,12 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     query_parse_attempts: int = 0
     query_parse_failures: int = 0
     query_parse_failure_views: List[str] = dataclass_field(default_factory=LossyList)
+    lkml_parse_cache_hits: int = 0
+    lkml_parse_cache_disk_hits: int = 0
+    lkml_parse_cache_misses: int = 0
+    lkml_files_parsed_in_parallel: int = 0
+    lkml_parse_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
+    lkml_parallel_parse_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
     _looker_api: Optional[LookerAPI] = None
 
     def report_models_scanned(self) -> None:
@@ -168,6 +176,19 @@ class LookMLSourceConfig(
         "view.sql_table_name. Defaults to an empty dictionary.",
     )
 
+    parse_cache_dir: Optional[pathlib.Path] = Field(
+        None,
+        description="A local directory in which parsed LookML files are cached across runs, keyed by a hash of "
+        "their content. Files that haven't changed since a previous run are not parsed again. The directory is "
+        "created if it doesn't exist, and can be shared between runs of different recipes.",
+    )
+    parsing_processes: int = Field(
+        0,
+        ge=0,
+        description="If set, all LookML files of the project and its dependencies are parsed up front in this "
+        "many worker processes, instead of one at a time as they are included.",
+    )
+
     looker_environment: Literal["prod", "dev"] = Field(
         "prod",
         description="A looker prod or dev environment. "
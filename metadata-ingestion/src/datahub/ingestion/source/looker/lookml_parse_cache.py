@@ -0,0 +1,168 @@
+"""A cache of parsed LookML files, keyed by a hash of the file content.
+
+Parsing LookML with lkml is slow, and the same files are loaded many times while
+resolving the includes of each model and view file. The cache keeps the parsed
+files in memory for the duration of a run and, if configured with a cache
+directory, on disk across runs, so unchanged files are never re-parsed.
+
+Only the output of the LookML parser is cached. The template language
+preprocessing depends on the source config, so it's applied to every load.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import tempfile
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from datahub.ingestion.source.looker.lkml_patched import loads_lkml
+from datahub.ingestion.source.looker.lookml_config import LookMLSourceReport
+
+try:
+    from importlib.metadata import version as _package_version
+
+    _LKML_VERSION = _package_version("lkml")
+except Exception:
+    _LKML_VERSION = "unknown"
+
+logger = logging.getLogger(__name__)
+
+# Bump this if the format of the cached files changes.
+_CACHE_VERSION = 1
+
+
+def _get_cache_key(text: str) -> str:
+    hasher = hashlib.sha256(f"{_CACHE_VERSION}:{_LKML_VERSION}\0".encode())
+    hasher.update(text.encode())
+    return hasher.hexdigest()
+
+
+def _parse_lkml_file(path: str) -> Optional[Tuple[str, str]]:
+    """Returns the cache key of the file and its serialized parse.
+
+    Runs in worker processes. Files that fail to load are skipped here, and the
+    error is reported when they are loaded in the main process.
+    """
+
+    try:
+        with open(path) as file:
+            text = file.read()
+        return _get_cache_key(text), json.dumps(loads_lkml(text))
+    except Exception as e:
+        logger.debug(f"Failed to parse {path}: {e}")
+        return None
+
+
+class LookMLParseCache:
+    def __init__(
+        self, cache_dir: Optional[pathlib.Path], reporter: LookMLSourceReport
+    ) -> None:
+        self._cache_dir = cache_dir
+        self.reporter = reporter
+
+        # cache key -> serialized parse. The parsed files are mutated by the
+        # preprocessing, so every load deserializes a fresh copy.
+        self._parsed: Dict[str, str] = {}
+
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_file(self, key: str) -> pathlib.Path:
+        assert self._cache_dir is not None
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _get(self, key: str) -> Optional[str]:
+        if key in self._parsed:
+            return self._parsed[key]
+        if self._cache_dir is None:
+            return None
+
+        try:
+            serialized = self._get_cache_file(key).read_text()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached LookML parse {key}: {e}")
+            return None
+        self.reporter.lkml_parse_cache_disk_hits += 1
+        self._parsed[key] = serialized
+        return serialized
+
+    def _put(self, key: str, serialized: str) -> None:
+        self._parsed[key] = serialized
+        if self._cache_dir is None:
+            return
+
+        # Write to a temporary file first, so that concurrent runs sharing the
+        # cache directory never see partially written files.
+        cache_file = self._get_cache_file(key)
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(serialized)
+            os.replace(tmp_path, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to write cached LookML parse {key}: {e}")
+
+    def load(self, path: Union[str, pathlib.Path]) -> dict:
+        """Loads a LookML file from disk and returns a dictionary, like load_lkml."""
+
+        with open(path) as file:
+            text = file.read()
+
+        key = _get_cache_key(text)
+        serialized = self._get(key)
+        if serialized is None:
+            self.reporter.lkml_parse_cache_misses += 1
+            with self.reporter.lkml_parse_timer:
+                serialized = json.dumps(loads_lkml(text))
+            self._put(key, serialized)
+        else:
+            self.reporter.lkml_parse_cache_hits += 1
+
+        return json.loads(serialized)
+
+    def parse_files(self, paths: Iterable[str], processes: int) -> None:
+        """Parses the files in worker processes and adds them to the cache.
+
+        Files that are already cached on disk are only hashed, not re-parsed.
+        """
+
+        paths = [
+            path
+            for path in paths
+            if self._cache_dir is None or not self._is_cached_on_disk(path)
+        ]
+        if not paths:
+            return
+
+        logger.info(f"Parsing {len(paths)} LookML files in {processes} processes")
+        with self.reporter.lkml_parallel_parse_timer:
+            # We use spawn instead of fork, since the parent process may have
+            # background threads.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                for result in executor.map(
+                    _parse_lkml_file,
+                    paths,
+                    chunksize=max(1, len(paths) // (4 * processes)),
+                ):
+                    if result is None:
+                        continue
+                    self._put(*result)
+                    self.reporter.lkml_files_parsed_in_parallel += 1
+
+    def _is_cached_on_disk(self, path: str) -> bool:
+        try:
+            with open(path) as file:
+                key = _get_cache_key(file.read())
+        except Exception:
+            return False
+        return self._get_cache_file(key).exists()
@@ -64,6 +64,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 from datahub.ingestion.source.looker.lookml_refinement import LookerRefinementResolver
 from datahub.ingestion.source.looker.view_upstream import (
     AbstractViewUpstream,
@@ -290,6 +291,9 @@ class LookMLSource(StatefulIngestionSourceBase):
         self.source_config: LookMLSourceConfig = config
         self.ctx = ctx
         self.reporter = LookMLSourceReport()
+        self.parse_cache = LookMLParseCache(
+            self.source_config.parse_cache_dir, self.reporter
+        )
 
         # To keep track of projects (containers) which have already been ingested
         self.processed_projects: List[str] = []
@@ -316,6 +320,7 @@ class LookMLSource(StatefulIngestionSourceBase):
         parsed = load_and_preprocess_file(
             path=path,
             source_config=self.source_config,
+            parse_cache=self.parse_cache,
         )
 
         looker_model = LookerModel.from_looker_dict(
@@ -326,6 +331,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             path,
             self.source_config,
             self.reporter,
+            parse_cache=self.parse_cache,
         )
         return looker_model
 
@@ -502,7 +508,9 @@ class LookMLSource(StatefulIngestionSourceBase):
         manifest_file = folder / "manifest.lkml"
         if manifest_file.exists():
             manifest_dict = load_and_preprocess_file(
-                path=manifest_file, source_config=self.source_config
+                path=manifest_file,
+                source_config=self.source_config,
+                parse_cache=self.parse_cache,
             )
 
             manifest = LookerManifest(
@@ -673,11 +681,25 @@ class LookMLSource(StatefulIngestionSourceBase):
     def get_internal_workunits(self) -> Iterable[MetadataWorkUnit]:  # noqa: C901
         assert self.source_config.base_folder
 
+        if self.source_config.parsing_processes > 0:
+            self.parse_cache.parse_files(
+                sorted(
+                    {
+                        str(path.resolve())
+                        for folder in self.base_projects_folder.values()
+                        for path in pathlib.Path(folder).glob("**/*.lkml")
+                        if path.is_file()
+                    }
+                ),
+                self.source_config.parsing_processes,
+            )
+
         viewfile_loader = LookerViewFileLoader(
             self.source_config.project_name,
             self.base_projects_folder,
             self.reporter,
             self.source_config,
+            parse_cache=self.parse_cache,
         )
 
         # Some views can be mentioned by multiple 'include' statements and can be included via different connections.
@@ -1,4 +1,5 @@
 import logging
+import pathlib
 from dataclasses import dataclass, field as dataclass_field
 from enum import Enum
 from typing import Dict, List, Literal, Optional, Union
@@ -208,6 +209,11 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     m_query_resolver_errors: int = 0
     m_query_resolver_no_lineage: int = 0
     m_query_resolver_successes: int = 0
+    m_query_parse_cache_hits: int = 0
+    m_query_parse_cache_misses: int = 0
+    m_query_parallel_parses: int = 0
+    m_query_parallel_parse_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
+    workspace_scan_wait_timer: PerfTimer = dataclass_field(default_factory=PerfTimer)
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -342,6 +348,14 @@ class PowerBiDashboardSourceConfig(
         le=100,
         description="batch size for sending workspace_ids to PBI, 100 is the limit",
     )
+    workspace_extraction_max_workers: int = pydantic.Field(
+        default=1,
+        ge=1,
+        description="Number of threads used to call the PowerBI REST APIs. If greater than 1, the scan jobs of "
+        "up to this many workspace batches are submitted and polled concurrently, and the datasets, dashboards "
+        "and reports of the workspaces in a batch are fetched in parallel. Workspaces are still emitted in order. "
+        "Throttled (429) requests are retried after the delay given in their Retry-After header.",
+    )
     workspace_id_as_urn_part: bool = pydantic.Field(
         default=False,
         description="It is recommended to set this to True only if you have legacy workspaces based on Office 365 groups, as those workspaces can have identical names. "
@@ -497,6 +511,20 @@ class PowerBiDashboardSourceConfig(
         "Increase this value if you encounter the 'M-Query Parsing Timeout' message in the connector report.",
     )
 
+    m_query_parse_cache_dir: Optional[pathlib.Path] = pydantic.Field(
+        default=None,
+        description="A local directory in which M-query parse trees are cached across runs, keyed by a hash of "
+        "the expression. Expressions that were parsed in a previous run are not parsed again. Within a run, "
+        "identical expressions are always parsed only once.",
+    )
+
+    m_query_parse_processes: int = pydantic.Field(
+        default=0,
+        ge=0,
+        description="If set, the M-query expressions of each workspace are parsed up front in this many worker "
+        "processes, instead of one at a time in the main process.",
+    )
+
     metadata_api_timeout: int = pydantic.Field(
         default=30,
         description="timeout in seconds for Metadata Rest Api.",
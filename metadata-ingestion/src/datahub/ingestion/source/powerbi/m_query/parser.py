@@ -1,13 +1,21 @@
+import concurrent.futures
 import functools
+import hashlib
 import importlib.resources as pkg_resource
 import logging
+import multiprocessing
 import os
-from typing import Dict, List
+import pathlib
+import pickle
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import lark
 from lark import Lark, Tree
 
 import datahub.ingestion.source.powerbi.m_query.data_classes
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.powerbi.config import (
     PowerBiDashboardSourceConfig,
@@ -21,6 +29,7 @@ from datahub.ingestion.source.powerbi.m_query.data_classes import (
     TRACE_POWERBI_MQUERY_PARSER,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
+from datahub.utilities.file_backed_collections import FileBackedDict
 from datahub.utilities.threading_timeout import TimeoutException, threading_timeout
 
 logger = logging.getLogger(__name__)
@@ -28,19 +37,26 @@ logger = logging.getLogger(__name__)
 _M_QUERY_PARSE_TIMEOUT = int(os.getenv("DATAHUB_POWERBI_M_QUERY_PARSE_TIMEOUT", 60))
 
 
+# Bump this if the cached parse trees change in an incompatible way.
+_M_QUERY_PARSE_CACHE_VERSION = 1
+_M_QUERY_PARSE_CACHE_FILE = "m_query_parse_cache.db"
+
+
+def _get_grammar() -> str:
+    return pkg_resource.read_text(
+        "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
+    )
+
+
 @functools.lru_cache(maxsize=1)
 def get_lark_parser() -> Lark:
     # Read lexical grammar as text
-    grammar: str = pkg_resource.read_text(
-        "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
-    )
+    grammar: str = _get_grammar()
     # Create lark parser for the grammar text
     return Lark(grammar, start="let_expression", regex=True)
 
 
-def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
-    lark_parser: Lark = get_lark_parser()
-
+def _normalize_expression(expression: str) -> str:
     # Replace U+00a0 NO-BREAK SPACE with a normal space.
     # Sometimes PowerBI returns expressions with this character and it breaks the parser.
     expression = expression.replace("\u00a0", " ")
@@ -49,6 +65,14 @@ def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
     # to distinguish between an empty and null set =null to ="null"
     expression = expression.replace("=null", '="null"')
 
+    return expression
+
+
+def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
+    lark_parser: Lark = get_lark_parser()
+
+    expression = _normalize_expression(expression)
+
     logger.debug(f"Parsing expression = {expression}")
     with threading_timeout(parse_timeout):
         parse_tree: Tree = lark_parser.parse(expression)
@@ -59,6 +83,234 @@ def _parse_expression(expression: str, parse_timeout: int = 60) -> Tree:
     return parse_tree
 
 
+@functools.lru_cache(maxsize=1)
+def _get_parse_cache_key_prefix() -> bytes:
+    # Parse trees from a different grammar or lark version must not be reused.
+    return hashlib.sha256(
+        f"{_M_QUERY_PARSE_CACHE_VERSION}:{lark.__version__}:{_get_grammar()}".encode()
+    ).digest()
+
+
+def _get_parse_cache_key(expression: str) -> str:
+    hasher = hashlib.sha256(_get_parse_cache_key_prefix())
+    hasher.update(_normalize_expression(expression).encode())
+    return hasher.hexdigest()
+
+
+def _parse_expression_in_worker(
+    expression: str, parse_timeout: int
+) -> Union[Tree, TimeoutException, None]:
+    try:
+        return _parse_expression(expression, parse_timeout=parse_timeout)
+    except TimeoutException as e:
+        return e
+    except Exception:
+        # Other failures are usually quick, and not all lark exceptions can be
+        # unpickled, so these expressions are parsed again in the main process.
+        return None
+
+
+class _PersistentParseTreeStore(Closeable):
+    """A sqlite database of parse trees that is shared across runs.
+
+    Unlike the temporary databases behind FileBackedDict, this uses WAL mode and
+    the default durability settings, so that concurrent runs can share the file
+    and a crash can't corrupt it. The store is only an optimization, so any
+    errors reading or writing entries are logged and ignored.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: pathlib.Path) -> "_PersistentParseTreeStore":
+        try:
+            return cls(cls._connect(path))
+        except sqlite3.OperationalError:
+            # e.g. the database is locked by another run, which we must not
+            # clobber. The caller falls back to an in-run cache.
+            raise
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Recreating corrupt M-Query parse cache {path}: {e}")
+            for suffix in ["", "-wal", "-shm"]:
+                pathlib.Path(f"{path}{suffix}").unlink(missing_ok=True)
+            return cls(cls._connect(path))
+
+    @staticmethod
+    def _connect(path: pathlib.Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_trees (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            # Fails if the file isn't a valid database.
+            conn.execute("SELECT COUNT(*) FROM parse_trees WHERE key = ''").fetchone()
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def get(self, key: str) -> Optional[Tree]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM parse_trees WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Failed to read cached M-Query parse tree {key}: {e}")
+            return None
+
+    def put_many(self, items: List[Tuple[str, Tree]]) -> None:
+        try:
+            rows = [(key, pickle.dumps(tree)) for key, tree in items]
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO parse_trees (key, value) VALUES (?, ?)",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            logger.warning(f"Failed to write cached M-Query parse trees: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MQueryParseCache(Closeable):
+    """Caches M-Query parse trees, keyed by a hash of the normalized expression.
+
+    Many tables share the same expression, and parsing is by far the most expensive
+    part of the lineage extraction. Parse trees are kept in a FileBackedDict for the
+    current run, and also in a persistent store if a cache directory is given. Parse
+    failures are only cached for the current run, so that later runs can retry them,
+    e.g. with a higher timeout.
+    """
+
+    def __init__(
+        self,
+        reporter: PowerBiDashboardSourceReport,
+        cache_dir: Optional[pathlib.Path] = None,
+    ):
+        self.reporter = reporter
+
+        self._persistent_store: Optional[_PersistentParseTreeStore] = None
+        if cache_dir is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                self._persistent_store = _PersistentParseTreeStore.open(
+                    cache_dir / _M_QUERY_PARSE_CACHE_FILE
+                )
+            except Exception as e:
+                reporter.warning(
+                    title="M-Query parse cache unavailable",
+                    message="Failed to open the M-Query parse cache. Parse trees will only be cached for this run.",
+                    context=str(cache_dir),
+                    exc=e,
+                )
+        self._parse_trees: FileBackedDict[Tree] = FileBackedDict(
+            tablename="m_query_parse_trees",
+            cache_max_size=1000,
+        )
+        self._parse_failures: Dict[str, Exception] = {}
+
+    def _get(self, key: str) -> Optional[Tree]:
+        parse_tree = self._parse_trees.get(key)
+        if parse_tree is None and self._persistent_store is not None:
+            parse_tree = self._persistent_store.get(key)
+            if parse_tree is not None:
+                self._parse_trees[key] = parse_tree
+        return parse_tree
+
+    def _put_many(self, items: List[Tuple[str, Tree]]) -> None:
+        for key, parse_tree in items:
+            self._parse_trees[key] = parse_tree
+        if self._persistent_store is not None and items:
+            self._persistent_store.put_many(items)
+
+    def parse(self, expression: str, parse_timeout: int) -> Tree:
+        """Like _parse_expression, but returns cached trees and re-raises cached failures."""
+
+        key = _get_parse_cache_key(expression)
+        if key in self._parse_failures:
+            self.reporter.m_query_parse_cache_hits += 1
+            raise self._parse_failures[key]
+        parse_tree = self._get(key)
+        if parse_tree is not None:
+            self.reporter.m_query_parse_cache_hits += 1
+            return parse_tree
+
+        self.reporter.m_query_parse_cache_misses += 1
+        try:
+            parse_tree = _parse_expression(expression, parse_timeout=parse_timeout)
+        except Exception as e:
+            self._parse_failures[key] = e
+            raise
+        self._put_many([(key, parse_tree)])
+        return parse_tree
+
+    def parse_all(
+        self, expressions: Iterable[str], parse_timeout: int, processes: int
+    ) -> None:
+        """Parses the expressions that aren't cached yet in worker processes."""
+
+        keys: Dict[str, str] = {}
+        for expression in expressions:
+            key = _get_parse_cache_key(expression)
+            if (
+                key not in keys
+                and key not in self._parse_failures
+                and self._get(key) is None
+            ):
+                keys[key] = expression
+        if not keys:
+            return
+
+        logger.info(f"Parsing {len(keys)} M-Query expressions in {processes} processes")
+        with self.reporter.m_query_parallel_parse_timer:
+            # We use spawn instead of fork, since the parent process usually has
+            # open sqlite connections and background threads.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                parse_trees: List[Tuple[str, Tree]] = []
+                for key, result in zip(
+                    keys,
+                    executor.map(
+                        _parse_expression_in_worker,
+                        keys.values(),
+                        [parse_timeout] * len(keys),
+                    ),
+                ):
+                    if result is None:
+                        continue
+                    if isinstance(result, TimeoutException):
+                        self._parse_failures[key] = result
+                    else:
+                        parse_trees.append((key, result))
+                    self.reporter.m_query_parallel_parses += 1
+                self._put_many(parse_trees)
+
+    def close(self) -> None:
+        self._parse_trees.close()
+        if self._persistent_store is not None:
+            self._persistent_store.close()
+
+
 def get_upstream_tables(
     table: Table,
     reporter: PowerBiDashboardSourceReport,
@@ -66,6 +318,7 @@ def get_upstream_tables(
     ctx: PipelineContext,
     config: PowerBiDashboardSourceConfig,
     parameters: Dict[str, str] = {},
+    parse_cache: Optional[MQueryParseCache] = None,
 ) -> List[datahub.ingestion.source.powerbi.m_query.data_classes.Lineage]:
     if table.expression is None:
         logger.debug(f"There is no M-Query expression in table {table.full_name}")
@@ -94,8 +347,14 @@ def get_upstream_tables(
 
         with reporter.m_query_parse_timer:
             reporter.m_query_parse_attempts += 1
-            parse_tree: Tree = _parse_expression(
-                table.expression, parse_timeout=config.m_query_parse_timeout
+            parse_tree: Tree = (
+                parse_cache.parse(
+                    table.expression, parse_timeout=config.m_query_parse_timeout
+                )
+                if parse_cache
+                else _parse_expression(
+                    table.expression, parse_timeout=config.m_query_parse_timeout
+                )
             )
 
     except KeyboardInterrupt:
@@ -49,7 +49,7 @@ from datahub.ingestion.source.powerbi.dataplatform_instance_resolver import (
     AbstractDataPlatformInstanceResolver,
     create_dataplatform_instance_resolver,
 )
-from datahub.ingestion.source.powerbi.m_query import parser
+from datahub.ingestion.source.powerbi.m_query import parser, validator
 from datahub.ingestion.source.powerbi.rest_api_wrapper.powerbi_api import PowerBiAPI
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalHandler,
@@ -124,11 +124,13 @@ class Mapper:
         config: PowerBiDashboardSourceConfig,
         reporter: PowerBiDashboardSourceReport,
         dataplatform_instance_resolver: AbstractDataPlatformInstanceResolver,
+        parse_cache: Optional[parser.MQueryParseCache] = None,
     ):
         self.__ctx = ctx
         self.__config = config
         self.__reporter = reporter
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
+        self.__parse_cache = parse_cache
         self.workspace_key: Optional[ContainerKey] = None
 
     @staticmethod
@@ -247,6 +249,7 @@ class Mapper:
             ctx=self.__ctx,
             config=self.__config,
             parameters=parameters,
+            parse_cache=self.__parse_cache,
         )
 
         logger.debug(
@@ -1238,8 +1241,15 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
             )  # Exit pipeline as we are not able to connect to PowerBI API Service. This exit will avoid raising
             # unwanted stacktrace on console
 
+        self.parse_cache = parser.MQueryParseCache(
+            self.reporter, cache_dir=self.source_config.m_query_parse_cache_dir
+        )
         self.mapper = Mapper(
-            ctx, config, self.reporter, self.dataplatform_instance_resolver
+            ctx,
+            config,
+            self.reporter,
+            self.dataplatform_instance_resolver,
+            parse_cache=self.parse_cache,
         )
 
         # Create and register the stateful ingestion use-case handler.
@@ -1426,9 +1436,38 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
                 ),
             )
 
+    def parse_workspace_expressions(
+        self, workspace: powerbi_data_classes.Workspace
+    ) -> None:
+        if (
+            not self.source_config.extract_lineage
+            or self.source_config.m_query_parse_processes <= 0
+        ):
+            return
+
+        expressions = []
+        for dataset in workspace.datasets.values():
+            for table in dataset.tables:
+                if table.expression is None:
+                    continue
+                valid, _ = validator.validate_parse_tree(
+                    table.expression,
+                    native_query_enabled=self.source_config.native_query_parsing,
+                )
+                if valid:
+                    expressions.append(table.expression)
+
+        self.parse_cache.parse_all(
+            expressions,
+            parse_timeout=self.source_config.m_query_parse_timeout,
+            processes=self.source_config.m_query_parse_processes,
+        )
+
     def get_workspace_workunit(
         self, workspace: powerbi_data_classes.Workspace
     ) -> Iterable[MetadataWorkUnit]:
+        self.parse_workspace_expressions(workspace)
+
         if self.source_config.extract_workspaces_to_containers:
             workspace_workunits = self.mapper.generate_container_for_workspace(
                 workspace
@@ -1510,31 +1549,34 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase, TestableSource):
         batches = more_itertools.chunked(
             allowed_workspaces, self.source_config.scan_batch_size
         )
-        for batch_workspaces in batches:
-            for workspace in self.powerbi_client.fill_workspaces(
-                batch_workspaces, self.reporter
-            ):
-                logger.info(f"Processing workspace id: {workspace.id}")
-
-                if self.source_config.modified_since:
-                    # As modified_workspaces is not idempotent, hence we checkpoint for each powerbi workspace
-                    # Because job_id is used as a dictionary key, we have to set a new job_id
-                    # Refer to https://github.com/datahub-project/datahub/blob/master/metadata-ingestion/src/datahub/ingestion/source/state/stateful_ingestion_base.py#L390
-                    self.stale_entity_removal_handler.set_job_id(workspace.id)
-                    self.state_provider.register_stateful_ingestion_usecase_handler(
-                        self.stale_entity_removal_handler
-                    )
+        for workspace in self.powerbi_client.fill_workspace_batches(
+            batches, self.reporter
+        ):
+            logger.info(f"Processing workspace id: {workspace.id}")
+
+            if self.source_config.modified_since:
+                # As modified_workspaces is not idempotent, hence we checkpoint for each powerbi workspace
+                # Because job_id is used as a dictionary key, we have to set a new job_id
+                # Refer to https://github.com/datahub-project/datahub/blob/master/metadata-ingestion/src/datahub/ingestion/source/state/stateful_ingestion_base.py#L390
+                self.stale_entity_removal_handler.set_job_id(workspace.id)
+                self.state_provider.register_stateful_ingestion_usecase_handler(
+                    self.stale_entity_removal_handler
+                )
 
-                    yield from self._apply_workunit_processors(
-                        [
-                            *super().get_workunit_processors(),
-                            self.stale_entity_removal_handler.workunit_processor,
-                        ],
-                        self.get_workspace_workunit(workspace),
-                    )
-                else:
-                    # Maintain backward compatibility
-                    yield from self.get_workspace_workunit(workspace)
+                yield from self._apply_workunit_processors(
+                    [
+                        *super().get_workunit_processors(),
+                        self.stale_entity_removal_handler.workunit_processor,
+                    ],
+                    self.get_workspace_workunit(workspace),
+                )
+            else:
+                # Maintain backward compatibility
+                yield from self.get_workspace_workunit(workspace)
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.parse_cache.close()
+        super().close()
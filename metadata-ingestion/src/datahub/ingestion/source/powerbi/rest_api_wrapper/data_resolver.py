@@ -1,4 +1,5 @@
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from time import sleep
@@ -9,6 +10,7 @@ import requests
 from requests import Response
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
+from urllib3.util.retry import RequestHistory
 
 from datahub.configuration.common import AllowDenyPattern, ConfigurationError
 from datahub.ingestion.source.powerbi.config import Constant
@@ -37,6 +39,10 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.query import DaxQuery
 # Logger instance
 logger = logging.getLogger(__name__)
 
+# How many throttled (429) responses to retry per request, in addition to the
+# retries for other failures.
+_RATE_LIMIT_RETRIES = 10
+
 
 def is_permission_error(e: Exception) -> bool:
     if not isinstance(e, requests.exceptions.HTTPError):
@@ -69,6 +75,46 @@ class SessionWithTimeout(requests.Session):
         return super().request(method, url, **kwargs)
 
 
+class _RateLimitAwareRetry(Retry):
+    """Retries throttled (429) responses more often than other failures.
+
+    Power BI throttles with 429 responses and a Retry-After header. Waiting as long
+    as the header says and retrying is the expected way to handle them, so up to
+    `rate_limit_retries` of them don't count towards the other retry limits.
+    """
+
+    def __init__(self, *args: Any, rate_limit_retries: int = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.rate_limit_retries = rate_limit_retries
+
+    def new(self, **kw: Any) -> "_RateLimitAwareRetry":
+        kw.setdefault("rate_limit_retries", self.rate_limit_retries)
+        return super().new(**kw)  # type: ignore[return-value]
+
+    def increment(  # type: ignore[override]
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Any = None,
+        error: Optional[Exception] = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> Retry:
+        if (
+            error is None
+            and response is not None
+            and response.status == 429
+            and self.rate_limit_retries > 0
+        ):
+            logger.debug(f"Throttled by Power BI, retrying {url}")
+            return self.new(
+                rate_limit_retries=self.rate_limit_retries - 1,
+                history=self.history
+                + (RequestHistory(method, url, error, response.status, None),),
+            )
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
 class DataResolverBase(ABC):
     SCOPE: str = "https://analysis.windows.net/powerbi/api/.default"
     MY_ORG_URL = "https://api.powerbi.com/v1.0/myorg"
@@ -86,6 +132,7 @@ class DataResolverBase(ABC):
     ):
         self._access_token: Optional[str] = None
         self._access_token_expiry_time: Optional[datetime] = None
+        self._access_token_lock = threading.Lock()
 
         self._tenant_id = tenant_id
         # Test connection by generating access token
@@ -100,20 +147,37 @@ class DataResolverBase(ABC):
 
         logger.info(f"Connected to {self._get_authority_url()}")
 
-        self._request_session = SessionWithTimeout(timeout=metadata_api_timeout)
+        self._metadata_api_timeout = metadata_api_timeout
+        # Workspaces may be fetched from several threads, and requests.Session
+        # isn't guaranteed to be thread-safe, so each thread gets its own session.
+        self._thread_local = threading.local()
+
+    @property
+    def _request_session(self) -> SessionWithTimeout:
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
+        return session
+
+    def _create_session(self) -> SessionWithTimeout:
+        session = SessionWithTimeout(timeout=self._metadata_api_timeout)
 
         # set re-try parameter for request_session
-        self._request_session.mount(
+        session.mount(
             "https://",
             HTTPAdapter(
-                max_retries=Retry(
+                max_retries=_RateLimitAwareRetry(
                     total=3,
                     backoff_factor=1,
                     allowed_methods=None,
                     status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                    rate_limit_retries=_RATE_LIMIT_RETRIES,
                 )
             ),
         )
+        return session
 
     @abstractmethod
     def get_groups_endpoint(self) -> str:
@@ -175,6 +239,10 @@ class DataResolverBase(ABC):
         return {Constant.Authorization: self.get_access_token()}
 
     def get_access_token(self) -> str:
+        with self._access_token_lock:
+            return self._get_access_token()
+
+    def _get_access_token(self) -> str:
         if self._access_token is not None and not self._is_access_token_expired():
             return self._access_token
 
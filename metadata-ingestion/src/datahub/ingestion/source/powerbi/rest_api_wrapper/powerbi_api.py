@@ -1,7 +1,9 @@
+import collections
+import concurrent.futures
 import json
 import logging
 import sys
-from typing import Any, Dict, Iterable, List, Optional, cast
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, cast
 
 import requests
 
@@ -536,10 +538,18 @@ class PowerBiAPI:
     ) -> List[Workspace]:
         workspace_ids = [workspace.id for workspace in workspaces]
         scan_result = self._get_scan_result(workspace_ids)
+        return self._create_workspaces_from_scan_result(workspaces, scan_result)
+
+    def _create_workspaces_from_scan_result(
+        self,
+        workspaces: List[Workspace],
+        scan_result: Any,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> List[Workspace]:
         if not scan_result:
             return workspaces
 
-        workspaces = []
+        workspaces_metadata = []
         for workspace_metadata in scan_result["workspaces"]:
             if (
                 workspace_metadata.get(Constant.STATE) != Constant.ACTIVE
@@ -558,44 +568,59 @@ class PowerBiAPI:
                     context=f"workspace={wrk_identifier}",
                 )
                 continue
+            workspaces_metadata.append(workspace_metadata)
 
-            cur_workspace = Workspace(
-                id=workspace_metadata[Constant.ID],
-                name=workspace_metadata[Constant.NAME],
-                type=workspace_metadata[Constant.TYPE],
-                datasets={},
-                dashboards={},
-                reports={},
-                report_endorsements={},
-                dashboard_endorsements={},
-                scan_result={},
-                independent_datasets={},
-                app=None,  # It is getting set from scan-result
+        if executor is not None:
+            workspaces = list(
+                executor.map(
+                    self._create_workspace_from_scan_result, workspaces_metadata
+                )
             )
-            cur_workspace.scan_result = workspace_metadata
-            cur_workspace.datasets = self._get_workspace_datasets(cur_workspace)
+        else:
+            workspaces = [
+                self._create_workspace_from_scan_result(workspace_metadata)
+                for workspace_metadata in workspaces_metadata
+            ]
+        for cur_workspace in workspaces:
             # collect all datasets in the registry
             self.dataset_registry.update(cur_workspace.datasets)
-            # Fetch endorsement tag if it is enabled from configuration
-            if self.__config.extract_endorsements_to_tags:
-                cur_workspace.dashboard_endorsements = self._get_dashboard_endorsements(
-                    cur_workspace.scan_result
-                )
-                cur_workspace.report_endorsements = self._get_report_endorsements(
-                    cur_workspace.scan_result
-                )
-            else:
-                logger.info(
-                    "Skipping endorsements tag as extract_endorsements_to_tags is not enabled"
-                )
 
-            self._populate_app_details(
-                workspace=cur_workspace,
-                workspace_metadata=workspace_metadata,
+        return workspaces
+
+    def _create_workspace_from_scan_result(self, workspace_metadata: dict) -> Workspace:
+        cur_workspace = Workspace(
+            id=workspace_metadata[Constant.ID],
+            name=workspace_metadata[Constant.NAME],
+            type=workspace_metadata[Constant.TYPE],
+            datasets={},
+            dashboards={},
+            reports={},
+            report_endorsements={},
+            dashboard_endorsements={},
+            scan_result={},
+            independent_datasets={},
+            app=None,  # It is getting set from scan-result
+        )
+        cur_workspace.scan_result = workspace_metadata
+        cur_workspace.datasets = self._get_workspace_datasets(cur_workspace)
+        # Fetch endorsement tag if it is enabled from configuration
+        if self.__config.extract_endorsements_to_tags:
+            cur_workspace.dashboard_endorsements = self._get_dashboard_endorsements(
+                cur_workspace.scan_result
+            )
+            cur_workspace.report_endorsements = self._get_report_endorsements(
+                cur_workspace.scan_result
+            )
+        else:
+            logger.info(
+                "Skipping endorsements tag as extract_endorsements_to_tags is not enabled"
             )
-            workspaces.append(cur_workspace)
 
-        return workspaces
+        self._populate_app_details(
+            workspace=cur_workspace,
+            workspace_metadata=workspace_metadata,
+        )
+        return cur_workspace
 
     def _fill_independent_datasets(self, workspace: Workspace) -> None:
         reachable_datasets: List[str] = []
@@ -673,3 +698,68 @@ class PowerBiAPI:
         for workspace in workspaces:
             self._fill_regular_metadata_detail(workspace=workspace)
         return workspaces
+
+    def fill_workspace_batches(
+        self,
+        batches: Iterable[List[Workspace]],
+        reporter: PowerBiDashboardSourceReport,
+    ) -> Iterable[Workspace]:
+        """
+        Same as calling fill_workspaces for each batch, but with the REST calls made concurrently.
+
+        While a batch is being processed, the scan jobs of the next few batches are already submitted
+        and polled. The datasets, dashboards, reports and apps of the workspaces in a batch are fetched
+        in parallel. The workspaces are still returned in the same order, and the dataset registry is
+        updated one batch at a time, so that the output doesn't depend on the concurrency.
+        """
+        max_workers = self.__config.workspace_extraction_max_workers
+        if max_workers <= 1:
+            for batch in batches:
+                yield from self.fill_workspaces(batch, reporter)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="powerbi_scan"
+        ) as scan_executor, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="powerbi_workspace"
+        ) as workspace_executor:
+            pending: Deque[Tuple[List[Workspace], concurrent.futures.Future]] = (
+                collections.deque()
+            )
+            batches_iter = iter(batches)
+            while True:
+                while len(pending) < max_workers:
+                    next_batch = next(batches_iter, None)
+                    if next_batch is None:
+                        break
+                    logger.info(
+                        f"Submitting scan for workspaces: {[workspace.format_name_for_logger() for workspace in next_batch]}"
+                    )
+                    pending.append(
+                        (
+                            next_batch,
+                            scan_executor.submit(
+                                self._get_scan_result,
+                                [workspace.id for workspace in next_batch],
+                            ),
+                        )
+                    )
+                if not pending:
+                    break
+
+                batch, future = pending.popleft()
+                with reporter.workspace_scan_wait_timer:
+                    scan_result = future.result()
+                workspaces = self._create_workspaces_from_scan_result(
+                    batch, scan_result, executor=workspace_executor
+                )
+                # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
+                yield from workspace_executor.map(
+                    self._fill_regular_metadata_detail_and_return, workspaces
+                )
+
+    def _fill_regular_metadata_detail_and_return(
+        self, workspace: Workspace
+    ) -> Workspace:
+        self._fill_regular_metadata_detail(workspace=workspace)
+        return workspace
@@ -591,8 +591,20 @@ class RedashSource(Source):
         self.report.total_dashboards = total_dashboards
         self.report.max_page_dashboards = max_page
 
+        def _process_page(current_page: int) -> Iterable[MetadataWorkUnit]:
+            # Report and skip a failing page rather than aborting the whole run.
+            try:
+                yield from self._process_dashboard_response(current_page)
+            except Exception as e:
+                self.report.failure(
+                    title="Failed to process dashboards page",
+                    message="Unable to fetch or process a page of dashboards from the Redash API",
+                    context=f"page={current_page}",
+                    exc=e,
+                )
+
         yield from ThreadedIteratorExecutor.process(
-            self._process_dashboard_response,
+            _process_page,
             [(page,) for page in range(1, max_page + 1)],
             max_workers=self.config.parallelism,
         )
@@ -715,8 +727,20 @@ class RedashSource(Source):
         self.report.total_queries = total_queries
         self.report.max_page_queries = max_page
 
+        def _process_page(current_page: int) -> Iterable[MetadataWorkUnit]:
+            # Report and skip a failing page rather than aborting the whole run.
+            try:
+                yield from self._process_query_response(current_page)
+            except Exception as e:
+                self.report.failure(
+                    title="Failed to process queries page",
+                    message="Unable to fetch or process a page of queries from the Redash API",
+                    context=f"page={current_page}",
+                    exc=e,
+                )
+
         yield from ThreadedIteratorExecutor.process(
-            self._process_query_response,
+            _process_page,
             [(page,) for page in range(1, max_page + 1)],
             max_workers=self.config.parallelism,
         )
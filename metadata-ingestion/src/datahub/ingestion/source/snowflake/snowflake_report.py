@@ -13,6 +13,9 @@ from datahub.ingestion.source_report.ingestion_stage import IngestionStageReport
 from datahub.ingestion.source_report.time_window import BaseTimeWindowReport
 from datahub.sql_parsing.sql_parsing_aggregator import SqlAggregatorReport
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutorReport,
+)
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.snowflake.snowflake_queries import (
@@ -131,6 +134,10 @@ class SnowflakeV2Report(
 
     rows_zero_objects_modified: int = 0
 
+    schema_processing_executor: ThreadedIteratorExecutorReport = field(
+        default_factory=ThreadedIteratorExecutorReport
+    )
+
     _processed_tags: MutableSet[str] = field(default_factory=set)
     _scanned_tags: MutableSet[str] = field(default_factory=set)
 
@@ -359,10 +359,25 @@ class SnowflakeSchemaGenerator(SnowflakeStructuredReportMixin):
         def _process_schema_worker(
             snowflake_schema: SnowflakeSchema,
         ) -> Iterable[MetadataWorkUnit]:
-            for wu in self._process_schema(
-                snowflake_schema, snowflake_db.name, db_tables
-            ):
-                yield wu
+            # Report and skip a failing schema rather than letting the executor
+            # propagate the exception and abort the rest of the database.
+            try:
+                for wu in self._process_schema(
+                    snowflake_schema, snowflake_db.name, db_tables
+                ):
+                    yield wu
+            except SnowflakePermissionError as e:
+                self.structured_reporter.failure(
+                    GENERIC_PERMISSION_ERROR_KEY,
+                    f"{snowflake_db.name}.{snowflake_schema.name}",
+                    exc=e,
+                )
+            except Exception as e:
+                self.structured_reporter.failure(
+                    "Failed to process schema",
+                    f"{snowflake_db.name}.{snowflake_schema.name}",
+                    exc=e,
+                )
 
         for wu in ThreadedIteratorExecutor.process(
             worker_func=_process_schema_worker,
@@ -370,6 +385,7 @@ class SnowflakeSchemaGenerator(SnowflakeStructuredReportMixin):
                 (snowflake_schema,) for snowflake_schema in snowflake_db.schemas
             ],
             max_workers=SCHEMA_PARALLELISM,
+            report=self.report.schema_processing_executor,
         ):
             yield wu
 
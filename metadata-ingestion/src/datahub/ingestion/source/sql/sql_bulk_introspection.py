@@ -0,0 +1,782 @@
+import collections
+import logging
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from sqlalchemy import sql
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.sql import sqltypes
+from sqlalchemy.types import TypeEngine
+
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+
+logger = logging.getLogger(__name__)
+
+# Processing usually moves through schemas one at a time, but views are
+# processed after tables.
+_MAX_CACHED_SCHEMAS = 4
+
+
+@dataclass
+class SchemaIntrospectionResult:
+    """Reflection results for all tables and views in a schema, keyed by table name.
+
+    A value of None means that the dialect doesn't support fetching that piece of
+    metadata in bulk, and the regular per-table inspector method should be used.
+    """
+
+    columns: Dict[str, List[dict]]
+    pk_constraints: Optional[Dict[str, dict]] = None
+    foreign_keys: Optional[Dict[str, List[dict]]] = None
+    table_comments: Optional[Dict[str, dict]] = None
+
+
+class BulkSchemaIntrospector(ABC):
+    """Fetches column, constraint and comment metadata for an entire schema at once.
+
+    The SQLAlchemy inspector issues several catalog queries for every table. For
+    schemas with thousands of tables, those round-trips dominate the extraction time.
+    Implementations instead run one query per type of metadata for the whole schema,
+    and return dicts in the same format as the corresponding inspector methods.
+    """
+
+    def __init__(self, dialect: Dialect):
+        self.dialect = dialect
+
+    def introspect_schema(
+        self, conn: Connection, schema: str
+    ) -> SchemaIntrospectionResult:
+        return SchemaIntrospectionResult(
+            columns=self.fetch_columns(conn, schema),
+            pk_constraints=self.fetch_pk_constraints(conn, schema),
+            foreign_keys=self.fetch_foreign_keys(conn, schema),
+            table_comments=self.fetch_table_comments(conn, schema),
+        )
+
+    @abstractmethod
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        pass
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        return None
+
+    def fetch_foreign_keys(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, List[dict]]]:
+        return None
+
+    def fetch_table_comments(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        return None
+
+    def _parse_type(self, data_type: str) -> TypeEngine:
+        # A best-effort fallback: look up the base type name and pass along any
+        # numeric arguments, e.g. "varchar(255)" -> VARCHAR(255).
+        match = re.match(r"^\s*([\w ]+?)\s*(?:\((.*)\))?\s*$", data_type)
+        if not match:
+            return sqltypes.NULLTYPE
+        type_name, type_args = match.groups()
+        type_cls = self.dialect.ischema_names.get(
+            type_name.lower()
+        ) or self.dialect.ischema_names.get(type_name.upper())
+        if type_cls is None:
+            return sqltypes.NULLTYPE
+
+        args = [int(arg) for arg in re.findall(r"\d+", type_args or "")]
+        try:
+            return type_cls(*args)
+        except TypeError:
+            return type_cls()
+
+    @staticmethod
+    def _group_pk_rows(
+        rows: List[Tuple[str, Optional[str], str]],
+    ) -> Dict[str, dict]:
+        # Rows are (table, constraint name, column), ordered by column position.
+        pk_constraints: Dict[str, dict] = {}
+        for table, constraint_name, column in rows:
+            pk = pk_constraints.setdefault(
+                table, {"constrained_columns": [], "name": constraint_name}
+            )
+            pk["constrained_columns"].append(column)
+        return pk_constraints
+
+    @staticmethod
+    def _group_fk_rows(
+        rows: List[Tuple[str, str, str, Optional[str], str, str]],
+    ) -> Dict[str, List[dict]]:
+        # Rows are (table, constraint name, column, referred schema, referred table,
+        # referred column), ordered by constraint and then by column position.
+        foreign_keys: Dict[str, List[dict]] = collections.defaultdict(list)
+        fks_by_name: Dict[Tuple[str, str], dict] = {}
+        for (
+            table,
+            constraint_name,
+            column,
+            referred_schema,
+            referred_table,
+            referred_column,
+        ) in rows:
+            fk = fks_by_name.get((table, constraint_name))
+            if fk is None:
+                fk = {
+                    "name": constraint_name,
+                    "constrained_columns": [],
+                    "referred_schema": referred_schema,
+                    "referred_table": referred_table,
+                    "referred_columns": [],
+                    "options": {},
+                }
+                fks_by_name[(table, constraint_name)] = fk
+                foreign_keys[table].append(fk)
+            fk["constrained_columns"].append(column)
+            fk["referred_columns"].append(referred_column)
+        return dict(foreign_keys)
+
+
+class PostgresBulkSchemaIntrospector(BulkSchemaIntrospector):
+    _RELKINDS = "('r', 'p', 'v', 'm', 'f')"
+
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        rows = conn.execute(
+            sql.text(
+                f"""
+SELECT c.relname AS table_name,
+  a.attname,
+  pg_catalog.format_type(a.atttypid, a.atttypmod) AS format_type,
+  (
+    SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+    FROM pg_catalog.pg_attrdef d
+    WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+    AND a.atthasdef
+  ) AS default_,
+  a.attnotnull,
+  pgd.description AS comment
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_catalog.pg_description pgd ON (
+  pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+WHERE n.nspname = :schema
+AND c.relkind IN {self._RELKINDS}
+AND a.attnum > 0 AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+
+        # The inspector loads these once per table. We only need them once per schema.
+        domains = self.dialect._load_domains(conn)  # type: ignore
+        enums = dict(
+            ((rec["name"],), rec)
+            if rec["visible"]
+            else ((rec["schema"], rec["name"]), rec)
+            for rec in self.dialect._load_enums(conn, schema="*")  # type: ignore
+        )
+
+        columns: Dict[str, List[dict]] = collections.defaultdict(list)
+        for table, name, format_type, default, notnull, comment in rows:
+            columns[table].append(
+                self.dialect._get_column_info(  # type: ignore
+                    name,
+                    format_type,
+                    default,
+                    notnull,
+                    domains,
+                    enums,
+                    schema,
+                    comment,
+                    None,  # generated
+                    None,  # identity
+                )
+            )
+        return dict(columns)
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT c.relname, con.conname, a.attname
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+WHERE n.nspname = :schema AND con.contype = 'p'
+ORDER BY c.relname, k.ord
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_pk_rows([tuple(row) for row in rows])
+
+    def fetch_foreign_keys(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, List[dict]]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT c.relname, con.conname, a.attname, rn.nspname, rc.relname, ra.attname
+FROM pg_catalog.pg_constraint con
+JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+  WITH ORDINALITY AS k(attnum, ref_attnum, ord)
+JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+JOIN pg_catalog.pg_attribute ra ON ra.attrelid = rc.oid AND ra.attnum = k.ref_attnum
+WHERE n.nspname = :schema AND con.contype = 'f'
+ORDER BY c.relname, con.conname, k.ord
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_fk_rows([tuple(row) for row in rows])
+
+    def fetch_table_comments(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                f"""
+SELECT c.relname, pgd.description
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_catalog.pg_description pgd
+  ON pgd.objoid = c.oid AND pgd.objsubid = 0
+  AND pgd.classoid = 'pg_catalog.pg_class'::regclass
+WHERE n.nspname = :schema AND c.relkind IN {self._RELKINDS}
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return {table: {"text": comment} for table, comment in rows}
+
+
+class MySQLBulkSchemaIntrospector(BulkSchemaIntrospector):
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        from sqlalchemy.dialects.mysql.reflection import ReflectedState
+
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT, COLUMN_COMMENT
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = :schema
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+
+        # The inspector parses the output of SHOW CREATE TABLE. We reuse its column
+        # parser on the equivalent column definitions, so that the types match.
+        parser = self.dialect._tabledef_parser  # type: ignore
+        preparer = self.dialect.identifier_preparer
+
+        columns: Dict[str, List[dict]] = collections.defaultdict(list)
+        for table, name, column_type, is_nullable, default, comment in rows:
+            state = ReflectedState()
+            parser._parse_column(
+                f"  {preparer.quote_identifier(name)} {column_type},", state
+            )
+            type_ = state.columns[0]["type"] if state.columns else sqltypes.NULLTYPE
+            columns[table].append(
+                {
+                    "name": name,
+                    "type": type_,
+                    "nullable": is_nullable == "YES",
+                    "default": default,
+                    "comment": comment or None,
+                }
+            )
+        return dict(columns)
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT TABLE_NAME, NULL, COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = :schema AND CONSTRAINT_NAME = 'PRIMARY'
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_pk_rows([tuple(row) for row in rows])
+
+    def fetch_foreign_keys(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, List[dict]]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME,
+  REFERENCED_TABLE_SCHEMA, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = :schema AND REFERENCED_TABLE_NAME IS NOT NULL
+ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_fk_rows([tuple(row) for row in rows])
+
+    def fetch_table_comments(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT TABLE_NAME, TABLE_COMMENT
+FROM information_schema.TABLES
+WHERE TABLE_SCHEMA = :schema
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return {table: {"text": comment or None} for table, comment in rows}
+
+
+class MSSQLBulkSchemaIntrospector(BulkSchemaIntrospector):
+    # Table comments aren't supported by the mssql dialect, and the mssql source
+    # fetches table and column descriptions separately.
+
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, CHARACTER_MAXIMUM_LENGTH,
+  NUMERIC_PRECISION, NUMERIC_SCALE, COLUMN_DEFAULT, COLLATION_NAME
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA = :schema
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+
+        columns: Dict[str, List[dict]] = collections.defaultdict(list)
+        for (
+            table,
+            name,
+            data_type,
+            is_nullable,
+            char_length,
+            numeric_precision,
+            numeric_scale,
+            default,
+            collation,
+        ) in rows:
+            columns[table].append(
+                {
+                    "name": name,
+                    "type": self._make_type(
+                        data_type,
+                        char_length,
+                        numeric_precision,
+                        numeric_scale,
+                        collation,
+                    ),
+                    "nullable": is_nullable == "YES",
+                    "default": default,
+                    "autoincrement": False,
+                }
+            )
+        return dict(columns)
+
+    def _make_type(
+        self,
+        data_type: str,
+        char_length: Optional[int],
+        numeric_precision: Optional[int],
+        numeric_scale: Optional[int],
+        collation: Optional[str],
+    ) -> TypeEngine:
+        # This mirrors how the mssql dialect reflects column types.
+        type_cls = self.dialect.ischema_names.get(data_type)
+        if type_cls is None:
+            return sqltypes.NULLTYPE
+
+        kwargs: Dict[str, Any] = {}
+        if issubclass(type_cls, (sqltypes.String, sqltypes.LargeBinary)) or (
+            issubclass(type_cls, sqltypes._Binary)
+        ):
+            kwargs["length"] = None if char_length == -1 else char_length
+            if collation and issubclass(type_cls, sqltypes.String):
+                kwargs["collation"] = collation
+        if issubclass(type_cls, sqltypes.Numeric):
+            kwargs["precision"] = numeric_precision
+            if not issubclass(type_cls, sqltypes.Float):
+                kwargs["scale"] = numeric_scale
+
+        try:
+            return type_cls(**kwargs)
+        except TypeError:
+            return type_cls()
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.COLUMN_NAME
+FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+  ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+  AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+WHERE tc.TABLE_SCHEMA = :schema AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+ORDER BY kcu.TABLE_NAME, kcu.ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_pk_rows([tuple(row) for row in rows])
+
+    def fetch_foreign_keys(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, List[dict]]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.COLUMN_NAME,
+  rkcu.TABLE_SCHEMA, rkcu.TABLE_NAME, rkcu.COLUMN_NAME
+FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+  ON kcu.CONSTRAINT_SCHEMA = rc.CONSTRAINT_SCHEMA
+  AND kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE rkcu
+  ON rkcu.CONSTRAINT_SCHEMA = rc.UNIQUE_CONSTRAINT_SCHEMA
+  AND rkcu.CONSTRAINT_NAME = rc.UNIQUE_CONSTRAINT_NAME
+  AND rkcu.ORDINAL_POSITION = kcu.ORDINAL_POSITION
+WHERE kcu.TABLE_SCHEMA = :schema
+ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+        return self._group_fk_rows([tuple(row) for row in rows])
+
+
+class OracleBulkSchemaIntrospector(BulkSchemaIntrospector):
+    # Oracle stores unquoted identifiers in upper case, while SQLAlchemy
+    # presents them in lower case.
+
+    def _normalize(self, name: str) -> str:
+        return self.dialect.normalize_name(name)  # type: ignore
+
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT col.table_name, col.column_name, col.data_type, col.char_length,
+  col.data_precision, col.data_scale, col.nullable, col.data_default, com.comments
+FROM all_tab_cols col
+LEFT JOIN all_col_comments com
+  ON col.table_name = com.table_name
+  AND col.column_name = com.column_name
+  AND col.owner = com.owner
+WHERE col.owner = :owner AND col.hidden_column = 'NO'
+ORDER BY col.table_name, col.column_id
+"""
+            ),
+            {"owner": self.dialect.denormalize_name(schema)},  # type: ignore
+        ).fetchall()
+
+        columns: Dict[str, List[dict]] = collections.defaultdict(list)
+        for (
+            table,
+            name,
+            data_type,
+            length,
+            precision,
+            scale,
+            nullable,
+            default,
+            comment,
+        ) in rows:
+            column = {
+                "name": self._normalize(name),
+                "type": self._make_type(data_type, length, precision, scale),
+                "nullable": nullable == "Y",
+                "default": default,
+                "autoincrement": "auto",
+                "comment": comment,
+            }
+            if name.lower() == name:
+                column["quote"] = True
+            columns[self._normalize(table)].append(column)
+        return dict(columns)
+
+    def _make_type(
+        self,
+        data_type: str,
+        length: Optional[int],
+        precision: Optional[int],
+        scale: Optional[int],
+    ) -> TypeEngine:
+        # This mirrors how the oracle dialect reflects column types.
+        from sqlalchemy.dialects.oracle import FLOAT, INTEGER, NUMBER, TIMESTAMP
+
+        if data_type == "NUMBER":
+            if precision is None and scale == 0:
+                return INTEGER()
+            return NUMBER(precision, scale)
+        elif data_type == "FLOAT":
+            return FLOAT()
+        elif data_type in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            return self.dialect.ischema_names[data_type](length)
+        elif "WITH TIME ZONE" in data_type:
+            return TIMESTAMP(timezone=True)
+
+        type_cls = self.dialect.ischema_names.get(re.sub(r"\(\d+\)", "", data_type))
+        if type_cls is None:
+            return sqltypes.NULLTYPE
+        return type_cls()
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT c.table_name, c.constraint_name, cc.column_name
+FROM all_constraints c
+JOIN all_cons_columns cc
+  ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+WHERE c.owner = :owner AND c.constraint_type = 'P'
+ORDER BY c.table_name, cc.position
+"""
+            ),
+            {"owner": self.dialect.denormalize_name(schema)},  # type: ignore
+        ).fetchall()
+        return self._group_pk_rows(
+            [
+                (self._normalize(table), self._normalize(name), self._normalize(col))
+                for table, name, col in rows
+            ]
+        )
+
+    def fetch_foreign_keys(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, List[dict]]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT c.table_name, c.constraint_name, cc.column_name,
+  rc.owner, rc.table_name, rcc.column_name
+FROM all_constraints c
+JOIN all_cons_columns cc
+  ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+JOIN all_constraints rc
+  ON rc.owner = c.r_owner AND rc.constraint_name = c.r_constraint_name
+JOIN all_cons_columns rcc
+  ON rcc.owner = rc.owner AND rcc.constraint_name = rc.constraint_name
+  AND rcc.position = cc.position
+WHERE c.owner = :owner AND c.constraint_type = 'R'
+ORDER BY c.table_name, c.constraint_name, cc.position
+"""
+            ),
+            {"owner": self.dialect.denormalize_name(schema)},  # type: ignore
+        ).fetchall()
+        return self._group_fk_rows(
+            [tuple(self._normalize(value) for value in row) for row in rows]  # type: ignore
+        )
+
+    def fetch_table_comments(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT table_name, comments
+FROM all_tab_comments
+WHERE owner = :owner
+"""
+            ),
+            {"owner": self.dialect.denormalize_name(schema)},  # type: ignore
+        ).fetchall()
+        return {self._normalize(table): {"text": comment} for table, comment in rows}
+
+
+class TrinoBulkSchemaIntrospector(BulkSchemaIntrospector):
+    # Trino has no primary or foreign keys, and the trino source fetches table
+    # properties (including comments) from connector-specific tables.
+
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        from trino.sqlalchemy import datatype
+
+        rows = conn.execute(
+            sql.text(
+                """
+SELECT "table_name", "column_name", "data_type", "column_default",
+  UPPER("is_nullable") AS "is_nullable", "comment"
+FROM "information_schema"."columns"
+WHERE "table_schema" = :schema
+ORDER BY "table_name", "ordinal_position" ASC
+"""
+            ),
+            {"schema": schema},
+        ).fetchall()
+
+        columns: Dict[str, List[dict]] = collections.defaultdict(list)
+        for table, name, data_type, default, is_nullable, comment in rows:
+            columns[table].append(
+                {
+                    "name": name,
+                    "type": datatype.parse_sqltype(data_type),
+                    "nullable": is_nullable == "YES",
+                    "default": default,
+                    "comment": comment,
+                }
+            )
+        return dict(columns)
+
+
+_BULK_SCHEMA_INTROSPECTORS: Dict[str, Type[BulkSchemaIntrospector]] = {
+    "postgresql": PostgresBulkSchemaIntrospector,
+    "mysql": MySQLBulkSchemaIntrospector,
+    "mariadb": MySQLBulkSchemaIntrospector,
+    "mssql": MSSQLBulkSchemaIntrospector,
+    "oracle": OracleBulkSchemaIntrospector,
+    "trino": TrinoBulkSchemaIntrospector,
+}
+
+
+def get_bulk_schema_introspector(
+    dialect: Dialect,
+) -> Optional[BulkSchemaIntrospector]:
+    introspector_cls = _BULK_SCHEMA_INTROSPECTORS.get(dialect.name)
+    if introspector_cls is None:
+        return None
+    return introspector_cls(dialect)
+
+
+class SchemaIntrospectionCache:
+    """Caches the bulk introspection results for the most recently used schemas.
+
+    Each schema is only introspected once, even if it's requested again later.
+    """
+
+    def __init__(self, introspector: BulkSchemaIntrospector, report: SQLSourceReport):
+        self.introspector = introspector
+        self.report = report
+
+        self._results: "collections.OrderedDict[str, Optional[SchemaIntrospectionResult]]" = collections.OrderedDict()
+
+    def get(
+        self, bind: Union[Connection, Engine], schema: str
+    ) -> Optional[SchemaIntrospectionResult]:
+        if schema in self._results:
+            self._results.move_to_end(schema)
+            return self._results[schema]
+
+        result: Optional[SchemaIntrospectionResult] = None
+        try:
+            if isinstance(bind, Engine):
+                with bind.connect() as conn:
+                    result = self.introspector.introspect_schema(conn, schema)
+            else:
+                result = self.introspector.introspect_schema(bind, schema)
+            self.report.num_schemas_bulk_introspected += 1
+        except Exception as e:
+            # We'll fall back to the per-table inspector methods.
+            self.report.warning(
+                title="Failed to introspect schema in bulk",
+                message="Falling back to fetching metadata table by table",
+                context=schema,
+                exc=e,
+            )
+
+        self._results[schema] = result
+        if len(self._results) > _MAX_CACHED_SCHEMAS:
+            self._results.popitem(last=False)
+        return result
+
+
+class BulkIntrospectionInspectorWrapper:
+    """
+    Inspector class wrapper, which answers per-table reflection calls from a
+    schema-level SchemaIntrospectionCache. Anything that isn't in the cache goes
+    to the wrapped inspector.
+    """
+
+    def __init__(self, inspector_instance: Inspector, cache: SchemaIntrospectionCache):
+        self._inspector_instance = inspector_instance
+        self._cache = cache
+
+    def _get_schema_result(
+        self, schema: Optional[str]
+    ) -> Optional[SchemaIntrospectionResult]:
+        if schema is None:
+            return None
+        return self._cache.get(self._inspector_instance.bind, schema)
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        result = self._get_schema_result(schema)
+        if result is not None and table_name in result.columns:
+            self._cache.report.num_bulk_introspection_hits += 1
+            return [dict(column) for column in result.columns[table_name]]
+        return self._inspector_instance.get_columns(table_name, schema, **kw)
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        result = self._get_schema_result(schema)
+        if (
+            result is not None
+            and result.pk_constraints is not None
+            and table_name in result.columns
+        ):
+            pk_constraint = result.pk_constraints.get(table_name)
+            if pk_constraint is None:
+                return {"constrained_columns": [], "name": None}
+            return {
+                **pk_constraint,
+                "constrained_columns": list(pk_constraint["constrained_columns"]),
+            }
+        return self._inspector_instance.get_pk_constraint(table_name, schema, **kw)
+
+    def get_foreign_keys(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        result = self._get_schema_result(schema)
+        if (
+            result is not None
+            and result.foreign_keys is not None
+            and table_name in result.columns
+        ):
+            return [dict(fk) for fk in result.foreign_keys.get(table_name, [])]
+        return self._inspector_instance.get_foreign_keys(table_name, schema, **kw)
+
+    def get_table_comment(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        result = self._get_schema_result(schema)
+        if (
+            result is not None
+            and result.table_comments is not None
+            and table_name in result.table_comments
+        ):
+            return dict(result.table_comments[table_name])
+        return self._inspector_instance.get_table_comment(table_name, schema, **kw)  # type: ignore
+
+    def __getattr__(self, item: str) -> Any:
+        # Map method call to original class
+        return getattr(self._inspector_instance, item)
@@ -2,6 +2,7 @@ import contextlib
 import datetime
 import functools
 import logging
+import threading
 import traceback
 from dataclasses import dataclass, field
 from functools import partial
@@ -35,6 +36,7 @@ from datahub.emitter.mce_builder import (
     make_tag_urn,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.decorators import capability
 from datahub.ingestion.api.incremental_lineage_helper import auto_incremental_lineage
@@ -55,6 +57,11 @@ from datahub.ingestion.source.common.subtypes import (
     DatasetContainerSubTypes,
     DatasetSubTypes,
 )
+from datahub.ingestion.source.sql.sql_bulk_introspection import (
+    BulkIntrospectionInspectorWrapper,
+    SchemaIntrospectionCache,
+    get_bulk_schema_introspector,
+)
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sql_report import SQLSourceReport
 from datahub.ingestion.source.sql.sql_utils import (
@@ -108,6 +115,7 @@ from datahub.metadata.schema_classes import (
 from datahub.sql_parsing.schema_resolver import SchemaResolver
 from datahub.sql_parsing.sql_parsing_aggregator import SqlParsingAggregator
 from datahub.telemetry import telemetry
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.sqlalchemy_type_converter import (
     get_native_data_type_for_sqlalchemy_type,
@@ -257,6 +265,110 @@ def get_schema_metadata(
     return schema_metadata
 
 
+class _ThreadLocalInspectors(Closeable):
+    """Hands out a separate inspector to each worker thread.
+
+    SQLAlchemy connections are not thread-safe, so each thread checks out its
+    own connection from the engine's pool. They're all released on close.
+    """
+
+    def __init__(self, inspector: Inspector):
+        self._engine = inspector.engine
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._exit_stack = contextlib.ExitStack()
+
+    def get(self) -> Inspector:
+        if not hasattr(self._local, "inspector"):
+            with self._lock:
+                conn = self._exit_stack.enter_context(self._engine.connect())
+            self._local.inspector = inspect(conn)
+        return self._local.inspector
+
+    def close(self) -> None:
+        self._exit_stack.close()
+
+
+# The per-table inspector calls that are made by worker threads ahead of time
+# during parallel extraction, by entity type.
+_PREFETCHED_INSPECTOR_METHODS: Dict[str, Tuple[str, ...]] = {
+    "table": (
+        "get_columns",
+        "get_pk_constraint",
+        "get_foreign_keys",
+        "get_table_comment",
+    ),
+    "view": ("get_columns", "get_table_comment", "get_view_definition"),
+}
+
+
+class _PrefetchedInspector:
+    """
+    Inspector class wrapper, which answers the reflection calls for a single table
+    with results that were already fetched by a worker thread. Each result is used
+    at most once, and anything else goes to the wrapped inspector.
+    """
+
+    def __init__(
+        self,
+        inspector_instance: Inspector,
+        schema: str,
+        table_name: str,
+        results: Dict[str, Any],
+    ):
+        self._inspector_instance = inspector_instance
+        self._schema = schema
+        self._table_name = table_name
+        self._results = results
+
+    def _call(
+        self, method: str, table_name: str, schema: Optional[str], **kw: Any
+    ) -> Any:
+        if (
+            not kw
+            and table_name == self._table_name
+            and schema == self._schema
+            and method in self._results
+        ):
+            result = self._results.pop(method)
+            # Errors are raised where the call is made, like they would be
+            # without prefetching.
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return getattr(self._inspector_instance, method)(table_name, schema, **kw)
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        return self._call("get_columns", table_name, schema, **kw)
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        return self._call("get_pk_constraint", table_name, schema, **kw)
+
+    def get_foreign_keys(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        return self._call("get_foreign_keys", table_name, schema, **kw)
+
+    def get_table_comment(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        return self._call("get_table_comment", table_name, schema, **kw)
+
+    def get_view_definition(
+        self, view_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> str:
+        return self._call("get_view_definition", view_name, schema, **kw)
+
+    def __getattr__(self, item: str) -> Any:
+        # Map method call to original class
+        return getattr(self._inspector_instance, item)
+
+
 # config flags to emit telemetry for
 config_options_to_report = [
     "include_views",
@@ -525,8 +637,22 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
             sql_config.options.setdefault(
                 "max_overflow", sql_config.profiling.max_workers
             )
+        if sql_config.metadata_extraction_max_workers > 1:
+            sql_config.options.setdefault(
+                "max_overflow", sql_config.metadata_extraction_max_workers
+            )
 
         for inspector in self.get_inspectors():
+            if sql_config.bulk_schema_introspection:
+                inspector = self._wrap_with_bulk_introspection(inspector)
+            if sql_config.metadata_extraction_max_workers > 1 and (
+                not self._is_parallel_extraction_enabled(inspector, sql_config)
+            ):
+                logger.info(
+                    "Parallel metadata extraction is not supported with a wrapped inspector, "
+                    "e.g. with bulk_schema_introspection; processing tables sequentially"
+                )
+
             profiler = None
             profile_requests: List["GEProfilerRequest"] = []
             if sql_config.is_profiling_enabled():
@@ -637,50 +763,148 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         schema: str,
         sql_config: SQLCommonConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
-        tables_seen: Set[str] = set()
         data_reader = self.make_data_reader(inspector)
         with data_reader or contextlib.nullcontext():
-            try:
-                for table in inspector.get_table_names(schema):
-                    dataset_name = self.get_identifier(
-                        schema=schema, entity=table, inspector=inspector
+            for table_inspector, dataset_name, table in self._prefetch_in_parallel(
+                inspector,
+                schema,
+                self._get_tables_to_process(inspector, schema, sql_config),
+                ent_type="table",
+                sql_config=sql_config,
+            ):
+                try:
+                    yield from self._process_table(
+                        dataset_name,
+                        table_inspector,
+                        schema,
+                        table,
+                        sql_config,
+                        data_reader,
+                    )
+                except Exception as e:
+                    self.report.warning(
+                        "Error processing table",
+                        context=f"{schema}.{table}",
+                        exc=e,
                     )
 
-                    if dataset_name not in tables_seen:
-                        tables_seen.add(dataset_name)
-                    else:
-                        logger.debug(
-                            f"{dataset_name} has already been seen, skipping..."
-                        )
-                        continue
-
-                    self.report.report_entity_scanned(dataset_name, ent_type="table")
-                    if not sql_config.table_pattern.allowed(dataset_name):
-                        self.report.report_dropped(dataset_name)
-                        continue
-
-                    try:
-                        yield from self._process_table(
-                            dataset_name,
-                            inspector,
-                            schema,
-                            table,
-                            sql_config,
-                            data_reader,
-                        )
-                    except Exception as e:
-                        self.report.warning(
-                            "Error processing table",
-                            context=f"{schema}.{table}",
-                            exc=e,
-                        )
-            except Exception as e:
-                self.report.failure(
-                    "Error processing tables",
-                    context=schema,
-                    exc=e,
+    def _get_tables_to_process(
+        self,
+        inspector: Inspector,
+        schema: str,
+        sql_config: SQLCommonConfig,
+    ) -> Iterable[Tuple[str, str]]:
+        tables_seen: Set[str] = set()
+        try:
+            for table in inspector.get_table_names(schema):
+                dataset_name = self.get_identifier(
+                    schema=schema, entity=table, inspector=inspector
+                )
+
+                if dataset_name not in tables_seen:
+                    tables_seen.add(dataset_name)
+                else:
+                    logger.debug(f"{dataset_name} has already been seen, skipping...")
+                    continue
+
+                self.report.report_entity_scanned(dataset_name, ent_type="table")
+                if not sql_config.table_pattern.allowed(dataset_name):
+                    self.report.report_dropped(dataset_name)
+                    continue
+
+                yield dataset_name, table
+        except Exception as e:
+            self.report.failure(
+                "Error processing tables",
+                context=schema,
+                exc=e,
+            )
+
+    def _prefetch_in_parallel(
+        self,
+        inspector: Inspector,
+        schema: str,
+        entities: Iterable[Tuple[str, str]],
+        ent_type: str,
+        sql_config: SQLCommonConfig,
+    ) -> Iterable[Tuple[Inspector, str, str]]:
+        """Yields an inspector to use for each (dataset_name, entity) pair.
+
+        With parallel extraction, worker threads make the per-table inspector calls
+        ahead of time, and the returned inspector answers them from those results.
+        Everything else, including the calls to the aggregator and the report, still
+        happens on the calling thread.
+        """
+
+        if not self._is_parallel_extraction_enabled(inspector, sql_config):
+            for dataset_name, entity in entities:
+                yield inspector, dataset_name, entity
+            return
+
+        thread_inspectors = _ThreadLocalInspectors(inspector)
+
+        def _prefetch(
+            dataset_name: str, entity: str
+        ) -> Tuple[str, str, Dict[str, Any]]:
+            thread_inspector = thread_inspectors.get()
+
+            results: Dict[str, Any] = {}
+            for method in _PREFETCHED_INSPECTOR_METHODS[ent_type]:
+                try:
+                    results[method] = getattr(thread_inspector, method)(entity, schema)
+                except Exception as e:
+                    results[method] = e
+            return dataset_name, entity, results
+
+        with thread_inspectors:
+            for future in BackpressureAwareExecutor.map(
+                _prefetch,
+                entities,
+                max_workers=sql_config.metadata_extraction_max_workers,
+            ):
+                dataset_name, entity, results = future.result()
+                yield (
+                    cast(
+                        Inspector,
+                        _PrefetchedInspector(inspector, schema, entity, results),
+                    ),
+                    dataset_name,
+                    entity,
                 )
 
+    def _is_parallel_extraction_enabled(
+        self, inspector: Inspector, sql_config: SQLCommonConfig
+    ) -> bool:
+        if sql_config.metadata_extraction_max_workers <= 1:
+            return False
+        # Worker threads create plain inspectors for their own connections, so
+        # they can't reproduce inspectors that a source has wrapped.
+        return isinstance(inspector, Inspector)
+
+    def _wrap_with_bulk_introspection(self, inspector: Inspector) -> Inspector:
+        if not isinstance(inspector, Inspector):
+            # Sources like Oracle wrap the inspector to change how metadata is
+            # fetched, e.g. from the DBA_* views. The bulk introspectors would
+            # silently bypass that.
+            logger.info(
+                "Bulk schema introspection is not supported for sources with a customized inspector; "
+                "fetching metadata table by table"
+            )
+            return inspector
+
+        introspector = get_bulk_schema_introspector(inspector.dialect)
+        if introspector is None:
+            logger.info(
+                f"Bulk schema introspection is not supported for {inspector.dialect.name}; "
+                "fetching metadata table by table"
+            )
+            return inspector
+
+        # Schema names are only unique within a database, so each inspector
+        # gets its own cache.
+        cache = SchemaIntrospectionCache(introspector, self.report)
+        return cast(Inspector, BulkIntrospectionInspectorWrapper(inspector, cache))
+
     def add_information_for_schema(self, inspector: Inspector, schema: str) -> None:
         pass
 
@@ -992,6 +1216,34 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         schema: str,
         sql_config: SQLCommonConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        for view_inspector, dataset_name, view in self._prefetch_in_parallel(
+            inspector,
+            schema,
+            self._get_views_to_process(inspector, schema, sql_config),
+            ent_type="view",
+            sql_config=sql_config,
+        ):
+            try:
+                yield from self._process_view(
+                    dataset_name=dataset_name,
+                    inspector=view_inspector,
+                    schema=schema,
+                    view=view,
+                    sql_config=sql_config,
+                )
+            except Exception as e:
+                self.report.warning(
+                    "Error processing view",
+                    context=f"{schema}.{view}",
+                    exc=e,
+                )
+
+    def _get_views_to_process(
+        self,
+        inspector: Inspector,
+        schema: str,
+        sql_config: SQLCommonConfig,
+    ) -> Iterable[Tuple[str, str]]:
         try:
             for view in inspector.get_view_names(schema):
                 dataset_name = self.get_identifier(
@@ -1003,20 +1255,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
                     self.report.report_dropped(dataset_name)
                     continue
 
-                try:
-                    yield from self._process_view(
-                        dataset_name=dataset_name,
-                        inspector=inspector,
-                        schema=schema,
-                        view=view,
-                        sql_config=sql_config,
-                    )
-                except Exception as e:
-                    self.report.warning(
-                        "Error processing view",
-                        context=f"{schema}.{view}",
-                        exc=e,
-                    )
+                yield dataset_name, view
         except Exception as e:
             self.report.failure(
                 "Error processing views",
@@ -109,6 +109,25 @@ class SQLCommonConfig(
         " Requires `include_view_lineage` to be enabled.",
     )
 
+    metadata_extraction_max_workers: int = Field(
+        default=1,
+        description="Number of threads to use for fetching table and view metadata within a schema. "
+        "Each thread checks out its own connection from the SQLAlchemy connection pool and makes the per-table "
+        "column, constraint, comment and view definition calls; the tables are then processed one at a time. "
+        "Workunits for a given table or view are always emitted together, but tables may be emitted in a different order. "
+        "Not supported together with bulk_schema_introspection, or for sources that wrap the SQLAlchemy inspector. "
+        "Defaults to 1, which processes tables and views sequentially.",
+    )
+
+    bulk_schema_introspection: bool = Field(
+        default=False,
+        description="Fetch columns, primary keys, foreign keys and table comments for an entire schema "
+        "with one catalog query each, instead of issuing several queries per table. "
+        "This is much faster for schemas with many tables, at the cost of holding one schema's metadata in memory. "
+        "Supported for postgres, mysql, mariadb, mssql, oracle and trino; ignored for other platforms, "
+        "and for sources that customize the inspector, such as oracle with data_dictionary_mode other than ALL.",
+    )
+
     use_file_backed_cache: bool = Field(
         default=True,
         description="Whether to use a file backed cache for the view definitions.",
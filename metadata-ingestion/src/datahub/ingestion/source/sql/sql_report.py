@@ -48,6 +48,9 @@ class SQLSourceReport(
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
 
+    num_schemas_bulk_introspected: int = 0
+    num_bulk_introspection_hits: int = 0
+
     num_view_definitions_parsed: int = 0
     num_view_definitions_view_urn_mismatch: int = 0
     num_view_definitions_failed_parsing: int = 0
@@ -1,10 +1,25 @@
+import collections
+import concurrent.futures
 import json
 import logging
+import multiprocessing
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import partial
-from typing import Iterable, List, Optional, Set
+from itertools import islice
+from typing import (
+    IO,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pydantic import Field
 
@@ -35,11 +50,27 @@ from datahub.ingestion.api.source_helpers import auto_workunit_reporter
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
-from datahub.sql_parsing.schema_resolver import SchemaResolver
-from datahub.sql_parsing.sqlglot_lineage import sqlglot_lineage
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolver
+from datahub.sql_parsing.sql_parsing_pool import _SnapshotSchemaResolver
+from datahub.sql_parsing.sqlglot_lineage import (
+    SqlParsingResult,
+    _sqlglot_lineage_nocache,
+    get_referenced_tables,
+    sqlglot_lineage,
+)
+from datahub.utilities.perf_timer import PerfTimer
 
 logger = logging.getLogger(__name__)
 
+# Queries are read in batches, so that the schemas for all of the tables in a batch
+# can be fetched together. This is kept below the size of the parsed statement
+# cache, so that extracting the tables doesn't cause queries to be parsed twice.
+_QUERY_BATCH_SIZE = 500
+
+# In parallel mode, the query file is split into shards of roughly this size.
+# Each worker parses a whole shard at a time.
+_SHARD_SIZE_BYTES = 4 * 1024 * 1024
+
 
 class SqlQueriesSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
     query_file: str = Field(description="Path to file to ingest")
@@ -70,15 +101,46 @@ class SqlQueriesSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
         description="The SQL dialect to use when parsing queries. Overrides automatic dialect detection.",
         default=None,
     )
+    parsing_processes: int = Field(
+        description="If set, the query file is split into shards by byte offset, and the queries are "
+        "parsed in this many worker processes. Each worker parses against a snapshot of the schemas "
+        "loaded when ingestion starts, so this works best with `use_schema_resolver` enabled. "
+        "The results are merged in file order, so the output matches sequential parsing.",
+        default=0,
+        ge=0,
+    )
 
 
+@dataclass
 class SqlQueriesSourceReport(SourceReport):
     num_queries_parsed: int = 0
     num_table_parse_failures: int = 0
     num_column_parse_failures: int = 0
+    schema_prefetch_timer: PerfTimer = field(default_factory=PerfTimer)
+
+    query_file_bytes: int = 0
+    query_file_bytes_processed: int = 0
+    query_file_progress_pct: Optional[float] = None
+    query_file_timer: PerfTimer = field(default_factory=PerfTimer)
+    queries_parsed_per_sec: Optional[float] = None
+
+    # Parallel mode only.
+    num_query_file_shards: int = 0
+    num_query_file_shards_processed: int = 0
+    num_query_file_shards_failed: int = 0
+    # Queries that were parsed again in the main process because schemas that were
+    # missing from the workers' snapshot became available.
+    num_queries_reparsed: int = 0
 
     def compute_stats(self) -> None:
         super().compute_stats()
+        if self.query_file_bytes:
+            self.query_file_progress_pct = round(
+                100 * self.query_file_bytes_processed / self.query_file_bytes, 2
+            )
+        elapsed = self.query_file_timer.elapsed_seconds()
+        if elapsed > 0:
+            self.queries_parsed_per_sec = round(self.num_queries_parsed / elapsed, 2)
         self.table_failure_rate = (
             f"{self.num_table_parse_failures / self.num_queries_parsed:.4f}"
             if self.num_queries_parsed
@@ -158,31 +220,175 @@ class SqlQueriesSource(Source):
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         logger.info(f"Parsing queries from {os.path.basename(self.config.query_file)}")
-        with open(self.config.query_file) as f:
-            for line in f:
+        self.report.query_file_bytes = os.path.getsize(self.config.query_file)
+        with self.report.query_file_timer:
+            if self.config.parsing_processes > 0:
+                yield from self._process_query_file_parallel()
+            else:
+                with open(self.config.query_file, "rb") as f:
+                    yield from self._process_lines(f)
+
+        logger.info("Generating workunits")
+        yield from self.builder.gen_workunits()
+
+    def _process_lines(self, lines: Iterator[bytes]) -> Iterable[MetadataWorkUnit]:
+        while True:
+            batch = list(islice(lines, _QUERY_BATCH_SIZE))
+            if not batch:
+                break
+
+            entries: List[QueryEntry] = []
+            for line in batch:
+                try:
+                    entries.append(_parse_query_line(line, self.config))
+                except Exception as e:
+                    logger.warning("Error processing query", exc_info=True)
+                    self.report.report_warning("process-query", str(e))
+
+            self._prefetch_schemas(entries)
+
+            for entry in entries:
                 try:
-                    query_dict = json.loads(line, strict=False)
-                    entry = QueryEntry.create(query_dict, config=self.config)
                     yield from self._process_query(entry)
                 except Exception as e:
                     logger.warning("Error processing query", exc_info=True)
                     self.report.report_warning("process-query", str(e))
 
-        logger.info("Generating workunits")
-        yield from self.builder.gen_workunits()
+            self.report.query_file_bytes_processed += sum(len(line) for line in batch)
+
+    def _process_query_file_parallel(self) -> Iterable[MetadataWorkUnit]:
+        processes = self.config.parsing_processes
+        shards = _get_shard_offsets(self.config.query_file, _SHARD_SIZE_BYTES)
+        self.report.num_query_file_shards = len(shards)
+
+        snapshot = self.schema_resolver.snapshot()
+        logger.info(
+            f"Parsing {len(shards)} shards of the query file in {processes} processes, "
+            f"with a snapshot of {len(snapshot)} schemas"
+        )
+
+        # We use spawn instead of fork, since the parent process usually has
+        # open sqlite connections and background threads.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.schema_resolver.platform,
+                self.schema_resolver.platform_instance,
+                self.schema_resolver.env,
+                snapshot,
+            ),
+        ) as executor:
+            # To bound memory usage, only a couple shards per worker are in flight.
+            # The results are consumed in file order, so the builder sees the same
+            # sequence of queries as it would when parsing sequentially.
+            pending: Deque[Tuple[Tuple[int, int], concurrent.futures.Future]] = (
+                collections.deque()
+            )
+            shards_iter = iter(shards)
+            while True:
+                while len(pending) < 2 * processes:
+                    shard = next(shards_iter, None)
+                    if shard is None:
+                        break
+                    pending.append(
+                        (
+                            shard,
+                            executor.submit(
+                                _parse_shard,
+                                self.config.query_file,
+                                *shard,
+                                self.config,
+                            ),
+                        )
+                    )
+                if not pending:
+                    break
+
+                (start, end), future = pending.popleft()
+                try:
+                    shard_result: _ShardResult = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to parse bytes {start}-{end} of the query file in a worker; "
+                        f"parsing them in the main process instead: {e}",
+                        exc_info=True,
+                    )
+                    self.report.num_query_file_shards_failed += 1
+                    with open(self.config.query_file, "rb") as f:
+                        yield from self._process_lines(_read_shard(f, start, end))
+                else:
+                    yield from self._process_shard_result(shard_result)
+                    self.report.query_file_bytes_processed += end - start
+
+                self.report.num_query_file_shards_processed += 1
+                logger.info(
+                    f"Processed {self.report.num_query_file_shards_processed} of "
+                    f"{len(shards)} query file shards ({self.report.num_queries_parsed} queries)"
+                )
+
+    def _process_shard_result(
+        self, shard_result: "_ShardResult"
+    ) -> Iterable[MetadataWorkUnit]:
+        for error in shard_result.errors:
+            self.report.report_warning("process-query", error)
+
+        if self.schema_resolver.graph is not None:
+            # Some of the schemas that were missing from the snapshot may be fetchable.
+            self.schema_resolver.prefetch_urns(
+                urn
+                for parsed in shard_result.parsed
+                for urn in parsed.missing_urns
+                if not self.schema_resolver.is_cached(urn)
+            )
 
-    def _process_query(self, entry: "QueryEntry") -> Iterable[MetadataWorkUnit]:
+        for parsed in shard_result.parsed:
+            try:
+                if any(
+                    self.schema_resolver.has_urn(urn) for urn in parsed.missing_urns
+                ):
+                    self.report.num_queries_reparsed += 1
+                    yield from self._process_query(parsed.entry)
+                else:
+                    yield from self._process_query(parsed.entry, result=parsed.result)
+            except Exception as e:
+                logger.warning("Error processing query", exc_info=True)
+                self.report.report_warning("process-query", str(e))
+
+    def _prefetch_schemas(self, entries: List["QueryEntry"]) -> None:
+        if self.schema_resolver.graph is None:
+            # All of the schemas were already loaded up front.
+            return
+
+        with self.report.schema_prefetch_timer:
+            self.schema_resolver.prefetch_tables(
+                table
+                for entry in entries
+                for table in get_referenced_tables(
+                    entry.query,
+                    platform=self.config.platform,
+                    default_db=self.config.default_db,
+                    default_schema=self.config.default_schema,
+                    default_dialect=self.config.default_dialect,
+                )
+            )
+
+    def _process_query(
+        self, entry: "QueryEntry", result: Optional[SqlParsingResult] = None
+    ) -> Iterable[MetadataWorkUnit]:
         self.report.num_queries_parsed += 1
         if self.report.num_queries_parsed % 1000 == 0:
             logger.info(f"Parsed {self.report.num_queries_parsed} queries")
 
-        result = sqlglot_lineage(
-            sql=entry.query,
-            schema_resolver=self.schema_resolver,
-            default_db=self.config.default_db,
-            default_schema=self.config.default_schema,
-            default_dialect=self.config.default_dialect,
-        )
+        if result is None:
+            result = sqlglot_lineage(
+                sql=entry.query,
+                schema_resolver=self.schema_resolver,
+                default_db=self.config.default_db,
+                default_schema=self.config.default_schema,
+                default_dialect=self.config.default_dialect,
+            )
         if result.debug_info.table_error:
             logger.info(f"Error parsing table lineage, {result.debug_info.table_error}")
             self.report.num_table_parse_failures += 1
@@ -251,3 +457,108 @@ class QueryEntry:
                 for table in entry_dict.get("upstream_tables", [])
             ],
         )
+
+
+def _parse_query_line(line: bytes, config: SqlQueriesSourceConfig) -> QueryEntry:
+    query_dict = json.loads(line, strict=False)
+    return QueryEntry.create(query_dict, config=config)
+
+
+def _get_shard_offsets(path: str, shard_size: int) -> List[Tuple[int, int]]:
+    """Splits a file into (start, end) byte ranges that fall on line boundaries."""
+
+    file_size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as f:
+        while offsets[-1] + shard_size < file_size:
+            # Move past the end of the line that the nominal boundary falls in.
+            f.seek(offsets[-1] + shard_size)
+            f.readline()
+            offset = f.tell()
+            if offset >= file_size:
+                break
+            offsets.append(offset)
+    offsets.append(file_size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if start < end]
+
+
+def _read_shard(f: IO[bytes], start: int, end: int) -> Iterator[bytes]:
+    f.seek(start)
+    position = start
+    while position < end:
+        line = f.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line
+
+
+@dataclass
+class _ParsedQuery:
+    entry: QueryEntry
+    result: SqlParsingResult
+
+    # The urns that were not present in the worker's schema snapshot.
+    missing_urns: FrozenSet[str]
+
+
+@dataclass
+class _ShardResult:
+    parsed: List[_ParsedQuery]
+    errors: List[str]
+
+
+# Each worker process holds its own copy of the snapshot resolver.
+_worker_schema_resolver: Optional[_SnapshotSchemaResolver] = None
+
+
+def _init_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    snapshot: Dict[str, Optional[SchemaInfo]],
+) -> None:
+    global _worker_schema_resolver
+    _worker_schema_resolver = _SnapshotSchemaResolver(
+        platform=platform,
+        platform_instance=platform_instance,
+        env=env,
+        snapshot=snapshot,
+    )
+
+
+def _parse_shard(
+    path: str, start: int, end: int, config: SqlQueriesSourceConfig
+) -> _ShardResult:
+    resolver = _worker_schema_resolver
+    assert resolver is not None, "worker was not initialized"
+
+    shard_result = _ShardResult(parsed=[], errors=[])
+    with open(path, "rb") as f:
+        for line in _read_shard(f, start, end):
+            try:
+                entry = _parse_query_line(line, config)
+
+                # We can't use the cached variant of sqlglot_lineage here, since a
+                # cache hit would not record the urns that are missing.
+                resolver.missing_urns = set()
+                result = _sqlglot_lineage_nocache(
+                    entry.query,
+                    schema_resolver=resolver,
+                    default_db=config.default_db,
+                    default_schema=config.default_schema,
+                    default_dialect=config.default_dialect,
+                )
+            except Exception as e:
+                logger.warning("Error processing query", exc_info=True)
+                shard_result.errors.append(str(e))
+                continue
+
+            shard_result.parsed.append(
+                _ParsedQuery(
+                    entry=entry,
+                    result=result,
+                    missing_urns=frozenset(resolver.missing_urns),
+                )
+            )
+    return shard_result
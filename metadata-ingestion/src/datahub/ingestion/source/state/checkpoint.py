@@ -5,9 +5,11 @@ import functools
 import json
 import logging
 import pickle
+import struct
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Callable, Generic, List, Optional, Type, TypeVar
 
 import pydantic
 
@@ -18,10 +20,52 @@ from datahub.metadata.schema_classes import (
     IngestionCheckpointStateClass,
 )
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
 
+# The compact serdes can split large states across multiple checkpoint aspects.
+# The zstd variant is used when the zstandard package is installed.
+COMPACT_SERDE_ZSTD = "base85-zstd-compact-json"
+COMPACT_SERDE_ZLIB = "base85-zlib-compact-json"
+_COMPACT_SERDES = {COMPACT_SERDE_ZSTD, COMPACT_SERDE_ZLIB}
+_MAX_CHECKPOINT_SHARDS = 64
+# shard index, number of shards
+_SHARD_HEADER = struct.Struct(">HH")
+
+
+def get_compact_serde() -> str:
+    return COMPACT_SERDE_ZSTD if zstandard is not None else COMPACT_SERDE_ZLIB
+
+
+def get_checkpoint_shard_job_name(job_name: str, shard: int) -> str:
+    """Returns the job name that the given shard of a checkpoint is stored under.
+
+    The first shard is always stored under the job's own name.
+    """
+    return job_name if shard == 0 else f"{job_name}-shard-{shard}"
+
+
+def _compress_compact(serde: str, data: bytes) -> bytes:
+    if serde == COMPACT_SERDE_ZSTD:
+        if zstandard is None:
+            raise ImportError(f"The {serde} serde requires the zstandard package")
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    return zlib.compress(data, 9)
+
+
+def _decompress_compact(serde: str, data: bytes) -> bytes:
+    if serde == COMPACT_SERDE_ZSTD:
+        if zstandard is None:
+            raise ImportError(f"The {serde} serde requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -58,6 +102,13 @@ class CheckpointStateBase(ConfigModel):
             )
         elif self.serde == "base85-bz2-json":
             encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+        elif self.serde in _COMPACT_SERDES:
+            shards = self.to_byte_shards(max_allowed_state_size=max_allowed_state_size)
+            if len(shards) > 1:
+                raise ValueError(
+                    f"The state size has exceeded the max_allowed_state_size of {max_allowed_state_size}"
+                )
+            encoded_bytes = shards[0]
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -78,6 +129,47 @@ class CheckpointStateBase(ConfigModel):
     ) -> bytes:
         return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
 
+    def to_byte_shards(
+        self, max_allowed_state_size: int = DEFAULT_MAX_STATE_SIZE
+    ) -> List[bytes]:
+        """
+        Serializes the state into one or more payloads, each within max_allowed_state_size.
+        Only the compact serdes split the state into multiple payloads.
+        """
+
+        if self.serde not in _COMPACT_SERDES:
+            return [self.to_bytes(max_allowed_state_size=max_allowed_state_size)]
+
+        body = _compress_compact(
+            self.serde, json.dumps(self._to_compact_obj()).encode("utf-8")
+        )
+
+        # base85 encodes every 4 bytes as 5 characters.
+        chunk_size = max_allowed_state_size // 5 * 4 - _SHARD_HEADER.size
+        if chunk_size <= 0:
+            raise ValueError(
+                f"The max_allowed_state_size of {max_allowed_state_size} is too small"
+            )
+        chunks = [
+            body[i : i + chunk_size] for i in range(0, max(len(body), 1), chunk_size)
+        ]
+        if len(chunks) > _MAX_CHECKPOINT_SHARDS:
+            raise ValueError(
+                f"The state size has exceeded {_MAX_CHECKPOINT_SHARDS} shards "
+                f"of max_allowed_state_size {max_allowed_state_size}"
+            )
+        return [
+            base64.b85encode(_SHARD_HEADER.pack(i, len(chunks)) + chunk)
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def _to_compact_obj(self) -> dict:
+        """
+        Returns the state as a JSON-compatible dict for the compact serdes. Subclasses can
+        override this to encode large fields more efficiently.
+        """
+        return json.loads(CheckpointStateBase._to_bytes_utf8(self))
+
     def prepare_for_commit(self) -> None:
         """
         Perform any pre-commit steps, such as deduplication, custom-compression across data etc.
@@ -107,7 +199,14 @@ class Checkpoint(Generic[StateType]):
         job_name: str,
         checkpoint_aspect: Optional[DatahubIngestionCheckpointClass],
         state_class: Type[StateType],
+        shard_loader: Optional[
+            Callable[[int], Optional[DatahubIngestionCheckpointClass]]
+        ] = None,
     ) -> Optional["Checkpoint[StateType]"]:
+        """
+        Constructs the checkpoint from its aspect. For states that were split across multiple
+        aspects, shard_loader is used to fetch the remaining shards by their index.
+        """
         if checkpoint_aspect is None:
             return None
         else:
@@ -128,6 +227,10 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
+                elif checkpoint_aspect.state.serde in _COMPACT_SERDES:
+                    state_obj = Checkpoint._from_compact_bytes(
+                        checkpoint_aspect, state_class, shard_loader
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
@@ -202,24 +305,96 @@ class Checkpoint(Generic[StateType]):
         state_as_dict["serde"] = checkpoint_aspect.state.serde
         return state_class.parse_obj(state_as_dict)
 
+    @staticmethod
+    def _from_compact_bytes(
+        checkpoint_aspect: DatahubIngestionCheckpointClass,
+        state_class: Type[StateType],
+        shard_loader: Optional[
+            Callable[[int], Optional[DatahubIngestionCheckpointClass]]
+        ],
+    ) -> StateType:
+        serde = checkpoint_aspect.state.serde
+        chunks: List[bytes] = []
+        num_shards = 1
+        while len(chunks) < num_shards:
+            shard = len(chunks)
+            shard_aspect = (
+                checkpoint_aspect
+                if shard == 0
+                else (shard_loader(shard) if shard_loader else None)
+            )
+            if (
+                shard_aspect is None
+                or shard_aspect.runId != checkpoint_aspect.runId
+                or shard_aspect.state.serde != serde
+                or shard_aspect.state.payload is None
+            ):
+                raise ValueError(
+                    f"Shard {shard} of {num_shards} of the checkpoint state is missing "
+                    f"or belongs to a different run"
+                )
+
+            data = base64.b85decode(shard_aspect.state.payload)
+            shard_index, num_shards = _SHARD_HEADER.unpack_from(data)
+            if shard_index != shard:
+                raise ValueError(
+                    f"Expected checkpoint shard {shard}, got {shard_index}"
+                )
+            chunks.append(data[_SHARD_HEADER.size :])
+
+        state_as_dict = json.loads(
+            _decompress_compact(serde, b"".join(chunks)).decode("utf-8")
+        )
+        state_as_dict["version"] = checkpoint_aspect.state.formatVersion
+        state_as_dict["serde"] = serde
+        return state_class.parse_obj(state_as_dict)
+
+    def _make_checkpoint_aspect(
+        self, payload: bytes, timestamp_millis: int
+    ) -> DatahubIngestionCheckpointClass:
+        return DatahubIngestionCheckpointClass(
+            timestampMillis=timestamp_millis,
+            pipelineName=self.pipeline_name,
+            platformInstanceId="",
+            runId=self.run_id,
+            config="",
+            state=IngestionCheckpointStateClass(
+                formatVersion=self.state.version,
+                serde=self.state.serde,
+                payload=payload,
+            ),
+        )
+
+    def to_checkpoint_aspects(
+        self, max_allowed_state_size: int
+    ) -> List[DatahubIngestionCheckpointClass]:
+        """
+        Like to_checkpoint_aspect, but states using a compact serde may be split across
+        multiple aspects. These must be committed under get_checkpoint_shard_job_name.
+        """
+        try:
+            payloads = self.state.to_byte_shards(
+                max_allowed_state_size=max_allowed_state_size
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to construct the checkpoint aspect from checkpoint object", e
+            )
+            return []
+
+        timestamp_millis = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
+        return [
+            self._make_checkpoint_aspect(payload, timestamp_millis)
+            for payload in payloads
+        ]
+
     def to_checkpoint_aspect(
         self, max_allowed_state_size: int
     ) -> Optional[DatahubIngestionCheckpointClass]:
         try:
-            checkpoint_state = IngestionCheckpointStateClass(
-                formatVersion=self.state.version,
-                serde=self.state.serde,
-                payload=self.state.to_bytes(
-                    max_allowed_state_size=max_allowed_state_size
-                ),
-            )
-            checkpoint_aspect = DatahubIngestionCheckpointClass(
-                timestampMillis=int(datetime.now(tz=timezone.utc).timestamp() * 1000),
-                pipelineName=self.pipeline_name,
-                platformInstanceId="",
-                runId=self.run_id,
-                config="",
-                state=checkpoint_state,
+            checkpoint_aspect = self._make_checkpoint_aspect(
+                self.state.to_bytes(max_allowed_state_size=max_allowed_state_size),
+                int(datetime.now(tz=timezone.utc).timestamp() * 1000),
             )
             return checkpoint_aspect
         except Exception as e:
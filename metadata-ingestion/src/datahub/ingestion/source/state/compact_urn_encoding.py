@@ -0,0 +1,112 @@
+"""A compact encoding for large, sorted lists of urns.
+
+Urns are sorted and split into runs that share an entity type and, where there
+is one, a platform. Within each run, every urn is stored as the length of the
+prefix it shares with the previous urn plus the remaining suffix. Since sorted
+urns tend to share long prefixes, this is much smaller than the plain list even
+before compression.
+
+Because the encoded urns are sorted, set operations against other sorted urn
+lists can be done with a single merge pass instead of building sets.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from datahub.utilities.urns.urn import guess_entity_type
+
+_PLATFORM_PREFIX = "(urn:li:dataPlatform:"
+
+
+def _get_group_key(urn: str) -> str:
+    if not urn.startswith("urn:li:"):
+        return ""
+    entity_type = guess_entity_type(urn)
+    entity_id = urn[len("urn:li:") + len(entity_type) + 1 :]
+    if entity_id.startswith(_PLATFORM_PREFIX):
+        platform = entity_id[len(_PLATFORM_PREFIX) :].split(",", 1)[0]
+        return f"{entity_type}:{platform}"
+    return entity_type
+
+
+def _shared_prefix_length(a: str, b: str) -> int:
+    max_length = min(len(a), len(b))
+    i = 0
+    while i < max_length and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def encode_urns(urns: Iterable[str]) -> Dict[str, Any]:
+    """Encodes the urns, which are sorted and deduplicated in the process."""
+
+    groups: List[Dict[str, Any]] = []
+    group: Optional[Dict[str, Any]] = None
+    prev = ""
+    for urn in sorted(set(urns)):
+        key = _get_group_key(urn)
+        if group is None or group["key"] != key:
+            # Each group is encoded independently of the others.
+            group = {"key": key, "prefix_lengths": [], "suffixes": []}
+            groups.append(group)
+            prev = ""
+
+        prefix_length = _shared_prefix_length(prev, urn)
+        group["prefix_lengths"].append(prefix_length)
+        group["suffixes"].append(urn[prefix_length:])
+        prev = urn
+    return {"groups": groups}
+
+
+def iter_decoded_urns(
+    encoded: Dict[str, Any], entity_type: Optional[str] = None
+) -> Iterator[str]:
+    """Yields the encoded urns in sorted order, optionally for only one entity type."""
+
+    for group in encoded["groups"]:
+        if entity_type is not None and group["key"].split(":", 1)[0] != entity_type:
+            continue
+
+        prev = ""
+        for prefix_length, suffix in zip(group["prefix_lengths"], group["suffixes"]):
+            prev = prev[:prefix_length] + suffix
+            yield prev
+
+
+def decode_urns(encoded: Dict[str, Any]) -> List[str]:
+    return list(iter_decoded_urns(encoded))
+
+
+def iter_sorted_difference(a: Iterable[str], b: Iterable[str]) -> Iterator[str]:
+    """Yields the distinct items of a that are not in b. Both must be sorted."""
+
+    b_iter = iter(b)
+    b_item = next(b_iter, None)
+    prev = None
+    for item in a:
+        if item == prev:
+            continue
+        prev = item
+
+        while b_item is not None and b_item < item:
+            b_item = next(b_iter, None)
+        if b_item != item:
+            yield item
+
+
+def count_sorted_intersection(a: Iterable[str], b: Iterable[str]) -> int:
+    """Counts the distinct items in both a and b. Both must be sorted."""
+
+    count = 0
+    b_iter = iter(b)
+    b_item = next(b_iter, None)
+    prev = None
+    for item in a:
+        if item == prev:
+            continue
+        prev = item
+
+        while b_item is not None and b_item < item:
+            b_item = next(b_iter, None)
+        if b_item == item:
+            count += 1
+    return count
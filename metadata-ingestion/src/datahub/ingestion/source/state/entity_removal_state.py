@@ -1,9 +1,16 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 import pydantic
 
 from datahub.emitter.mce_builder import make_assertion_urn, make_container_urn
 from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
+from datahub.ingestion.source.state.compact_urn_encoding import (
+    count_sorted_intersection,
+    decode_urns,
+    encode_urns,
+    iter_sorted_difference,
+)
 from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 from datahub.utilities.dedup_list import deduplicate_list
 from datahub.utilities.urns.urn import guess_entity_type
@@ -67,6 +74,7 @@ class GenericCheckpointState(CheckpointStateBase):
     # We can't used OrderedSet here because pydantic doesn't recognize it and
     # it isn't JSON serializable.
     _urns_set: set = pydantic.PrivateAttr(default_factory=set)
+    _sorted_urns: Optional[List[str]] = pydantic.PrivateAttr(default=None)
 
     _migration = pydantic_state_migrator(
         {
@@ -83,11 +91,32 @@ class GenericCheckpointState(CheckpointStateBase):
         }
     )
 
+    @pydantic.validator("urns", pre=True)
+    def _decode_compact_urns(cls, v: Any) -> Any:
+        # The compact serdes store the urns in encoded form.
+        if isinstance(v, dict):
+            return decode_urns(v)
+        return v
+
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
         self.urns = deduplicate_list(self.urns)
         self._urns_set = set(self.urns)
 
+    def _to_compact_obj(self) -> dict:
+        obj = json.loads(self.json(exclude={"version", "serde", "urns"}))
+        obj["urns"] = encode_urns(self.urns)
+        return obj
+
+    def _get_sorted_urns(self) -> List[str]:
+        # States loaded from a compact serde are already sorted, in which case
+        # we avoid making a copy.
+        if self._sorted_urns is None:
+            if _is_sorted(self.urns):
+                return self.urns
+            self._sorted_urns = sorted(self.urns)
+        return self._sorted_urns
+
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
         Adds an urn into the list used for tracking the type.
@@ -100,6 +129,18 @@ class GenericCheckpointState(CheckpointStateBase):
         if urn not in self._urns_set:
             self.urns.append(urn)
             self._urns_set.add(urn)
+            self._sorted_urns = None
+
+    def add_checkpoint_urns(self, urns: Iterable[str]) -> None:
+        """
+        Adds multiple urns at once, skipping any that are already present.
+        """
+
+        new_urns = [urn for urn in dict.fromkeys(urns) if urn not in self._urns_set]
+        if new_urns:
+            self.urns.extend(new_urns)
+            self._urns_set.update(new_urns)
+            self._sorted_urns = None
 
     def get_urns_not_in(
         self, type: str, other_checkpoint_state: "GenericCheckpointState"
@@ -112,7 +153,10 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Both urn lists are sorted, so we can merge them instead of building sets.
+        diff = iter_sorted_difference(
+            self._get_sorted_urns(), other_checkpoint_state._get_sorted_urns()
+        )
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -133,11 +177,18 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
 
-        old_urns_filtered = filter_ignored_entity_types(old_checkpoint_state.urns)
-
-        return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_urns_filtered
+        # Both urn lists are sorted, so this doesn't need any copies of them.
+        old_urns = old_checkpoint_state._get_sorted_urns()
+        old_count = _count_distinct_sorted(
+            urn for urn in old_urns if not _is_ignored_entity_urn(urn)
         )
+        if not old_count:
+            return 0.0
+        overlap_count = count_sorted_intersection(
+            (urn for urn in old_urns if not _is_ignored_entity_urn(urn)),
+            self._get_sorted_urns(),
+        )
+        return (1 - overlap_count / old_count) * 100.0
 
     def urn_count(self) -> int:
         return len(self.urns)
@@ -162,9 +213,37 @@ def compute_percent_entities_changed(
 def _get_entity_overlap_and_cardinalities(
     new_entities: List[str], old_entities: List[str]
 ) -> Tuple[int, int, int]:
-    new_set = set(new_entities)
-    old_set = set(old_entities)
-    return len(new_set.intersection(old_set)), len(old_set), len(new_set)
+    # Sorting is linear if the lists are already sorted.
+    new_sorted = sorted(new_entities)
+    old_sorted = sorted(old_entities)
+    return (
+        count_sorted_intersection(new_sorted, old_sorted),
+        _count_distinct_sorted(old_sorted),
+        _count_distinct_sorted(new_sorted),
+    )
+
+
+def _count_distinct_sorted(items: Iterable[str]) -> int:
+    count = 0
+    prev = None
+    for item in items:
+        if item != prev:
+            count += 1
+            prev = item
+    return count
+
+
+def _is_sorted(items: List[str]) -> bool:
+    return all(items[i] <= items[i + 1] for i in range(len(items) - 1))
+
+
+_IGNORED_ENTITY_URN_PREFIXES = tuple(
+    f"urn:li:{entity_type}:" for entity_type in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
+)
+
+
+def _is_ignored_entity_urn(urn: str) -> bool:
+    return urn.startswith(_IGNORED_ENTITY_URN_PREFIXES)
 
 
 def filter_ignored_entity_types(urns: List[str]) -> List[str]:
@@ -173,11 +252,4 @@ def filter_ignored_entity_types(urns: List[str]) -> List[str]:
     # setting of `fail_safe_threshold` due to removal of irrelevant urns from new state,
     # here, we would ignore irrelevant urns from percentage entities changed computation
     # This special handling can be removed after few months.
-    return [
-        urn
-        for urn in urns
-        if not any(
-            urn.startswith(f"urn:li:{entityType}")
-            for entityType in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
-        )
-    ]
+    return [urn for urn in urns if not _is_ignored_entity_urn(urn)]
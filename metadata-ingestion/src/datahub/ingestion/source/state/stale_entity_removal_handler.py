@@ -1,8 +1,11 @@
 import logging
+import os
 from dataclasses import dataclass, field
 from functools import partial
 from typing import Dict, Iterable, Optional, Set, Type, cast
 
+import humanfriendly
+import psutil
 import pydantic
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -10,7 +13,7 @@ from datahub.emitter.mcp_builder import entity_supports_aspect
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.source.state.checkpoint import Checkpoint
+from datahub.ingestion.source.state.checkpoint import Checkpoint, get_compact_serde
 from datahub.ingestion.source.state.entity_removal_state import (
     STATEFUL_INGESTION_IGNORED_ENTITY_TYPES,
     GenericCheckpointState,
@@ -26,6 +29,7 @@ from datahub.ingestion.source.state.use_case_handler import (
 )
 from datahub.metadata.schema_classes import StatusClass
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.urns.urn import guess_entity_type
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -54,12 +58,27 @@ class StaleEntityRemovalSourceReport(StatefulIngestionReport):
     soft_deleted_stale_entities: LossyList[str] = field(default_factory=LossyList)
     last_state_non_deletable_entities: LossyList[str] = field(default_factory=LossyList)
 
+    stale_entity_percent_changed_timer: PerfTimer = field(default_factory=PerfTimer)
+    stale_entity_diff_timer: PerfTimer = field(default_factory=PerfTimer)
+    stale_entity_copy_state_timer: PerfTimer = field(default_factory=PerfTimer)
+    # Process memory usage after each phase of the stale entity removal.
+    stale_entity_removal_memory_usage: Dict[str, str] = field(default_factory=dict)
+
     def report_stale_entity_soft_deleted(self, urn: str) -> None:
         self.soft_deleted_stale_entities.append(urn)
 
     def report_last_state_non_deletable_entities(self, urn: str) -> None:
         self.last_state_non_deletable_entities.append(urn)
 
+    def report_stale_entity_removal_memory_usage(self, phase: str) -> None:
+        try:
+            mem_usage = psutil.Process(os.getpid()).memory_info().rss
+            self.stale_entity_removal_memory_usage[phase] = humanfriendly.format_size(
+                mem_usage
+            )
+        except Exception as e:
+            logger.warning(f"Failed to compute memory usage: {e}")
+
 
 def auto_stale_entity_removal(
     stale_entity_removal_handler: "StaleEntityRemovalHandler",
@@ -200,7 +219,13 @@ class StaleEntityRemovalHandler(
         return self.checkpointing_enabled
 
     def _get_state_obj(self):
-        return self.state_type_class()
+        state = self.state_type_class()
+        if (
+            self.stateful_ingestion_config
+            and self.stateful_ingestion_config.compact_state_encoding
+        ):
+            state.serde = get_compact_serde()
+        return state
 
     def create_checkpoint(self) -> Optional[Checkpoint]:
         if self.is_checkpointing_enabled() and not self._ignore_new_state():
@@ -281,10 +306,17 @@ class StaleEntityRemovalHandler(
             )
             copy_previous_state_and_exit = True
 
+        report = self.source.get_report()
+        assert isinstance(report, StaleEntityRemovalSourceReport)
+
         # Check if the entity delta is below the fail-safe threshold.
-        entity_difference_percent = cur_checkpoint_state.get_percent_entities_changed(
-            last_checkpoint_state
-        )
+        # Both states are already in memory, since the current one is committed at
+        # the end of the run. The diff merges their sorted urns without copying them.
+        with report.stale_entity_percent_changed_timer:
+            entity_difference_percent = (
+                cur_checkpoint_state.get_percent_entities_changed(last_checkpoint_state)
+            )
+        report.report_stale_entity_removal_memory_usage("percent_changed")
         if not copy_previous_state_and_exit and (
             entity_difference_percent
             > self.stateful_ingestion_config.fail_safe_threshold
@@ -314,17 +346,18 @@ stateful_ingestion:\
                 f"Copying urns from last state (size {len(last_checkpoint_state.urns)}) to current state (size {len(cur_checkpoint_state.urns)}) "
                 "to ensure stale entities from previous runs are deleted on the next successful run."
             )
-            for urn in last_checkpoint_state.urns:
-                self.add_entity_to_state("", urn)
+            if not self._ignore_new_state():
+                with report.stale_entity_copy_state_timer:
+                    cur_checkpoint_state.add_checkpoint_urns(last_checkpoint_state.urns)
+                report.report_stale_entity_removal_memory_usage("copy_state")
             return
 
-        report = self.source.get_report()
-        assert isinstance(report, StaleEntityRemovalSourceReport)
-
         # Everything looks good, emit the soft-deletion workunits
-        for urn in last_checkpoint_state.get_urns_not_in(
+        stale_urns = last_checkpoint_state.get_urns_not_in(
             type="*", other_checkpoint_state=cur_checkpoint_state
-        ):
+        )
+        report.stale_entity_diff_timer.start()
+        for urn in stale_urns:
             entity_type = guess_entity_type(urn)
             if (
                 entity_type in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
@@ -339,7 +372,10 @@ stateful_ingestion:\
                     f"Not soft-deleting entity {urn} since it is in urns_to_skip"
                 )
                 continue
-            yield self._create_soft_delete_workunit(urn)
+            with report.stale_entity_diff_timer.pause():
+                yield self._create_soft_delete_workunit(urn)
+        report.stale_entity_diff_timer.finish()
+        report.report_stale_entity_removal_memory_usage("diff")
 
     def add_entity_to_state(self, type: str, urn: str) -> None:
         if not self.is_checkpointing_enabled() or self._ignore_new_state():
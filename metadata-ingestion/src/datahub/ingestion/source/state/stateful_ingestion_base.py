@@ -21,7 +21,11 @@ from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
     JobId,
 )
 from datahub.ingestion.api.source import Source, SourceCapability, SourceReport
-from datahub.ingestion.source.state.checkpoint import Checkpoint, StateType
+from datahub.ingestion.source.state.checkpoint import (
+    Checkpoint,
+    StateType,
+    get_checkpoint_shard_job_name,
+)
 from datahub.ingestion.source.state.use_case_handler import (
     StatefulIngestionUsecaseHandlerBase,
 )
@@ -75,6 +79,13 @@ class StatefulIngestionConfig(ConfigModel):
         description="If set to True, ignores the current checkpoint state.",
         hidden_from_docs=True,
     )
+    compact_state_encoding: bool = Field(
+        default=False,
+        description="If set to True, the checkpoint state is stored sorted, prefix-encoded and "
+        "compressed with zstd (or zlib if zstandard isn't installed), and large states are split "
+        "across multiple checkpoint aspects. Older versions of the CLI can't read state written this way.",
+        hidden_from_docs=True,
+    )
 
     @pydantic.root_validator(skip_on_failure=True)
     def validate_config(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -345,10 +356,16 @@ class StateProviderWrapper:
             )
 
             # Convert it to a first-class Checkpoint object.
+            provider = self.ingestion_checkpointing_state_provider
+            pipeline_name = self.ctx.pipeline_name
             last_checkpoint = Checkpoint[StateType].create_from_checkpoint_aspect(
                 job_name=job_id,
                 checkpoint_aspect=last_checkpoint_aspect,
                 state_class=checkpoint_state_class,
+                shard_loader=lambda shard: provider.get_latest_checkpoint(
+                    pipeline_name=pipeline_name,
+                    job_name=JobId(get_checkpoint_shard_job_name(job_id, shard)),
+                ),
             )
         return last_checkpoint
 
@@ -408,7 +425,7 @@ class StateProviderWrapper:
                 continue
             job_checkpoint.prepare_for_commit()
             try:
-                checkpoint_aspect = job_checkpoint.to_checkpoint_aspect(
+                checkpoint_aspects = job_checkpoint.to_checkpoint_aspects(
                     self.stateful_ingestion_config.max_checkpoint_state_size
                 )
             except Exception as e:
@@ -417,8 +434,10 @@ class StateProviderWrapper:
                     e,
                 )
             else:
-                if checkpoint_aspect is not None:
-                    job_checkpoint_aspects[job_name] = checkpoint_aspect
+                for shard, checkpoint_aspect in enumerate(checkpoint_aspects):
+                    job_checkpoint_aspects[
+                        JobId(get_checkpoint_shard_job_name(job_name, shard))
+                    ] = checkpoint_aspect
 
         # Set the state to commit in the provider.
         assert self.ingestion_checkpointing_state_provider
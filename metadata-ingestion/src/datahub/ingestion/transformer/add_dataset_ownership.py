@@ -13,6 +13,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
 from datahub.ingestion.transformer.dataset_transformer import OwnershipTransformer
 from datahub.metadata.schema_classes import (
     BrowsePathsV2Class,
@@ -60,7 +61,10 @@ class AddDatasetOwnership(OwnershipTransformer):
 
     @staticmethod
     def _merge_with_server_ownership(
-        graph: DataHubGraph, urn: str, mce_ownership: Optional[OwnershipClass]
+        graph: DataHubGraph,
+        urn: str,
+        mce_ownership: Optional[OwnershipClass],
+        server_aspect_cache: Optional[ServerAspectCache] = None,
     ) -> Optional[OwnershipClass]:
         if not mce_ownership or not mce_ownership.owners:
             # If there are no owners to add, we don't need to patch anything.
@@ -69,7 +73,11 @@ class AddDatasetOwnership(OwnershipTransformer):
         # Merge the transformed ownership with existing server ownership.
         # The transformed ownership takes precedence, which may change the ownership type.
 
-        server_ownership = graph.get_ownership(entity_urn=urn)
+        server_ownership = (
+            server_aspect_cache.get_aspect(urn, OwnershipClass)
+            if server_aspect_cache
+            else graph.get_ownership(entity_urn=urn)
+        )
         if server_ownership:
             owners = {owner.owner: owner for owner in server_ownership.owners}
             owners.update({owner.owner: owner for owner in mce_ownership.owners})
@@ -149,7 +157,10 @@ class AddDatasetOwnership(OwnershipTransformer):
             return cast(
                 Optional[Aspect],
                 self._merge_with_server_ownership(
-                    self.ctx.graph, entity_urn, out_ownership_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    out_ownership_aspect,
+                    server_aspect_cache=self.ctx.server_aspect_cache,
                 ),
             )
         else:
@@ -10,6 +10,7 @@ from datahub.configuration.import_resolver import pydantic_resolve_key
 from datahub.emitter.mce_builder import Aspect
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
 from datahub.ingestion.transformer.dataset_transformer import (
     DatasetPropertiesTransformer,
 )
@@ -58,11 +59,14 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
         graph: DataHubGraph,
         entity_urn: str,
         dataset_properties_aspect: Optional[DatasetPropertiesClass],
+        server_aspect_cache: Optional[ServerAspectCache] = None,
     ) -> Optional[DatasetPropertiesClass]:
         assert dataset_properties_aspect
 
         server_dataset_properties_aspect: Optional[DatasetPropertiesClass] = (
-            graph.get_dataset_properties(entity_urn)
+            server_aspect_cache.get_aspect(entity_urn, DatasetPropertiesClass)
+            if server_aspect_cache
+            else graph.get_dataset_properties(entity_urn)
         )
         # No need to take any action if server properties is None or there is not customProperties in server properties
         if (
@@ -108,7 +112,10 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
             assert self.ctx.graph
             patch_dataset_properties_aspect = (
                 AddDatasetProperties._merge_with_server_properties(
-                    self.ctx.graph, entity_urn, out_dataset_properties_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    out_dataset_properties_aspect,
+                    server_aspect_cache=self.ctx.server_aspect_cache,
                 )
             )
             return cast(Optional[Aspect], patch_dataset_properties_aspect)
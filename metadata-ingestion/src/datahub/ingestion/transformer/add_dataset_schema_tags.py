@@ -90,7 +90,9 @@ class AddDatasetSchemaTags(DatasetSchemaMetadataTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             server_schema_metadata_aspect: Optional[SchemaMetadataClass] = (
-                self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
+                self.ctx.server_aspect_cache.get_aspect(entity_urn, SchemaMetadataClass)
+                if self.ctx.server_aspect_cache
+                else self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
             )
             if server_schema_metadata_aspect is not None:
                 if not schema_metadata_aspect:
@@ -11,6 +11,7 @@ from datahub.configuration.import_resolver import pydantic_resolve_key
 from datahub.emitter.mce_builder import Aspect
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
 from datahub.ingestion.transformer.dataset_transformer import DatasetTermsTransformer
 from datahub.metadata.schema_classes import (
     AuditStampClass,
@@ -47,6 +48,7 @@ class AddDatasetTerms(DatasetTermsTransformer):
         graph: DataHubGraph,
         urn: str,
         glossary_terms_aspect: Optional[GlossaryTermsClass],
+        server_aspect_cache: Optional[ServerAspectCache] = None,
     ) -> Optional[GlossaryTermsClass]:
         if not glossary_terms_aspect or not glossary_terms_aspect.terms:
             # nothing to add, no need to consult server
@@ -54,7 +56,11 @@ class AddDatasetTerms(DatasetTermsTransformer):
 
         # Merge the transformed terms with existing server terms.
         # The transformed terms takes precedence, which may change the term context.
-        server_glossary_terms_aspect = graph.get_glossary_terms(entity_urn=urn)
+        server_glossary_terms_aspect = (
+            server_aspect_cache.get_aspect(urn, GlossaryTermsClass)
+            if server_aspect_cache
+            else graph.get_glossary_terms(entity_urn=urn)
+        )
         if server_glossary_terms_aspect is not None:
             glossary_terms_aspect.terms = list(
                 {
@@ -94,7 +100,10 @@ class AddDatasetTerms(DatasetTermsTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             patch_glossary_terms = AddDatasetTerms._merge_with_server_glossary_terms(
-                self.ctx.graph, entity_urn, out_glossary_terms
+                self.ctx.graph,
+                entity_urn,
+                out_glossary_terms,
+                server_aspect_cache=self.ctx.server_aspect_cache,
             )
             return cast(Optional[Aspect], patch_glossary_terms)
         else:
@@ -14,6 +14,7 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
 from datahub.ingestion.transformer.dataset_transformer import DatasetDomainTransformer
 from datahub.metadata.schema_classes import (
     BrowsePathsV2Class,
@@ -91,14 +92,21 @@ class AddDatasetDomain(DatasetDomainTransformer):
 
     @staticmethod
     def _merge_with_server_domains(
-        graph: Optional[DataHubGraph], urn: str, mce_domain: Optional[DomainsClass]
+        graph: Optional[DataHubGraph],
+        urn: str,
+        mce_domain: Optional[DomainsClass],
+        server_aspect_cache: Optional[ServerAspectCache] = None,
     ) -> Optional[DomainsClass]:
         if not mce_domain or not mce_domain.domains:
             # nothing to add, no need to consult server
             return None
 
         assert graph
-        server_domain = graph.get_domain(entity_urn=urn)
+        server_domain = (
+            server_aspect_cache.get_aspect(urn, DomainsClass)
+            if server_aspect_cache
+            else graph.get_domain(entity_urn=urn)
+        )
         if server_domain:
             # compute patch
             # we only include domain who are not present in the server domain list
@@ -180,12 +188,19 @@ class AddDatasetDomain(DatasetDomainTransformer):
         if domain_aspect.domains:
             if self.config.on_conflict == TransformerOnConflict.DO_NOTHING:
                 assert self.ctx.graph
-                server_domain = self.ctx.graph.get_domain(entity_urn)
+                server_domain = (
+                    self.ctx.server_aspect_cache.get_aspect(entity_urn, DomainsClass)
+                    if self.ctx.server_aspect_cache
+                    else self.ctx.graph.get_domain(entity_urn)
+                )
                 if server_domain and server_domain.domains:
                     return None
             if self.config.semantics == TransformerSemantics.PATCH:
                 final_aspect = AddDatasetDomain._merge_with_server_domains(
-                    self.ctx.graph, entity_urn, domain_aspect
+                    self.ctx.graph,
+                    entity_urn,
+                    domain_aspect,
+                    server_aspect_cache=self.ctx.server_aspect_cache,
                 )
         return cast(Optional[Aspect], final_aspect)
 
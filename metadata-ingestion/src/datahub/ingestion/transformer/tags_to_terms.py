@@ -8,6 +8,7 @@ from datahub.configuration.common import (
 from datahub.emitter.mce_builder import Aspect, make_term_urn
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
 from datahub.ingestion.transformer.dataset_transformer import TagsToTermTransformer
 from datahub.metadata.schema_classes import (
     AuditStampClass,
@@ -40,6 +41,7 @@ class TagsToTermMapper(TagsToTermTransformer):
         graph: DataHubGraph,
         urn: str,
         glossary_terms_aspect: Optional[GlossaryTermsClass],
+        server_aspect_cache: Optional[ServerAspectCache] = None,
     ) -> Optional[GlossaryTermsClass]:
         if not glossary_terms_aspect or not glossary_terms_aspect.terms:
             # nothing to add, no need to consult server
@@ -47,7 +49,11 @@ class TagsToTermMapper(TagsToTermTransformer):
 
         # Merge the transformed terms with existing server terms.
         # The transformed terms takes precedence, which may change the term context.
-        server_glossary_terms_aspect = graph.get_glossary_terms(entity_urn=urn)
+        server_glossary_terms_aspect = (
+            server_aspect_cache.get_aspect(urn, GlossaryTermsClass)
+            if server_aspect_cache
+            else graph.get_glossary_terms(entity_urn=urn)
+        )
         if server_glossary_terms_aspect is not None:
             glossary_terms_aspect.terms = list(
                 {
@@ -136,7 +142,10 @@ class TagsToTermMapper(TagsToTermTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             patch_glossary_terms: Optional[GlossaryTermsClass] = (
                 TagsToTermMapper._merge_with_server_glossary_terms(
-                    self.ctx.graph, entity_urn, out_glossary_terms
+                    self.ctx.graph,
+                    entity_urn,
+                    out_glossary_terms,
+                    server_aspect_cache=self.ctx.server_aspect_cache,
                 )
             )
             return cast(Optional[Aspect], patch_glossary_terms)
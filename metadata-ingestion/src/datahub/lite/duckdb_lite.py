@@ -1,8 +1,21 @@
+import contextlib
 import json
 import logging
 import pathlib
+import re
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import duckdb
 
@@ -38,6 +51,91 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# The number of distinct edges to buffer before writing them to the edge table.
+_EDGE_BUFFER_FLUSH_SIZE = 10_000
+
+
+# Weights for the search index, by the kind of text that a token came from.
+_SEARCH_WEIGHT_URN = 1.0
+_SEARCH_WEIGHT_NAME = 3.0
+_SEARCH_WEIGHT_DESCRIPTION = 1.0
+_SEARCH_WEIGHT_TAG = 2.0
+_SEARCH_WEIGHT_FIELD_PATH = 1.5
+# Tokens that match a search term exactly rank higher than prefix matches.
+_SEARCH_PREFIX_MATCH_PENALTY = 0.5
+# The pseudo-aspect name used for tokens that come from the urn itself.
+_SEARCH_URN_ASPECT = "urn"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_FIELD_PATH_ANNOTATION_PATTERN = re.compile(r"\[[^\]]*\]")
+_URN_STOPWORDS = {"urn", "li"}
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _search_rows_for_urn(urn: str) -> List[Tuple[str, str, str, str, float]]:
+    return [
+        (token, urn, _SEARCH_URN_ASPECT, "urn", _SEARCH_WEIGHT_URN)
+        for token in sorted(set(_tokenize(urn)) - _URN_STOPWORDS)
+    ]
+
+
+def _search_rows_for_aspect(
+    urn: str, aspect_name: str, aspect_json: dict
+) -> List[Tuple[str, str, str, str, float]]:
+    """Extracts the (token, urn, aspect_name, field, weight) rows for the search index."""
+
+    texts: List[Tuple[str, str, float]] = []
+    if aspect_name == "globalTags":
+        for tag in aspect_json.get("tags") or []:
+            tag_urn = tag.get("tag") or ""
+            texts.append(("tag", tag_urn.split(":", 3)[-1], _SEARCH_WEIGHT_TAG))
+    elif aspect_name == "schemaMetadata":
+        for schema_field in aspect_json.get("fields") or []:
+            field_path = _FIELD_PATH_ANNOTATION_PATTERN.sub(
+                "", schema_field.get("fieldPath") or ""
+            )
+            texts.append(("fieldPath", field_path, _SEARCH_WEIGHT_FIELD_PATH))
+    else:
+        for field, weight in [
+            ("name", _SEARCH_WEIGHT_NAME),
+            ("title", _SEARCH_WEIGHT_NAME),
+            ("description", _SEARCH_WEIGHT_DESCRIPTION),
+        ]:
+            value = aspect_json.get(field)
+            if isinstance(value, str):
+                texts.append((field, value, weight))
+
+    rows: Dict[Tuple[str, str], float] = {}
+    for field, text, weight in texts:
+        for token in _tokenize(text):
+            rows[(token, field)] = max(rows.get((token, field), 0.0), weight)
+    return [
+        (token, urn, aspect_name, field, weight)
+        for (token, field), weight in rows.items()
+    ]
+
+
+def _split_on_duplicate_keys(
+    writeables: List[MetadataChangeProposalWrapper],
+) -> Iterable[List[MetadataChangeProposalWrapper]]:
+    # Later writes to an aspect need to see the earlier ones, so each chunk may only
+    # contain a given (urn, aspect_name) pair once.
+    chunk: List[MetadataChangeProposalWrapper] = []
+    keys: Set[Tuple[Optional[str], Optional[str]]] = set()
+    for writeable in writeables:
+        key = (writeable.entityUrn, writeable.aspectName)
+        if key in keys:
+            yield chunk
+            chunk = []
+            keys = set()
+        chunk.append(writeable)
+        keys.add(key)
+    if chunk:
+        yield chunk
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -52,6 +150,11 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client = duckdb.connect(
             str(fpath), read_only=config.read_only, config=config.options
         )
+        self._staging_tables_created = False
+        # When set, add_edge buffers edges here instead of writing them.
+        self._edge_buffer: Optional[
+            Dict[Tuple[str, ...], Tuple[str, str, str, Optional[str], bool]]
+        ] = None
         if not config.read_only:
             self._init_db()
 
@@ -85,6 +188,21 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             "edge_idx", "metadata_edge_v2", ["src_id", "relnship", "dst_id"]
         )
 
+        search_index_exists = self._search_index_exists()
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_v2 "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, field VARCHAR, weight DOUBLE)"
+        )
+        if not search_index_exists:
+            # Catalogs created before the search index existed need to be backfilled.
+            self._rebuild_search_index()
+
+    def _search_index_exists(self) -> bool:
+        row = self.duckdb_client.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = 'metadata_search_v2'"
+        ).fetchone()
+        return bool(row and row[0])
+
     def location(self) -> str:
         return self.config.file
 
@@ -99,47 +217,123 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             MetadataChangeProposalWrapper,
         ],
     ) -> None:
-        writeables: Iterable[MetadataChangeProposalWrapper]
-        if isinstance(record, MetadataChangeProposalWrapper):
-            writeables = [record]
-        elif isinstance(record, MetadataChangeEventClass):
-            writeables = mcps_from_mce(record)
-        else:
-            raise ValueError(
-                f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
-            )
+        self.write_batch([record])
+
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        writeables: List[MetadataChangeProposalWrapper] = []
+        for record in records:
+            if isinstance(record, MetadataChangeProposalWrapper):
+                writeables.append(record)
+            elif isinstance(record, MetadataChangeEventClass):
+                writeables.extend(mcps_from_mce(record))
+            else:
+                raise ValueError(
+                    f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
+                )
 
         if not writeables:
             return
 
-        # TODO use `with` for transaction
+        self._ensure_staging_tables()
         self.duckdb_client.begin()
-        for writeable in writeables:
-            needs_write = False
+        try:
+            with self._batched_edges():
+                for chunk in _split_on_duplicate_keys(writeables):
+                    self._write_chunk(chunk)
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        self.duckdb_client.commit()
+
+    def _ensure_staging_tables(self) -> None:
+        # Temp tables are private to this connection, and are dropped when it closes.
+        if self._staging_tables_created:
+            return
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_aspect_keys "
+            "(seq INTEGER, urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_aspect_updates "
+            "(urn VARCHAR, aspect_name VARCHAR, metadata JSON, system_metadata JSON)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_search_keys "
+            "(urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_search_rows "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, field VARCHAR, weight DOUBLE)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_edges "
+            "(src_id VARCHAR, relnship VARCHAR, dst_id VARCHAR, dst_label VARCHAR, remove_existing BOOLEAN)"
+        )
+        self._staging_tables_created = True
+
+    def _write_chunk(self, writeables: List[MetadataChangeProposalWrapper]) -> None:
+        # The (urn, aspect_name) pairs in a chunk are unique, so all of the rows can
+        # be diffed against the existing v0 rows with a single join.
+        self.duckdb_client.execute("DELETE FROM staged_aspect_keys")
+        self.duckdb_client.executemany(
+            "INSERT INTO staged_aspect_keys VALUES (?, ?, ?)",
+            [
+                [seq, writeable.entityUrn, writeable.aspectName]
+                for seq, writeable in enumerate(writeables)
+            ],
+        )
+        existing_rows: Dict[int, Tuple[str, str, Optional[int]]] = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self.duckdb_client.execute(
+                "SELECT k.seq, a.metadata, a.system_metadata, m.max_version "
+                "FROM staged_aspect_keys k "
+                "JOIN metadata_aspect_v2 a "
+                "ON a.urn = k.urn AND a.aspect_name = k.aspect_name AND a.version = 0 "
+                "LEFT JOIN ("
+                "  SELECT v.urn, v.aspect_name, max(v.version) AS max_version "
+                "  FROM metadata_aspect_v2 v "
+                "  JOIN staged_aspect_keys k2 "
+                "  ON v.urn = k2.urn AND v.aspect_name = k2.aspect_name "
+                "  GROUP BY v.urn, v.aspect_name"
+                ") m ON m.urn = k.urn AND m.aspect_name = k.aspect_name"
+            ).fetchall()
+        }
+
+        inserts: List[List[Any]] = []
+        updates: List[List[Any]] = []
+        written: List[MetadataChangeProposalWrapper] = []
+        search_rows: List[Tuple[str, str, str, str, float]] = []
+        for seq, writeable in enumerate(writeables):
             try:
                 writeable_dict = writeable.to_obj(simplified_structure=True)
-                exists = self.duckdb_client.execute(
-                    "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
-                    [writeable.entityUrn, writeable.aspectName],
-                )
-                max_row = exists.fetchone()
-                if max_row is None:
+                metadata_json = json.dumps(writeable_dict["aspect"]["json"])
+                existing_row = existing_rows.get(seq)
+                if existing_row is None:
                     new_version = 1
                     needs_write = True
                 else:
-                    metadata_dict = json.loads(max_row[0])  # type: ignore
-                    system_metadata = json.loads(max_row[1])  # type: ignore
+                    existing_metadata, system_metadata_json, max_version = existing_row
+                    system_metadata = json.loads(system_metadata_json)
                     real_version = system_metadata.get("properties", {}).get(
                         "sysVersion"
                     )
                     if real_version is None:
-                        max_version_row = self.duckdb_client.execute(
-                            "SELECT max(version) FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ?",
-                            [writeable.entityUrn, writeable.aspectName],
-                        ).fetchone()
-                        real_version = max_version_row[0]  # type: ignore
+                        real_version = max_version
 
-                    if writeable_dict["aspect"]["json"] == metadata_dict:
+                    # Comparing the serialized forms is much cheaper, and almost
+                    # always sufficient. We only parse the JSON when they differ.
+                    if metadata_json == existing_metadata or (
+                        writeable_dict["aspect"]["json"]
+                        == json.loads(existing_metadata)
+                    ):
                         needs_write = False
                         new_version = real_version
                     else:
@@ -167,40 +361,47 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                     new_version
                 )
                 if needs_write:
-                    self.duckdb_client.execute(
-                        query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
-                        parameters=[
+                    system_metadata_json = json.dumps(writeable_dict["systemMetadata"])
+                    inserts.append(
+                        [
                             writeable.entityUrn,
                             writeable.aspectName,
                             new_version,
-                            json.dumps(writeable_dict["aspect"]["json"]),
-                            json.dumps(writeable_dict["systemMetadata"]),
+                            metadata_json,
+                            system_metadata_json,
                             created_on,
-                        ],
+                        ]
                     )
-                    if not max_row:
-                        self.duckdb_client.execute(
-                            query="INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)",
-                            parameters=[
+                    if existing_row is None:
+                        inserts.append(
+                            [
                                 writeable.entityUrn,
                                 writeable.aspectName,
                                 0,
-                                json.dumps(writeable_dict["aspect"]["json"]),
-                                json.dumps(writeable_dict["systemMetadata"]),
+                                metadata_json,
+                                system_metadata_json,
                                 created_on,
-                            ],
+                            ]
                         )
                     else:
                         # we update the existing v0 row
-                        self.duckdb_client.execute(
-                            query="UPDATE metadata_aspect_v2 SET metadata = ?, system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
-                            parameters=[
-                                json.dumps(writeable_dict["aspect"]["json"]),
-                                json.dumps(writeable_dict["systemMetadata"]),
+                        updates.append(
+                            [
                                 writeable.entityUrn,
                                 writeable.aspectName,
-                            ],
+                                metadata_json,
+                                system_metadata_json,
+                            ]
                         )
+                    written.append(writeable)
+                    assert writeable.entityUrn and writeable.aspectName
+                    search_rows.extend(
+                        _search_rows_for_aspect(
+                            writeable.entityUrn,
+                            writeable.aspectName,
+                            writeable_dict["aspect"]["json"],
+                        )
+                    )
                 else:
                     # this is a dup, we still want to update the lastObserved timestamp
                     if not system_metadata:
@@ -211,27 +412,103 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                         system_metadata["lastObserved"] = (
                             writeable.systemMetadata.lastObserved
                         )
-                    self.duckdb_client.execute(
-                        query="UPDATE metadata_aspect_v2 SET system_metadata = ? WHERE urn = ? AND aspect_name = ? AND version = 0",
-                        parameters=[
-                            json.dumps(system_metadata),
+                    updates.append(
+                        [
                             writeable.entityUrn,
                             writeable.aspectName,
-                        ],
+                            None,
+                            json.dumps(system_metadata),
+                        ]
                     )
             except Exception as e:
                 logger.error(f"Failed to write {writeable}", e)
-            else:
-                if needs_write:
-                    assert (
-                        writeable.entityUrn
-                        and writeable.aspectName
-                        and writeable.aspect
-                    )
-                    self.post_update_hook(
-                        writeable.entityUrn, writeable.aspectName, writeable.aspect
-                    )
 
+        if inserts:
+            self.duckdb_client.executemany(
+                "INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)", inserts
+            )
+        if updates:
+            self.duckdb_client.execute("DELETE FROM staged_aspect_updates")
+            self.duckdb_client.executemany(
+                "INSERT INTO staged_aspect_updates VALUES (?, ?, ?, ?)", updates
+            )
+            # A NULL metadata means that only the system metadata changed.
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 "
+                "SET metadata = coalesce(u.metadata, metadata_aspect_v2.metadata), "
+                "system_metadata = u.system_metadata "
+                "FROM staged_aspect_updates u "
+                "WHERE metadata_aspect_v2.urn = u.urn "
+                "AND metadata_aspect_v2.aspect_name = u.aspect_name "
+                "AND metadata_aspect_v2.version = 0"
+            )
+
+        self._update_search_index(
+            {(writeable.entityUrn, writeable.aspectName) for writeable in written},  # type: ignore
+            search_rows,
+        )
+
+        for writeable in written:
+            assert writeable.entityUrn and writeable.aspectName and writeable.aspect
+            self.post_update_hook(
+                writeable.entityUrn, writeable.aspectName, writeable.aspect
+            )
+
+    def _update_search_index(
+        self,
+        keys: Set[Tuple[str, str]],
+        search_rows: List[Tuple[str, str, str, str, float]],
+    ) -> None:
+        # Replaces the search rows for the given (urn, aspect_name) pairs.
+        if not keys:
+            return
+
+        self.duckdb_client.execute("DELETE FROM staged_search_keys")
+        self.duckdb_client.executemany(
+            "INSERT INTO staged_search_keys VALUES (?, ?)", [list(key) for key in keys]
+        )
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_search_v2 WHERE EXISTS ("
+            "  SELECT 1 FROM staged_search_keys k "
+            "  WHERE k.urn = metadata_search_v2.urn AND k.aspect_name = metadata_search_v2.aspect_name"
+            ")"
+        )
+
+        # The urn tokens are only written once per urn.
+        for urn in {urn for urn, _ in keys}:
+            search_rows.extend(_search_rows_for_urn(urn))
+        self.duckdb_client.execute("DELETE FROM staged_search_rows")
+        if search_rows:
+            self.duckdb_client.executemany(
+                "INSERT INTO staged_search_rows VALUES (?, ?, ?, ?, ?)",
+                [list(row) for row in search_rows],
+            )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_search_v2 SELECT * FROM staged_search_rows s "
+            f"WHERE s.aspect_name <> '{_SEARCH_URN_ASPECT}' OR NOT EXISTS ("
+            "  SELECT 1 FROM metadata_search_v2 e "
+            f"  WHERE e.urn = s.urn AND e.aspect_name = '{_SEARCH_URN_ASPECT}'"
+            ")"
+        )
+
+    def _rebuild_search_index(self) -> None:
+        self._ensure_staging_tables()
+        self.duckdb_client.begin()
+        self.duckdb_client.execute("DELETE FROM metadata_search_v2")
+        results = self.duckdb_client.execute(
+            "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 WHERE version = 0"
+        ).fetchall()
+        batch_size = 10_000
+        for i in range(0, len(results), batch_size):
+            batch = results[i : i + batch_size]
+            search_rows: List[Tuple[str, str, str, str, float]] = []
+            for urn, aspect_name, metadata in batch:
+                search_rows.extend(
+                    _search_rows_for_aspect(urn, aspect_name, json.loads(metadata))
+                )
+            self._update_search_index(
+                {(urn, aspect_name) for urn, aspect_name, _ in batch}, search_rows
+            )
         self.duckdb_client.commit()
 
     def list_ids(self) -> Iterable[str]:
@@ -265,7 +542,10 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             aspect: Union[dict, _Aspect] = json.loads(r[2])
             if typed:
                 assert isinstance(aspect, dict)
-                aspect = ASPECT_MAP[aspect_name].from_obj(post_json_transform(aspect))
+                aspect_cls = ASPECT_MAP[aspect_name]
+                aspect = aspect_cls.from_obj(
+                    post_json_transform(aspect, aspect_cls.RECORD_SCHEMA)
+                )
 
             result_map[aspect_name] = aspect
             if details:
@@ -287,7 +567,10 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         aspects: List[str] = [],
         snippet: bool = True,
     ) -> Iterable[Searchable]:
-        if flavor == SearchFlavor.FREE_TEXT:
+        if flavor == SearchFlavor.FREE_TEXT and self._search_index_exists():
+            yield from self._search_index(query, aspects, snippet)
+        elif flavor == SearchFlavor.FREE_TEXT:
+            # Read-only catalogs created before the search index existed.
             base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
             for r in self.duckdb_client.execute(base_query).fetchall():
                 yield Searchable(
@@ -302,6 +585,51 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             raise Exception(f"Unhandled search flavor {flavor}")
 
+    def _search_index(
+        self, query: str, aspects: List[str], snippet: bool
+    ) -> Iterable[Searchable]:
+        # Every query token must prefix-match some token of the entity. Entities are
+        # ranked by the sum of the best match weight for each query token.
+        tokens = list(dict.fromkeys(_tokenize(query)))
+        if not tokens:
+            return
+
+        aspect_filter = ""
+        aspect_params: List[str] = []
+        if aspects:
+            aspect_filter = f" AND aspect_name IN ({', '.join('?' for _ in aspects)})"
+            aspect_params = list(aspects)
+
+        hits = " UNION ALL ".join(
+            f"SELECT {i} AS qi, urn, aspect_name, "
+            f"weight * (CASE WHEN token = ? THEN 1.0 ELSE {_SEARCH_PREFIX_MATCH_PENALTY} END) AS score "
+            f"FROM metadata_search_v2 WHERE starts_with(token, ?){aspect_filter}"
+            for i in range(len(tokens))
+        )
+        params: List[Any] = []
+        for token in tokens:
+            params.extend([token, token, *aspect_params])
+
+        results = self.duckdb_client.execute(
+            f"WITH hits AS ({hits}), "
+            "per_token AS ("
+            "  SELECT urn, qi, max(score) AS score, arg_max(aspect_name, score) AS aspect_name "
+            "  FROM hits GROUP BY urn, qi"
+            ") "
+            "SELECT r.urn, r.aspect_name, a.metadata FROM ("
+            "  SELECT urn, sum(score) AS score, arg_max(aspect_name, score) AS aspect_name "
+            "  FROM per_token GROUP BY urn HAVING count(*) = ?"
+            ") r "
+            "LEFT JOIN metadata_aspect_v2 a "
+            "ON a.urn = r.urn AND a.aspect_name = r.aspect_name AND a.version = 0 "
+            "ORDER BY r.score DESC, r.urn",
+            [*params, len(tokens)],
+        ).fetchall()
+        for urn, aspect_name, metadata in results:
+            yield Searchable(
+                id=urn, aspect=aspect_name, snippet=metadata if snippet else None
+            )
+
     def remove_edge(self, src: str, relnship: str) -> None:
         try:
             self.duckdb_client.execute(
@@ -324,6 +652,19 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._edge_buffer is not None:
+            key = (src_id, relnship) if remove_existing else (src_id, relnship, dst_id)
+            self._edge_buffer[key] = (
+                src_id,
+                relnship,
+                dst_id,
+                dst_label,
+                remove_existing,
+            )
+            if len(self._edge_buffer) >= _EDGE_BUFFER_FLUSH_SIZE:
+                self._flush_edges()
+            return
+
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -374,6 +715,73 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
         self.duckdb_client.commit()
 
+    @contextlib.contextmanager
+    def _batched_edges(self) -> Iterator[None]:
+        """Buffers the edges from add_edge, and writes them set-wise on exit.
+
+        This must be used within a transaction. Edges are applied with the same
+        semantics as add_edge, but the buffered edges aren't visible to queries
+        until they are flushed.
+        """
+
+        if self._edge_buffer is not None:
+            # We're already batching.
+            yield
+            return
+
+        self._edge_buffer = {}
+        try:
+            yield
+            self._flush_edges()
+        finally:
+            self._edge_buffer = None
+
+    def _flush_edges(self) -> None:
+        if not self._edge_buffer:
+            return
+        self._ensure_staging_tables()
+        self.duckdb_client.execute("DELETE FROM staged_edges")
+        self.duckdb_client.executemany(
+            "INSERT INTO staged_edges VALUES (?, ?, ?, ?, ?)",
+            [list(edge) for edge in self._edge_buffer.values()],
+        )
+        self._edge_buffer.clear()
+
+        # Edges with remove_existing replace any other edge with the same src and relnship.
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 SET dst_id = s.dst_id, dst_label = s.dst_label "
+            "FROM staged_edges s "
+            "WHERE s.remove_existing "
+            "AND metadata_edge_v2.src_id = s.src_id AND metadata_edge_v2.relnship = s.relnship "
+            "AND (metadata_edge_v2.dst_id IS DISTINCT FROM s.dst_id "
+            "OR metadata_edge_v2.dst_label IS DISTINCT FROM s.dst_label)"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 "
+            "SELECT s.src_id, s.relnship, s.dst_id, s.dst_label FROM staged_edges s "
+            "WHERE s.remove_existing AND NOT EXISTS ("
+            "  SELECT 1 FROM metadata_edge_v2 e "
+            "  WHERE e.src_id = s.src_id AND e.relnship = s.relnship"
+            ")"
+        )
+        # Other edges are only unique by src, relnship and dst.
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 SET dst_label = s.dst_label "
+            "FROM staged_edges s "
+            "WHERE NOT s.remove_existing "
+            "AND metadata_edge_v2.src_id = s.src_id AND metadata_edge_v2.relnship = s.relnship "
+            "AND metadata_edge_v2.dst_id = s.dst_id "
+            "AND metadata_edge_v2.dst_label IS DISTINCT FROM s.dst_label"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 "
+            "SELECT s.src_id, s.relnship, s.dst_id, s.dst_label FROM staged_edges s "
+            "WHERE NOT s.remove_existing AND NOT EXISTS ("
+            "  SELECT 1 FROM metadata_edge_v2 e "
+            "  WHERE e.src_id = s.src_id AND e.relnship = s.relnship AND e.dst_id = s.dst_id"
+            ")"
+        )
+
     def ls(self, path: str) -> List[Browseable]:
         def get_id_for_name(
             name: str,
@@ -476,14 +884,21 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             ]
 
     def reindex(self) -> None:
+        self._reindex_edges()
+        self._rebuild_search_index()
+
+    def _reindex_edges(self) -> None:
         self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
         self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self.duckdb_client.begin()
+        with self._batched_edges():
+            for urn_aspect_dict in self.get_all_entities(typed=True):
+                for urn, aspect_map in urn_aspect_dict.items():
+                    for aspect_name, aspect_value in aspect_map.items():
+                        assert isinstance(aspect_value, _Aspect)
+                        self.post_update_hook(urn, aspect_name, aspect_value)
+                    self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self.duckdb_client.commit()
 
     def get_all_entities(
         self, typed: bool = False
@@ -501,8 +916,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                     f"Missing aspect name {aspect_name} in the registry"
                 )
                 try:
-                    aspect_payload = ASPECT_MAP[aspect_name].from_obj(
-                        post_json_transform(aspect_payload)
+                    aspect_cls = ASPECT_MAP[aspect_name]
+                    aspect_payload = aspect_cls.from_obj(
+                        post_json_transform(aspect_payload, aspect_cls.RECORD_SCHEMA)
                     )
                 except Exception as e:
                     logger.exception(
@@ -531,8 +947,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         for r in results.fetchall():
             urn = r[0]
             aspect_name = r[1]
-            aspect_metadata = ASPECT_MAP[aspect_name].from_obj(
-                post_json_transform(json.loads(r[2]))
+            aspect_cls = ASPECT_MAP[aspect_name]
+            aspect_metadata = aspect_cls.from_obj(
+                post_json_transform(json.loads(r[2]), aspect_cls.RECORD_SCHEMA)
             )  # type: ignore
             system_metadata = SystemMetadataClass.from_obj(json.loads(r[3]))
             mcp = MetadataChangeProposalWrapper(
@@ -544,7 +961,8 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             yield mcp
 
     def close(self) -> None:
-        self.reindex()
+        # The search index is maintained on write, so only the edges need a rebuild.
+        self._reindex_edges()
         self.duckdb_client.close()
 
     def get_category_from_platform(self, data_platform_urn: DataPlatformUrn) -> Urn:
@@ -70,6 +70,19 @@ class DataHubLiteLocal(Generic[LiteConfig], Closeable, metaclass=ABCMeta):
     ) -> None:
         pass
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """Writes several records. Implementations can override this to write them more efficiently."""
+        for record in records:
+            self.write(record)
+
     @abstractmethod
     def list_ids(self) -> Iterable[str]:
         pass
@@ -0,0 +1,375 @@
+import atexit
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+import sqlglot
+
+from datahub._version import __version__
+from datahub.ingestion.api.closeable import Closeable
+from datahub.sql_parsing._models import _TableName
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolverInterface
+from datahub.sql_parsing.sqlglot_utils import get_query_fingerprint
+from datahub.utilities.cooperative_timeout import CooperativeTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# If set, sqlglot_lineage will persist parsing results to this file across runs.
+SQL_PARSE_RESULT_CACHE_PATH = os.getenv("DATAHUB_SQL_PARSE_RESULT_CACHE_PATH")
+SQL_PARSE_RESULT_CACHE_MAX_ENTRIES = int(
+    os.getenv("DATAHUB_SQL_PARSE_RESULT_CACHE_MAX_ENTRIES") or 1_000_000
+)
+
+_TABLE_NAME = "sql_parsing_results"
+_WRITE_BATCH_SIZE = 500
+
+# Results from a different parser version are never reused.
+_CACHE_VERSION = f"{__version__}/{sqlglot.__version__}"
+
+_T = TypeVar("_T")
+# (sql, schema_resolver, default_db, default_schema, default_dialect) -> result
+_ParseFunc = Callable[
+    [str, SchemaResolverInterface, Optional[str], Optional[str], Optional[str]], _T
+]
+
+
+@dataclasses.dataclass
+class _CachedParsingResult:
+    # This is a SqlParsingResult, but we can't import it here without a cycle.
+    result: Any
+
+    # The tables that the parser asked the schema resolver about, and a hash of
+    # what the resolver returned for them. If the hash changes, the entry is stale.
+    tables: List[_TableName]
+    schema_hash: str
+
+    last_used: int
+
+
+class _RecordingSchemaResolver(SchemaResolverInterface):
+    """Wraps a schema resolver and records every table that gets resolved."""
+
+    def __init__(self, base_resolver: SchemaResolverInterface):
+        self._base_resolver = base_resolver
+        self.tables: List[_TableName] = []
+
+    @property
+    def platform(self) -> str:
+        return self._base_resolver.platform
+
+    def includes_temp_tables(self) -> bool:
+        return self._base_resolver.includes_temp_tables()
+
+    def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
+        self.tables.append(table)
+        return self._base_resolver.resolve_table(table)
+
+
+def _hash_resolved_schemas(
+    schema_resolver: SchemaResolverInterface, tables: List[_TableName]
+) -> str:
+    # Column order matters (e.g. for SELECT * expansion), so we don't sort keys.
+    resolved = [
+        [
+            table.database,
+            table.db_schema,
+            table.table,
+            *schema_resolver.resolve_table(table),
+        ]
+        for table in tables
+    ]
+    return hashlib.sha256(json.dumps(resolved).encode("utf-8")).hexdigest()
+
+
+class SqlParsingResultCache(Closeable):
+    """A persistent, on-disk cache of SQL parsing results.
+
+    Entries are keyed by the query fingerprint, the dialect, and the default
+    db/schema. Because parsing results also depend on the schemas of the tables
+    that the query references, each entry also stores a hash of those schemas.
+    On lookup, the schemas are re-resolved, and the entry is only used if the
+    hash still matches.
+
+    Unlike the temporary databases behind FileBackedDict, the file uses WAL mode
+    and the default durability settings, so that concurrent runs can share it and
+    a crash can't corrupt it. A corrupt file is recreated on open. The cache is
+    only an optimization, so if reading or writing fails later on (e.g. because
+    another run holds the lock for too long), it is disabled for the rest of the run.
+
+    New entries are written in batches. When the cache grows beyond `max_entries`,
+    the least recently used entries are evicted on close.
+    """
+
+    def __init__(
+        self,
+        filename: pathlib.Path,
+        max_entries: int = SQL_PARSE_RESULT_CACHE_MAX_ENTRIES,
+    ):
+        self.filename = filename
+        self.max_entries = max_entries
+
+        self._run_timestamp = int(time.time())
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = self._open(filename)
+        self._pending: Dict[str, _CachedParsingResult] = {}
+        self._pending_last_used: Set[str] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @classmethod
+    def _open(cls, filename: pathlib.Path) -> sqlite3.Connection:
+        try:
+            return cls._connect(filename)
+        except sqlite3.OperationalError:
+            # e.g. the database is locked by another run, which we must not clobber.
+            raise
+        except sqlite3.DatabaseError as e:
+            logger.warning(
+                f"Recreating corrupt SQL parsing result cache {filename}: {e}"
+            )
+            for suffix in ["", "-wal", "-shm"]:
+                pathlib.Path(f"{filename}{suffix}").unlink(missing_ok=True)
+            return cls._connect(filename)
+
+    @staticmethod
+    def _connect(filename: pathlib.Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            filename, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_TABLE_NAME} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used INTEGER NOT NULL)"
+            )
+            # Fails if the file isn't a valid database.
+            conn.execute(
+                f"SELECT COUNT(*) FROM {_TABLE_NAME} WHERE key = ''"
+            ).fetchone()
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    @classmethod
+    def _make_key(
+        cls,
+        sql: str,
+        platform: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> str:
+        fingerprint = get_query_fingerprint(sql, platform=platform)
+        return hashlib.sha256(
+            json.dumps(
+                [_CACHE_VERSION, platform, default_db, default_schema, fingerprint]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _disable(self, action: str, e: Exception) -> None:
+        # Must be called with the lock held.
+        logger.warning(
+            f"Failed to {action} the SQL parsing result cache at {self.filename}; "
+            f"disabling it for the rest of this run: {e}"
+        )
+        self._pending.clear()
+        self._pending_last_used.clear()
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def _get(self, key: str) -> Optional[_CachedParsingResult]:
+        with self._lock:
+            if self._conn is None:
+                return None
+            if key in self._pending:
+                return self._pending[key]
+            try:
+                row = self._conn.execute(
+                    f"SELECT value FROM {_TABLE_NAME} WHERE key = ?", (key,)
+                ).fetchone()
+                return pickle.loads(row[0]) if row is not None else None
+            except Exception as e:
+                self._disable("read from", e)
+                return None
+
+    def _mark_used(self, key: str) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending_last_used.add(key)
+            self._maybe_flush()
+
+    def _put(self, key: str, entry: _CachedParsingResult) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending[key] = entry
+            self._pending_last_used.discard(key)
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        # Must be called with the lock held.
+        if len(self._pending) + len(self._pending_last_used) >= _WRITE_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        # Must be called with the lock held.
+        if self._conn is None or not (self._pending or self._pending_last_used):
+            return
+        try:
+            rows = [
+                (key, pickle.dumps(entry), entry.last_used)
+                for key, entry in self._pending.items()
+            ]
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {_TABLE_NAME} (key, value, last_used) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.executemany(
+                    f"UPDATE {_TABLE_NAME} SET last_used = ? WHERE key = ?",
+                    [(self._run_timestamp, key) for key in self._pending_last_used],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            self._disable("write to", e)
+            return
+        self._pending.clear()
+        self._pending_last_used.clear()
+
+    def get_or_parse(
+        self,
+        sql: str,
+        schema_resolver: SchemaResolverInterface,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+        default_dialect: Optional[str],
+        parse: _ParseFunc[_T],
+    ) -> _T:
+        key = self._make_key(
+            sql,
+            platform=default_dialect or schema_resolver.platform,
+            default_db=default_db,
+            default_schema=default_schema,
+        )
+
+        entry = self._get(key)
+        if entry is not None:
+            if entry.schema_hash == _hash_resolved_schemas(
+                schema_resolver, entry.tables
+            ):
+                self.hits += 1
+                if entry.last_used != self._run_timestamp:
+                    entry.last_used = self._run_timestamp
+                    self._mark_used(key)
+                return entry.result
+            self.stale += 1
+        else:
+            self.misses += 1
+
+        recording_resolver = _RecordingSchemaResolver(schema_resolver)
+        result = parse(
+            sql, recording_resolver, default_db, default_schema, default_dialect
+        )
+        if _is_cacheable(result):
+            self._put(
+                key,
+                _CachedParsingResult(
+                    result=result,
+                    tables=recording_resolver.tables,
+                    schema_hash=_hash_resolved_schemas(
+                        schema_resolver, recording_resolver.tables
+                    ),
+                    last_used=self._run_timestamp,
+                ),
+            )
+        return result
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale}
+
+    def _evict(self) -> None:
+        # Must be called with the lock held.
+        assert self._conn is not None
+        (num_entries,) = self._conn.execute(
+            f"SELECT COUNT(*) FROM {_TABLE_NAME}"
+        ).fetchone()
+        num_to_evict = num_entries - self.max_entries
+        if num_to_evict <= 0:
+            return
+
+        logger.debug(f"Evicting {num_to_evict} entries from the SQL parsing cache")
+        self._conn.execute(
+            f"DELETE FROM {_TABLE_NAME} WHERE rowid IN "
+            f"(SELECT rowid FROM {_TABLE_NAME} ORDER BY last_used ASC, rowid ASC LIMIT ?)",
+            (num_to_evict,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush()
+            if self._conn is None:
+                return
+            try:
+                self._evict()
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Failed to evict entries from the SQL parsing cache: {e}"
+                )
+            self._conn.close()
+            self._conn = None
+
+
+def _is_cacheable(result: Any) -> bool:
+    # Timeouts depend on the machine and its load, so they aren't worth persisting.
+    return not isinstance(
+        getattr(getattr(result, "debug_info", None), "column_error", None),
+        CooperativeTimeoutError,
+    )
+
+
+_global_cache: Optional[SqlParsingResultCache] = None
+_global_cache_initialized = False
+
+
+def get_global_parse_result_cache() -> Optional[SqlParsingResultCache]:
+    """Returns the process-wide cache, if one was configured via environment variables."""
+
+    global _global_cache, _global_cache_initialized
+    if not _global_cache_initialized:
+        _global_cache_initialized = True
+        if SQL_PARSE_RESULT_CACHE_PATH:
+            try:
+                _global_cache = SqlParsingResultCache(
+                    pathlib.Path(SQL_PARSE_RESULT_CACHE_PATH)
+                )
+                atexit.register(_global_cache.close)
+            except sqlite3.Error as e:
+                # Most likely, another process held the lock on the file for too long.
+                logger.warning(
+                    f"Failed to open SQL parsing result cache at {SQL_PARSE_RESULT_CACHE_PATH}; "
+                    f"continuing without it: {e}"
+                )
+    return _global_cache
@@ -1,6 +1,8 @@
+import concurrent.futures
 import contextlib
+import logging
 import pathlib
-from typing import Dict, List, Optional, Protocol, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Set, Tuple
 
 from typing_extensions import TypedDict
 
@@ -18,9 +20,15 @@ from datahub.sql_parsing.sql_parsing_common import PLATFORMS_WITH_CASE_SENSITIVE
 from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
 from datahub.utilities.urns.field_paths import get_simple_field_path_from_v2_field_path
 
+logger = logging.getLogger(__name__)
+
 # A lightweight table schema: column -> type mapping.
 SchemaInfo = Dict[str, str]
 
+# The number of urns to request from the graph in a single call when prefetching.
+_PREFETCH_BATCH_SIZE = 100
+_PREFETCH_MAX_WORKERS = 4
+
 
 class GraphQLSchemaField(TypedDict):
     fieldPath: str
@@ -80,6 +88,14 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
     def get_urns(self) -> Set[str]:
         return {k for k, v in self._schema_cache.items() if v is not None}
 
+    def snapshot(self) -> Dict[str, Optional[SchemaInfo]]:
+        """Returns a copy of the resolved schemas, keyed by urn.
+
+        Tables that are known to be missing are included with a `None` schema. This
+        is useful for handing the schemas to parsers in other processes.
+        """
+        return dict(self._schema_cache.items_snapshot())
+
     def schema_count(self) -> int:
         return int(
             self._schema_cache.sql_query(
@@ -127,19 +143,7 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
 
         return urn, None
 
-    def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
-        urn = self.get_urn_for_table(table)
-
-        schema_info = self._resolve_schema_info(urn)
-        if schema_info:
-            return urn, schema_info
-
-        urn_lower = self.get_urn_for_table(table, lower=True)
-        if urn_lower != urn:
-            schema_info = self._resolve_schema_info(urn_lower)
-            if schema_info:
-                return urn_lower, schema_info
-
+    def _get_candidate_urns(self, table: _TableName) -> List[str]:
         # Our treatment of platform instances when lowercasing urns
         # is inconsistent. In some places (e.g. Snowflake), we lowercase
         # the table names but not the platform instance. In other places
@@ -148,16 +152,23 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
         # See https://github.com/datahub-project/datahub/pull/8928.
         # While we have this sort of inconsistency, we should also
         # check the mixed case urn, as a last resort.
-        urn_mixed = self.get_urn_for_table(table, lower=True, mixed=True)
-        if urn_mixed not in {urn, urn_lower}:
-            schema_info = self._resolve_schema_info(urn_mixed)
+        return list(
+            dict.fromkeys(
+                [
+                    self.get_urn_for_table(table),
+                    self.get_urn_for_table(table, lower=True),
+                    self.get_urn_for_table(table, lower=True, mixed=True),
+                ]
+            )
+        )
+
+    def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
+        for urn in self._get_candidate_urns(table):
+            schema_info = self._resolve_schema_info(urn)
             if schema_info:
-                return urn_mixed, schema_info
+                return urn, schema_info
 
-        if self._prefers_urn_lower():
-            return urn_lower, None
-        else:
-            return urn, None
+        return self.get_urn_for_table(table, lower=self._prefers_urn_lower()), None
 
     def _prefers_urn_lower(self) -> bool:
         return self.platform not in PLATFORMS_WITH_CASE_SENSITIVE_TABLES
@@ -165,6 +176,60 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
     def has_urn(self, urn: str) -> bool:
         return self._schema_cache.get(urn) is not None
 
+    def is_cached(self, urn: str) -> bool:
+        """Whether the urn can be resolved without a graph lookup, including urns that are known to be missing."""
+        return urn in self._schema_cache
+
+    def prefetch_tables(self, tables: Iterable[_TableName]) -> None:
+        """Prefetches the schemas for all of the urns that the tables could resolve to."""
+
+        self.prefetch_urns(
+            urn for table in tables for urn in self._get_candidate_urns(table)
+        )
+
+    def prefetch_urns(self, urns: Iterable[str]) -> None:
+        """Fetches the schemas for any of the urns that aren't cached yet.
+
+        Schemas are fetched from the graph in batches, with a few batches in flight
+        at a time. Urns that don't have a schema are cached as missing, so that later
+        lookups don't go back to the graph. If a batch fails, its urns are left for
+        the individual lookups in `resolve_table` to deal with.
+        """
+
+        if not self.graph:
+            return
+        graph = self.graph
+
+        missing = [urn for urn in dict.fromkeys(urns) if urn not in self._schema_cache]
+        if not missing:
+            return
+
+        batches = [
+            missing[i : i + _PREFETCH_BATCH_SIZE]
+            for i in range(0, len(missing), _PREFETCH_BATCH_SIZE)
+        ]
+        logger.debug(f"Prefetching {len(missing)} schemas in {len(batches)} batches")
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_PREFETCH_MAX_WORKERS, len(batches))
+        ) as executor:
+            futures = {
+                executor.submit(self._fetch_schema_info_batch, graph, batch): batch
+                for batch in batches
+            }
+            # The cache is only written to from this thread.
+            for future in concurrent.futures.as_completed(futures):
+                batch = futures[future]
+                try:
+                    schemas = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to prefetch {len(batch)} schemas, will fetch them individually: {e}"
+                    )
+                    continue
+
+                for urn in batch:
+                    self._save_to_cache(urn, schemas.get(urn))
+
     def _resolve_schema_info(self, urn: str) -> Optional[SchemaInfo]:
         if urn in self._schema_cache:
             return self._schema_cache[urn]
@@ -222,6 +287,35 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
 
         return _convert_schema_aspect_to_info(aspect)
 
+    def _fetch_schema_info_batch(
+        self, graph: DataHubGraph, urns: List[str]
+    ) -> Dict[str, SchemaInfo]:
+        entities = graph.get_entities_v2(
+            "dataset", urns, aspects=[SchemaMetadataClass.ASPECT_NAME]
+        )
+
+        schemas: Dict[str, SchemaInfo] = {}
+        for urn, aspects in entities.items():
+            aspect: Optional[Dict[str, Any]] = aspects.get(
+                SchemaMetadataClass.ASPECT_NAME
+            )
+            if not aspect:
+                continue
+            # The OpenAPI response wraps each aspect's value alongside its metadata.
+            schema_metadata = aspect.get("value", aspect)
+            schemas[urn] = self.convert_graphql_schema_metadata_to_info(
+                {
+                    "fields": [
+                        {
+                            "fieldPath": field["fieldPath"],
+                            "nativeDataType": field.get("nativeDataType", ""),
+                        }
+                        for field in schema_metadata.get("fields", [])
+                    ]
+                }
+            )
+        return schemas
+
     @classmethod
     def convert_graphql_schema_metadata_to_info(
         cls, schema: GraphQLSchemaMetadata
@@ -1,7 +1,9 @@
+import collections
 import contextlib
 import dataclasses
 import enum
 import functools
+import itertools
 import json
 import logging
 import os
@@ -10,7 +12,7 @@ import tempfile
 import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Optional, Set, Union, cast
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
 import datahub.emitter.mce_builder as builder
 import datahub.metadata.schema_classes as models
@@ -31,12 +33,14 @@ from datahub.metadata.urns import (
     QueryUrn,
     SchemaFieldUrn,
 )
+from datahub.sql_parsing.parse_result_cache import get_global_parse_result_cache
 from datahub.sql_parsing.schema_resolver import (
     SchemaResolver,
     SchemaResolverInterface,
     _SchemaResolverWithExtras,
 )
 from datahub.sql_parsing.sql_parsing_common import QueryType, QueryTypeProps
+from datahub.sql_parsing.sql_parsing_pool import PooledParsingResult, SqlParsingPool
 from datahub.sql_parsing.sqlglot_lineage import (
     ColumnLineageInfo,
     ColumnRef,
@@ -57,6 +61,11 @@ from datahub.sql_parsing.tool_meta_extractor import (
     ToolMetaExtractorReport,
 )
 from datahub.utilities.cooperative_timeout import CooperativeTimeoutError
+from datahub.utilities.file_backed_codecs import (
+    FileBackedCodec,
+    get_codec,
+    is_codec_available,
+)
 from datahub.utilities.file_backed_collections import (
     ConnectionWrapper,
     FileBackedDict,
@@ -80,12 +89,32 @@ class QueryLogSetting(enum.Enum):
 
 _DEFAULT_USER_URN = CorpUserUrn("_ingestion")
 _MISSING_SESSION_ID = "__MISSING_SESSION_ID"
+
+# The query metadata and view definitions we spill to disk are mostly SQL text,
+# which compresses to roughly half its size. zstd is cheap enough that this
+# reduces the total cost of spilling, unlike gzip.
+_SPILL_COMPRESSION = "zstd" if is_codec_available("pickle5", "zstd") else None
+
+
+def _make_spill_codec() -> FileBackedCodec:
+    # Each collection gets its own codec instance, since the zstd codecs are
+    # not thread-safe.
+    return get_codec("pickle5", compression=_SPILL_COMPRESSION)
+
+
 _DEFAULT_QUERY_LOG_SETTING = QueryLogSetting[
     os.getenv("DATAHUB_SQL_AGG_QUERY_LOG") or QueryLogSetting.DISABLED.name
 ]
+_DEFAULT_PARSING_PROCESSES = int(os.getenv("DATAHUB_SQL_AGG_PARSING_PROCESSES") or 0)
 MAX_UPSTREAM_TABLES_COUNT = 300
 MAX_FINEGRAINEDLINEAGE_COUNT = 2000
 
+# When generating lineage, the query metadata for this many downstreams is fetched
+# from the query map at once.
+_LINEAGE_GEN_BATCH_SIZE = 500
+# The number of queries with temp table lineage resolved to keep around.
+_RESOLVED_QUERY_CACHE_SIZE = 1000
+
 
 @dataclasses.dataclass
 class LoggedQuery:
@@ -252,6 +281,15 @@ class SqlAggregatorReport(Report):
     sql_fingerprinting_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     sql_formatting_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     sql_parsing_cache_stats: Optional[dict] = dataclasses.field(default=None)
+    sql_parsing_persistent_cache_stats: Optional[dict] = dataclasses.field(default=None)
+    sql_parsing_pool_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
+    sql_parsing_schema_prefetch_timer: PerfTimer = dataclasses.field(
+        default_factory=PerfTimer
+    )
+    num_sql_parsed_in_pool: int = 0
+    num_sql_pool_results_discarded: int = 0
+    num_sql_parsing_pool_starts: int = 0
+    num_sql_parsing_pool_snapshot_updates: int = 0
     parse_statement_cache_stats: Optional[dict] = dataclasses.field(default=None)
     format_query_cache_stats: Optional[dict] = dataclasses.field(default=None)
 
@@ -309,7 +347,17 @@ class SqlAggregatorReport(Report):
         self.num_temp_sessions = len(self._aggregator._temp_lineage_map)
         self.num_inferred_temp_schemas = len(self._aggregator._inferred_temp_schemas)
 
+        parsing_pool = self._aggregator._parsing_pool
+        if parsing_pool is not None:
+            self.num_sql_parsing_pool_starts = parsing_pool.num_pool_starts
+            self.num_sql_parsing_pool_snapshot_updates = (
+                parsing_pool.num_snapshot_updates
+            )
+
         self.sql_parsing_cache_stats = _sqlglot_lineage_cached.cache_info()._asdict()
+        persistent_cache = get_global_parse_result_cache()
+        if persistent_cache is not None:
+            self.sql_parsing_persistent_cache_stats = persistent_cache.stats()
         self.parse_statement_cache_stats = _parse_statement.cache_info()._asdict()
         self.format_query_cache_stats = try_format_query.cache_info()._asdict()
 
@@ -337,6 +385,7 @@ class SqlParsingAggregator(Closeable):
         is_allowed_table: Optional[Callable[[str], bool]] = None,
         format_queries: bool = True,
         query_log: QueryLogSetting = _DEFAULT_QUERY_LOG_SETTING,
+        parsing_processes: int = _DEFAULT_PARSING_PROCESSES,
     ) -> None:
         self.platform = DataPlatformUrn(platform)
         self.platform_instance = platform_instance
@@ -430,7 +479,9 @@ class SqlParsingAggregator(Closeable):
 
         # Map of query_id -> QueryMetadata
         self._query_map = FileBackedDict[QueryMetadata](
-            shared_connection=self._shared_connection, tablename="query_map"
+            shared_connection=self._shared_connection,
+            tablename="query_map",
+            codec=_make_spill_codec(),
         )
         self._exit_stack.push(self._query_map)
 
@@ -442,7 +493,9 @@ class SqlParsingAggregator(Closeable):
 
         # Map of view urn -> view definition
         self._view_definitions = FileBackedDict[ViewDefinition](
-            shared_connection=self._shared_connection, tablename="view_definitions"
+            shared_connection=self._shared_connection,
+            tablename="view_definitions",
+            codec=_make_spill_codec(),
         )
         self._exit_stack.push(self._view_definitions)
 
@@ -457,6 +510,7 @@ class SqlParsingAggregator(Closeable):
         self._inferred_temp_schemas = FileBackedDict[List[models.SchemaFieldClass]](
             shared_connection=self._shared_connection,
             tablename="inferred_temp_schemas",
+            codec=_make_spill_codec(),
         )
         self._exit_stack.push(self._inferred_temp_schemas)
 
@@ -472,6 +526,12 @@ class SqlParsingAggregator(Closeable):
         )
         self._exit_stack.push(self._table_swaps)
 
+        # Memoized results of _resolve_query_with_temp_tables, keyed by query id.
+        # Only populated while generating lineage.
+        self._resolved_queries: "collections.OrderedDict[QueryId, QueryMetadata]" = (
+            collections.OrderedDict()
+        )
+
         # Usage aggregator. This will only be initialized if usage statistics are enabled.
         # TODO: Replace with FileBackedDict.
         # TODO: The BaseUsageConfig class is much too broad for our purposes, and has a number of
@@ -495,6 +555,18 @@ class SqlParsingAggregator(Closeable):
         self._tool_meta_extractor = ToolMetaExtractor.create(graph)
         self.report.tool_meta_report = self._tool_meta_extractor.report
 
+        # Optional process pool for parsing observed queries. When enabled, observed
+        # queries are buffered and parsed in batches. Anything else that mutates the
+        # aggregator's state flushes the buffer first, so that the end result is
+        # identical to parsing each query as it arrives.
+        self._parsing_pool: Optional[SqlParsingPool] = None
+        self._pending_observed_queries: List[Tuple[ObservedQuery, bool, bool]] = []
+        if parsing_processes > 0:
+            self._parsing_pool = SqlParsingPool(
+                schema_resolver=self._schema_resolver, processes=parsing_processes
+            )
+            self._exit_stack.push(self._parsing_pool)
+
     def close(self) -> None:
         # Compute stats once before closing connections
         self.report.compute_stats()
@@ -520,7 +592,10 @@ class SqlParsingAggregator(Closeable):
         # logic that we previously needed in each source
 
         if self._need_schemas:
+            self._flush_pending_observed_queries()
             self._schema_resolver.add_schema_metadata(str(urn), schema)
+            if self._parsing_pool is not None:
+                self._parsing_pool.invalidate_snapshot()
 
     def register_schemas_from_stream(
         self, stream: Iterable[MetadataWorkUnit]
@@ -617,6 +692,7 @@ class SqlParsingAggregator(Closeable):
                 for the query ID.
         """
 
+        self._flush_pending_observed_queries()
         self.report.num_known_query_lineage += 1
 
         # Generate a fingerprint for the query.
@@ -676,6 +752,7 @@ class SqlParsingAggregator(Closeable):
         logger.debug(
             f"Adding lineage to the map, downstream: {downstream_urn}, upstream: {upstream_urn}"
         )
+        self._flush_pending_observed_queries()
         self.report.num_known_mapping_lineage += 1
 
         # We generate a fake "query" object to hold the lineage.
@@ -764,7 +841,81 @@ class SqlParsingAggregator(Closeable):
         map, which will get used in subsequent queries with the same session ID.
 
         This assumes that queries come in order of increasing timestamps.
+
+        If a parsing pool is enabled, the query may not be processed until a
+        full batch of queries has been accumulated.
         """
+        if self._parsing_pool is not None:
+            self._pending_observed_queries.append(
+                (observed, is_known_temp_table, require_out_table_schema)
+            )
+            if len(self._pending_observed_queries) >= self._parsing_pool.batch_size:
+                self._flush_pending_observed_queries()
+            return
+
+        self._add_observed_query(
+            observed,
+            is_known_temp_table=is_known_temp_table,
+            require_out_table_schema=require_out_table_schema,
+        )
+
+    def _flush_pending_observed_queries(self) -> None:
+        if not self._pending_observed_queries:
+            return
+        pending = self._pending_observed_queries
+        self._pending_observed_queries = []
+
+        pooled_results: List[Optional[PooledParsingResult]] = [None] * len(pending)
+        use_pool = (
+            self._parsing_pool is not None
+            and len(pending) >= self._parsing_pool.min_batch_size
+        )
+        if use_pool:
+            assert self._parsing_pool is not None
+            with self.report.sql_parsing_pool_timer:
+                pooled_results = self._parsing_pool.parse_many(
+                    [
+                        (observed.query, observed.default_db, observed.default_schema)
+                        for observed, _, _ in pending
+                    ]
+                )
+            schema_count_before = self._schema_resolver.schema_count()
+
+            # Resolve all of the tables that the pool couldn't find in one go, rather
+            # than with a graph lookup per table while applying the results.
+            with self.report.sql_parsing_schema_prefetch_timer:
+                self._schema_resolver.prefetch_urns(
+                    urn
+                    for pooled in pooled_results
+                    if pooled is not None
+                    for urn in pooled.missing_urns
+                )
+
+        # The pooled results are applied in the original order, since the
+        # processing of each query depends on the state left by previous queries.
+        for (observed, is_known_temp_table, require_out_table_schema), pooled in zip(
+            pending, pooled_results
+        ):
+            self._add_observed_query(
+                observed,
+                is_known_temp_table=is_known_temp_table,
+                require_out_table_schema=require_out_table_schema,
+                pooled=pooled,
+            )
+
+        if use_pool and self._schema_resolver.schema_count() != schema_count_before:
+            # Some schemas were fetched from the graph while processing this batch,
+            # so the pool's snapshot is out of date.
+            assert self._parsing_pool is not None
+            self._parsing_pool.invalidate_snapshot()
+
+    def _add_observed_query(
+        self,
+        observed: ObservedQuery,
+        is_known_temp_table: bool,
+        require_out_table_schema: bool,
+        pooled: Optional[PooledParsingResult] = None,
+    ) -> None:
         self.report.num_observed_queries += 1
 
         # All queries with no session ID are assumed to be part of the same session.
@@ -786,6 +937,7 @@ class SqlParsingAggregator(Closeable):
             session_id=session_id,
             timestamp=observed.timestamp,
             user=observed.user,
+            pooled=pooled,
         )
         if parsed.debug_info.error:
             self.report.observed_query_parse_failures.append(
@@ -839,6 +991,7 @@ class SqlParsingAggregator(Closeable):
         self._tool_meta_extractor.extract_bi_metadata(parsed)
 
         if not _is_internal:
+            self._flush_pending_observed_queries()
             self.report.num_preparsed_queries += 1
 
         if parsed.timestamp:
@@ -1118,14 +1271,21 @@ class SqlParsingAggregator(Closeable):
         session_id: str = _MISSING_SESSION_ID,
         timestamp: Optional[datetime] = None,
         user: Optional[Union[CorpUserUrn, CorpGroupUrn]] = None,
+        pooled: Optional[PooledParsingResult] = None,
     ) -> SqlParsingResult:
-        with self.report.sql_parsing_timer:
-            parsed = sqlglot_lineage(
-                query,
-                schema_resolver=schema_resolver,
-                default_db=default_db,
-                default_schema=default_schema,
-            )
+        if pooled is not None and self._is_pooled_result_valid(pooled, schema_resolver):
+            parsed = pooled.result
+            self.report.num_sql_parsed_in_pool += 1
+        else:
+            if pooled is not None:
+                self.report.num_sql_pool_results_discarded += 1
+            with self.report.sql_parsing_timer:
+                parsed = sqlglot_lineage(
+                    query,
+                    schema_resolver=schema_resolver,
+                    default_db=default_db,
+                    default_schema=default_schema,
+                )
         self.report.num_sql_parsed += 1
 
         # Conditionally log the query.
@@ -1151,6 +1311,31 @@ class SqlParsingAggregator(Closeable):
 
         return parsed
 
+    def _is_pooled_result_valid(
+        self, pooled: PooledParsingResult, schema_resolver: SchemaResolverInterface
+    ) -> bool:
+        # The pool parses against the base schema resolver. The result is only
+        # usable if parsing in-process would have produced the same thing.
+        if isinstance(schema_resolver, _SchemaResolverWithExtras) and any(
+            urn in schema_resolver._extra_schemas for urn in pooled.touched_urns
+        ):
+            # The query references one of the session's temp tables.
+            return False
+
+        if any(
+            self._schema_resolver.has_urn(urn)
+            or (
+                self._schema_resolver.graph is not None
+                and not self._schema_resolver.is_cached(urn)
+            )
+            for urn in pooled.missing_urns
+        ):
+            # The schema for a referenced table could be resolved in-process,
+            # but wasn't available in the pool's snapshot.
+            return False
+
+        return True
+
     def _add_to_query_map(
         self, new: QueryMetadata, merge_lineage: bool = False
     ) -> None:
@@ -1198,6 +1383,8 @@ class SqlParsingAggregator(Closeable):
             self._query_map[query_fingerprint] = new
 
     def gen_metadata(self) -> Iterable[MetadataChangeProposalWrapper]:
+        self._flush_pending_observed_queries()
+
         queries_generated: Set[QueryId] = set()
 
         yield from self._gen_lineage_mcps(queries_generated)
@@ -1219,11 +1406,37 @@ class SqlParsingAggregator(Closeable):
             self._process_view_definition(view_urn, view_definition)
         self._view_definitions.clear()
 
-        # Generate lineage and queries.
-        for downstream_urn in sorted(self._lineage_map):
-            yield from self._gen_lineage_for_downstream(
-                downstream_urn, queries_generated=queries_generated
+        # Generate lineage and queries. The downstreams are streamed from the lineage
+        # map in sorted order, and the query metadata is fetched in bulk for each
+        # batch of downstreams.
+        self._resolved_queries.clear()
+        lineage_items = self._lineage_map.items_snapshot(sort_by_key=True)
+        while True:
+            batch = list(itertools.islice(lineage_items, _LINEAGE_GEN_BATCH_SIZE))
+            if not batch:
+                break
+
+            allowed_batch = []
+            for downstream_urn, query_ids in batch:
+                if not self.is_allowed_table(downstream_urn):
+                    self.report.num_lineage_skipped_due_to_filters += 1
+                    continue
+                allowed_batch.append((downstream_urn, query_ids))
+
+            queries = self._query_map.get_many(
+                query_id
+                for _, query_ids in allowed_batch
+                for query_id in query_ids
+                if query_id not in self._resolved_queries
             )
+            for downstream_urn, query_ids in allowed_batch:
+                yield from self._gen_lineage_for_downstream(
+                    downstream_urn,
+                    query_ids=query_ids,
+                    queries=queries,
+                    queries_generated=queries_generated,
+                )
+        self._resolved_queries.clear()
 
     @classmethod
     def _query_type_precedence(cls, query_type: str) -> int:
@@ -1240,26 +1453,24 @@ class SqlParsingAggregator(Closeable):
         return idx
 
     def _gen_lineage_for_downstream(
-        self, downstream_urn: str, queries_generated: Set[QueryId]
+        self,
+        downstream_urn: str,
+        query_ids: OrderedSet[QueryId],
+        queries: Dict[QueryId, QueryMetadata],
+        queries_generated: Set[QueryId],
     ) -> Iterable[MetadataChangeProposalWrapper]:
-        if not self.is_allowed_table(downstream_urn):
-            self.report.num_lineage_skipped_due_to_filters += 1
-            return
-
-        query_ids = self._lineage_map[downstream_urn]
-        queries: List[QueryMetadata] = [
-            self._resolve_query_with_temp_tables(self._query_map[query_id])
-            for query_id in query_ids
+        resolved_queries: List[QueryMetadata] = [
+            self._get_resolved_query(query_id, queries) for query_id in query_ids
         ]
 
         # Sort the queries by highest precedence first, then by latest timestamp.
         # In case of ties, prefer queries with a known query type.
         # Tricky: by converting the timestamp to a number, we also can ignore the
         # differences between naive and aware datetimes.
-        queries = sorted(
+        resolved_queries = sorted(
             # Sorted is a stable sort, so in the case of total ties, we want
             # to prefer the most recently added query.
-            reversed(queries),
+            reversed(resolved_queries),
             key=lambda query: (
                 self._query_type_precedence(query.lineage_type),
                 -(make_ts_millis(query.latest_timestamp) or 0),
@@ -1268,7 +1479,7 @@ class SqlParsingAggregator(Closeable):
         )
 
         queries_map: Dict[QueryId, QueryMetadata] = {
-            query.query_id: query for query in queries
+            query.query_id: query for query in resolved_queries
         }
 
         # mapping of upstream urn -> query id that produced it
@@ -1276,7 +1487,7 @@ class SqlParsingAggregator(Closeable):
         # mapping of downstream column -> { upstream column -> query id that produced it }
         cll: Dict[str, Dict[SchemaFieldUrn, QueryId]] = defaultdict(dict)
 
-        for query in queries:
+        for query in resolved_queries:
             # Using setdefault to respect the precedence of queries.
 
             for upstream in query.upstreams:
@@ -1525,6 +1736,26 @@ class SqlParsingAggregator(Closeable):
 
                 self.report.num_query_usage_stats_generated += 1
 
+    def _get_resolved_query(
+        self, query_id: QueryId, queries: Dict[QueryId, QueryMetadata]
+    ) -> QueryMetadata:
+        # A memoized version of _resolve_query_with_temp_tables. The base query
+        # is looked up in `queries`, which is expected to be prefetched.
+        if query_id in self._resolved_queries:
+            self._resolved_queries.move_to_end(query_id)
+            return self._resolved_queries[query_id]
+
+        # Queries that were resolved when the batch was prefetched aren't in
+        # `queries`, but may have been evicted from the cache since then.
+        base_query = queries.get(query_id)
+        if base_query is None:
+            base_query = self._query_map[query_id]
+        resolved_query = self._resolve_query_with_temp_tables(base_query)
+        self._resolved_queries[query_id] = resolved_query
+        if len(self._resolved_queries) > _RESOLVED_QUERY_CACHE_SIZE:
+            self._resolved_queries.popitem(last=False)
+        return resolved_query
+
     def _resolve_query_with_temp_tables(
         self,
         base_query: QueryMetadata,
@@ -1534,6 +1765,11 @@ class SqlParsingAggregator(Closeable):
 
         session_id = base_query.session_id
 
+        # Fast path if the session has no temp tables.
+        session_temp_tables = self._temp_lineage_map.get(session_id)
+        if not session_temp_tables:
+            return base_query
+
         composed_of_queries = OrderedSet[QueryId]()
 
         @dataclasses.dataclass
@@ -1565,9 +1801,7 @@ class SqlParsingAggregator(Closeable):
             # Find all the temp tables that this query depends on.
             temp_upstream_queries: Dict[UrnStr, QueryLineageInfo] = {}
             for upstream in query.upstreams:
-                upstream_query_ids = self._temp_lineage_map.get(session_id, {}).get(
-                    upstream
-                )
+                upstream_query_ids = session_temp_tables.get(upstream)
                 if upstream_query_ids:
                     for upstream_query_id in upstream_query_ids:
                         upstream_query = self._query_map.get(upstream_query_id)
@@ -0,0 +1,334 @@
+import concurrent.futures
+import dataclasses
+import functools
+import hashlib
+import logging
+import multiprocessing
+import pathlib
+import pickle
+import shutil
+import tempfile
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.sql_parsing._models import _TableName
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolver
+from datahub.sql_parsing.sqlglot_lineage import (
+    SQL_PARSE_RESULT_CACHE_SIZE,
+    SqlParsingResult,
+    _sqlglot_lineage_nocache,
+)
+
+logger = logging.getLogger(__name__)
+
+# (sql, default_db, default_schema)
+ParsingRequest = Tuple[str, Optional[str], Optional[str]]
+
+_DEFAULT_CHUNK_SIZE = 100
+_DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclasses.dataclass
+class PooledParsingResult:
+    result: SqlParsingResult
+
+    # The urns that the parser looked up while resolving table references. These
+    # are computed the same way that temp table lookups are, so the caller can
+    # check whether a session's temp tables would have affected the result.
+    touched_urns: FrozenSet[str]
+
+    # The urns that were not present in the schema snapshot at all. If the main
+    # process can resolve any of these (e.g. via the graph), the result is stale.
+    missing_urns: FrozenSet[str]
+
+
+class _SnapshotSchemaResolver(SchemaResolver):
+    """A read-only schema resolver backed by a snapshot of another resolver's cache."""
+
+    def __init__(
+        self,
+        *,
+        platform: str,
+        platform_instance: Optional[str],
+        env: str,
+        snapshot: Dict[str, Optional[SchemaInfo]],
+    ):
+        super().__init__(
+            platform=platform, platform_instance=platform_instance, env=env
+        )
+        self._snapshot = snapshot
+
+        self.touched_urns: Set[str] = set()
+        self.missing_urns: Set[str] = set()
+
+    def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
+        self.touched_urns.add(
+            self.get_urn_for_table(table, lower=self._prefers_urn_lower())
+        )
+        return super().resolve_table(table)
+
+    def has_urn(self, urn: str) -> bool:
+        return self._snapshot.get(urn) is not None
+
+    def _resolve_schema_info(self, urn: str) -> Optional[SchemaInfo]:
+        if urn not in self._snapshot:
+            self.missing_urns.add(urn)
+            return None
+        return self._snapshot[urn]
+
+
+class _SnapshotUpdateError(Exception):
+    """A worker failed to apply an update to its schema snapshot."""
+
+
+# Each worker process holds its own copy of the snapshot resolver, and the
+# number of snapshot updates it has applied to it.
+_worker_schema_resolver: Optional[_SnapshotSchemaResolver] = None
+_worker_snapshot_generation = 0
+
+
+def _init_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    snapshot: Dict[str, Optional[SchemaInfo]],
+) -> None:
+    global _worker_schema_resolver
+    _worker_schema_resolver = _SnapshotSchemaResolver(
+        platform=platform,
+        platform_instance=platform_instance,
+        env=env,
+        snapshot=snapshot,
+    )
+
+
+@functools.lru_cache(maxsize=SQL_PARSE_RESULT_CACHE_SIZE)
+def _parse_in_worker(
+    sql: str, default_db: Optional[str], default_schema: Optional[str]
+) -> PooledParsingResult:
+    # We can't use the cached variant of sqlglot_lineage here, since a cache hit
+    # would not record the urns that the query touches.
+    resolver = _worker_schema_resolver
+    assert resolver is not None, "worker was not initialized"
+
+    resolver.touched_urns = set()
+    resolver.missing_urns = set()
+    result = _sqlglot_lineage_nocache(
+        sql,
+        schema_resolver=resolver,
+        default_db=default_db,
+        default_schema=default_schema,
+    )
+    return PooledParsingResult(
+        result=result,
+        touched_urns=frozenset(resolver.touched_urns),
+        missing_urns=frozenset(resolver.missing_urns),
+    )
+
+
+def _apply_snapshot_updates(updates_dir: pathlib.Path, generation: int) -> None:
+    global _worker_snapshot_generation
+    resolver = _worker_schema_resolver
+    assert resolver is not None, "worker was not initialized"
+
+    if _worker_snapshot_generation >= generation:
+        return
+    try:
+        while _worker_snapshot_generation < generation:
+            next_generation = _worker_snapshot_generation + 1
+            with open(updates_dir / f"{next_generation}.pickle", "rb") as f:
+                resolver._snapshot.update(pickle.load(f))
+            _worker_snapshot_generation = next_generation
+    except Exception as e:
+        raise _SnapshotUpdateError(
+            f"Failed to apply schema snapshot update {_worker_snapshot_generation + 1}: {e}"
+        ) from None
+    finally:
+        # Cached results may depend on the schemas that changed.
+        _parse_in_worker.cache_clear()
+
+
+def _parse_chunk(
+    chunk: List[ParsingRequest], updates_dir: pathlib.Path, generation: int
+) -> List[PooledParsingResult]:
+    _apply_snapshot_updates(updates_dir, generation)
+    return [_parse_in_worker(*request) for request in chunk]
+
+
+def _digest_schema_info(schema_info: Optional[SchemaInfo]) -> bytes:
+    return hashlib.blake2b(pickle.dumps(schema_info), digest_size=16).digest()
+
+
+class SqlParsingPool(Closeable):
+    """Parses SQL queries in a pool of worker processes.
+
+    Each worker gets a read-only snapshot of the schema resolver's cache, taken
+    when the pool is started. Call `invalidate_snapshot` after registering new
+    schemas so that the next batch is parsed against an up-to-date snapshot.
+
+    Rather than respawning the workers, the pool then ships only the schemas that
+    changed: each update is written to a file in a temp directory, and workers
+    apply the updates they haven't seen yet before parsing their next chunk. If
+    that fails, the pool falls back to starting new workers with a full snapshot.
+
+    Results are speculative: they are computed without any session-specific temp
+    tables and without graph lookups. See `PooledParsingResult` for the information
+    callers need to decide whether a result is usable as-is.
+    """
+
+    def __init__(
+        self,
+        *,
+        schema_resolver: SchemaResolver,
+        processes: int,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ):
+        assert processes > 0, "processes must be positive"
+
+        self._schema_resolver = schema_resolver
+        self.processes = processes
+        self.chunk_size = chunk_size
+
+        # Callers should accumulate this many queries before calling parse_many.
+        self.batch_size = batch_size
+        # Below this many queries, the IPC overhead isn't worth it.
+        self.min_batch_size = chunk_size * processes
+
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+        # What the workers' snapshots contain, as urn -> digest of the schema.
+        self._snapshot_digests: Dict[str, bytes] = {}
+        self._snapshot_generation = 0
+        self._snapshot_stale = False
+        self._updates_dir: Optional[pathlib.Path] = None
+
+        self.num_pool_starts = 0
+        self.num_snapshot_updates = 0
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            snapshot = self._schema_resolver.snapshot()
+            logger.debug(
+                f"Starting SQL parsing pool with {self.processes} processes "
+                f"and a snapshot of {len(snapshot)} schemas"
+            )
+            self._snapshot_digests = {
+                urn: _digest_schema_info(schema_info)
+                for urn, schema_info in snapshot.items()
+            }
+            self._snapshot_generation = 0
+            self._snapshot_stale = False
+            self._updates_dir = pathlib.Path(tempfile.mkdtemp())
+
+            # We use spawn instead of fork, since the parent process usually has
+            # open sqlite connections and background threads.
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self._schema_resolver.platform,
+                    self._schema_resolver.platform_instance,
+                    self._schema_resolver.env,
+                    snapshot,
+                ),
+            )
+            self.num_pool_starts += 1
+        return self._executor
+
+    def invalidate_snapshot(self) -> None:
+        """Mark the workers' snapshot as outdated, so that it is updated before the next batch."""
+
+        self._snapshot_stale = True
+
+    def _update_snapshot(self) -> None:
+        assert self._updates_dir is not None
+
+        updates: Dict[str, Optional[SchemaInfo]] = {}
+        for urn, schema_info in self._schema_resolver.snapshot().items():
+            digest = _digest_schema_info(schema_info)
+            if self._snapshot_digests.get(urn) != digest:
+                updates[urn] = schema_info
+                self._snapshot_digests[urn] = digest
+        self._snapshot_stale = False
+        if not updates:
+            return
+
+        generation = self._snapshot_generation + 1
+        try:
+            with open(self._updates_dir / f"{generation}.pickle", "wb") as f:
+                pickle.dump(updates, f)
+        except Exception as e:
+            logger.debug(
+                f"Failed to write a schema snapshot update; restarting the pool: {e}",
+                exc_info=e,
+            )
+            self._shutdown()
+            return
+        self._snapshot_generation = generation
+        self.num_snapshot_updates += 1
+        logger.debug(f"Sending {len(updates)} updated schemas to the parsing pool")
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._updates_dir is not None:
+            shutil.rmtree(self._updates_dir, ignore_errors=True)
+            self._updates_dir = None
+
+    def parse_many(
+        self, requests: Sequence[ParsingRequest]
+    ) -> List[Optional[PooledParsingResult]]:
+        """Parse a batch of queries, returning results in the same order.
+
+        If a chunk of queries fails to round-trip through the pool (e.g. because
+        an error isn't picklable), the results for that chunk will be None and
+        the caller is expected to parse those queries itself.
+        """
+
+        if self._executor is not None and self._snapshot_stale:
+            self._update_snapshot()
+        executor = self._get_executor()
+        assert self._updates_dir is not None
+
+        chunks = [
+            list(requests[i : i + self.chunk_size])
+            for i in range(0, len(requests), self.chunk_size)
+        ]
+        futures = [
+            executor.submit(
+                _parse_chunk, chunk, self._updates_dir, self._snapshot_generation
+            )
+            for chunk in chunks
+        ]
+
+        results: List[Optional[PooledParsingResult]] = []
+        pool_broken = False
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                logger.debug(
+                    f"Failed to parse a chunk of {len(chunk)} queries in the pool: {e}",
+                    exc_info=e,
+                )
+                if isinstance(
+                    e,
+                    (
+                        concurrent.futures.process.BrokenProcessPool,
+                        _SnapshotUpdateError,
+                    ),
+                ):
+                    pool_broken = True
+                results.extend([None] * len(chunk))
+
+        if pool_broken:
+            # A worker died or fell behind on its snapshot. Start from scratch
+            # on the next batch.
+            self._shutdown()
+        return results
+
+    def close(self) -> None:
+        self._shutdown()
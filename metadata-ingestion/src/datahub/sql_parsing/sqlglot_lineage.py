@@ -32,6 +32,7 @@ from datahub.metadata.schema_classes import (
     TimeTypeClass,
 )
 from datahub.sql_parsing._models import _FrozenModel, _ParserBaseModel, _TableName
+from datahub.sql_parsing.parse_result_cache import get_global_parse_result_cache
 from datahub.sql_parsing.query_types import get_query_type_of_sql, is_create_table_ddl
 from datahub.sql_parsing.schema_resolver import (
     SchemaInfo,
@@ -1169,8 +1170,31 @@ def _sqlglot_lineage_nocache(
         return SqlParsingResult.make_from_error(e)
 
 
+def _sqlglot_lineage_persistent(
+    sql: sqlglot.exp.ExpOrStr,
+    schema_resolver: SchemaResolverInterface,
+    default_db: Optional[str] = None,
+    default_schema: Optional[str] = None,
+    default_dialect: Optional[str] = None,
+) -> SqlParsingResult:
+    persistent_cache = get_global_parse_result_cache()
+    if persistent_cache is None or not isinstance(sql, str):
+        return _sqlglot_lineage_nocache(
+            sql, schema_resolver, default_db, default_schema, default_dialect
+        )
+
+    return persistent_cache.get_or_parse(
+        sql,
+        schema_resolver=schema_resolver,
+        default_db=default_db,
+        default_schema=default_schema,
+        default_dialect=default_dialect,
+        parse=_sqlglot_lineage_nocache,
+    )
+
+
 _sqlglot_lineage_cached = functools.lru_cache(maxsize=SQL_PARSE_RESULT_CACHE_SIZE)(
-    _sqlglot_lineage_nocache
+    _sqlglot_lineage_persistent
 )
 
 
@@ -1191,6 +1215,50 @@ def sqlglot_lineage(
         )
 
 
+def get_referenced_tables(
+    sql: str,
+    platform: str,
+    default_db: Optional[str] = None,
+    default_schema: Optional[str] = None,
+    default_dialect: Optional[str] = None,
+) -> Set[_TableName]:
+    """Returns the qualified tables that a statement reads from or writes to.
+
+    This does not resolve any schemas, and is meant for prefetching them ahead
+    of calling `sqlglot_lineage` on the same statement. Since parsed statements
+    are cached, the subsequent parse is usually free. Returns an empty set if
+    the statement can't be parsed.
+    """
+
+    dialect = get_dialect(default_dialect or platform)
+    default_db = _normalize_db_or_schema(default_db, dialect)
+    default_schema = _normalize_db_or_schema(default_schema, dialect)
+
+    try:
+        statement = parse_statement(sql, dialect=dialect)
+        statement = sqlglot.optimizer.qualify.qualify(
+            _simplify_select_into(statement),
+            dialect=dialect,
+            catalog=default_db,
+            db=default_schema,
+            qualify_columns=False,
+            validate_qualify_columns=False,
+            allow_partial_qualification=True,
+            identify=False,
+        )
+        tables, modified = _table_level_lineage(statement, dialect=dialect)
+    except Exception as e:
+        logger.debug(f"Failed to extract tables from statement: {e}")
+        return set()
+
+    return {
+        table.qualified(
+            dialect=dialect, default_db=default_db, default_schema=default_schema
+        )
+        for table in tables | modified
+    }
+
+
 @functools.lru_cache(maxsize=128)
 def create_and_cache_schema_resolver(
     platform: str,
@@ -0,0 +1,280 @@
+"""A compact binary file format for serialized MCPs and MCEs.
+
+The file starts with a magic string and a small JSON header, followed by a
+sequence of length-prefixed records. Each record stores the entity urn and
+aspect name in the clear, and the serialized object as a (by default
+zlib-compressed) JSON payload. This means readers can filter by aspect name
+without decoding payloads. When the writer is closed, it appends an index from
+urn to record offsets, which enables random access by urn. Files that were not
+closed properly have no index, but can still be read sequentially.
+"""
+
+import dataclasses
+import json
+import struct
+import zlib
+from typing import (
+    IO,
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+BINARY_MCP_FILE_EXTENSION = ".mcpb"
+
+_MAGIC = b"DHMCPB01"
+_INDEX_MAGIC = b"DHMCPIDX"
+
+# flags, urn length, aspect name length, payload length
+_RECORD_HEADER = struct.Struct(">BHHI")
+# index offset, index magic
+_FOOTER = struct.Struct(">Q8s")
+_LENGTH = struct.Struct(">I")
+
+_FLAG_COMPRESSED = 1
+_FLAG_HAS_ASPECT_NAME = 2
+# Marks the end of the records, so that streams can be read without seeking
+# to the index.
+_FLAG_END_OF_RECORDS = 0x80
+
+# Compressing tiny payloads usually makes them larger.
+_MIN_COMPRESSED_PAYLOAD_SIZE = 128
+_DEFAULT_COMPRESSION_LEVEL = 6
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter than the stdlib, e.g. for ints beyond 64 bits.
+            pass
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def is_binary_mcp_file(path: str) -> bool:
+    return path.endswith(BINARY_MCP_FILE_EXTENSION)
+
+
+@dataclasses.dataclass
+class BinaryMcpRecord:
+    # The position of the record in the file, starting from 0.
+    index: int
+    urn: str
+    aspect_name: Optional[str]
+    obj: dict
+
+
+class BinaryMcpFileWriter:
+    """Writes records to a binary MCP file in a streaming fashion.
+
+    Only the urn index is kept in memory, and it's written out by `close`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compression_level: Optional[int] = _DEFAULT_COMPRESSION_LEVEL,
+    ):
+        self.compression_level = compression_level
+        self._file: IO[bytes] = open(path, "wb")
+        # urn -> (offset, record index) pairs
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        self._num_records = 0
+
+        header = _json_dumps(
+            {"compression": "zlib" if compression_level is not None else None}
+        )
+        self._file.write(_MAGIC)
+        self._file.write(_LENGTH.pack(len(header)))
+        self._file.write(header)
+
+    def write(self, urn: str, aspect_name: Optional[str], obj: dict) -> None:
+        urn_bytes = urn.encode()
+        aspect_name_bytes = (aspect_name or "").encode()
+        payload = _json_dumps(obj)
+
+        flags = _FLAG_HAS_ASPECT_NAME if aspect_name is not None else 0
+        if (
+            self.compression_level is not None
+            and len(payload) >= _MIN_COMPRESSED_PAYLOAD_SIZE
+        ):
+            payload = zlib.compress(payload, self.compression_level)
+            flags |= _FLAG_COMPRESSED
+
+        self._index.setdefault(urn, []).append((self._file.tell(), self._num_records))
+        self._file.write(
+            _RECORD_HEADER.pack(
+                flags, len(urn_bytes), len(aspect_name_bytes), len(payload)
+            )
+        )
+        self._file.write(urn_bytes)
+        self._file.write(aspect_name_bytes)
+        self._file.write(payload)
+        self._num_records += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+
+        self._file.write(_RECORD_HEADER.pack(_FLAG_END_OF_RECORDS, 0, 0, 0))
+        index_offset = self._file.tell()
+        index = zlib.compress(
+            _json_dumps({"num_records": self._num_records, "urns": self._index})
+        )
+        self._file.write(_LENGTH.pack(len(index)))
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(index_offset, _INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "BinaryMcpFileWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class BinaryMcpFileReader:
+    """Reads a binary MCP file.
+
+    Sequential reads work on any binary stream. Reading by urn needs a seekable
+    file, and is only efficient if the file has an index.
+    """
+
+    def __init__(self, file: Union[str, IO[bytes]]):
+        self._file: IO[bytes] = open(file, "rb") if isinstance(file, str) else file
+        self._owns_file = isinstance(file, str)
+
+        if self._file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("Not a binary MCP file")
+        (header_length,) = _LENGTH.unpack(self._file.read(_LENGTH.size))
+        self.header = _json_loads(self._file.read(header_length))
+        self._data_offset = len(_MAGIC) + _LENGTH.size + header_length
+
+        self._index: Optional[Dict[str, List[Tuple[int, int]]]] = None
+        if self._file.seekable():
+            self._read_index()
+            self._file.seek(self._data_offset)
+
+    def _read_index(self) -> None:
+        end = self._file.seek(0, 2)
+        if end - self._data_offset < _FOOTER.size:
+            return
+        self._file.seek(end - _FOOTER.size)
+        index_offset, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        if magic != _INDEX_MAGIC:
+            return
+
+        self._file.seek(index_offset)
+        (index_length,) = _LENGTH.unpack(self._file.read(_LENGTH.size))
+        index = _json_loads(zlib.decompress(self._file.read(index_length)))
+        self._index = index["urns"]
+
+    @property
+    def has_index(self) -> bool:
+        return self._index is not None
+
+    def _read_record(
+        self, aspect_names: Optional[Collection[str]]
+    ) -> Optional[Tuple[str, Optional[str], Optional[dict]]]:
+        # Returns None at the end of the records, and a None obj for records
+        # that were skipped because of their aspect name.
+        header = self._file.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return None
+        flags, urn_length, aspect_name_length, payload_length = _RECORD_HEADER.unpack(
+            header
+        )
+        if flags & _FLAG_END_OF_RECORDS:
+            return None
+        urn = self._file.read(urn_length).decode()
+        aspect_name: Optional[str] = self._file.read(aspect_name_length).decode()
+        if not flags & _FLAG_HAS_ASPECT_NAME:
+            aspect_name = None
+
+        if (
+            aspect_names is not None
+            and aspect_name is not None
+            and aspect_name not in aspect_names
+        ):
+            if self._file.seekable():
+                self._file.seek(payload_length, 1)
+            else:
+                self._file.read(payload_length)
+            return urn, aspect_name, None
+
+        payload = self._file.read(payload_length)
+        if flags & _FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        return urn, aspect_name, _json_loads(payload)
+
+    def read(
+        self, aspect_names: Optional[Collection[str]] = None
+    ) -> Iterator[BinaryMcpRecord]:
+        """Reads all records in file order.
+
+        If aspect_names is set, records for other aspects are skipped without
+        being decoded. Records without an aspect name, like MCEs, are always read.
+        """
+
+        if self._file.seekable():
+            self._file.seek(self._data_offset)
+        i = 0
+        while True:
+            record = self._read_record(aspect_names)
+            if record is None:
+                break
+            urn, aspect_name, obj = record
+            if obj is not None:
+                yield BinaryMcpRecord(i, urn, aspect_name, obj)
+            i += 1
+
+    def __iter__(self) -> Iterator[BinaryMcpRecord]:
+        return self.read()
+
+    def get_urns(self) -> List[str]:
+        if self._index is not None:
+            return list(self._index)
+        return list(dict.fromkeys(record.urn for record in self.read()))
+
+    def get_records(self, urn: str) -> List[BinaryMcpRecord]:
+        """Returns all records for the urn, in file order."""
+
+        if self._index is None:
+            return [record for record in self.read() if record.urn == urn]
+
+        records = []
+        for offset, i in self._index.get(urn, []):
+            self._file.seek(offset)
+            record = self._read_record(aspect_names=None)
+            assert record is not None
+            _, aspect_name, obj = record
+            assert obj is not None
+            records.append(BinaryMcpRecord(i, urn, aspect_name, obj))
+        return records
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "BinaryMcpFileReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
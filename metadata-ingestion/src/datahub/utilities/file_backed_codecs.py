@@ -0,0 +1,292 @@
+"""Codecs for the values stored by FileBacked* collections.
+
+A codec is a pair of functions that converts values to bytes and back. Codecs
+are built from a serialization format (e.g. pickle or msgpack), optionally
+followed by a compression step (e.g. gzip or zstd).
+
+Not every format can round-trip every value type. For example, the JSON-based
+formats turn tuples into lists and can't represent arbitrary classes. Use
+`choose_codec` to benchmark the candidates on a sample of real values - it only
+considers codecs that round-trip the samples exactly.
+"""
+
+import dataclasses
+import gzip
+import logging
+import pickle
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+_Encoder = Callable[[Any], bytes]
+_Decoder = Callable[[bytes], Any]
+
+# When picking a codec, we weigh the encoded size against the CPU time spent
+# encoding and decoding by assuming that this many bytes can be read or written
+# to disk per second.
+_ASSUMED_DISK_BYTES_PER_SEC = 200 * 1024 * 1024
+
+# zstd level 3 is the library default. It's still several times faster than gzip's
+# default level while usually producing smaller outputs.
+_DEFAULT_ZSTD_LEVEL = 3
+_DEFAULT_ZSTD_DICT_SIZE = 16 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class FileBackedCodec:
+    name: str
+    serializer: _Encoder
+    deserializer: _Decoder
+
+    def __repr__(self) -> str:
+        return f"FileBackedCodec({self.name!r})"
+
+
+def _make_orjson() -> Tuple[_Encoder, _Decoder]:
+    if orjson is None:
+        raise ImportError("The orjson codec requires the orjson package")
+    return orjson.dumps, orjson.loads
+
+
+def _make_msgpack() -> Tuple[_Encoder, _Decoder]:
+    if msgpack is None:
+        raise ImportError("The msgpack codec requires the msgpack package")
+
+    def _dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def _loads(data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    return _dumps, _loads
+
+
+def _make_pickle(protocol: int) -> Callable[[], Tuple[_Encoder, _Decoder]]:
+    def _factory() -> Tuple[_Encoder, _Decoder]:
+        return (lambda value: pickle.dumps(value, protocol=protocol)), pickle.loads
+
+    return _factory
+
+
+_FORMATS: Dict[str, Callable[[], Tuple[_Encoder, _Decoder]]] = {
+    "pickle": _make_pickle(pickle.DEFAULT_PROTOCOL),
+    # Protocol 5 (PEP 574) avoids extra copies when pickling large bytes-like objects.
+    "pickle5": _make_pickle(5),
+    "orjson": _make_orjson,
+    "msgpack": _make_msgpack,
+}
+
+
+def _make_gzip(
+    level: Optional[int], zstd_dict: Optional[bytes]
+) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if zstd_dict is not None:
+        raise ValueError("Compression dictionaries are only supported by zstd")
+    compresslevel = 9 if level is None else level
+    return (lambda data: gzip.compress(data, compresslevel=compresslevel)), (
+        gzip.decompress
+    )
+
+
+def _make_zstd(
+    level: Optional[int], zstd_dict: Optional[bytes]
+) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if zstandard is None:
+        raise ImportError("zstd compression requires the zstandard package")
+
+    dict_data = zstandard.ZstdCompressionDict(zstd_dict) if zstd_dict else None
+    compressor = zstandard.ZstdCompressor(
+        level=_DEFAULT_ZSTD_LEVEL if level is None else level, dict_data=dict_data
+    )
+    decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+    # The compressor and decompressor objects are not thread-safe, so don't share
+    # a codec instance across threads.
+    return compressor.compress, decompressor.decompress
+
+
+_COMPRESSIONS: Dict[
+    str,
+    Callable[
+        [Optional[int], Optional[bytes]],
+        Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]],
+    ],
+] = {
+    "gzip": _make_gzip,
+    "zstd": _make_zstd,
+}
+
+
+def register_codec_format(
+    name: str, factory: Callable[[], Tuple[_Encoder, _Decoder]]
+) -> None:
+    """Registers a serialization format that can be used with `get_codec`."""
+
+    if name in _FORMATS:
+        raise ValueError(f"Codec format {name} is already registered")
+    _FORMATS[name] = factory
+
+
+def is_codec_available(name: str, compression: Optional[str] = None) -> bool:
+    try:
+        get_codec(name, compression=compression)
+    except ImportError:
+        return False
+    return True
+
+
+def get_codec(
+    name: str,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    zstd_dict: Optional[bytes] = None,
+) -> FileBackedCodec:
+    """Builds a codec from a serialization format and an optional compression.
+
+    Raises an ImportError if the format or compression needs a package that
+    isn't installed.
+    """
+
+    if name not in _FORMATS:
+        raise ValueError(
+            f"Unknown codec format {name}; must be one of {sorted(_FORMATS)}"
+        )
+    serializer, deserializer = _FORMATS[name]()
+    if compression is None:
+        return FileBackedCodec(name, serializer, deserializer)
+
+    if compression not in _COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression}; must be one of {sorted(_COMPRESSIONS)}"
+        )
+    compress, decompress = _COMPRESSIONS[compression](compression_level, zstd_dict)
+
+    def _serialize(value: Any) -> bytes:
+        return compress(serializer(value))
+
+    def _deserialize(data: bytes) -> Any:
+        return deserializer(decompress(data))
+
+    codec_name = f"{name}+{compression}"
+    if compression_level is not None:
+        codec_name += f"-{compression_level}"
+    if zstd_dict is not None:
+        codec_name += "-dict"
+    return FileBackedCodec(codec_name, _serialize, _deserialize)
+
+
+def train_zstd_dictionary(
+    samples: Iterable[Any],
+    name: str = "pickle",
+    dict_size: int = _DEFAULT_ZSTD_DICT_SIZE,
+) -> bytes:
+    """Trains a zstd dictionary on the serialized forms of the sample values.
+
+    Dictionaries help most when there are many small values with a shared
+    structure, which generic compression can't exploit one value at a time.
+    The resulting bytes can be passed to `get_codec` as `zstd_dict`.
+    """
+
+    if zstandard is None:
+        raise ImportError("zstd compression requires the zstandard package")
+
+    serializer = get_codec(name).serializer
+    return zstandard.train_dictionary(
+        dict_size, [serializer(sample) for sample in samples]
+    ).as_bytes()
+
+
+@dataclasses.dataclass
+class CodecBenchmarkResult:
+    codec: FileBackedCodec
+    encoded_bytes: int
+    encode_sec: float
+    decode_sec: float
+
+    @property
+    def cost(self) -> float:
+        return (
+            self.encode_sec
+            + self.decode_sec
+            + self.encoded_bytes / _ASSUMED_DISK_BYTES_PER_SEC
+        )
+
+
+def _benchmark_codec(
+    codec: FileBackedCodec, samples: Sequence[Any]
+) -> Optional[CodecBenchmarkResult]:
+    try:
+        start = time.perf_counter()
+        encoded = [codec.serializer(sample) for sample in samples]
+        encode_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = [codec.deserializer(data) for data in encoded]
+        decode_sec = time.perf_counter() - start
+    except Exception as e:
+        logger.debug(f"Codec {codec.name} can't handle the samples: {e}")
+        return None
+
+    if decoded != list(samples):
+        logger.debug(f"Codec {codec.name} does not round-trip the samples")
+        return None
+
+    return CodecBenchmarkResult(
+        codec=codec,
+        encoded_bytes=sum(len(data) for data in encoded),
+        encode_sec=encode_sec,
+        decode_sec=decode_sec,
+    )
+
+
+def benchmark_codecs(
+    samples: Sequence[Any], candidates: Optional[Iterable[FileBackedCodec]] = None
+) -> List[CodecBenchmarkResult]:
+    """Benchmarks codecs on the sample values, returning the best codec first.
+
+    By default, every installed format is tried with and without zstd compression.
+    Codecs that fail to exactly round-trip the samples are left out.
+    """
+
+    if candidates is None:
+        candidates = []
+        for name in _FORMATS:
+            for compression in (None, "zstd"):
+                try:
+                    candidates.append(get_codec(name, compression=compression))
+                except ImportError:
+                    pass
+
+    results = [
+        result
+        for result in (_benchmark_codec(codec, samples) for codec in candidates)
+        if result is not None
+    ]
+    results.sort(key=lambda result: result.cost)
+    return results
+
+
+def choose_codec(
+    samples: Sequence[Any], candidates: Optional[Iterable[FileBackedCodec]] = None
+) -> FileBackedCodec:
+    """Picks the cheapest codec for the sample values, falling back to pickle."""
+
+    results = benchmark_codecs(samples, candidates)
+    if not results:
+        return get_codec("pickle")
+    return results[0].codec
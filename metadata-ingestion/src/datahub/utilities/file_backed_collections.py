@@ -18,6 +18,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Iterable,
     Iterator,
     List,
     MutableMapping,
@@ -28,9 +29,11 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    overload,
 )
 
 from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_codecs import FileBackedCodec
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -52,6 +55,11 @@ _DEFAULT_TABLE_NAME = "data"
 _DEFAULT_MEMORY_CACHE_MAX_SIZE = 900
 _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE = 150
 
+# The number of rows to pull from SQLite at a time when scanning a table.
+_DEFAULT_SCAN_CHUNK_SIZE = 1000
+# Older versions of SQLite limit queries to 999 bound parameters.
+_MAX_SQL_PARAMS = 900
+
 # https://docs.python.org/3/library/sqlite3.html#sqlite-and-python-types
 # Datetimes get converted to strings
 SqliteValue = Union[int, float, str, bytes, datetime, None]
@@ -207,6 +215,9 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
     serializer: Callable[[_VT], SqliteValue] = _default_serializer
     deserializer: Callable[[Any], _VT] = _default_deserializer
     extra_columns: Dict[str, Callable[[_VT], SqliteValue]] = field(default_factory=dict)
+    # If set, replaces the serializer and deserializer.
+    # See datahub.utilities.file_backed_codecs for the available codecs.
+    codec: Optional[FileBackedCodec] = None
 
     cache_max_size: int = _DEFAULT_MEMORY_CACHE_MAX_SIZE
     cache_eviction_batch_size: int = _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE
@@ -222,6 +233,10 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         init=False, repr=False
     )
     _use_sqlite_on_conflict: bool = field(repr=False, default=True)
+    # If set, the keys must be string-encoded integers and are stored as the table's
+    # integer primary key. Rows are then physically stored in key order, which makes
+    # range scans over the keys as fast as a sequential read of the table.
+    _integer_keys: bool = field(repr=False, default=False)
 
     def __post_init__(self) -> None:
         assert self.cache_eviction_batch_size > 0, (
@@ -232,6 +247,18 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
             if reserved_column in self.extra_columns:
                 raise ValueError(f'"{reserved_column}" is a reserved column name')
 
+        if self.codec is not None:
+            if (
+                self.serializer is not _default_serializer
+                or self.deserializer is not _default_deserializer
+                or self.should_compress_value
+            ):
+                raise ValueError(
+                    "codec cannot be combined with a custom serializer, deserializer, or should_compress_value"
+                )
+            self.serializer = self.codec.serializer
+            self.deserializer = self.codec.deserializer
+
         if self.shared_connection:
             self._conn = self.shared_connection
             self.shared_connection._dependent_objects.append(self)
@@ -255,11 +282,16 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         # Create the table.
         # We could use the built-in sqlite `rowid` column, but that can get changed
         # if a VACUUM is performed and would break our ordering guarantees.
+        # With integer keys, the key column is itself an alias for the rowid.
         if_not_exists = "IF NOT EXISTS" if self._conn.allow_table_name_reuse else ""
+        key_columns = (
+            "key INTEGER PRIMARY KEY"
+            if self._integer_keys
+            else "rowid INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT UNIQUE"
+        )
         self._conn.execute(
             f"""CREATE TABLE {if_not_exists} {self.tablename} (
-                rowid INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT UNIQUE,
+                {key_columns},
                 value BLOB
                 {"".join(f", {column_name} BLOB" for column_name in self.extra_columns.keys())}
             )"""
@@ -278,9 +310,10 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if self.indexes_created:
             return
         # The key column will automatically be indexed, but we need indexes for the extra columns.
+        if_not_exists = "IF NOT EXISTS" if self._conn.allow_table_name_reuse else ""
         for column_name in self.extra_columns.keys():
             self._conn.execute(
-                f"CREATE INDEX {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
+                f"CREATE INDEX {if_not_exists} {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
             )
         self.indexes_created = True
 
@@ -368,6 +401,32 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
     def __setitem__(self, key: str, value: _VT) -> None:
         self._add_to_cache(key, value, True)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, _VT]:
+        """Looks up many keys at once, skipping any keys that don't exist.
+
+        This is much faster than looking up keys one by one. Values that aren't
+        already cached are read with a few bulk queries and aren't added to the
+        cache, so they must not be mutated.
+        """
+
+        result: Dict[str, _VT] = {}
+        missing: List[str] = []
+        for key in keys:
+            if key in self._active_object_cache:
+                result[key] = self._active_object_cache[key][0]
+            elif key not in result:
+                missing.append(key)
+
+        for i in range(0, len(missing), _MAX_SQL_PARAMS):
+            batch = missing[i : i + _MAX_SQL_PARAMS]
+            cursor = self._conn.execute(
+                f"SELECT key, value FROM {self.tablename} WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, value in cursor:
+                result[key] = self.deserializer(value)
+        return result
+
     def for_mutation(
         self,
         /,
@@ -418,19 +477,30 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if not self._active_object_cache[key][1]:
             self._active_object_cache[key] = self._active_object_cache[key][0], True
 
-    def __iter__(self) -> Iterator[str]:
+    def _scan(
+        self,
+        query: str,
+        params: Tuple[Any, ...] = (),
+        chunk_size: int = _DEFAULT_SCAN_CHUNK_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        # Flushing first means that our active object cache is empty, so it's fine to
+        # just pull from the DB. The rows are streamed from a single cursor and never
+        # go through the cache, so scans don't evict anything useful from it.
         self.flush()
 
-        # Our active object cache should now be empty, so it's fine to
-        # just pull from the DB.
-        cursor = self._conn.execute(
-            f"SELECT key FROM {self.tablename} ORDER BY rowid ASC"
-        )
-        for row in cursor:
+        cursor = self._conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+
+    def __iter__(self) -> Iterator[str]:
+        for row in self._scan(f"SELECT key FROM {self.tablename} ORDER BY rowid ASC"):
             yield row[0]
 
     def items_snapshot(
-        self, cond_sql: Optional[str] = None
+        self, cond_sql: Optional[str] = None, sort_by_key: bool = False
     ) -> Iterator[Tuple[str, _VT]]:
         """
         Return a fixed snapshot, rather than a view, of the dictionary's items.
@@ -440,17 +510,21 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
 
         Args:
             cond_sql: Conditional expression for WHERE statement, e.g. `x = 0 AND y = "value"`
+            sort_by_key: If set, the items are returned in the same order as `sorted(keys)`
+                instead of in insertion order. This walks the primary key index, so it's
+                an alternative to sorting all the keys in memory.
 
         Returns:
             Iterator of filtered (key, value) pairs.
         """
-        self.flush()
         sql = f"SELECT key, value FROM {self.tablename}"
         if cond_sql:
             sql += f" WHERE {cond_sql}"
+        # SQLite compares text with memcmp on its UTF-8 encoding. That matches the
+        # code point ordering used by Python's string comparisons.
+        sql += " ORDER BY key ASC" if sort_by_key else " ORDER BY rowid ASC"
 
-        cursor = self._conn.execute(sql)
-        for row in cursor:
+        for row in self._scan(sql):
             yield row[0], self.deserializer(row[1])
 
     def __len__(self) -> int:
@@ -510,7 +584,11 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
 
 
 class FileBackedList(Generic[_VT], Closeable):
-    """An append-only, list-like object that stores its contents in a SQLite database."""
+    """An append-only, list-like object that stores its contents in a SQLite database.
+
+    Iteration and slicing read the underlying table with a single ordered scan,
+    so they are much cheaper than indexing item by item.
+    """
 
     _len: int = field(default=0)
     _dict: FileBackedDict[_VT] = field(init=False)
@@ -524,6 +602,7 @@ class FileBackedList(Generic[_VT], Closeable):
         extra_columns: Optional[Dict[str, Callable[[_VT], SqliteValue]]] = None,
         cache_max_size: Optional[int] = None,
         cache_eviction_batch_size: Optional[int] = None,
+        codec: Optional[FileBackedCodec] = None,
     ) -> None:
         self._dict = FileBackedDict[_VT](
             shared_connection=shared_connection,
@@ -531,9 +610,11 @@ class FileBackedList(Generic[_VT], Closeable):
             serializer=serializer,
             deserializer=deserializer,
             extra_columns=extra_columns or {},
+            codec=codec,
             cache_max_size=cache_max_size or _DEFAULT_MEMORY_CACHE_MAX_SIZE,
             cache_eviction_batch_size=cache_eviction_batch_size
             or _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE,
+            _integer_keys=True,
         )
 
         if shared_connection:
@@ -542,11 +623,37 @@ class FileBackedList(Generic[_VT], Closeable):
         # In case we're reusing an existing list, we need to run a query to get the length.
         self._len = len(self._dict)
 
+        # Lists persisted by older versions store their indexes in a text column.
+        # Those can still be range scanned, but need a cast and a sort to do so.
+        self._key_sql = (
+            "key" if self._has_integer_key_column() else "CAST(key AS INTEGER)"
+        )
+
+    def _has_integer_key_column(self) -> bool:
+        cursor = self._dict._conn.execute(f"PRAGMA table_info({self.tablename})")
+        return any(row["name"] == "key" and row["pk"] for row in cursor)
+
     @property
     def tablename(self) -> str:
         return self._dict.tablename
 
-    def __getitem__(self, index: int) -> _VT:
+    @overload
+    def __getitem__(self, index: int) -> _VT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_VT]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_VT, List[_VT]]:
+        if isinstance(index, slice):
+            indexes = range(*index.indices(self._len))
+            if not indexes:
+                return []
+            start = min(indexes[0], indexes[-1])
+            values = list(self.iter_range(start, max(indexes[0], indexes[-1]) + 1))
+            if indexes.step == 1:
+                return values
+            return [values[i - start] for i in indexes]
+
         if index < 0 or index >= self._len:
             raise IndexError(f"list index {index} out of range")
 
@@ -566,8 +673,28 @@ class FileBackedList(Generic[_VT], Closeable):
         return self._len
 
     def __iter__(self) -> Iterator[_VT]:
-        for index in range(self._len):
-            yield self[index]
+        return self.iter_range()
+
+    def iter_range(self, start: int = 0, stop: Optional[int] = None) -> Iterator[_VT]:
+        """Iterates over the items with indexes in [start, stop), in order.
+
+        The items are streamed from SQLite in chunks and bypass the in-memory cache.
+        Like `items_snapshot` on FileBackedDict, this reflects the contents of the
+        list at the time iteration started.
+        """
+
+        start = max(start, 0)
+        stop = self._len if stop is None else min(stop, self._len)
+        if start >= stop:
+            return
+
+        for row in self._dict._scan(
+            f"SELECT value FROM {self.tablename} "
+            f"WHERE {self._key_sql} >= ? AND {self._key_sql} < ? "
+            f"ORDER BY {self._key_sql} ASC",
+            (start, stop),
+        ):
+            yield self._dict.deserializer(row[0])
 
     def flush(self) -> None:
         self._dict.flush()
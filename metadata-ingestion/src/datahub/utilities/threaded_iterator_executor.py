@@ -1,15 +1,64 @@
 import concurrent.futures
-import contextlib
+import dataclasses
 import queue
-from typing import Any, Callable, Generator, Iterable, Tuple, TypeVar
+import threading
+import time
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple, TypeVar
+
+from datahub.ingestion.api.report import Report
 
 T = TypeVar("T")
 
+# The maximum number of items that can be buffered before workers block.
+_DEFAULT_MAX_QUEUE_SIZE = 1000
+
+
+@dataclasses.dataclass
+class ThreadedIteratorExecutorReport(Report):
+    items_yielded: int = 0
+
+    max_queue_depth: int = 0
+    avg_queue_depth: float = 0.0
+
+    # Time spent by workers waiting for space in the queue, summed across workers.
+    # If this is high, the consumer is the bottleneck.
+    producer_blocked_sec: float = 0.0
+    # Time spent by the consumer waiting for the workers to produce an item.
+    # If this is high, the workers are the bottleneck.
+    consumer_blocked_sec: float = 0.0
+
+    _total_queue_depth: int = 0
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        if self.items_yielded:
+            self.avg_queue_depth = round(
+                self._total_queue_depth / self.items_yielded, 2
+            )
+
+
+class _WorkerDone:
+    """Sentinel that a worker puts on its queue after its last item."""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: Optional[BaseException]):
+        self.exc = exc
+
 
 class ThreadedIteratorExecutor:
     """
     Executes worker functions of type `Callable[..., Iterable[T]]` in parallel threads,
     yielding items of type `T` as they become available.
+
+    Items are passed through bounded queues, so workers block once `max_queue_size`
+    items are waiting for the consumer. If `ordered` is set, all items produced by
+    a given set of args are yielded together, in the order of `args_list`. In that
+    case, each worker gets its own queue of size `max_queue_size`.
+
+    If a worker raises an exception, it is re-raised by the consumer once it reaches
+    the point where that worker stopped producing items. If the consumer stops
+    iterating early, the remaining workers are stopped at their next item.
     """
 
     @classmethod
@@ -18,33 +67,79 @@ class ThreadedIteratorExecutor:
         worker_func: Callable[..., Iterable[T]],
         args_list: Iterable[Tuple[Any, ...]],
         max_workers: int,
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+        ordered: bool = False,
+        report: Optional[ThreadedIteratorExecutorReport] = None,
     ) -> Generator[T, None, None]:
-        out_q: queue.Queue[T] = queue.Queue()
+        stats = report or ThreadedIteratorExecutorReport()
+        stats_lock = threading.Lock()
+        cancelled = threading.Event()
 
-        def _worker_wrapper(
-            worker_func: Callable[..., Iterable[T]], *args: Any
-        ) -> None:
-            for item in worker_func(*args):
+        def _put(out_q: "queue.Queue[Any]", item: Any) -> None:
+            try:
+                out_q.put_nowait(item)
+            except queue.Full:
+                start = time.perf_counter()
                 out_q.put(item)
+                with stats_lock:
+                    stats.producer_blocked_sec += time.perf_counter() - start
+
+        def _get(out_q: "queue.Queue[Any]") -> Any:
+            try:
+                return out_q.get_nowait()
+            except queue.Empty:
+                start = time.perf_counter()
+                item = out_q.get()
+                stats.consumer_blocked_sec += time.perf_counter() - start
+                return item
+
+        def _worker_wrapper(out_q: "queue.Queue[Any]", *args: Any) -> None:
+            exc: Optional[BaseException] = None
+            try:
+                for item in worker_func(*args):
+                    if cancelled.is_set():
+                        break
+                    _put(out_q, item)
+            except BaseException as e:
+                # This includes SystemExit, which would otherwise silently end the thread.
+                exc = e
+            finally:
+                _put(out_q, _WorkerDone(exc))
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
+            shared_q: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+            tasks: List[Tuple[concurrent.futures.Future, "queue.Queue[Any]"]] = []
             for args in args_list:
-                future = executor.submit(_worker_wrapper, worker_func, *args)
-                futures.append(future)
-            # Read from the queue and yield the work units until all futures are done.
-            while True:
-                if not out_q.empty():
-                    while not out_q.empty():
-                        yield out_q.get_nowait()
-                else:
-                    with contextlib.suppress(queue.Empty):
-                        yield out_q.get(timeout=0.2)
-
-                # Filter out the done futures.
-                futures = [f for f in futures if not f.done()]
-                if not futures:
-                    break
-        # Yield the remaining work units. This theoretically should not happen, but adding it just in case.
-        while not out_q.empty():
-            yield out_q.get_nowait()
+                out_q = queue.Queue(maxsize=max_queue_size) if ordered else shared_q
+                tasks.append((executor.submit(_worker_wrapper, out_q, *args), out_q))
+
+            # The queues for which we have not yet seen the _WorkerDone sentinel.
+            # Without ordering, all of the entries point at the shared queue.
+            pending: List["queue.Queue[Any]"] = [out_q for _, out_q in tasks]
+            try:
+                while pending:
+                    out_q = pending[0] if ordered else shared_q
+                    depth = out_q.qsize()
+                    item = _get(out_q)
+                    if isinstance(item, _WorkerDone):
+                        pending.remove(out_q)
+                        if item.exc is not None:
+                            raise item.exc
+                        continue
+
+                    stats.items_yielded += 1
+                    stats._total_queue_depth += depth
+                    stats.max_queue_depth = max(stats.max_queue_depth, depth)
+                    yield item
+            finally:
+                if pending:
+                    # We're exiting early. Stop the workers, and drain their queues so
+                    # that none of them stay blocked on a full queue.
+                    cancelled.set()
+                    for future, out_q in tasks:
+                        if future.cancel():
+                            pending.remove(out_q)
+                    while pending:
+                        out_q = pending[0] if ordered else shared_q
+                        if isinstance(out_q.get(), _WorkerDone):
+                            pending.remove(out_q)
@@ -20,7 +20,10 @@ from datahub.ingestion.source.looker.looker_template_language import (
     load_and_preprocess_file,
     resolve_liquid_variable,
 )
-from datahub.ingestion.source.looker.lookml_config import LookMLSourceConfig
+from datahub.ingestion.source.looker.lookml_config import (
+    LookMLSourceConfig,
+    LookMLSourceReport,
+)
 from datahub.ingestion.source.looker.lookml_refinement import LookerRefinementResolver
 from datahub.ingestion.source.looker.lookml_source import LookMLSource
 from datahub.metadata.schema_classes import (
@@ -91,6 +94,40 @@ def test_lookml_ingest(pytestconfig, tmp_path, mock_time):
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_lookml_ingest_with_parse_cache(pytestconfig, tmp_path, mock_time):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/lookml"
+    mce_out_file = "expected_output.json"
+
+    recipe = get_default_recipe(
+        f"{tmp_path}/{mce_out_file}", f"{test_resources_dir}/lkml_samples"
+    )
+    recipe["source"]["config"]["parse_cache_dir"] = f"{tmp_path}/parse_cache"
+    recipe["source"]["config"]["parsing_processes"] = 2
+
+    # The first run populates the cache, and the second one reads from it.
+    for i in range(2):
+        pipeline = Pipeline.create(recipe)
+        pipeline.run()
+        pipeline.raise_from_status(raise_warnings=False)
+
+        report = pipeline.source.get_report()
+        assert isinstance(report, LookMLSourceReport)
+        if i == 0:
+            assert report.lkml_files_parsed_in_parallel > 0
+            assert report.lkml_parse_cache_disk_hits == 0
+        else:
+            assert report.lkml_files_parsed_in_parallel == 0
+            assert report.lkml_parse_cache_disk_hits > 0
+        assert report.lkml_parse_cache_hits > 0
+
+        mce_helpers.check_golden_file(
+            pytestconfig,
+            output_path=tmp_path / mce_out_file,
+            golden_path=test_resources_dir / mce_out_file,
+        )
+
+
 @freeze_time(FROZEN_TIME)
 def test_lookml_refinement_ingest(pytestconfig, tmp_path, mock_time):
     """Test backwards compatibility with previous form of config with new flags turned off"""
@@ -1,7 +1,7 @@
 import logging
 import sys
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -1207,3 +1207,97 @@ def test_comments_in_m_query():
         data_platform_tables[0].urn
         == "urn:li:dataset:(urn:li:dataPlatform:snowflake,snowflake_sample_data.tpcds_sf100tcl.item,PROD)"
     )
+
+
+def _parse_cache_warnings(reporter: PowerBiDashboardSourceReport) -> list:
+    return [
+        warning
+        for warning in reporter.warnings
+        if warning.title == "M-Query parse cache unavailable"
+    ]
+
+
+def test_m_query_parse_cache(tmp_path):
+    expressions = [
+        M_QUERIES[0],
+        M_QUERIES[3],
+        M_QUERIES[0],
+        'let\n    Source = Sql.Database("AUPRDWHDB", "COMMOPSDB"),,\nin\n    Source',
+    ]
+
+    def get_lineage(
+        reporter: PowerBiDashboardSourceReport,
+        parse_cache: Optional[parser.MQueryParseCache],
+    ) -> List[List[Lineage]]:
+        ctx, config, platform_instance_resolver = get_default_instances(
+            {"native_query_parsing": True}
+        )
+        return [
+            parser.get_upstream_tables(
+                powerbi_data_classes.Table(
+                    columns=[],
+                    measures=[],
+                    expression=expression,
+                    name="virtual_order_table",
+                    full_name="OrderDataSet.virtual_order_table",
+                ),
+                reporter,
+                ctx=ctx,
+                config=config,
+                platform_instance_resolver=platform_instance_resolver,
+                parse_cache=parse_cache,
+            )
+            for expression in expressions
+        ]
+
+    expected_lineage = get_lineage(PowerBiDashboardSourceReport(), parse_cache=None)
+    assert expected_lineage[0]
+
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.MQueryParseCache(reporter, cache_dir=tmp_path)
+    parse_cache.parse_all(expressions, parse_timeout=60, processes=2)
+    assert reporter.m_query_parallel_parses == 2
+
+    # Expressions that failed to parse in a worker are parsed in the main process.
+    assert get_lineage(reporter, parse_cache) == expected_lineage
+    assert reporter.m_query_parse_cache_hits == 3
+    assert reporter.m_query_parse_cache_misses == 1
+    assert reporter.m_query_parse_unexpected_character_errors == 1
+    parse_cache.close()
+
+    # The parse trees are persisted across runs, but the failures are not.
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.MQueryParseCache(reporter, cache_dir=tmp_path)
+    parse_cache.parse_all(expressions, parse_timeout=60, processes=2)
+    assert reporter.m_query_parallel_parses == 0
+
+    # Concurrent runs can share the cache.
+    other_reporter = PowerBiDashboardSourceReport()
+    other_parse_cache = parser.MQueryParseCache(other_reporter, cache_dir=tmp_path)
+    assert get_lineage(other_reporter, other_parse_cache) == expected_lineage
+    assert get_lineage(reporter, parse_cache) == expected_lineage
+    assert reporter.m_query_parse_cache_misses == 1
+    assert other_reporter.m_query_parse_cache_misses == 1
+    assert not _parse_cache_warnings(reporter)
+    assert not _parse_cache_warnings(other_reporter)
+    other_parse_cache.close()
+    parse_cache.close()
+
+    # A corrupt cache file is recreated.
+    (tmp_path / parser._M_QUERY_PARSE_CACHE_FILE).write_bytes(b"not a database" * 100)
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.MQueryParseCache(reporter, cache_dir=tmp_path)
+    assert get_lineage(reporter, parse_cache) == expected_lineage
+    assert reporter.m_query_parse_cache_misses == 3
+    assert not _parse_cache_warnings(reporter)
+    parse_cache.close()
+
+    # If the cache can't be opened at all, parse trees are only cached in memory.
+    reporter = PowerBiDashboardSourceReport()
+    parse_cache = parser.MQueryParseCache(
+        reporter, cache_dir=tmp_path / parser._M_QUERY_PARSE_CACHE_FILE
+    )
+    assert get_lineage(reporter, parse_cache) == expected_lineage
+    assert reporter.m_query_parse_cache_misses == 3
+    assert len(_parse_cache_warnings(reporter)) == 1
+    parse_cache.close()
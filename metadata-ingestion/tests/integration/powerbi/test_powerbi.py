@@ -441,12 +441,14 @@ def test_override_ownership(
 @freeze_time(FROZEN_TIME)
 @mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
 @pytest.mark.integration
+@pytest.mark.parametrize("workspace_extraction_max_workers", [1, 4])
 def test_scan_all_workspaces(
     mock_msal: MagicMock,
     pytestconfig: pytest.Config,
     tmp_path: str,
     mock_time: datetime.datetime,
     requests_mock: Any,
+    workspace_extraction_max_workers: int,
 ) -> None:
     test_resources_dir = pytestconfig.rootpath / "tests/integration/powerbi"
 
@@ -464,6 +466,7 @@ def test_scan_all_workspaces(
                     "workspace_id_pattern": {
                         "deny": ["64ED5CAD-7322-4684-8180-826122881108"],
                     },
+                    "workspace_extraction_max_workers": workspace_extraction_max_workers,
                 },
             },
             "sink": {
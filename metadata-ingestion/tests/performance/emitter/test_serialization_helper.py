@@ -0,0 +1,64 @@
+import logging
+import timeit
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.serialization_helper import (
+    post_json_transform,
+    pre_json_transform,
+)
+
+
+def _make_wide_schema(num_fields: int) -> models.SchemaMetadataClass:
+    return models.SchemaMetadataClass(
+        schemaName="wide_table",
+        platform="urn:li:dataPlatform:hive",
+        version=0,
+        hash="",
+        platformSchema=models.OtherSchemaClass(rawSchema=""),
+        fields=[
+            models.SchemaFieldClass(
+                fieldPath=f"column_{i}",
+                type=models.SchemaFieldDataTypeClass(
+                    type=models.StringTypeClass() if i % 2 else models.NumberTypeClass()
+                ),
+                nativeDataType="VARCHAR" if i % 2 else "NUMBER",
+                description=f"Description for column {i}",
+                globalTags=models.GlobalTagsClass(
+                    tags=[models.TagAssociationClass(tag="urn:li:tag:pii")]
+                ),
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+def run_test() -> None:
+    N = 20
+    aspect = _make_wide_schema(num_fields=5000)
+    obj = aspect.to_obj()
+    server_obj = pre_json_transform(obj)
+
+    assert pre_json_transform(obj, aspect.RECORD_SCHEMA) == server_obj
+    assert post_json_transform(server_obj, aspect.RECORD_SCHEMA) == (
+        post_json_transform(server_obj)
+    )
+
+    for name, func in [
+        ("pre_json_transform", lambda: pre_json_transform(obj)),
+        (
+            "pre_json_transform (compiled)",
+            lambda: pre_json_transform(obj, aspect.RECORD_SCHEMA),
+        ),
+        ("post_json_transform", lambda: post_json_transform(server_obj)),
+        (
+            "post_json_transform (compiled)",
+            lambda: post_json_transform(server_obj, aspect.RECORD_SCHEMA),
+        ),
+    ]:
+        seconds = timeit.timeit(func, number=N)
+        print(f"{name}: {seconds / N * 1000:.2f} ms per call")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
@@ -6,14 +6,18 @@ import pytest
 from freezegun import freeze_time
 from typing_extensions import Self
 
-from datahub.configuration.common import DynamicTypedConfig
+from datahub.configuration.common import DynamicTypedConfig, PipelineExecutionError
 from datahub.ingestion.api.committable import CommitPolicy, Committable
 from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.graph.config import DatahubClientConfig
-from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
+from datahub.ingestion.run.pipeline import (
+    Pipeline,
+    PipelineContext,
+    PipelineStatus,
+)
 from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
@@ -252,6 +256,57 @@ class TestPipeline:
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_with_staged_execution(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.api.test_pipeline.FakeSource"},
+                "transformers": [
+                    {"type": "tests.unit.api.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "flags": {"staged_execution": True},
+                "run_id": "pipeline_test",
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        expected_mce = get_initial_mce()
+
+        dataset_snapshot = cast(DatasetSnapshotClass, expected_mce.proposedSnapshot)
+        dataset_snapshot.aspects.append(get_status_removed_aspect())
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+
+        # The received records are shared across RecordingSink instances.
+        assert sink_report.total_records_written == 1
+        assert expected_mce == sink_report.received_records[-1].record
+
+        stages = pipeline.cli_report.as_obj()["pipeline_stages"]
+        assert set(stages) == {"source", "transform", "sink"}
+        assert stages["source"]["items"] == 1
+        # One batch of records for the workunit, plus one for the end of stream.
+        assert stages["sink"]["items"] == 2
+
+    @freeze_time(FROZEN_TIME)
+    def test_run_with_staged_execution_source_failure(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.api.test_pipeline.FakeSourceWithError"},
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "flags": {"staged_execution": True},
+                "run_id": "pipeline_test",
+            }
+        )
+        pipeline.run()
+
+        assert pipeline.final_status == PipelineStatus.ERROR
+        with pytest.raises(PipelineExecutionError):
+            pipeline.raise_from_status()
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
@@ -464,6 +519,12 @@ class FakeSourceWithWarnings(FakeSource):
         return self.source_report
 
 
+class FakeSourceWithError(FakeSource):
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        yield from super().get_workunits()
+        raise ValueError("source failed")
+
+
 class FakeSourceWithFailures(FakeSource):
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
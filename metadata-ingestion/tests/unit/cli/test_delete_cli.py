@@ -0,0 +1,117 @@
+import pathlib
+from unittest import mock
+
+from datahub.cli.delete_cli import (
+    _AdaptiveConcurrencyLimiter,
+    _delete_urns,
+    _DeleteCheckpoint,
+    _summarize_urns,
+)
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.metadata.schema_classes import StatusClass
+
+_URNS = [make_dataset_urn("hive", f"db.table_{i}") for i in range(250)]
+
+
+def test_soft_delete_in_batches() -> None:
+    graph = mock.MagicMock()
+
+    result = _delete_urns(
+        graph=graph,
+        urns=iter(_URNS),
+        delete_by_urn=False,
+        start_time=None,
+        end_time=None,
+        soft=True,
+        workers=4,
+    )
+
+    assert result.num_entities == 250
+    assert graph.emit_mcps.call_count == 3
+    emitted = [mcp for call in graph.emit_mcps.call_args_list for mcp in call.args[0]]
+    assert sorted(mcp.entityUrn for mcp in emitted) == sorted(_URNS)
+    assert all(mcp.aspect == StatusClass(removed=True) for mcp in emitted)
+    graph.soft_delete_entity.assert_not_called()
+
+
+def test_hard_delete_resumes_from_checkpoint(tmp_path: pathlib.Path) -> None:
+    urns = _URNS[:10]
+    graph = mock.MagicMock()
+
+    def _hard_delete_entity(urn: str) -> tuple:
+        if urn == urns[3]:
+            raise Exception("server unavailable")
+        return 2, 0
+
+    graph.hard_delete_entity.side_effect = _hard_delete_entity
+    checkpoint = _DeleteCheckpoint(str(tmp_path / "checkpoint.txt"))
+    result = _delete_urns(
+        graph=graph,
+        urns=urns,
+        delete_by_urn=False,
+        start_time=None,
+        end_time=None,
+        soft=False,
+        checkpoint=checkpoint,
+    )
+    checkpoint.close()
+    assert result.num_entities == 9
+    assert result.num_records == 18
+
+    # Re-running only retries the urn that failed.
+    graph.hard_delete_entity.reset_mock(side_effect=True)
+    graph.hard_delete_entity.return_value = (2, 0)
+    checkpoint = _DeleteCheckpoint(str(tmp_path / "checkpoint.txt"))
+    assert checkpoint.num_done == 9
+    result = _delete_urns(
+        graph=graph,
+        urns=urns,
+        delete_by_urn=False,
+        start_time=None,
+        end_time=None,
+        soft=False,
+        checkpoint=checkpoint,
+    )
+    checkpoint.close()
+    assert result.num_entities == 1
+    graph.hard_delete_entity.assert_called_once_with(urn=urns[3])
+
+
+def test_adaptive_concurrency_limiter() -> None:
+    limiter = _AdaptiveConcurrencyLimiter(max_limit=8)
+    assert limiter.limit == 8
+
+    # Errors halve the limit, but only once per round of in-flight requests.
+    limiter.on_error()
+    assert limiter.limit == 4
+    assert limiter.backoff_sec > 0
+    limiter.on_error()
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.on_success(0.1)
+    assert limiter.backoff_sec == 0
+    limiter.on_error()
+    assert limiter.limit == 2
+
+    # Requests that are much slower than the baseline also reduce the limit.
+    for _ in range(2):
+        limiter.on_success(0.1)
+    limiter.on_success(10.0)
+    assert limiter.limit == 1
+
+    # A run of healthy requests brings the limit back up to the max.
+    for _ in range(100):
+        limiter.on_success(0.1)
+    assert limiter.limit == 8
+
+
+def test_summarize_urns() -> None:
+    urns = [*_URNS, "urn:li:corpuser:foo"]
+    summary = _summarize_urns(iter(urns), sample_size=5)
+
+    assert summary.num_urns == 251
+    assert summary.num_urns_by_type == {"dataset": 250, "corpuser": 1}
+    assert len(summary.samples_by_type["dataset"]) == 5
+    assert set(summary.samples_by_type["dataset"]) <= set(_URNS)
+    assert summary.samples_by_type["corpuser"] == ["urn:li:corpuser:foo"]
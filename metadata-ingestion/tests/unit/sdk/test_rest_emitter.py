@@ -1,5 +1,13 @@
+import gzip
+import json
+from typing import List
+from unittest.mock import MagicMock, patch
+
 from datahub.emitter import rest_emitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.metadata.schema_classes import StatusClass
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -44,3 +52,55 @@ def test_datahub_rest_emitter_extra_params() -> None:
     )
     assert emitter._session.headers.get("key1") == "value1"
     assert emitter._session.headers.get("key2") == "value2"
+
+
+def _make_status_mcps(n: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,table_{i},PROD)",
+            aspect=StatusClass(removed=False),
+        )
+        for i in range(n)
+    ]
+
+
+def _emit_and_capture_payloads(
+    emitter: DatahubRestEmitter, mcps: List[MetadataChangeProposalWrapper]
+) -> List[dict]:
+    with patch.object(emitter._session, "post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=200)
+        emitter.emit_mcps(mcps, async_flag=True)
+
+    payloads = []
+    for call in mock_post.call_args_list:
+        data = call.kwargs["data"]
+        if call.kwargs["headers"] == {"Content-Encoding": "gzip"}:
+            data = gzip.decompress(data)
+        payloads.append(json.loads(data))
+    return payloads
+
+
+def test_datahub_rest_emitter_emit_mcps_chunking() -> None:
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    mcps = _make_status_mcps(5)
+
+    with patch.object(rest_emitter, "BATCH_INGEST_MAX_PAYLOAD_LENGTH", 2):
+        payloads = _emit_and_capture_payloads(emitter, mcps)
+
+    assert [len(payload["proposals"]) for payload in payloads] == [2, 2, 1]
+    assert all(payload["async"] == "true" for payload in payloads)
+    assert [proposal for payload in payloads for proposal in payload["proposals"]] == [
+        pre_json_transform(mcp.to_obj()) for mcp in mcps
+    ]
+
+
+def test_datahub_rest_emitter_gzip_requests() -> None:
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT, gzip_requests=True)
+    mcps = _make_status_mcps(3)
+
+    payloads = _emit_and_capture_payloads(emitter, mcps)
+
+    assert len(payloads) == 1
+    assert payloads[0]["proposals"] == [
+        pre_json_transform(mcp.to_obj()) for mcp in mcps
+    ]
@@ -2,6 +2,7 @@ import io
 import json
 import pathlib
 import shutil
+from typing import List
 from unittest.mock import patch
 
 import fastavro
@@ -12,10 +13,11 @@ from freezegun import freeze_time
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
 from datahub.emitter import mce_builder
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
 from datahub.ingestion.run.pipeline import Pipeline
 from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
-from datahub.metadata.schema_classes import MetadataChangeEventClass
+from datahub.metadata.schema_classes import DictWrapper, MetadataChangeEventClass
 from datahub.metadata.schemas import getMetadataChangeEventSchema
 from tests.test_helpers import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
@@ -355,6 +357,43 @@ def test_json_transforms(model, ref_server_obj):
     recovered = type(model).from_obj(post_obj)
     assert recovered == model
 
+    # The precompiled transforms should produce the same output.
+    assert pre_json_transform(model.to_obj(), model.RECORD_SCHEMA) == server_obj
+    assert post_json_transform(server_obj, model.RECORD_SCHEMA) == post_obj
+
+
+@pytest.mark.parametrize(
+    "json_filename",
+    [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_chart_snapshot.json",
+        "tests/unit/serde/test_serde_profile.json",
+    ],
+)
+def test_precompiled_json_transforms(
+    pytestconfig: pytest.Config, json_filename: str
+) -> None:
+    for mcp_obj in json.loads((pytestconfig.rootpath / json_filename).read_text()):
+        if "proposedSnapshot" in mcp_obj:
+            mce = MetadataChangeEventClass.from_obj(mcp_obj)
+            models_to_check: List[DictWrapper] = [mce, mce.proposedSnapshot]
+        else:
+            mcpc = models.MetadataChangeProposalClass.from_obj(mcp_obj)
+            mcp = MetadataChangeProposalWrapper.try_from_mcpc(mcpc)
+            models_to_check = [mcpc]
+            if mcp is not None and mcp.aspect is not None:
+                models_to_check.append(mcp.aspect)
+
+        for model in models_to_check:
+            obj = model.to_obj()
+            server_obj = pre_json_transform(obj)
+            assert json.dumps(
+                pre_json_transform(obj, model.RECORD_SCHEMA)
+            ) == json.dumps(server_obj)
+            assert json.dumps(
+                post_json_transform(server_obj, model.RECORD_SCHEMA)
+            ) == json.dumps(post_json_transform(server_obj))
+
 
 def test_unions_with_aliases_assumptions():
     # We have special handling for unions with aliases in our json serialization helpers.
@@ -0,0 +1,135 @@
+import pathlib
+import sqlite3
+from unittest import mock
+
+from datahub.sql_parsing.parse_result_cache import SqlParsingResultCache
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sqlglot_lineage import (
+    SqlParsingResult,
+    _sqlglot_lineage_nocache,
+)
+
+
+def _make_schema_resolver(columns: dict) -> SchemaResolver:
+    schema_resolver = SchemaResolver(platform="snowflake")
+    schema_resolver.add_raw_schema_info(
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.public.upstream,PROD)",
+        columns,
+    )
+    return schema_resolver
+
+
+def _parse(
+    cache: SqlParsingResultCache, sql: str, schema_resolver: SchemaResolver
+) -> SqlParsingResult:
+    return cache.get_or_parse(
+        sql,
+        schema_resolver=schema_resolver,
+        default_db="db",
+        default_schema="public",
+        default_dialect=None,
+        parse=_sqlglot_lineage_nocache,
+    )
+
+
+def test_parse_result_cache_persists_across_runs(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    schema_resolver = _make_schema_resolver({"a": "int", "b": "int"})
+
+    with SqlParsingResultCache(cache_file) as cache:
+        first = _parse(
+            cache, "create table foo as select * from upstream", schema_resolver
+        )
+        assert cache.stats() == {"hits": 0, "misses": 1, "stale": 0}
+
+    with SqlParsingResultCache(cache_file) as cache:
+        # Queries with the same fingerprint share a cache entry.
+        second = _parse(
+            cache, "CREATE TABLE foo AS SELECT *  FROM upstream", schema_resolver
+        )
+        assert cache.stats() == {"hits": 1, "misses": 0, "stale": 0}
+        assert second == first
+
+
+def test_parse_result_cache_invalidated_by_schema_change(
+    tmp_path: pathlib.Path,
+) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    sql = "create table foo as select * from upstream"
+
+    with SqlParsingResultCache(cache_file) as cache:
+        _parse(cache, sql, _make_schema_resolver({"a": "int"}))
+
+    with SqlParsingResultCache(cache_file) as cache:
+        result = _parse(cache, sql, _make_schema_resolver({"a": "int", "c": "int"}))
+        assert cache.stats() == {"hits": 0, "misses": 0, "stale": 1}
+        assert result.column_lineage is not None
+        assert [cll.downstream.column for cll in result.column_lineage] == ["a", "c"]
+
+
+def test_parse_result_cache_eviction(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    schema_resolver = _make_schema_resolver({"a": "int"})
+
+    with SqlParsingResultCache(cache_file, max_entries=2) as cache:
+        for table in ["foo", "bar", "baz"]:
+            _parse(
+                cache,
+                f"create table {table} as select a from upstream",
+                schema_resolver,
+            )
+
+    with SqlParsingResultCache(cache_file, max_entries=2) as cache:
+        _parse(cache, "create table foo as select a from upstream", schema_resolver)
+        _parse(cache, "create table baz as select a from upstream", schema_resolver)
+        assert cache.stats() == {"hits": 1, "misses": 1, "stale": 0}
+
+
+def test_parse_result_cache_shared_by_concurrent_runs(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    schema_resolver = _make_schema_resolver({"a": "int"})
+
+    with SqlParsingResultCache(cache_file) as first, SqlParsingResultCache(
+        cache_file
+    ) as second:
+        _parse(first, "create table foo as select a from upstream", schema_resolver)
+        _parse(second, "create table bar as select a from upstream", schema_resolver)
+
+    with SqlParsingResultCache(cache_file) as cache:
+        _parse(cache, "create table foo as select a from upstream", schema_resolver)
+        _parse(cache, "create table bar as select a from upstream", schema_resolver)
+        assert cache.stats() == {"hits": 2, "misses": 0, "stale": 0}
+
+
+def test_parse_result_cache_recreates_corrupt_file(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    cache_file.write_bytes(b"this is not a sqlite database" * 100)
+    schema_resolver = _make_schema_resolver({"a": "int"})
+
+    with SqlParsingResultCache(cache_file) as cache:
+        _parse(cache, "create table foo as select a from upstream", schema_resolver)
+
+    with SqlParsingResultCache(cache_file) as cache:
+        _parse(cache, "create table foo as select a from upstream", schema_resolver)
+        assert cache.stats() == {"hits": 1, "misses": 0, "stale": 0}
+
+
+def test_parse_result_cache_disabled_on_error(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "parse_cache.db"
+    schema_resolver = _make_schema_resolver({"a": "int"})
+    sql = "create table foo as select a from upstream"
+
+    with SqlParsingResultCache(cache_file) as cache:
+        real_conn = cache._conn
+        assert real_conn is not None
+        cache._conn = mock.Mock(
+            execute=mock.Mock(side_effect=sqlite3.OperationalError("locked"))
+        )
+        result = _parse(cache, sql, schema_resolver)
+        assert result.debug_info.error is None
+        assert cache._conn is None
+        real_conn.close()
+
+        # Parsing keeps working, but nothing is cached any more.
+        _parse(cache, sql, schema_resolver)
+        assert cache.stats() == {"hits": 0, "misses": 2, "stale": 0}
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from datahub.sql_parsing.schema_resolver import (
     SchemaInfo,
     SchemaResolver,
@@ -110,3 +112,69 @@ def test_match_columns_to_schema():
     )
 
     assert output_columns == ["id", "Name", "Address", "weight"]
+
+
+def test_prefetch_urns() -> None:
+    urn_1 = "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_1,PROD)"
+    urn_2 = "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_2,PROD)"
+    urn_3 = "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_3,PROD)"
+
+    graph = MagicMock()
+    graph.get_entities_v2.return_value = {
+        urn_1: {
+            "schemaMetadata": {
+                "value": {
+                    "fields": [
+                        {"fieldPath": "id", "nativeDataType": "NUMBER"},
+                        {"fieldPath": "name", "nativeDataType": "VARCHAR"},
+                    ]
+                }
+            }
+        }
+    }
+
+    schema_resolver = SchemaResolver(platform="snowflake", env="PROD", graph=graph)
+    schema_resolver.add_raw_schema_info(urn_3, {"x": "INT"})
+    schema_resolver.prefetch_tables(
+        [
+            _TableName(database="db", db_schema="schema", table="table_1"),
+            _TableName(database="db", db_schema="schema", table="table_2"),
+            _TableName(database="db", db_schema="schema", table="table_3"),
+        ]
+    )
+
+    # Only the uncached urns are requested, in a single call.
+    graph.get_entities_v2.assert_called_once_with(
+        "dataset", [urn_1, urn_2], aspects=["schemaMetadata"]
+    )
+
+    # Both the found and missing schemas are cached, so resolving the tables
+    # doesn't go back to the graph.
+    assert schema_resolver.resolve_urn(urn_1) == (
+        urn_1,
+        {"id": "NUMBER", "name": "VARCHAR"},
+    )
+    assert schema_resolver.resolve_urn(urn_2) == (urn_2, None)
+    assert schema_resolver.is_cached(urn_2)
+    graph.get_aspect.assert_not_called()
+
+    assert schema_resolver.snapshot() == {
+        urn_1: {"id": "NUMBER", "name": "VARCHAR"},
+        urn_2: None,
+        urn_3: {"x": "INT"},
+    }
+
+
+def test_prefetch_urns_failure_falls_back() -> None:
+    urn = "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_1,PROD)"
+
+    graph = MagicMock()
+    graph.get_entities_v2.side_effect = RuntimeError("boom")
+    graph.get_aspect.return_value = None
+
+    schema_resolver = SchemaResolver(platform="snowflake", env="PROD", graph=graph)
+    schema_resolver.prefetch_urns([urn])
+    assert not schema_resolver.is_cached(urn)
+
+    assert schema_resolver.resolve_urn(urn) == (urn, None)
+    graph.get_aspect.assert_called_once()
@@ -7,6 +7,7 @@ from unittest.mock import patch
 import pytest
 from freezegun import freeze_time
 
+import datahub.metadata.schema_classes as models
 from datahub.configuration.datetimes import parse_user_datetime
 from datahub.configuration.time_window_config import BucketDuration, get_time_bucket
 from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
@@ -1035,3 +1036,139 @@ def test_sql_aggreator_close_cleans_tmp(tmp_path):
         assert len(os.listdir(tmp_path)) > 0
         aggregator.close()
         assert len(os.listdir(tmp_path)) == 0
+
+
+def _run_aggregator_with_mixed_queries(
+    parsing_processes: int,
+) -> SqlParsingAggregator:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        parsing_processes=parsing_processes,
+    )
+    aggregator.register_schema(
+        DatasetUrn("redshift", "dev.public.bar").urn(),
+        models.SchemaMetadataClass(
+            schemaName="bar",
+            platform="urn:li:dataPlatform:redshift",
+            version=0,
+            hash="",
+            platformSchema=models.OtherSchemaClass(rawSchema=""),
+            fields=[
+                models.SchemaFieldClass(
+                    fieldPath=column,
+                    type=models.SchemaFieldDataTypeClass(models.NumberTypeClass()),
+                    nativeDataType="int",
+                )
+                for column in ["a", "b", "c"]
+            ],
+        ),
+    )
+
+    for i in range(150):
+        # Queries that only depend on the base schemas.
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query=f"create table foo_{i % 7} as select a, b + {i} as b from bar",
+                default_db="dev",
+                default_schema="public",
+                session_id=f"session{i}",
+            )
+        )
+        # Queries that depend on the session's temp tables.
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query="create temp table tmp as select a, b + c as c from bar",
+                default_db="dev",
+                default_schema="public",
+                session_id=f"temp_session{i % 3}",
+            )
+        )
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query=f"create table from_tmp_{i % 5} as select * from tmp",
+                default_db="dev",
+                default_schema="public",
+                session_id=f"temp_session{i % 3}",
+            )
+        )
+
+    return aggregator
+
+
+@freeze_time(FROZEN_TIME)
+def test_parallel_parsing_matches_serial() -> None:
+    serial_aggregator = _run_aggregator_with_mixed_queries(parsing_processes=0)
+    serial_mcps = [mcp.to_obj() for mcp in serial_aggregator.gen_metadata()]
+    serial_aggregator.close()
+
+    pooled_aggregator = _run_aggregator_with_mixed_queries(parsing_processes=2)
+    pooled_mcps = [mcp.to_obj() for mcp in pooled_aggregator.gen_metadata()]
+    pooled_aggregator.report.compute_stats()
+    pooled_aggregator.close()
+
+    assert pooled_aggregator.report.num_sql_parsed_in_pool > 0
+    assert pooled_aggregator.report.num_sql_pool_results_discarded > 0
+    assert pooled_aggregator.report.num_sql_parsing_pool_starts == 1
+    assert (
+        pooled_aggregator.report.num_sql_parsed
+        == serial_aggregator.report.num_sql_parsed
+    )
+    assert pooled_mcps == serial_mcps
+
+
+@freeze_time(FROZEN_TIME)
+def test_shared_query_evicted_from_resolved_queries_cache() -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+    )
+
+    def _add_query(query_id: str, downstream: str) -> None:
+        aggregator.add_known_query_lineage(
+            KnownQueryLineageInfo(
+                query_text=f"insert into {downstream} select * from upstream_{query_id}",
+                downstream=DatasetUrn("redshift", f"dev.public.{downstream}").urn(),
+                upstreams=[
+                    DatasetUrn("redshift", f"dev.public.upstream_{query_id}").urn()
+                ],
+                timestamp=_ts(20),
+                query_type=QueryType.INSERT,
+                query_id=query_id,
+            )
+        )
+
+    # The shared query is resolved at the end of the first batch, so it isn't
+    # prefetched for the second one. By the time the second batch reaches it
+    # again, the other queries have evicted it from the cache.
+    for i in range(4):
+        _add_query(f"filler_{i}", f"a_filler_{i}")
+    _add_query("shared", "b_shared")
+    for i in range(4):
+        _add_query(f"other_{i}", "c_last")
+    _add_query("shared", "c_last")
+
+    with patch(
+        "datahub.sql_parsing.sql_parsing_aggregator._LINEAGE_GEN_BATCH_SIZE", 5
+    ), patch(
+        "datahub.sql_parsing.sql_parsing_aggregator._RESOLVED_QUERY_CACHE_SIZE", 2
+    ):
+        mcps = list(aggregator.gen_metadata())
+
+    lineage = {
+        mcp.entityUrn: mcp.aspect
+        for mcp in mcps
+        if isinstance(mcp.aspect, models.UpstreamLineageClass)
+    }
+    last_upstreams = {
+        upstream.dataset
+        for upstream in lineage[
+            DatasetUrn("redshift", "dev.public.c_last").urn()
+        ].upstreams
+    }
+    assert DatasetUrn("redshift", "dev.public.upstream_shared").urn() in last_upstreams
+    assert len(last_upstreams) == 5
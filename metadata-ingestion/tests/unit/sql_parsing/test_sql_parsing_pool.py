@@ -0,0 +1,30 @@
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sql_parsing_pool import SqlParsingPool
+
+_UPSTREAM_URN = "urn:li:dataset:(urn:li:dataPlatform:redshift,dev.public.bar,PROD)"
+_QUERY = ("create table foo as select * from bar", "dev", "public")
+
+
+def _downstream_columns(pool: SqlParsingPool) -> list:
+    (pooled,) = pool.parse_many([_QUERY])
+    assert pooled is not None
+    return [cll.downstream.column for cll in pooled.result.column_lineage or []]
+
+
+def test_snapshot_updates_sent_to_running_workers() -> None:
+    schema_resolver = SchemaResolver(platform="redshift", env="PROD")
+    schema_resolver.add_raw_schema_info(_UPSTREAM_URN, {"a": "int"})
+
+    with SqlParsingPool(schema_resolver=schema_resolver, processes=1) as pool:
+        assert _downstream_columns(pool) == ["a"]
+
+        schema_resolver.add_raw_schema_info(_UPSTREAM_URN, {"a": "int", "b": "int"})
+        pool.invalidate_snapshot()
+        assert _downstream_columns(pool) == ["a", "b"]
+
+        # Nothing changed, so there's no update to send.
+        pool.invalidate_snapshot()
+        assert _downstream_columns(pool) == ["a", "b"]
+
+        assert pool.num_pool_starts == 1
+        assert pool.num_snapshot_updates == 1
@@ -3,6 +3,8 @@ import pathlib
 import pytest
 
 import datahub.testing.check_sql_parser_result as checker
+from datahub.sql_parsing.schema_resolver import _TableName
+from datahub.sql_parsing.sqlglot_lineage import get_referenced_tables
 from datahub.testing.check_sql_parser_result import assert_sql_result
 
 RESOURCE_DIR = pathlib.Path(__file__).parent / "goldens"
@@ -1323,3 +1325,22 @@ GROUP BY Age
         },
         expected_file=RESOURCE_DIR / "test_mssql_select_into.json",
     )
+
+
+def test_get_referenced_tables() -> None:
+    assert get_referenced_tables(
+        """\
+WITH recent AS (SELECT * FROM orders WHERE ts > '2024-01-01')
+INSERT INTO analytics.daily_orders
+SELECT r.id, c.name FROM recent r JOIN other_db.crm.customers c ON r.cid = c.id
+""",
+        platform="snowflake",
+        default_db="sales",
+        default_schema="public",
+    ) == {
+        _TableName(database="SALES", db_schema="PUBLIC", table="ORDERS"),
+        _TableName(database="SALES", db_schema="ANALYTICS", table="DAILY_ORDERS"),
+        _TableName(database="OTHER_DB", db_schema="CRM", table="CUSTOMERS"),
+    }
+
+    assert get_referenced_tables("SELECT FROM WHERE", platform="snowflake") == set()
@@ -4,7 +4,14 @@ from typing import Dict, List
 import pydantic
 import pytest
 
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.checkpoint import (
+    COMPACT_SERDE_ZLIB,
+    Checkpoint,
+    CheckpointStateBase,
+    get_checkpoint_shard_job_name,
+    get_compact_serde,
+)
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -157,6 +164,10 @@ def test_supported_encodings():
     test_state.serde = "base85-bz2-json"
     test_serde_idempotence(test_state)
 
+    # 3. Test the compact encoding
+    test_state.serde = get_compact_serde()
+    test_serde_idempotence(test_state)
+
 
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
@@ -175,7 +186,7 @@ def test_base85_upgrade_pickle_to_json():
 
 @pytest.mark.parametrize(
     "serde",
-    ["utf-8", "base85-bz2-json"],
+    ["utf-8", "base85-bz2-json", COMPACT_SERDE_ZLIB],
 )
 def test_state_forward_compatibility(serde: str) -> None:
     class PrevState(CheckpointStateBase):
@@ -202,3 +213,65 @@ def test_state_forward_compatibility(serde: str) -> None:
     )
 
     _assert_checkpoint_deserialization(checkpoint_state, expected_next_state)
+
+
+def test_compact_serde_sharding() -> None:
+    state = GenericCheckpointState(serde=COMPACT_SERDE_ZLIB)
+    for i in range(5000):
+        state.add_checkpoint_urn(
+            "*", f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i * 7919},PROD)"
+        )
+        state.add_checkpoint_urn("*", f"urn:li:container:{i:08x}{i * 31:08x}")
+
+    # The compact serde is much smaller than the default one.
+    compact_size = len(state.to_bytes())
+    assert compact_size < len(
+        state.copy(update={"serde": "base85-bz2-json"}).to_bytes()
+    )
+
+    checkpoint = Checkpoint(
+        job_name=test_job_name,
+        pipeline_name=test_pipeline_name,
+        run_id=test_run_id,
+        state=state,
+    )
+    aspects = checkpoint.to_checkpoint_aspects(max_allowed_state_size=compact_size // 3)
+    assert len(aspects) == 4
+    assert all(
+        len(aspect.state.payload or b"") <= compact_size // 3 for aspect in aspects
+    )
+    with pytest.raises(ValueError):
+        state.to_bytes(max_allowed_state_size=compact_size // 3)
+
+    committed = {
+        get_checkpoint_shard_job_name(test_job_name, i): aspect
+        for i, aspect in enumerate(aspects)
+    }
+    assert set(committed) == {
+        test_job_name,
+        f"{test_job_name}-shard-1",
+        f"{test_job_name}-shard-2",
+        f"{test_job_name}-shard-3",
+    }
+
+    loaded = Checkpoint.create_from_checkpoint_aspect(
+        job_name=test_job_name,
+        checkpoint_aspect=aspects[0],
+        state_class=GenericCheckpointState,
+        shard_loader=lambda shard: committed.get(
+            get_checkpoint_shard_job_name(test_job_name, shard)
+        ),
+    )
+    assert loaded is not None
+    assert loaded.state.urns == sorted(state.urns)
+    assert loaded.state.serde == COMPACT_SERDE_ZLIB
+
+    # Shards from a different run are rejected.
+    aspects[2].runId = "another_run"
+    with pytest.raises(ValueError):
+        Checkpoint.create_from_checkpoint_aspect(
+            job_name=test_job_name,
+            checkpoint_aspect=aspects[0],
+            state_class=GenericCheckpointState,
+            shard_loader=lambda shard: aspects[shard],
+        )
@@ -0,0 +1,65 @@
+import random
+
+from datahub.ingestion.source.state.compact_urn_encoding import (
+    count_sorted_intersection,
+    decode_urns,
+    encode_urns,
+    iter_decoded_urns,
+    iter_sorted_difference,
+)
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
+
+_URNS = [
+    "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_2,PROD)",
+    "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_1,PROD)",
+    "urn:li:dataset:(urn:li:dataPlatform:hive2,db.table_1,PROD)",
+    "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_10,PROD)",
+    "urn:li:container:abc",
+    "urn:li:container:abd",
+    "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_1,PROD)",
+    "not-an-urn",
+]
+
+
+def test_encode_urns() -> None:
+    encoded = encode_urns(_URNS)
+    assert [group["key"] for group in encoded["groups"]] == [
+        "",
+        "container",
+        "dataset:hive",
+        "dataset:hive2",
+    ]
+    assert encoded["groups"][1]["prefix_lengths"] == [0, 19]
+    assert encoded["groups"][1]["suffixes"] == ["urn:li:container:abc", "d"]
+
+    assert decode_urns(encoded) == sorted(set(_URNS))
+    assert list(iter_decoded_urns(encoded, entity_type="container")) == [
+        "urn:li:container:abc",
+        "urn:li:container:abd",
+    ]
+    assert decode_urns(encode_urns([])) == []
+
+
+def test_sorted_set_operations() -> None:
+    rng = random.Random(0)
+    for _ in range(50):
+        a = sorted(str(rng.randint(0, 30)) for _ in range(rng.randint(0, 20)))
+        b = sorted(str(rng.randint(0, 30)) for _ in range(rng.randint(0, 20)))
+        assert list(iter_sorted_difference(a, b)) == sorted(set(a) - set(b))
+        assert count_sorted_intersection(a, b) == len(set(a) & set(b))
+
+
+def test_generic_checkpoint_state_diff() -> None:
+    old_state = GenericCheckpointState(urns=_URNS[:-1])
+    new_state = GenericCheckpointState()
+    new_state.add_checkpoint_urn("*", "urn:li:container:abc")
+    new_state.add_checkpoint_urn("*", "urn:li:corpuser:foo")
+    new_state.add_checkpoint_urn(
+        "*", "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_1,PROD)"
+    )
+
+    assert sorted(old_state.get_urns_not_in("container", new_state)) == [
+        "urn:li:container:abd"
+    ]
+    assert len(list(old_state.get_urns_not_in("*", new_state))) == 4
+    assert new_state.get_percent_entities_changed(old_state) == (1 - 2 / 6) * 100
@@ -3,6 +3,7 @@ from typing import Dict, List, Tuple
 import pytest
 
 from datahub.ingestion.source.state.entity_removal_state import (
+    GenericCheckpointState,
     compute_percent_entities_changed,
     filter_ignored_entity_types,
 )
@@ -63,3 +64,48 @@ def test_filter_ignored_entity_types():
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset2,PROD)",
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset3,PROD)",
     ]
+
+
+def _dataset_urns(start: int, end: int) -> List[str]:
+    return [
+        f"urn:li:dataset:(urn:li:dataPlatform:postgres,table_{i},PROD)"
+        for i in range(start, end)
+    ]
+
+
+def test_state_diff_with_sorted_urns() -> None:
+    last_state = GenericCheckpointState(
+        urns=[
+            *_dataset_urns(0, 100),
+            "urn:li:dataProcessInstance:478810e859f870a54f72c681f41af619",
+        ]
+    )
+    cur_state = GenericCheckpointState(urns=_dataset_urns(50, 120))
+
+    assert cur_state.get_percent_entities_changed(last_state) == 50.0
+    assert compute_percent_entities_changed(
+        new_entities=cur_state.urns,
+        old_entities=filter_ignored_entity_types(last_state.urns),
+    ) == pytest.approx(50.0)
+    assert set(
+        last_state.get_urns_not_in(type="*", other_checkpoint_state=cur_state)
+    ) == {
+        *_dataset_urns(0, 50),
+        "urn:li:dataProcessInstance:478810e859f870a54f72c681f41af619",
+    }
+
+    # Sorted states, like those loaded from the compact encoding, aren't copied.
+    sorted_state = GenericCheckpointState(urns=sorted(_dataset_urns(0, 20)))
+    assert sorted_state._get_sorted_urns() is sorted_state.urns
+
+
+def test_add_checkpoint_urns() -> None:
+    state = GenericCheckpointState(urns=_dataset_urns(0, 10))
+    state.add_checkpoint_urns([*_dataset_urns(5, 15), *_dataset_urns(12, 20)])
+    assert state.urns == _dataset_urns(0, 20)
+    assert list(
+        state.get_urns_not_in(
+            type="*",
+            other_checkpoint_state=GenericCheckpointState(urns=_dataset_urns(0, 18)),
+        )
+    ) == _dataset_urns(18, 20)
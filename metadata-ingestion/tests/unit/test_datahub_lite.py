@@ -0,0 +1,174 @@
+import json
+import pathlib
+from typing import List, Optional
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.sink.datahub_lite import DataHubLiteSink
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import SearchFlavor
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    GlobalTagsClass,
+    StatusClass,
+    SystemMetadataClass,
+    TagAssociationClass,
+    _Aspect,
+)
+
+_URN_1 = make_dataset_urn("postgres", "db.schema.table_1")
+_URN_2 = make_dataset_urn("postgres", "db.schema.table_2")
+
+
+def _make_mcp(
+    urn: str, aspect: _Aspect, last_observed: int
+) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=urn,
+        aspect=aspect,
+        systemMetadata=SystemMetadataClass(lastObserved=last_observed, runId="test"),
+    )
+
+
+def _get_versions(lite: DuckDBLite, urn: str, aspect_name: str) -> list:
+    return lite.duckdb_client.execute(
+        "SELECT version, metadata->>'$.name', system_metadata->>'$.lastObserved' "
+        "FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? ORDER BY version",
+        [urn, aspect_name],
+    ).fetchall()
+
+
+def test_duckdb_lite_write_batch(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb")))
+
+    lite.write_batch(
+        [
+            _make_mcp(_URN_1, DatasetPropertiesClass(name="first"), 1000),
+            _make_mcp(_URN_2, DatasetPropertiesClass(name="other"), 1000),
+            # Repeated aspects within a batch behave like sequential writes.
+            _make_mcp(_URN_1, DatasetPropertiesClass(name="second"), 2000),
+            _make_mcp(_URN_1, StatusClass(removed=False), 2000),
+        ]
+    )
+    lite.write_batch(
+        [
+            # An unchanged aspect only updates lastObserved.
+            _make_mcp(_URN_1, DatasetPropertiesClass(name="second"), 3000),
+            _make_mcp(_URN_2, DatasetPropertiesClass(name="renamed"), 3000),
+        ]
+    )
+
+    assert _get_versions(lite, _URN_1, "datasetProperties") == [
+        (0, "second", "3000"),
+        (1, "first", "1000"),
+        (2, "second", "2000"),
+    ]
+    assert _get_versions(lite, _URN_2, "datasetProperties") == [
+        (0, "renamed", "3000"),
+        (1, "other", "1000"),
+        (2, "renamed", "3000"),
+    ]
+    assert lite.get(_URN_1, aspects=["status"]) == {
+        "urn": _URN_1,
+        "status": {"removed": False},
+    }
+
+    # The name edges are maintained as part of the batch.
+    assert sorted(
+        lite.duckdb_client.execute(
+            "SELECT src_id, dst_id FROM metadata_edge_v2 WHERE relnship = 'name'"
+        ).fetchall()
+    ) == [(_URN_1, "second"), (_URN_2, "renamed")]
+
+    lite.close()
+
+
+def test_datahub_lite_sink_batches_writes(tmp_path: pathlib.Path) -> None:
+    sink = DataHubLiteSink.create(
+        {
+            "config": {"file": str(tmp_path / "lite.duckdb")},
+            "batch_size": 2,
+        },
+        PipelineContext(run_id="test"),
+    )
+    for i in range(5):
+        sink.write_record_async(
+            RecordEnvelope(
+                record=_make_mcp(
+                    make_dataset_urn("postgres", f"db.schema.table_{i}"),
+                    StatusClass(removed=False),
+                    1000,
+                ),
+                metadata={},
+            ),
+            NoopWriteCallback(),
+        )
+
+    # Only the full batches have been written so far.
+    assert sink.report.total_records_written == 4
+    sink.close()
+    assert sink.report.total_records_written == 5
+
+    lite = DuckDBLite(
+        DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb"), read_only=True)
+    )
+    assert len(list(lite.list_ids())) == 5
+    lite.duckdb_client.close()
+
+
+def test_duckdb_lite_search(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb")))
+
+    lite.write_batch(
+        [
+            _make_mcp(
+                _URN_1,
+                DatasetPropertiesClass(name="customers", description="All buyers"),
+                1000,
+            ),
+            _make_mcp(
+                _URN_1,
+                GlobalTagsClass(tags=[TagAssociationClass(tag="urn:li:tag:pii")]),
+                1000,
+            ),
+            _make_mcp(
+                _URN_2, DatasetPropertiesClass(name="orders", description=None), 1000
+            ),
+        ]
+    )
+
+    def _search(query: str, aspects: Optional[List[str]] = None) -> List[tuple]:
+        return [
+            (result.id, result.aspect)
+            for result in lite.search(
+                query, SearchFlavor.FREE_TEXT, aspects=aspects or [], snippet=False
+            )
+        ]
+
+    # Exact matches on names rank above prefix matches and urn matches.
+    assert _search("customers") == [(_URN_1, "datasetProperties")]
+    assert _search("cust pii") == [(_URN_1, "globalTags")]
+    assert _search("table") == [(_URN_1, "urn"), (_URN_2, "urn")]
+    assert _search("table_2") == [(_URN_2, "urn")]
+    assert _search("customers", aspects=["globalTags"]) == []
+    assert _search("nothing") == []
+
+    # Rewriting an aspect replaces its search terms.
+    lite.write(
+        _make_mcp(_URN_2, DatasetPropertiesClass(name="purchases"), 2000),
+    )
+    assert _search("orders") == []
+    assert _search("purchase") == [(_URN_2, "datasetProperties")]
+
+    # Snippets contain the matching aspect.
+    [result] = lite.search("purchases", SearchFlavor.FREE_TEXT)
+    assert result.snippet and json.loads(result.snippet)["name"] == "purchases"
+
+    # The index can be rebuilt from scratch.
+    lite.reindex()
+    assert _search("cust pii") == [(_URN_1, "globalTags")]
+
+    lite.close()
@@ -0,0 +1,134 @@
+import json
+import pathlib
+from typing import List, Tuple
+from unittest import mock
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.sink.file import FileSink, FileSinkConfig, write_metadata_file
+from datahub.ingestion.source import file as file_source
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    GenericFileSource,
+    _get_array_shard_offsets,
+    read_metadata_file,
+)
+from datahub.metadata.schema_classes import StatusClass
+
+_MCE_FILE = pathlib.Path(__file__).parents[2] / "examples/mce_files/bootstrap_mce.json"
+
+
+def _make_mcps(num_mcps: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)",
+            aspect=StatusClass(removed=i % 2 == 0),
+        )
+        for i in range(num_mcps)
+    ]
+
+
+def _write_mcp_file(path: pathlib.Path, num_mcps: int) -> None:
+    records: list = _make_mcps(num_mcps)
+    records.insert(num_mcps // 2, {"entityUrn": "urn:li:corpuser:foo", "aspect": {}})
+    write_metadata_file(path, records)
+
+
+def _run_source(path: pathlib.Path, parsing_processes: int) -> List[Tuple[str, dict]]:
+    source = GenericFileSource(
+        PipelineContext(run_id="file-source-test"),
+        FileSourceConfig(path=str(path), parsing_processes=parsing_processes),
+    )
+    workunits = [
+        (wu.id, wu.metadata.to_obj()) for wu in source.get_workunits_internal()
+    ]
+
+    report = source.get_report()
+    report.compute_stats()
+    assert report.num_files_completed == len(list(source.get_filenames()))
+    assert report.percentage_completion == "100.00%"
+    return workunits
+
+
+def test_get_array_shard_offsets(tmp_path: pathlib.Path) -> None:
+    mcp_file = tmp_path / "mcps.json"
+    _write_mcp_file(mcp_file, 100)
+    size = mcp_file.stat().st_size
+
+    shards = _get_array_shard_offsets(str(mcp_file), size, shard_size=1000)
+    assert len(shards) > 10
+    assert shards[0][0] == 0
+    assert shards[-1][1] == size
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+    assert all(
+        mcp_file.read_bytes()[start:end].rstrip().endswith(b"},")
+        for start, end in shards[:-1]
+    )
+
+    assert _get_array_shard_offsets(str(mcp_file), size, shard_size=10**9) == [
+        (0, size)
+    ]
+
+    compact_file = tmp_path / "compact.json"
+    compact_file.write_text(json.dumps(json.loads(mcp_file.read_text())))
+    compact_size = compact_file.stat().st_size
+    assert _get_array_shard_offsets(str(compact_file), compact_size, 1000) == [
+        (0, compact_size)
+    ]
+
+
+def test_file_source_parallel_reading(tmp_path: pathlib.Path) -> None:
+    _write_mcp_file(tmp_path / "mcps.json", 300)
+    (tmp_path / "bootstrap_mce.json").write_bytes(_MCE_FILE.read_bytes())
+
+    # With indent=0, nested objects close at the same indentation as top-level
+    # ones, so the shards are not split on element boundaries.
+    (tmp_path / "unindented.json").write_text(
+        json.dumps(json.loads(_MCE_FILE.read_text()), indent=0)
+    )
+
+    serial_workunits = _run_source(tmp_path, parsing_processes=0)
+    with mock.patch.object(file_source, "_SHARD_SIZE_BYTES", 5000):
+        parallel_workunits = _run_source(tmp_path, parsing_processes=2)
+
+    assert len(serial_workunits) == 300 + 2 * 104
+    assert parallel_workunits == serial_workunits
+
+
+def test_file_source_binary_format(tmp_path: pathlib.Path) -> None:
+    records = [*read_metadata_file(_MCE_FILE), *_make_mcps(50)]
+    json_file = tmp_path / "mcps.json"
+    write_metadata_file(json_file, records)
+
+    binary_file = tmp_path / "mcps.mcpb"
+    sink = FileSink(
+        PipelineContext(run_id="file-sink-test"),
+        FileSinkConfig(filename=str(binary_file)),
+    )
+    for record in records:
+        sink.write_record_async(
+            RecordEnvelope(record, metadata={}), NoopWriteCallback()
+        )
+    sink.close()
+    assert binary_file.stat().st_size < json_file.stat().st_size / 2
+
+    workunits = _run_source(binary_file, parsing_processes=0)
+    assert [wu for _, wu in workunits] == [
+        wu for _, wu in _run_source(json_file, parsing_processes=0)
+    ]
+    assert workunits[-1][0] == f"{binary_file}:{len(records) - 1}"
+
+    # Selective reads by aspect name match the JSON source.
+    filtered_workunits = [
+        [
+            wu.metadata.to_obj()
+            for wu in GenericFileSource(
+                PipelineContext(run_id="file-source-test"),
+                FileSourceConfig(path=str(path), aspect="status"),
+            ).get_workunits_internal()
+        ]
+        for path in (binary_file, json_file)
+    ]
+    assert filtered_workunits[0] == filtered_workunits[1]
+    assert len(filtered_workunits[0]) < len(records)
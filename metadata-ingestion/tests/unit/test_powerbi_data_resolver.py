@@ -0,0 +1,68 @@
+import threading
+from typing import List
+from unittest import mock
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from datahub.ingestion.source.powerbi.rest_api_wrapper.data_resolver import (
+    RegularAPIResolver,
+    SessionWithTimeout,
+    _RateLimitAwareRetry,
+)
+
+
+def _increment(retry: Retry, status: int) -> Retry:
+    return retry.increment(
+        "GET",
+        "/v1.0/myorg/groups",
+        response=HTTPResponse(status=status, headers={"Retry-After": "2"}),
+    )
+
+
+def test_rate_limited_responses_get_extra_retries() -> None:
+    retry: Retry = _RateLimitAwareRetry(
+        total=3,
+        allowed_methods=None,
+        status_forcelist=[429, 500],
+        respect_retry_after_header=True,
+        rate_limit_retries=5,
+    )
+    assert retry.get_retry_after(HTTPResponse(headers={"Retry-After": "2"})) == 2
+
+    # Throttled responses don't count towards the other retry limits...
+    for _ in range(5):
+        retry = _increment(retry, 429)
+    assert retry.total == 3
+    assert len(retry.history) == 5
+
+    # ...until the rate limit retries are used up.
+    retry = _increment(retry, 429)
+    retry = _increment(retry, 500)
+    retry = _increment(retry, 500)
+    with pytest.raises(MaxRetryError):
+        _increment(retry, 500)
+
+
+@mock.patch("msal.ConfidentialClientApplication")
+def test_each_thread_gets_its_own_session(mock_msal: mock.MagicMock) -> None:
+    mock_msal.return_value.acquire_token_for_client.return_value = {
+        "access_token": "token",
+        "expires_in": 3600,
+    }
+    resolver = RegularAPIResolver(
+        client_id="client-id",
+        client_secret="client-secret",
+        tenant_id="tenant-id",
+        metadata_api_timeout=30,
+    )
+    assert resolver._request_session is resolver._request_session
+
+    sessions: List[SessionWithTimeout] = []
+    thread = threading.Thread(target=lambda: sessions.append(resolver._request_session))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not resolver._request_session
+    assert sessions[0].timeout == 30
@@ -0,0 +1,145 @@
+from typing import Dict, List
+from unittest import mock
+
+from datahub.emitter.mce_builder import make_dataset_urn, make_user_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.graph.server_aspect_cache import ServerAspectCache
+from datahub.ingestion.transformer.add_dataset_ownership import AddDatasetOwnership
+from datahub.metadata.schema_classes import (
+    DatasetProfileClass,
+    GlobalTagsClass,
+    OwnerClass,
+    OwnershipClass,
+    OwnershipTypeClass,
+    TagAssociationClass,
+)
+
+_URNS = [make_dataset_urn("hive", f"db.table_{i}") for i in range(5)]
+
+
+def _make_ownership(*owners: str) -> OwnershipClass:
+    return OwnershipClass(
+        owners=[
+            OwnerClass(owner=make_user_urn(owner), type=OwnershipTypeClass.DATAOWNER)
+            for owner in owners
+        ]
+    )
+
+
+def _make_graph(server_aspects: Dict[str, Dict[str, dict]]) -> mock.MagicMock:
+    def _get_entities_v2(
+        entity_type: str, urns: List[str], aspects: List[str]
+    ) -> Dict[str, dict]:
+        return {
+            urn: {
+                name: {"value": aspect}
+                for name, aspect in server_aspects.get(urn, {}).items()
+                if name in aspects
+            }
+            for urn in urns
+        }
+
+    graph = mock.MagicMock()
+    graph.get_entities_v2.side_effect = _get_entities_v2
+    return graph
+
+
+def test_server_aspect_cache_learns_aspects() -> None:
+    graph = _make_graph(
+        {
+            _URNS[0]: {"ownership": _make_ownership("alice").to_obj()},
+            _URNS[1]: {"ownership": _make_ownership("bob").to_obj()},
+        }
+    )
+    cache = ServerAspectCache(graph, batch_size=2)
+
+    cache.set_window(_URNS[:3])
+    assert graph.get_entities_v2.call_count == 0
+
+    # The first lookup fetches the aspect for the whole window.
+    assert cache.get_aspect(_URNS[0], OwnershipClass) == _make_ownership("alice")
+    assert graph.get_entities_v2.call_count == 2
+    assert cache.get_aspect(_URNS[1], OwnershipClass) == _make_ownership("bob")
+    assert cache.get_aspect(_URNS[2], OwnershipClass) is None
+    assert graph.get_entities_v2.call_count == 2
+    assert cache.report.hits == 2
+    assert cache.report.misses == 1
+
+    # Lookups return fresh objects, so modifying one doesn't affect the cache.
+    ownership = cache.get_aspect(_URNS[0], OwnershipClass)
+    assert isinstance(ownership, OwnershipClass)
+    ownership.owners.clear()
+    assert cache.get_aspect(_URNS[0], OwnershipClass) == _make_ownership("alice")
+
+    # Later windows prefetch the learned aspects up front.
+    cache.set_window(_URNS[3:])
+    assert graph.get_entities_v2.call_count == 3
+    assert cache.get_aspect(_URNS[3], OwnershipClass) is None
+    assert graph.get_entities_v2.call_count == 3
+    graph.get_aspect.assert_not_called()
+
+    # Urns outside of the window, and timeseries aspects, fall back to single reads.
+    graph.get_aspect.return_value = GlobalTagsClass(
+        tags=[TagAssociationClass(tag="urn:li:tag:pii")]
+    )
+    assert cache.get_aspect(_URNS[0], GlobalTagsClass) is not None
+    cache.get_aspect(_URNS[3], DatasetProfileClass)
+    assert graph.get_aspect.call_count == 2
+
+    cache.report.compute_stats()
+    assert cache.report.num_aspects_prefetched == 2
+
+
+def test_server_aspect_cache_prefetch_failure() -> None:
+    graph = mock.MagicMock()
+    graph.get_entities_v2.side_effect = Exception("server unavailable")
+    graph.get_aspect.return_value = _make_ownership("alice")
+    cache = ServerAspectCache(graph)
+
+    cache.set_window(_URNS)
+    assert cache.get_aspect(_URNS[0], OwnershipClass) == _make_ownership("alice")
+    assert cache.report.num_prefetch_failures == 1
+    graph.get_aspect.assert_called_once_with(_URNS[0], OwnershipClass)
+
+
+def test_ownership_patching_with_server_aspect_cache() -> None:
+    graph = _make_graph({_URNS[0]: {"ownership": _make_ownership("alice").to_obj()}})
+    cache = ServerAspectCache(graph)
+    cache.set_window(_URNS)
+
+    ownership = AddDatasetOwnership._merge_with_server_ownership(
+        graph, _URNS[0], _make_ownership("bob"), server_aspect_cache=cache
+    )
+    assert ownership is not None
+    assert {owner.owner for owner in ownership.owners} == {
+        make_user_urn("alice"),
+        make_user_urn("bob"),
+    }
+    graph.get_ownership.assert_not_called()
+
+
+def test_two_patches_to_one_entity_in_one_window() -> None:
+    graph = _make_graph({_URNS[0]: {"ownership": _make_ownership("alice").to_obj()}})
+    cache = ServerAspectCache(graph)
+    cache.set_window(_URNS)
+
+    # Two workunits in the same window patch the ownership of the same dataset.
+    for new_owner in ["bob", "carol"]:
+        ownership = AddDatasetOwnership._merge_with_server_ownership(
+            graph, _URNS[0], _make_ownership(new_owner), server_aspect_cache=cache
+        )
+        assert ownership is not None
+        # This is what the pipeline does for each record it emits.
+        cache.update_from_record(
+            MetadataChangeProposalWrapper(entityUrn=_URNS[0], aspect=ownership)
+        )
+
+    # The second patch builds on the first one instead of undoing it.
+    assert ownership is not None
+    assert {owner.owner for owner in ownership.owners} == {
+        make_user_urn("alice"),
+        make_user_urn("bob"),
+        make_user_urn("carol"),
+    }
+    assert graph.get_entities_v2.call_count == 1
+    graph.get_ownership.assert_not_called()
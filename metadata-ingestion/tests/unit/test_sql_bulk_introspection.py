@@ -0,0 +1,180 @@
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy.dialects.mssql.base import MSDialect
+from sqlalchemy.dialects.mysql.base import MySQLDialect
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import sqltypes
+
+from datahub.ingestion.source.sql.sql_bulk_introspection import (
+    BulkIntrospectionInspectorWrapper,
+    BulkSchemaIntrospector,
+    MSSQLBulkSchemaIntrospector,
+    MySQLBulkSchemaIntrospector,
+    SchemaIntrospectionCache,
+    get_bulk_schema_introspector,
+)
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+
+
+class _FakeIntrospector(BulkSchemaIntrospector):
+    def __init__(self, fail: bool = False):
+        super().__init__(MySQLDialect())
+        self.fail = fail
+        self.calls: List[str] = []
+
+    def fetch_columns(self, conn: Connection, schema: str) -> Dict[str, List[dict]]:
+        self.calls.append(schema)
+        if self.fail:
+            raise RuntimeError("catalog query failed")
+        return {"t1": [{"name": "bulk_col", "type": sqltypes.INTEGER()}]}
+
+    def fetch_pk_constraints(
+        self, conn: Connection, schema: str
+    ) -> Optional[Dict[str, dict]]:
+        return {}
+
+
+def _make_sqlite_inspector() -> Any:
+    engine = sqlalchemy.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE t1 (id INTEGER PRIMARY KEY)"))
+        conn.execute(sqlalchemy.text("CREATE TABLE t2 (id INTEGER PRIMARY KEY)"))
+    return sqlalchemy.inspect(engine)
+
+
+def test_inspector_wrapper_uses_cache() -> None:
+    introspector = _FakeIntrospector()
+    report = SQLSourceReport()
+    wrapper = BulkIntrospectionInspectorWrapper(
+        _make_sqlite_inspector(), SchemaIntrospectionCache(introspector, report)
+    )
+
+    assert [c["name"] for c in wrapper.get_columns("t1", "main")] == ["bulk_col"]
+    # Callers may mutate the returned columns, which must not affect the cache.
+    wrapper.get_columns("t1", "main")[0]["name"] = "mutated"
+    assert [c["name"] for c in wrapper.get_columns("t1", "main")] == ["bulk_col"]
+
+    # Tables missing from the bulk results, and metadata that the introspector
+    # doesn't support, fall back to the wrapped inspector.
+    assert [c["name"] for c in wrapper.get_columns("t2", "main")] == ["id"]
+    assert wrapper.get_pk_constraint("t1", "main") == {
+        "constrained_columns": [],
+        "name": None,
+    }
+    assert wrapper.get_foreign_keys("t1", "main") == []
+    assert sorted(wrapper.get_table_names("main")) == ["t1", "t2"]
+
+    assert introspector.calls == ["main"]
+    assert report.num_schemas_bulk_introspected == 1
+    assert report.num_bulk_introspection_hits == 3
+
+
+def test_inspector_wrapper_falls_back_on_failure() -> None:
+    introspector = _FakeIntrospector(fail=True)
+    report = SQLSourceReport()
+    wrapper = BulkIntrospectionInspectorWrapper(
+        _make_sqlite_inspector(), SchemaIntrospectionCache(introspector, report)
+    )
+
+    assert [c["name"] for c in wrapper.get_columns("t1", "main")] == ["id"]
+    assert [c["name"] for c in wrapper.get_columns("t2", "main")] == ["id"]
+
+    # The failure is only reported once per schema.
+    assert introspector.calls == ["main"]
+    assert len(report.warnings) == 1
+
+
+def test_get_bulk_schema_introspector() -> None:
+    assert isinstance(
+        get_bulk_schema_introspector(MySQLDialect()), MySQLBulkSchemaIntrospector
+    )
+    assert isinstance(
+        get_bulk_schema_introspector(MSDialect()), MSSQLBulkSchemaIntrospector
+    )
+    assert get_bulk_schema_introspector(_make_sqlite_inspector().dialect) is None
+
+
+def _make_fake_conn(rows: List[tuple]) -> Any:
+    conn = mock.MagicMock()
+    conn.execute.return_value.fetchall.return_value = rows
+    return conn
+
+
+def test_mysql_bulk_columns() -> None:
+    introspector = MySQLBulkSchemaIntrospector(MySQLDialect())
+    columns = introspector.fetch_columns(
+        _make_fake_conn(
+            [
+                ("orders", "id", "bigint unsigned", "NO", None, ""),
+                ("orders", "note", "varchar(255)", "YES", "n/a", "a note"),
+                ("users", "status", "enum('a','b')", "YES", None, ""),
+            ]
+        ),
+        "db",
+    )
+
+    assert list(columns) == ["orders", "users"]
+    id_col, note_col = columns["orders"]
+    assert isinstance(id_col["type"], sqltypes.BIGINT)
+    assert id_col["type"].unsigned
+    assert id_col["nullable"] is False
+    assert id_col["comment"] is None
+    assert isinstance(note_col["type"], sqltypes.VARCHAR)
+    assert note_col["type"].length == 255
+    assert note_col["default"] == "n/a"
+    assert note_col["comment"] == "a note"
+    assert columns["users"][0]["type"].enums == ["a", "b"]
+
+
+def test_mysql_bulk_foreign_keys() -> None:
+    introspector = MySQLBulkSchemaIntrospector(MySQLDialect())
+    foreign_keys = introspector.fetch_foreign_keys(
+        _make_fake_conn(
+            [
+                ("orders", "fk_user", "user_id", "db", "users", "id"),
+                ("orders", "fk_user", "user_region", "db", "users", "region"),
+                ("orders", "fk_item", "item_id", "other_db", "items", "id"),
+            ]
+        ),
+        "db",
+    )
+
+    assert foreign_keys == {
+        "orders": [
+            {
+                "name": "fk_user",
+                "constrained_columns": ["user_id", "user_region"],
+                "referred_schema": "db",
+                "referred_table": "users",
+                "referred_columns": ["id", "region"],
+                "options": {},
+            },
+            {
+                "name": "fk_item",
+                "constrained_columns": ["item_id"],
+                "referred_schema": "other_db",
+                "referred_table": "items",
+                "referred_columns": ["id"],
+                "options": {},
+            },
+        ]
+    }
+
+
+def test_mssql_bulk_column_types() -> None:
+    introspector = MSSQLBulkSchemaIntrospector(MSDialect())
+
+    nvarchar = introspector._make_type("nvarchar", -1, None, None, "Latin1_General")
+    assert isinstance(nvarchar, sqltypes.NVARCHAR)
+    assert nvarchar.length is None
+    assert nvarchar.collation == "Latin1_General"
+
+    decimal = introspector._make_type("decimal", None, 10, 2, None)
+    assert isinstance(decimal, sqltypes.DECIMAL)
+    assert (decimal.precision, decimal.scale) == (10, 2)
+
+    assert introspector._make_type("no_such_type", None, None, None, None) is (
+        sqltypes.NULLTYPE
+    )
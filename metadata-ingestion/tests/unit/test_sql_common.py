@@ -1,8 +1,18 @@
-from typing import Dict
+import pathlib
+import threading
+from typing import Any, Dict, List, Tuple, cast
 from unittest import mock
 
 import pytest
+import sqlalchemy
+from freezegun import freeze_time
+from sqlalchemy.dialects.mysql.base import MySQLDialect
+from sqlalchemy.engine.reflection import Inspector
 
+from datahub.ingestion.api.source import SourceCapability
+from datahub.ingestion.source.sql.sql_bulk_introspection import (
+    BulkIntrospectionInspectorWrapper,
+)
 from datahub.ingestion.source.sql.sql_common import PipelineContext, SQLAlchemySource
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sqlalchemy_uri_mapper import (
@@ -138,3 +148,140 @@ def test_test_connection_failure():
     assert not report.basic_connectivity.capable
     assert report.basic_connectivity.failure_reason
     assert "Connection refused" in report.basic_connectivity.failure_reason
+
+
+class _SqliteTestConfig(SQLCommonConfig):
+    sqlite_path: str
+
+    def get_sql_alchemy_url(self):
+        return f"sqlite:///{self.sqlite_path}"
+
+
+class _SqliteTestSource(SQLAlchemySource):
+    @classmethod
+    def create(cls, config_dict, ctx):
+        config = _SqliteTestConfig.parse_obj(config_dict)
+        return cls(config, ctx, "sqlite")
+
+
+def _get_workunits(
+    sqlite_path: pathlib.Path, max_workers: int
+) -> List[Tuple[str, dict]]:
+    source = _SqliteTestSource.create(
+        config_dict={
+            "sqlite_path": str(sqlite_path),
+            "metadata_extraction_max_workers": max_workers,
+            # SQLite uses a NullPool by default, which doesn't accept pool options.
+            "options": {
+                "poolclass": sqlalchemy.pool.QueuePool,
+                "connect_args": {"check_same_thread": False},
+            },
+        },
+        ctx=PipelineContext(run_id="test_ctx"),
+    )
+
+    # The aggregator isn't thread-safe, so it must only be called from the
+    # thread that consumes the workunits.
+    aggregator_threads = set()
+    for method in ["register_schema", "add_view_definition"]:
+        original = getattr(source.aggregator, method)
+
+        def _record_thread(*args: Any, _original: Any = original, **kwargs: Any) -> Any:
+            aggregator_threads.add(threading.current_thread())
+            return _original(*args, **kwargs)
+
+        setattr(source.aggregator, method, _record_thread)
+
+    workunits = [
+        (wu.id, wu.metadata.to_obj()) for wu in source.get_workunits_internal()
+    ]
+    assert aggregator_threads == {threading.current_thread()}
+    assert not source.report.warnings
+    return workunits
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_parallel_metadata_extraction(tmp_path: pathlib.Path) -> None:
+    sqlite_path = tmp_path / "test.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{sqlite_path}")
+    with engine.begin() as conn:
+        for i in range(20):
+            conn.execute(
+                sqlalchemy.text(
+                    f"CREATE TABLE table_{i} (id INTEGER PRIMARY KEY, name TEXT)"
+                )
+            )
+            conn.execute(
+                sqlalchemy.text(
+                    f"CREATE VIEW view_{i} AS SELECT id, name FROM table_{i}"
+                )
+            )
+
+    serial_workunits = _get_workunits(sqlite_path, max_workers=1)
+    parallel_workunits = _get_workunits(sqlite_path, max_workers=4)
+
+    assert len(serial_workunits) > 40
+    assert sorted(parallel_workunits, key=lambda wu: wu[0]) == sorted(
+        serial_workunits, key=lambda wu: wu[0]
+    )
+
+    # View definitions are parsed into lineage, like without parallelism.
+    lineage_urns = {
+        wu["entityUrn"]
+        for _, wu in parallel_workunits
+        if wu.get("aspectName") == "upstreamLineage"
+    }
+    assert len(lineage_urns) == 20
+
+    # The workunits for each table should still be emitted together.
+    parallel_ids = [wu_id for wu_id, _ in parallel_workunits]
+    for i in range(20):
+        positions = [
+            pos
+            for pos, wu_id in enumerate(parallel_ids)
+            if f"main.table_{i}" == wu_id or f"main.table_{i}-" in wu_id
+        ]
+        assert positions == list(range(positions[0], positions[0] + len(positions)))
+
+
+def test_sqlalchemy_source_subclass_capabilities() -> None:
+    from datahub.ingestion.source.sql.postgres import PostgresSource
+
+    capabilities = {
+        capability.capability
+        for capability in PostgresSource.get_capabilities()  # type: ignore[attr-defined]
+    }
+    assert {
+        SourceCapability.SCHEMA_METADATA,
+        SourceCapability.CONTAINERS,
+        SourceCapability.DESCRIPTIONS,
+        SourceCapability.CLASSIFICATION,
+        SourceCapability.DOMAINS,
+    } <= capabilities
+
+
+def test_bulk_introspection_skipped_for_wrapped_inspector() -> None:
+    source = _TestSQLAlchemySource.create(
+        config_dict={"bulk_schema_introspection": True},
+        ctx=PipelineContext(run_id="test_ctx"),
+    )
+    inspector = mock.create_autospec(Inspector, instance=True)
+    inspector.dialect = MySQLDialect()
+    assert isinstance(
+        source._wrap_with_bulk_introspection(inspector),
+        BulkIntrospectionInspectorWrapper,
+    )
+
+    # e.g. the Oracle source's wrapper for data_dictionary_mode: DBA
+    class _CustomInspectorWrapper:
+        def __init__(self, inspector: Inspector):
+            self._inspector_instance = inspector
+
+        def __getattr__(self, item: str) -> Any:
+            return getattr(self._inspector_instance, item)
+
+    wrapped_inspector = _CustomInspectorWrapper(inspector)
+    assert (
+        source._wrap_with_bulk_introspection(cast(Inspector, wrapped_inspector))
+        is wrapped_inspector
+    )
@@ -0,0 +1,90 @@
+import json
+import pathlib
+from typing import List
+from unittest import mock
+
+from freezegun import freeze_time
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source import sql_queries
+from datahub.ingestion.source.sql_queries import (
+    SqlQueriesSource,
+    SqlQueriesSourceConfig,
+    _get_shard_offsets,
+    _read_shard,
+)
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+
+
+def _write_query_file(path: pathlib.Path, num_queries: int) -> None:
+    with open(path, "w") as f:
+        for i in range(num_queries):
+            query = {
+                "query": f"INSERT INTO db.sch.target_{i % 7} SELECT a, b FROM db.sch.source_{i % 5}",
+                "timestamp": 1700000000 + i,
+                "user": f"user_{i % 3}",
+            }
+            f.write(json.dumps(query) + "\n")
+        f.write("not json\n")
+
+
+def test_get_shard_offsets(tmp_path: pathlib.Path) -> None:
+    query_file = tmp_path / "queries.json"
+    _write_query_file(query_file, 100)
+
+    shards = _get_shard_offsets(str(query_file), shard_size=500)
+    assert len(shards) > 10
+    assert shards[0][0] == 0
+    assert shards[-1][1] == query_file.stat().st_size
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+
+    with open(query_file, "rb") as f:
+        lines = [line for start, end in shards for line in _read_shard(f, start, end)]
+    assert lines == query_file.read_bytes().splitlines(keepends=True)
+
+    assert _get_shard_offsets(str(query_file), shard_size=10**9) == [
+        (0, query_file.stat().st_size)
+    ]
+
+
+def _run_source(query_file: pathlib.Path, parsing_processes: int) -> List[dict]:
+    schema_resolver = SchemaResolver(platform="snowflake")
+    for i in range(5):
+        schema_resolver.add_raw_schema_info(
+            make_dataset_urn("snowflake", f"db.sch.source_{i}"),
+            {"a": "int", "b": "varchar"},
+        )
+
+    graph = mock.MagicMock()
+    graph._make_schema_resolver.return_value = schema_resolver
+    source = SqlQueriesSource(
+        PipelineContext(run_id="sql-queries-test", graph=graph),
+        SqlQueriesSourceConfig(
+            query_file=str(query_file),
+            platform="snowflake",
+            use_schema_resolver=False,
+            parsing_processes=parsing_processes,
+        ),
+    )
+    mcps = [wu.metadata.to_obj() for wu in source.get_workunits_internal()]
+
+    report = source.get_report()
+    report.compute_stats()
+    assert report.num_queries_parsed == 200
+    assert report.num_table_parse_failures == 0
+    assert len(report.warnings) == 1
+    assert report.query_file_progress_pct == 100
+    return mcps
+
+
+@freeze_time("2024-01-01 00:00:00")
+def test_sql_queries_parallel_parsing(tmp_path: pathlib.Path) -> None:
+    query_file = tmp_path / "queries.json"
+    _write_query_file(query_file, 200)
+
+    serial_mcps = _run_source(query_file, parsing_processes=0)
+    with mock.patch.object(sql_queries, "_SHARD_SIZE_BYTES", 2000):
+        parallel_mcps = _run_source(query_file, parsing_processes=2)
+
+    assert parallel_mcps == serial_mcps
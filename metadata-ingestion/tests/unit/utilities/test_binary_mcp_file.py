@@ -0,0 +1,65 @@
+import io
+import pathlib
+
+from datahub.utilities.binary_mcp_file import BinaryMcpFileReader, BinaryMcpFileWriter
+
+
+class _NonSeekableStream(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+def _write_file(path: pathlib.Path, close: bool = True) -> None:
+    writer = BinaryMcpFileWriter(str(path))
+    for i in range(100):
+        urn = f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i % 10},PROD)"
+        writer.write(urn, "status", {"entityUrn": urn, "removed": i % 2 == 0})
+        writer.write(urn, "datasetProperties", {"description": "x" * 200, "i": i})
+    writer.write("urn:li:corpuser:foo", None, {"proposedSnapshot": {}})
+    if close:
+        writer.close()
+    else:
+        writer._file.close()
+
+
+def test_binary_mcp_file_roundtrip(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "mcps.mcpb"
+    _write_file(path)
+
+    with BinaryMcpFileReader(str(path)) as reader:
+        assert reader.has_index
+        records = list(reader)
+        assert len(records) == 201
+        assert [record.index for record in records] == list(range(201))
+        assert records[0].aspect_name == "status"
+        assert records[1].obj == {"description": "x" * 200, "i": 0}
+        assert records[-1].aspect_name is None
+
+        # Records for other aspects are skipped, but records without an
+        # aspect name are always read.
+        status_records = list(reader.read(aspect_names=["status"]))
+        assert len(status_records) == 101
+        assert [record.index for record in status_records[:2]] == [0, 2]
+
+        urn = "urn:li:dataset:(urn:li:dataPlatform:hive,db.table_3,PROD)"
+        assert len(reader.get_urns()) == 11
+        urn_records = reader.get_records(urn)
+        assert urn_records == [record for record in records if record.urn == urn]
+        assert reader.get_records("urn:li:corpuser:bar") == []
+
+    # The payloads are compressed, so the file is smaller than the JSON.
+    assert path.stat().st_size < sum(len(str(record.obj)) for record in records)
+
+    # Non-seekable streams can be read sequentially.
+    stream = _NonSeekableStream(path.read_bytes())
+    assert list(BinaryMcpFileReader(stream)) == records
+
+
+def test_binary_mcp_file_without_index(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "mcps.mcpb"
+    _write_file(path, close=False)
+
+    with BinaryMcpFileReader(str(path)) as reader:
+        assert not reader.has_index
+        assert len(list(reader)) == 201
+        assert len(reader.get_records("urn:li:corpuser:foo")) == 1
@@ -0,0 +1,96 @@
+import dataclasses
+
+import pytest
+
+from datahub.utilities.file_backed_codecs import (
+    benchmark_codecs,
+    choose_codec,
+    get_codec,
+    is_codec_available,
+    train_zstd_dictionary,
+)
+from datahub.utilities.file_backed_collections import FileBackedDict, FileBackedList
+
+
+@dataclasses.dataclass
+class _Query:
+    query: str
+    upstreams: tuple
+
+
+def test_get_codec() -> None:
+    value = {"a": [1, 2, 3], "b": "x" * 1000}
+
+    for name, compression in [
+        ("pickle", None),
+        ("pickle5", None),
+        ("pickle", "gzip"),
+        ("pickle5", "gzip"),
+    ]:
+        codec = get_codec(name, compression=compression)
+        assert codec.deserializer(codec.serializer(value)) == value
+
+    gzip_codec = get_codec("pickle", compression="gzip", compression_level=1)
+    assert gzip_codec.name == "pickle+gzip-1"
+    assert len(gzip_codec.serializer(value)) < len(
+        get_codec("pickle").serializer(value)
+    )
+
+    with pytest.raises(ValueError, match="Unknown codec format"):
+        get_codec("yaml")
+    with pytest.raises(ValueError, match="Unknown compression"):
+        get_codec("pickle", compression="brotli")
+    with pytest.raises(ValueError, match="only supported by zstd"):
+        get_codec("pickle", compression="gzip", zstd_dict=b"dict")
+
+
+def test_choose_codec_requires_round_trip() -> None:
+    samples = [_Query(query=f"SELECT {i} FROM t", upstreams=("t",)) for i in range(10)]
+
+    results = benchmark_codecs(
+        samples, [get_codec("pickle"), get_codec("pickle", compression="gzip")]
+    )
+    assert {result.codec.name for result in results} == {"pickle", "pickle+gzip"}
+    assert results[0].cost <= results[1].cost
+
+    if is_codec_available("orjson"):
+        # orjson can't load the dataclass back, so it's never picked.
+        assert choose_codec(samples, [get_codec("orjson")]).name == "pickle"
+        assert choose_codec([{"a": 1}], [get_codec("orjson")]).name == "orjson"
+
+
+def test_zstd_codec() -> None:
+    pytest.importorskip("zstandard")
+
+    samples = [
+        {"query": f"SELECT col_{i} FROM db.schema.table_{i % 10}", "id": i}
+        for i in range(500)
+    ]
+    zstd_dict = train_zstd_dictionary(samples, dict_size=4096)
+    codec = get_codec("pickle5", compression="zstd", zstd_dict=zstd_dict)
+    assert codec.name == "pickle5+zstd-dict"
+    assert all(codec.deserializer(codec.serializer(s)) == s for s in samples)
+
+
+def test_file_backed_collections_with_codec() -> None:
+    cache = FileBackedDict[_Query](
+        codec=get_codec("pickle5", compression="gzip"), cache_max_size=1
+    )
+    cache["a"] = _Query("SELECT 1", ("t1",))
+    cache["b"] = _Query("SELECT 2", ("t2",))
+    cache.flush()
+    assert cache["a"] == _Query("SELECT 1", ("t1",))
+    assert dict(cache.items_snapshot()) == {
+        "a": _Query("SELECT 1", ("t1",)),
+        "b": _Query("SELECT 2", ("t2",)),
+    }
+    cache.close()
+
+    my_list = FileBackedList[int](codec=get_codec("pickle", compression="gzip"))
+    my_list.append(1)
+    my_list.append(2)
+    assert list(my_list) == [1, 2]
+    my_list.close()
+
+    with pytest.raises(ValueError, match="codec cannot be combined"):
+        FileBackedDict[int](codec=get_codec("pickle"), should_compress_value=True)
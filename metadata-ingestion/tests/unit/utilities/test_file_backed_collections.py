@@ -259,6 +259,23 @@ def test_file_dict_ordering(use_sqlite_on_conflict: bool) -> None:
     assert list(cache.items()) == list(data.items())
 
 
+def test_file_dict_bulk_reads() -> None:
+    cache = FileBackedDict[int](cache_max_size=10, cache_eviction_batch_size=10)
+    keys = [f"key-{i}" for i in random.sample(range(2000), 2000)] + ["ключ", "Zebra"]
+    for i, key in enumerate(keys):
+        cache[key] = i
+
+    # The sorted scan matches Python's string ordering, even for non-ascii keys.
+    assert [key for key, _ in cache.items_snapshot(sort_by_key=True)] == sorted(keys)
+
+    # Lookups mix cached and stored items, and skip missing keys.
+    cache["key-5"] = -5
+    lookup = [f"key-{i}" for i in range(0, 2000, 2)] + ["key-5", "missing"]
+    expected = {key: cache[key] for key in lookup if key != "missing"}
+    assert cache.get_many(lookup) == expected
+    assert cache.get_many([]) == {}
+
+
 @dataclass
 class Pair:
     x: int
@@ -420,6 +437,65 @@ def test_file_list() -> None:
         my_list[100] = 100
 
 
+def test_file_list_range_reads() -> None:
+    my_list = FileBackedList[int](
+        serializer=lambda x: x,
+        deserializer=lambda x: x,
+        cache_max_size=5,
+        cache_eviction_batch_size=5,
+    )
+    for i in range(20):
+        my_list.append(i)
+
+    # Reading an item moves it to the end of the LRU cache, so rows are no longer
+    # persisted in index order. Scans must still return the items in index order.
+    assert my_list[0] == 0
+    my_list[1] = 101
+
+    assert list(my_list) == [0, 101, *range(2, 20)]
+    assert my_list._dict._active_object_cache == {}
+
+    # Iterating does not populate the cache.
+    assert list(my_list.iter_range(15, 100)) == [15, 16, 17, 18, 19]
+    assert my_list._dict._active_object_cache == {}
+    assert list(my_list.iter_range(10, 10)) == []
+
+    assert my_list[3:6] == [3, 4, 5]
+    assert my_list[-2:] == [18, 19]
+    assert my_list[::7] == [0, 7, 14]
+    assert my_list[5:1:-2] == [5, 3]
+    assert my_list[30:] == []
+
+
+def test_file_list_reuses_text_keyed_table(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "list.db"
+    with ConnectionWrapper(filename) as connection:
+        # Emulate a list that was persisted with the original text-keyed layout.
+        legacy_dict = FileBackedDict[int](
+            shared_connection=connection,
+            tablename="queries",
+            serializer=lambda x: x,
+            deserializer=lambda x: x,
+        )
+        for i in range(12):
+            legacy_dict[str(i)] = i * 10
+        legacy_dict.close()
+
+    with ConnectionWrapper(filename) as connection:
+        my_list = FileBackedList[int](
+            shared_connection=connection,
+            tablename="queries",
+            serializer=lambda x: x,
+            deserializer=lambda x: x,
+        )
+        assert len(my_list) == 12
+        assert list(my_list) == [i * 10 for i in range(12)]
+        assert my_list[9:11] == [90, 100]
+
+        my_list.append(120)
+        assert my_list[-1:] == [120]
+
+
 def test_file_cleanup():
     cache = FileBackedDict[int]()
     filename = pathlib.Path(cache._conn.filename)
@@ -0,0 +1,36 @@
+from datahub.utilities.fingerprint_set import FingerprintSet, HyperLogLog
+
+
+def test_fingerprint_set() -> None:
+    urns = FingerprintSet()
+    for i in range(10_000):
+        assert urns.add(f"urn:li:dataset:{i}")
+    for i in range(10_000):
+        assert not urns.add(f"urn:li:dataset:{i}")
+
+    assert len(urns) == 10_000
+    assert "urn:li:dataset:123" in urns
+    assert "urn:li:dataset:-1" not in urns
+    assert not urns.saturated
+
+
+def test_fingerprint_set_saturated() -> None:
+    urns = FingerprintSet(max_exact_size=1000)
+    num_new = sum(urns.add(f"urn:li:dataset:{i}") for i in range(50_000))
+    assert urns.saturated
+
+    # Once saturated, some new keys get reported as duplicates, but keys
+    # are never reported as new twice.
+    assert 1000 < num_new <= 50_000
+    assert not any(urns.add(f"urn:li:dataset:{i}") for i in range(50_000))
+
+    # The size is estimated instead.
+    assert abs(len(urns) - 50_000) < 50_000 * 0.05
+
+
+def test_hyperloglog() -> None:
+    for n in [10, 1000, 100_000]:
+        hll = HyperLogLog()
+        for i in range(n):
+            hll.add_hash(hash(f"item-{i}") & ((1 << 64) - 1))
+        assert abs(hll.count() - n) <= max(n * 0.05, 1)
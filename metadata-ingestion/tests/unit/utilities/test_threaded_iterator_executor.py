@@ -1,4 +1,12 @@
-from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
+import time
+from typing import List, Tuple
+
+import pytest
+
+from datahub.utilities.threaded_iterator_executor import (
+    ThreadedIteratorExecutor,
+    ThreadedIteratorExecutorReport,
+)
 
 
 def test_threaded_iterator_executor():
@@ -12,3 +20,75 @@ def test_threaded_iterator_executor():
             table_of, [(i,) for i in range(1, 30)], max_workers=2
         )
     } == {x for i in range(1, 30) for x in table_of(i)}
+
+
+def test_threaded_iterator_executor_ordered():
+    def worker(i):
+        for j in range(5):
+            if i % 3 == 0:
+                time.sleep(0.001)
+            yield (i, j)
+
+    assert list(
+        ThreadedIteratorExecutor.process(
+            worker, [(i,) for i in range(20)], max_workers=4, ordered=True
+        )
+    ) == [(i, j) for i in range(20) for j in range(5)]
+
+
+def test_threaded_iterator_executor_backpressure():
+    report = ThreadedIteratorExecutorReport()
+    produced: List[Tuple[int, int]] = []
+
+    def worker(i):
+        for j in range(10):
+            produced.append((i, j))
+            yield (i, j)
+
+    results: List[Tuple[int, int]] = []
+    for item in ThreadedIteratorExecutor.process(
+        worker, [(i,) for i in range(3)], max_workers=3, max_queue_size=2, report=report
+    ):
+        time.sleep(0.005)
+        # The workers can only get ahead of us by the queue size, plus one
+        # in-flight item per worker.
+        assert len(produced) - len(results) <= 2 + 3 + 1
+        results.append(item)
+
+    assert len(results) == 30
+    assert report.items_yielded == 30
+    assert report.max_queue_depth <= 2
+    assert report.producer_blocked_sec > 0
+    report.compute_stats()
+    assert report.avg_queue_depth > 0
+
+
+def test_threaded_iterator_executor_worker_exception():
+    def worker(i):
+        yield i
+        if i == 2:
+            raise ValueError("worker failed")
+
+    with pytest.raises(ValueError, match="worker failed"):
+        list(
+            ThreadedIteratorExecutor.process(
+                worker, [(i,) for i in range(5)], max_workers=2
+            )
+        )
+
+
+def test_threaded_iterator_executor_early_exit():
+    def worker(i):
+        yield from range(1000)
+
+    for ordered in [False, True]:
+        # If the workers weren't stopped, they'd block on the full queue forever.
+        gen = ThreadedIteratorExecutor.process(
+            worker,
+            [(i,) for i in range(10)],
+            max_workers=2,
+            max_queue_size=5,
+            ordered=ordered,
+        )
+        assert next(gen) == 0
+        gen.close()